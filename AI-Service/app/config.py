@@ -1,28 +1,68 @@
 """
 Configuration for AI Service
-Loads environment variables and OpenAI settings
+Loads environment variables and LLM provider settings
 """
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Dict, Optional
 
 
 class Settings(BaseSettings):
     """AI Service Configuration"""
     
+    # LLM provider: "openai", "claude" (or "anthropic") or "stub" (deterministic, offline)
+    AI_PROVIDER: str = "openai"
+    # Simulated provider latency for AI_PROVIDER=stub (load tests); 0 answers immediately
+    STUB_LATENCY_MS: float = 0.0
+    # Per-task overrides, "provider" or "provider:model", e.g. {"cv_compare": "claude"}
+    LLM_TASK_ROUTES: Dict[str, str] = {}
+    
     # OpenAI Configuration
-    OPENAI_API_KEY: str
+    OPENAI_API_KEY: Optional[str] = None  # required unless every task runs on another provider
     MODEL_NAME: str = "gpt-4o-mini"
     MAX_TOKENS: int = 2000
     TEMPERATURE: float = 0.3
     
+    # Anthropic Configuration (AI_PROVIDER=claude; needs the anthropic package)
+    CLAUDE_API_KEY: Optional[str] = None
+    CLAUDE_MODEL_NAME: str = "claude-sonnet-4-20250514"
+    
+    # CV-job matching prompt budgets (tokens)
+    MATCH_PROMPT_CV_TOKEN_BUDGET: int = 3000
+    MATCH_PROMPT_JOB_TOKEN_BUDGET: int = 1500  # each for description and requirements
+    
+    # Coalescing of identical /match-cv-to-job and /compare-cvs requests:
+    # concurrent duplicates share one LLM call, successful results are reused for the TTL
+    AI_RESULT_CACHE_TTL_SECONDS: float = 30.0
+    AI_RESULT_CACHE_MAX_ENTRIES: int = 256
+    
     # Service Configuration
     AI_SERVICE_PORT: int = 8001
     
+    # Embeddings for semantic search: "hashing" (offline), "sentence_transformers" or "openai"
+    EMBEDDING_BACKEND: str = "hashing"
+    EMBEDDING_MODEL: Optional[str] = None
+    EMBEDDING_DIMENSIONS: int = 1536  # must match the vector(1536) DB columns
+    
+    # Location matching: Nominatim lookup for places missing from the offline gazetteer
+    GEOCODING_ONLINE_FALLBACK: bool = False
+    GEOCODING_MAX_LOOKUPS: int = 10  # per request (Nominatim allows ~1 req/s)
+    
     # LangFuse Configuration (Optional - for AI observability)
     LANGFUSE_ENABLED: bool = False
     LANGFUSE_SECRET_KEY: Optional[str] = None
     LANGFUSE_PUBLIC_KEY: Optional[str] = None
     LANGFUSE_HOST: str = "http://localhost:3000"
+    # Traces are buffered and exported in the background; full buffer drops new traces
+    LANGFUSE_SAMPLE_RATE: float = 1.0  # 0-1, for trace names not in LANGFUSE_SAMPLE_RATES
+    LANGFUSE_SAMPLE_RATES: Dict[str, float] = {}  # e.g. {"cv_parsing": 0.1, "job_matching": 0.05}
+    LANGFUSE_BUFFER_SIZE: int = 1000
+    LANGFUSE_BATCH_SIZE: int = 50
+    LANGFUSE_FLUSH_INTERVAL_SECONDS: float = 5.0
+
+    # OpenTelemetry tracing: none, otlp (OTEL_EXPORTER_OTLP_ENDPOINT), file or console
+    OTEL_TRACES_EXPORTER: str = "none"
+    OTEL_TRACES_FILE: str = "traces.jsonl"
+    OTEL_SERVICE_NAME: str = "ai-service"
     
     class Config:
         env_file = ".env"
@@ -1,24 +1,41 @@
 """
 AI Service - FastAPI Application
-Handles CV parsing and job matching with OpenAI
+Handles CV parsing and job matching with LLM providers (OpenAI, Claude or local stub)
 """
-from fastapi import FastAPI, UploadFile, File, HTTPException
+import asyncio
+import json
+import logging
+
+from fastapi import FastAPI, UploadFile, File, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, AsyncIterator, Optional, List
 import uvicorn
 
 from app.config import settings
 from app.services.cv_parser import cv_parser_service
 from app.services.job_matcher_service import get_job_matcher_service
+from app.services.prefilter_service import get_prefilter_service
+from app.services.embedding_service import get_embedding_service
 from app.services.compare_service import get_compare_service
 from app.services.job_generator_service import get_job_generator_service
 from app.services.interview_analyzer_service import get_interview_analyzer_service
+from app.services.llm_provider import get_llm
+from app.services.metrics import MetricsMiddleware, metrics_response
+from app.services.telemetry import TracingMiddleware, setup_tracing, shutdown_tracing
+from app.services.tracing import get_trace_exporter
+from app.utils.cv_features import DERIVED_KEY
+from app.utils.json_stream import JSONStreamParser
+from app.utils.location_utils import geocode_missing
+from app.utils.single_flight import canonical_key, get_single_flight
+
+logger = logging.getLogger(__name__)
 
 # Initialize FastAPI app
 app = FastAPI(
     title="AI Service",
-    description="CV Parsing and Job Matching with OpenAI",
+    description="CV Parsing and Job Matching with LLMs",
     version="1.0.0"
 )
 
@@ -31,6 +48,38 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Request latency per route and requests in progress (served at /metrics)
+app.add_middleware(MetricsMiddleware)
+
+# Server span per request, continuing the Back-end's trace
+app.add_middleware(TracingMiddleware)
+
+
+# OpenTelemetry exporter (no-op unless OTEL_TRACES_EXPORTER is set)
+@app.on_event("startup")
+async def start_tracing():
+    setup_tracing()
+
+
+@app.on_event("shutdown")
+async def stop_tracing():
+    shutdown_tracing()
+
+
+# Background LangFuse export (no-op when tracing is off)
+@app.on_event("startup")
+async def start_trace_exporter():
+    exporter = get_trace_exporter()
+    if exporter:
+        exporter.start()
+
+
+@app.on_event("shutdown")
+async def stop_trace_exporter():
+    exporter = get_trace_exporter()
+    if exporter:
+        await exporter.stop()
+
 
 # ============================================
 # Request/Response Models
@@ -62,6 +111,35 @@ class MatchCVToJobResponse(BaseModel):
     error: Optional[str] = None
 
 
+class PrefilterCandidatesRequest(BaseModel):
+    """Request model for local candidate ranking before LLM matching"""
+    job_data: Dict[str, Any]
+    candidates: List[Dict[str, Any]]
+    top_k: Optional[int] = None
+    min_score: Optional[float] = None
+
+
+class PrefilterCandidatesResponse(BaseModel):
+    """Response model for local candidate ranking"""
+    success: bool
+    data: Optional[List[Dict[str, Any]]] = None
+    error: Optional[str] = None
+
+
+class EmbedTextsRequest(BaseModel):
+    """Request model for text embeddings"""
+    texts: List[str]
+
+
+class EmbedTextsResponse(BaseModel):
+    """Response model for text embeddings"""
+    success: bool
+    embeddings: Optional[List[List[float]]] = None
+    backend: Optional[str] = None
+    model: Optional[str] = None  # backend:model:dimensions; stored next to each vector
+    error: Optional[str] = None
+
+
 class CompareCVsRequest(BaseModel):
     """Request model for comparing exactly two candidates"""
     candidate_a: Dict[str, Any]
@@ -205,6 +283,15 @@ class RegenerateSingleLikertQuestionResponse(BaseModel):
     error: Optional[str] = None
 
 
+def _model_key(task: str) -> str:
+    """provider:model a task currently routes to (part of coalescing keys)"""
+    try:
+        provider, model = get_llm().resolve(task)
+        return f"{provider.name}:{model}"
+    except Exception:
+        return "unavailable"
+
+
 # ============================================
 # Health Check
 # ============================================
@@ -212,13 +299,25 @@ class RegenerateSingleLikertQuestionResponse(BaseModel):
 @app.get("/")
 async def health_check():
     """Health check endpoint"""
+    llm = get_llm()
+    try:
+        model = llm.resolve("job_matching")[1]
+    except Exception as e:
+        model = f"unavailable: {e}"
     return {
         "status": "healthy",
         "service": "AI Service",
-        "model": settings.MODEL_NAME
+        "provider": llm.default_provider,
+        "model": model
     }
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus metrics endpoint"""
+    return metrics_response()
+
+
 # ============================================
 # CV Parsing Endpoints
 # ============================================
@@ -316,13 +415,21 @@ async def match_cv_to_job(request: MatchCVToJobRequest):
         
         # Get job matcher service
         matcher_service = get_job_matcher_service()
+        language = request.language or "turkish"
         
-        # Perform matching analysis
-        analysis_result = await matcher_service.match_cv_to_job(
+        # Perform matching analysis (identical concurrent requests share one LLM call)
+        from app.prompts.cv_job_matching_prompt import PROMPT_VERSION
+        key = canonical_key(
+            "match-cv-to-job",
+            [request.job_data, request.candidate_data, language],
+            _model_key("job_matching"),
+            PROMPT_VERSION,
+        )
+        analysis_result = await get_single_flight().do(key, lambda: matcher_service.match_cv_to_job(
             job_data=request.job_data,
             candidate_data=request.candidate_data,
-            language=request.language or "turkish"
-        )
+            language=language
+        ))
         
         return MatchCVToJobResponse(
             success=True,
@@ -339,6 +446,79 @@ async def match_cv_to_job(request: MatchCVToJobRequest):
         )
 
 
+@app.post("/prefilter-candidates", response_model=PrefilterCandidatesResponse)
+async def prefilter_candidates(request: PrefilterCandidatesRequest):
+    """
+    Rank candidates for a job with deterministic local scoring (no LLM call).
+    
+    Args:
+        request: Contains job_data, candidates and optional top_k / min_score
+        
+    Returns:
+        Candidates best first with score (0-100), breakdown and a selected flag
+        telling the caller which ones to send to /match-cv-to-job
+    """
+    try:
+        if not request.job_data:
+            raise HTTPException(status_code=400, detail="job_data is required")
+        
+        prefilter_service = get_prefilter_service()
+        await geocode_missing(prefilter_service.locations(request.job_data, request.candidates))
+        # CPU-bound scoring off the event loop
+        ranked = await asyncio.to_thread(
+            prefilter_service.rank,
+            job_data=request.job_data,
+            candidates=request.candidates,
+            top_k=request.top_k,
+            min_score=request.min_score
+        )
+        
+        return PrefilterCandidatesResponse(
+            success=True,
+            data=ranked
+        )
+        
+    except HTTPException:
+        raise
+    
+    except Exception as e:
+        return PrefilterCandidatesResponse(
+            success=False,
+            error=str(e)
+        )
+
+
+# ============================================
+# Embedding Endpoint
+# ============================================
+
+@app.post("/embed", response_model=EmbedTextsResponse)
+async def embed_texts(request: EmbedTextsRequest):
+    """
+    Embed texts for semantic search (job descriptions, candidate CVs).
+    
+    Returns:
+        One normalized vector per text, sized to the database vector columns,
+        and the model id they belong to (an empty ``texts`` list returns only the id)
+    """
+    try:
+        embedding_service = get_embedding_service()
+        embeddings = await asyncio.to_thread(embedding_service.embed, request.texts)
+        
+        return EmbedTextsResponse(
+            success=True,
+            embeddings=embeddings,
+            backend=embedding_service.backend.name,
+            model=embedding_service.model
+        )
+        
+    except Exception as e:
+        return EmbedTextsResponse(
+            success=False,
+            error=str(e)
+        )
+
+
 # ============================================
 # Two-CV Comparison Endpoint
 # ============================================
@@ -356,7 +536,8 @@ async def compare_cvs(request: CompareCVsRequest):
 
         # Limit list lengths to keep token usage predictable
         def _trim(c: Dict[str, Any]) -> Dict[str, Any]:
-            pd = (c or {}).get("parsed_data") or {}
+            pd = dict((c or {}).get("parsed_data") or {})
+            pd.pop(DERIVED_KEY, None)
             for k in ("skills", "languages", "education", "experience"):
                 if isinstance(pd.get(k), list) and len(pd[k]) > 30:
                     pd[k] = pd[k][:30]
@@ -372,7 +553,9 @@ async def compare_cvs(request: CompareCVsRequest):
         language = request.language or "turkish"
 
         service = get_compare_service()
-        data = await service.compare_two_cvs(a, b, job, language)
+        from app.prompts.cv_compare_prompt import PROMPT_VERSION
+        key = canonical_key("compare-cvs", [a, b, job, language], _model_key("cv_compare"), PROMPT_VERSION)
+        data = await get_single_flight().do(key, lambda: service.compare_two_cvs(a, b, job, language))
         return CompareCVsResponse(success=True, data=data)
 
     except HTTPException:
@@ -554,17 +737,13 @@ async def generate_interview_questions(request: GenerateInterviewQuestionsReques
         if difficulty not in valid_difficulties:
             difficulty = "intermediate"
         
-        # Import prompt and OpenAI
+        # Import prompt
         from app.prompts.interview_question_generator_prompt import (
             get_interview_question_generator_prompt,
             get_system_message
         )
-        from openai import OpenAI
         import json
         
-        # Initialize OpenAI client
-        client = OpenAI(api_key=settings.OPENAI_API_KEY)
-        
         # Generate prompt with new parameters
         prompt = get_interview_question_generator_prompt(
             description=request.description,
@@ -574,26 +753,17 @@ async def generate_interview_questions(request: GenerateInterviewQuestionsReques
             difficulty=difficulty
         )
         
-        # Call OpenAI API
-        response = client.chat.completions.create(
-            model=settings.MODEL_NAME,
-            messages=[
-                {
-                    "role": "system",
-                    "content": get_system_message(language)
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
+        # Call the configured LLM provider
+        response = await get_llm().complete(
+            "interview_questions",
+            get_system_message(language),
+            prompt,
             temperature=0.7,
             max_tokens=2000,
-            response_format={"type": "json_object"}
         )
         
         # Extract and parse the response
-        response_text = response.choices[0].message.content
+        response_text = response.text
         response_data = json.loads(response_text)
         
         # Check if description was validated as invalid
@@ -674,17 +844,13 @@ async def regenerate_single_question(request: RegenerateSingleQuestionRequest):
         if language not in ["tr", "en"]:
             language = "tr"
         
-        # Import prompt and OpenAI
+        # Import prompt
         from app.prompts.interview_question_generator_prompt import (
             get_single_question_regenerate_prompt,
             get_system_message
         )
-        from openai import OpenAI
         import json
         
-        # Initialize OpenAI client
-        client = OpenAI(api_key=settings.OPENAI_API_KEY)
-        
         # Generate prompt for single question
         prompt = get_single_question_regenerate_prompt(
             description=request.description,
@@ -694,26 +860,17 @@ async def regenerate_single_question(request: RegenerateSingleQuestionRequest):
             existing_questions=request.existing_questions
         )
         
-        # Call OpenAI API
-        response = client.chat.completions.create(
-            model=settings.MODEL_NAME,
-            messages=[
-                {
-                    "role": "system",
-                    "content": get_system_message(language)
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
+        # Call the configured LLM provider
+        response = await get_llm().complete(
+            "interview_questions",
+            get_system_message(language),
+            prompt,
             temperature=0.8,  # Slightly higher for more variety
             max_tokens=500,
-            response_format={"type": "json_object"}
         )
         
         # Extract and parse the response
-        response_text = response.choices[0].message.content
+        response_text = response.text
         response_data = json.loads(response_text)
         
         question = GeneratedQuestion(
@@ -741,6 +898,71 @@ async def regenerate_single_question(request: RegenerateSingleQuestionRequest):
 # Likert Question Generator Endpoints
 # ============================================
 
+def _likert_generation_request(request: GenerateLikertQuestionsRequest):
+    """Validated settings and prompts: (system message, prompt, question count, dimension)"""
+    # Validate required fields
+    if not request.description or not request.description.strip():
+        raise HTTPException(status_code=400, detail="description is required")
+    
+    # Validate question count (1-30)
+    question_count = max(1, min(30, request.question_count))
+    
+    # Validate language
+    language = request.language.lower() if request.language else "tr"
+    if language not in ["tr", "en"]:
+        language = "tr"
+    
+    # Validate dimension
+    valid_dimensions = ["leadership", "communication", "teamwork", "problem_solving", 
+                      "stress_management", "adaptability", "motivation", "integrity", "mixed"]
+    dimension = request.dimension.lower() if request.dimension else "mixed"
+    if dimension not in valid_dimensions:
+        dimension = "mixed"
+    
+    # Validate direction
+    valid_directions = ["positive", "negative", "mixed"]
+    direction = request.direction.lower() if request.direction else "mixed"
+    if direction not in valid_directions:
+        direction = "mixed"
+    
+    # Validate scale type
+    scale_type = request.scale_type if request.scale_type in [5, 7] else 5
+    
+    # Import prompt
+    from app.prompts.likert_question_generator_prompt import (
+        get_likert_question_generator_prompt,
+        get_system_message
+    )
+    
+    # Generate prompt with parameters
+    prompt = get_likert_question_generator_prompt(
+        description=request.description,
+        question_count=question_count,
+        language=language,
+        dimension=dimension,
+        direction=direction,
+        scale_type=scale_type
+    )
+    return get_system_message(language), prompt, question_count, dimension
+
+
+def _to_likert_question(q: Any, dimension: str) -> Optional[GeneratedLikertQuestion]:
+    """Convert one raw AI question to a GeneratedLikertQuestion"""
+    if isinstance(q, dict):
+        return GeneratedLikertQuestion(
+            text=q.get("text", ""),
+            dimension=q.get("dimension", dimension if dimension != "mixed" else "leadership"),
+            direction=q.get("direction", "positive")
+        )
+    elif isinstance(q, str):
+        return GeneratedLikertQuestion(
+            text=q,
+            dimension=dimension if dimension != "mixed" else "leadership",
+            direction="positive"
+        )
+    return None
+
+
 @app.post("/generate-likert-questions", response_model=GenerateLikertQuestionsResponse)
 async def generate_likert_questions(request: GenerateLikertQuestionsRequest):
     """
@@ -753,94 +975,30 @@ async def generate_likert_questions(request: GenerateLikertQuestionsRequest):
         List of generated Likert questions with dimensions and directions
     """
     try:
-        # Validate required fields
-        if not request.description or not request.description.strip():
-            raise HTTPException(status_code=400, detail="description is required")
-        
-        # Validate question count (1-30)
-        question_count = max(1, min(30, request.question_count))
-        
-        # Validate language
-        language = request.language.lower() if request.language else "tr"
-        if language not in ["tr", "en"]:
-            language = "tr"
-        
-        # Validate dimension
-        valid_dimensions = ["leadership", "communication", "teamwork", "problem_solving", 
-                          "stress_management", "adaptability", "motivation", "integrity", "mixed"]
-        dimension = request.dimension.lower() if request.dimension else "mixed"
-        if dimension not in valid_dimensions:
-            dimension = "mixed"
-        
-        # Validate direction
-        valid_directions = ["positive", "negative", "mixed"]
-        direction = request.direction.lower() if request.direction else "mixed"
-        if direction not in valid_directions:
-            direction = "mixed"
-        
-        # Validate scale type
-        scale_type = request.scale_type if request.scale_type in [5, 7] else 5
-        
-        # Import prompt and OpenAI
-        from app.prompts.likert_question_generator_prompt import (
-            get_likert_question_generator_prompt,
-            get_system_message
-        )
-        from openai import OpenAI
         import json
         
-        # Initialize OpenAI client
-        client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        system_message, prompt, question_count, dimension = _likert_generation_request(request)
         
-        # Generate prompt with parameters
-        prompt = get_likert_question_generator_prompt(
-            description=request.description,
-            question_count=question_count,
-            language=language,
-            dimension=dimension,
-            direction=direction,
-            scale_type=scale_type
-        )
-        
-        # Call OpenAI API
-        response = client.chat.completions.create(
-            model=settings.MODEL_NAME,
-            messages=[
-                {
-                    "role": "system",
-                    "content": get_system_message(language)
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
+        # Call the configured LLM provider
+        response = await get_llm().complete(
+            "likert_questions",
+            system_message,
+            prompt,
             temperature=0.7,
             max_tokens=3000,
-            response_format={"type": "json_object"}
         )
         
         # Extract and parse the response
-        response_text = response.choices[0].message.content
+        response_text = response.text
         response_data = json.loads(response_text)
         
         raw_questions = response_data.get("questions", [])
         
         # Convert to GeneratedLikertQuestion objects
-        questions = []
-        for q in raw_questions[:question_count]:
-            if isinstance(q, dict):
-                questions.append(GeneratedLikertQuestion(
-                    text=q.get("text", ""),
-                    dimension=q.get("dimension", dimension if dimension != "mixed" else "leadership"),
-                    direction=q.get("direction", "positive")
-                ))
-            elif isinstance(q, str):
-                questions.append(GeneratedLikertQuestion(
-                    text=q,
-                    dimension=dimension if dimension != "mixed" else "leadership",
-                    direction="positive"
-                ))
+        questions = [
+            question for question in (_to_likert_question(q, dimension) for q in raw_questions[:question_count])
+            if question
+        ]
         
         return GenerateLikertQuestionsResponse(
             success=True,
@@ -892,17 +1050,13 @@ async def regenerate_single_likert_question(request: RegenerateSingleLikertQuest
         if language not in ["tr", "en"]:
             language = "tr"
         
-        # Import prompt and OpenAI
+        # Import prompt
         from app.prompts.likert_question_generator_prompt import (
             get_single_likert_question_regenerate_prompt,
             get_system_message
         )
-        from openai import OpenAI
         import json
         
-        # Initialize OpenAI client
-        client = OpenAI(api_key=settings.OPENAI_API_KEY)
-        
         # Generate prompt for single question
         prompt = get_single_likert_question_regenerate_prompt(
             description=request.description,
@@ -912,26 +1066,17 @@ async def regenerate_single_likert_question(request: RegenerateSingleLikertQuest
             existing_questions=request.existing_questions
         )
         
-        # Call OpenAI API
-        response = client.chat.completions.create(
-            model=settings.MODEL_NAME,
-            messages=[
-                {
-                    "role": "system",
-                    "content": get_system_message(language)
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
+        # Call the configured LLM provider
+        response = await get_llm().complete(
+            "likert_questions",
+            get_system_message(language),
+            prompt,
             temperature=0.8,
             max_tokens=500,
-            response_format={"type": "json_object"}
         )
         
         # Extract and parse the response
-        response_text = response.choices[0].message.content
+        response_text = response.text
         response_data = json.loads(response_text)
         
         question = GeneratedLikertQuestion(
@@ -956,6 +1101,112 @@ async def regenerate_single_likert_question(request: RegenerateSingleLikertQuest
         )
 
 
+# ============================================
+# Streaming Generation Endpoints
+# ============================================
+# Partial results while the model is still writing. Each event is a JSON
+# object: "delta" (text appended to a string field), "item" (one finished
+# array element, e.g. a question), "field" (a finished top-level value),
+# then "done" with the same data the non-streaming endpoint returns, or
+# "error". NDJSON by default; Server-Sent Events with ?format=sse or
+# "Accept: text/event-stream".
+
+def _stream_response(http_request: Request, events: AsyncIterator[Dict[str, Any]]) -> StreamingResponse:
+    sse = (
+        http_request.query_params.get("format") == "sse"
+        or "text/event-stream" in http_request.headers.get("accept", "")
+    )
+    
+    def encode(event: Dict[str, Any]) -> str:
+        data = json.dumps(event, ensure_ascii=False)
+        return f"event: {event['event']}\ndata: {data}\n\n" if sse else data + "\n"
+    
+    async def body():
+        try:
+            async for event in events:
+                yield encode(event)
+        except Exception as e:
+            logger.error(f"Streaming generation failed: {e}")
+            yield encode({"event": "error", "error": str(e)})
+    
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream" if sse else "application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.post("/generate-job-description/stream")
+async def generate_job_description_stream(request: GenerateJobRequest, http_request: Request):
+    """Streaming /generate-job-description: description text arrives as it is written"""
+    if not request.position or not request.position.strip():
+        raise HTTPException(status_code=400, detail="position is required")
+    if not request.location or not request.location.strip():
+        raise HTTPException(status_code=400, detail="location is required")
+    
+    events = get_job_generator_service().stream_job_description(
+        position=request.position,
+        department=request.department,
+        location=request.location,
+        employment_type=request.employment_type,
+        experience_level=request.experience_level,
+        required_skills=request.required_skills,
+        required_languages=[
+            {"name": lang.name, "level": lang.level}
+            for lang in request.required_languages
+        ],
+        additional_notes=request.additional_notes,
+        language=request.language
+    )
+    return _stream_response(http_request, events)
+
+
+@app.post("/generate-likert-questions/stream")
+async def generate_likert_questions_stream(request: GenerateLikertQuestionsRequest, http_request: Request):
+    """Streaming /generate-likert-questions: one "item" event per finished question"""
+    system_message, prompt, question_count, dimension = _likert_generation_request(request)
+    
+    async def events():
+        parser = JSONStreamParser()
+        questions: List[GeneratedLikertQuestion] = []
+        async for chunk in get_llm().stream(
+            "likert_questions",
+            system_message,
+            prompt,
+            temperature=0.7,
+            max_tokens=3000,
+        ):
+            for event in parser.feed(chunk):
+                if event["event"] != "item" or event["key"] != "questions" or len(questions) >= question_count:
+                    continue
+                question = _to_likert_question(event["value"], dimension)
+                if question:
+                    questions.append(question)
+                    yield {"event": "item", "key": "questions", "index": len(questions) - 1, "value": question.model_dump()}
+        yield {"event": "done", "data": {"questions": [q.model_dump() for q in questions]}}
+    
+    return _stream_response(http_request, events())
+
+
+@app.post("/analyze-interview/stream")
+async def analyze_interview_stream(request: AnalyzeInterviewRequest, http_request: Request):
+    """Streaming /analyze-interview: each category arrives as soon as it is scored"""
+    if not request.job_context:
+        raise HTTPException(status_code=400, detail="job_context is required")
+    if not request.questions_answers:
+        raise HTTPException(status_code=400, detail="questions_answers is required")
+    
+    events = get_interview_analyzer_service().stream_analysis(
+        job_context=request.job_context,
+        questions_answers=[
+            {"question": qa.question, "answer": qa.answer, "order": qa.order}
+            for qa in request.questions_answers
+        ],
+        language=request.language
+    )
+    return _stream_response(http_request, events)
+
+
 # ============================================
 # Run Server
 # ============================================
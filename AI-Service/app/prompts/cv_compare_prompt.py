@@ -6,6 +6,9 @@ All data extraction is done from database.
 import json
 from typing import Any, Dict, Optional
 
+# Bump on any wording/format change: part of the request-coalescing cache key
+PROMPT_VERSION = "1"
+
 
 def get_cv_compare_prompt(
     candidate_a: Dict[str, Any],
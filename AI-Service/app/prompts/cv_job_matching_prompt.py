@@ -1,7 +1,43 @@
 """
 CV to Job Matching Prompt
 Analyzes candidate CV against job requirements and provides detailed scoring.
+
+The prompt is assembled from three sections: the static instructions (built
+once per language), the job section (rendered once per distinct job, since an
+analysis run matches many candidates against the same job) and the candidate
+section, which is trimmed deterministically to MATCH_PROMPT_CV_TOKEN_BUDGET
+tokens so very long CVs do not blow up input tokens and latency.
 """
+import hashlib
+import json
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional
+
+from app.config import settings
+from app.services.metrics import cache_outcome
+from app.utils.token_utils import count_tokens, truncate_to_tokens
+
+# Bump on any wording/format change: part of the request-coalescing cache key
+PROMPT_VERSION = "1"
+
+_PREAMBLE = "You are an expert HR analyst and recruiter. Analyze the candidate's CV against the job requirements and provide a detailed matching score."
+
+# Rendered job sections keyed by a digest of job_data (LRU)
+_job_sections: "OrderedDict[str, str]" = OrderedDict()
+_JOB_SECTION_CACHE_SIZE = 128
+_JOB_SECTION_HITS, _JOB_SECTION_MISSES = cache_outcome("job_prompt_section")
+
+# Candidate trimming steps, mildest first:
+# (max experiences, max educations, max description chars, max projects)
+_TRIM_STEPS = (
+    (None, None, 1200, None),
+    (None, None, 500, None),
+    (10, 5, 300, 5),
+    (6, 3, 150, 3),
+    (4, 2, 0, 2),
+)
+
 
 def get_cv_job_matching_prompt(job_data: dict, candidate_data: dict, language: str = "turkish") -> str:
     """
@@ -15,6 +51,16 @@ def get_cv_job_matching_prompt(job_data: dict, candidate_data: dict, language: s
     Returns:
         Formatted prompt string for OpenAI
     """
+    return "\n\n---\n\n".join([
+        f"{_PREAMBLE}\n\n{render_job_section(job_data)}",
+        render_candidate_section(candidate_data),
+        _instructions(language),
+    ])
+
+
+@lru_cache(maxsize=None)
+def _instructions(language: str) -> str:
+    """Language instructions, scoring rubric and output format (static per language)"""
     
     # Choose language-specific instructions
     if language == "english":
@@ -34,42 +80,7 @@ def get_cv_job_matching_prompt(job_data: dict, candidate_data: dict, language: s
         
         summary_field_description = '"summary": "<Türkçe: bu rol için adayın uygunluğuna dair 2-3 cümle özet>"'
     
-    prompt = f"""You are an expert HR analyst and recruiter. Analyze the candidate's CV against the job requirements and provide a detailed matching score.
-
-**JOB INFORMATION:**
-Title: {job_data.get('title', 'N/A')}
-Department: {job_data.get('department', 'N/A')}
-Location: {job_data.get('location', 'N/A')}
-Employment Type: {job_data.get('employment_type', 'N/A')}
-Experience Level Required: {job_data.get('experience_level', 'N/A')}
-Required Education: {job_data.get('required_education', 'N/A')}
-Preferred Majors: {', '.join(job_data.get('preferred_majors', [])) if isinstance(job_data.get('preferred_majors'), list) else (job_data.get('preferred_majors') if job_data.get('preferred_majors') else 'N/A')}
-Required Languages: {', '.join([f"{lang}: {level}" for lang, level in job_data.get('required_languages', {}).items()]) if isinstance(job_data.get('required_languages'), dict) else (job_data.get('required_languages') if job_data.get('required_languages') else 'N/A')}
-Disabled Position (Engelli Kadrosu): {'YES - This position is specifically for disabled candidates (legal requirement)' if job_data.get('is_disabled_friendly') else 'No'}
-
-**Job Description:**
-{job_data.get('description_plain', job_data.get('description', 'N/A'))}
-
-**Job Requirements:**
-{job_data.get('requirements_plain', job_data.get('requirements', 'N/A'))}
-
-**Keywords/Skills Required:**
-{', '.join(job_data.get('keywords', [])) if isinstance(job_data.get('keywords'), list) and job_data.get('keywords') else (str(job_data.get('keywords')) if job_data.get('keywords') else 'N/A')}
-
----
-
-**CANDIDATE CV INFORMATION:**
-Name: {candidate_data.get('name', 'N/A')}
-Email: {candidate_data.get('email', 'N/A')}
-Phone: {candidate_data.get('phone', 'N/A')}
-CV Language: {candidate_data.get('cv_language', 'N/A')}
-
-**Parsed CV Data:**
-{format_parsed_data(candidate_data.get('parsed_data', {}))}
-
----
-
-{language_instructions}
+    return f"""{language_instructions}
 
 **ANALYSIS INSTRUCTIONS:**
 
@@ -172,11 +183,107 @@ Respond with a valid JSON object with the following structure:
 - **DISABILITY POSITION RULE (CRITICAL)**: If "Disabled Position: YES" is indicated above, this is a legally mandated position for disabled candidates in Turkey. If the candidate's CV does NOT explicitly mention any disability status (engelli, engellilik, engelli raporu, disability certificate, etc.), the overall_score MUST be 0 and recommendation MUST be "not_recommended". Disability positions have strict legal requirements - no exceptions.
 - Return ONLY the JSON object, no additional text"""
 
-    return prompt
 
+def render_job_section(job_data: dict) -> str:
+    """Job section of the prompt, cached by content"""
+    key = hashlib.sha1(json.dumps(job_data, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+    section = _job_sections.get(key)
+    if section is None:
+        _JOB_SECTION_MISSES.inc()
+        section = _render_job_section(job_data)
+        _job_sections[key] = section
+        if len(_job_sections) > _JOB_SECTION_CACHE_SIZE:
+            _job_sections.popitem(last=False)
+    else:
+        _JOB_SECTION_HITS.inc()
+        _job_sections.move_to_end(key)
+    return section
+
+
+def _render_job_section(job_data: dict) -> str:
+    budget = settings.MATCH_PROMPT_JOB_TOKEN_BUDGET
+    description = truncate_to_tokens(str(job_data.get('description_plain', job_data.get('description', 'N/A'))), budget)
+    requirements = truncate_to_tokens(str(job_data.get('requirements_plain', job_data.get('requirements', 'N/A'))), budget)
+    
+    return f"""**JOB INFORMATION:**
+Title: {job_data.get('title', 'N/A')}
+Department: {job_data.get('department', 'N/A')}
+Location: {job_data.get('location', 'N/A')}
+Employment Type: {job_data.get('employment_type', 'N/A')}
+Experience Level Required: {job_data.get('experience_level', 'N/A')}
+Required Education: {job_data.get('required_education', 'N/A')}
+Preferred Majors: {', '.join(job_data.get('preferred_majors', [])) if isinstance(job_data.get('preferred_majors'), list) else (job_data.get('preferred_majors') if job_data.get('preferred_majors') else 'N/A')}
+Required Languages: {', '.join([f"{lang}: {level}" for lang, level in job_data.get('required_languages', {}).items()]) if isinstance(job_data.get('required_languages'), dict) else (job_data.get('required_languages') if job_data.get('required_languages') else 'N/A')}
+Disabled Position (Engelli Kadrosu): {'YES - This position is specifically for disabled candidates (legal requirement)' if job_data.get('is_disabled_friendly') else 'No'}
 
-def format_parsed_data(parsed_data: dict) -> str:
-    """Format parsed CV data for prompt inclusion."""
+**Job Description:**
+{description}
+
+**Job Requirements:**
+{requirements}
+
+**Keywords/Skills Required:**
+{', '.join(job_data.get('keywords', [])) if isinstance(job_data.get('keywords'), list) and job_data.get('keywords') else (str(job_data.get('keywords')) if job_data.get('keywords') else 'N/A')}"""
+
+
+def render_candidate_section(candidate_data: dict, token_budget: Optional[int] = None) -> str:
+    """
+    Candidate section of the prompt.
+    
+    If the formatted CV exceeds the token budget, the _TRIM_STEPS are applied
+    in order until it fits (later list entries and long descriptions go
+    first), then the rest is cut as a last resort.
+    """
+    budget = token_budget or settings.MATCH_PROMPT_CV_TOKEN_BUDGET
+    parsed_data = candidate_data.get('parsed_data', {})
+    
+    body = format_parsed_data(parsed_data)
+    for max_experiences, max_educations, max_description_chars, max_projects in _TRIM_STEPS:
+        if count_tokens(body) <= budget:
+            break
+        body = format_parsed_data(
+            parsed_data,
+            max_experiences=max_experiences,
+            max_educations=max_educations,
+            max_description_chars=max_description_chars,
+            max_projects=max_projects,
+        )
+    body = truncate_to_tokens(body, budget)
+    
+    return f"""**CANDIDATE CV INFORMATION:**
+Name: {candidate_data.get('name', 'N/A')}
+Email: {candidate_data.get('email', 'N/A')}
+Phone: {candidate_data.get('phone', 'N/A')}
+CV Language: {candidate_data.get('cv_language', 'N/A')}
+
+**Parsed CV Data:**
+{body}"""
+
+
+def _clip(text, max_chars: Optional[int]) -> str:
+    text = str(text)
+    if max_chars is None or len(text) <= max_chars:
+        return text
+    return text[:max_chars].rstrip() + "…"
+
+
+def _omitted(count: int, label: str) -> str:
+    return f"\n({count} more {label} omitted for length)\n" if count > 0 else ""
+
+
+def format_parsed_data(
+    parsed_data: dict,
+    max_experiences: Optional[int] = None,
+    max_educations: Optional[int] = None,
+    max_description_chars: Optional[int] = None,
+    max_projects: Optional[int] = None,
+) -> str:
+    """
+    Format parsed CV data for prompt inclusion.
+    
+    The optional limits keep the first N entries of a list (CV order, normally
+    most recent first) and shorten descriptions; 0 description chars drops them.
+    """
     
     if not parsed_data:
         return "No structured data available"
@@ -201,21 +308,23 @@ def format_parsed_data(parsed_data: dict) -> str:
     if parsed_data.get('experience'):
         exp_text = "**Work Experience:**\n"
         experiences = parsed_data['experience'] if isinstance(parsed_data['experience'], list) else [parsed_data['experience']]
-        for i, exp in enumerate(experiences, 1):
+        for i, exp in enumerate(experiences[:max_experiences], 1):
             if isinstance(exp, dict):
                 exp_text += f"\n{i}. {exp.get('title', 'N/A')} at {exp.get('company', 'N/A')}\n"
                 exp_text += f"   Period: {exp.get('start_date', 'N/A')} - {exp.get('end_date', 'Present')}\n"
-                if exp.get('description'):
-                    exp_text += f"   Description: {exp['description']}\n"
+                if exp.get('description') and max_description_chars != 0:
+                    exp_text += f"   Description: {_clip(exp['description'], max_description_chars)}\n"
             else:
-                exp_text += f"\n{i}. {str(exp)}\n"
+                exp_text += f"\n{i}. {_clip(exp, max_description_chars or None)}\n"
+        if max_experiences is not None:
+            exp_text += _omitted(len(experiences) - max_experiences, "positions")
         sections.append(exp_text)
     
     # Education
     if parsed_data.get('education'):
         edu_text = "**Education:**\n"
         educations = parsed_data['education'] if isinstance(parsed_data['education'], list) else [parsed_data['education']]
-        for i, edu in enumerate(educations, 1):
+        for i, edu in enumerate(educations[:max_educations], 1):
             if isinstance(edu, dict):
                 edu_text += f"\n{i}. {edu.get('degree', 'N/A')} in {edu.get('field', 'N/A')}\n"
                 edu_text += f"   Institution: {edu.get('institution', 'N/A')}\n"
@@ -224,6 +333,8 @@ def format_parsed_data(parsed_data: dict) -> str:
                     edu_text += f"   GPA: {edu['gpa']}\n"
             else:
                 edu_text += f"\n{i}. {str(edu)}\n"
+        if max_educations is not None:
+            edu_text += _omitted(len(educations) - max_educations, "education entries")
         sections.append(edu_text)
     
     # Skills
@@ -287,11 +398,15 @@ def format_parsed_data(parsed_data: dict) -> str:
     if parsed_data.get('projects'):
         proj_text = "**Notable Projects:**\n"
         projects = parsed_data['projects'] if isinstance(parsed_data['projects'], list) else [parsed_data['projects']]
-        for proj in projects:
-            if isinstance(proj, dict):
-                proj_text += f"- {proj.get('name', 'N/A')}: {proj.get('description', 'N/A')}\n"
+        for proj in projects[:max_projects]:
+            if isinstance(proj, dict) and max_description_chars == 0:
+                proj_text += f"- {proj.get('name', 'N/A')}\n"
+            elif isinstance(proj, dict):
+                proj_text += f"- {proj.get('name', 'N/A')}: {_clip(proj.get('description', 'N/A'), max_description_chars)}\n"
             else:
                 proj_text += f"- {str(proj)}\n"
+        if max_projects is not None:
+            proj_text += _omitted(len(projects) - max_projects, "projects")
         sections.append(proj_text)
     
     return "\n\n".join(sections)
@@ -14,6 +14,8 @@ import re
 from typing import Dict, Any, List, Tuple, Optional
 import logging
 
+from app.services.telemetry import traced
+
 logger = logging.getLogger(__name__)
 
 
@@ -75,8 +77,23 @@ class CVAnonymizer:
         r'\b(?:0[1-9]|[12]\d|3[01])[./\-](?:0[1-9]|1[0-2])[./\-](?:19|20)\d{2}\b'
     )
 
+    # Masking order: URLs first (contain sub-patterns), then specific PII.
+    # A pattern only sees text not already claimed by an earlier one.
+    MASK_PATTERNS = (
+        ("LINKEDIN", LINKEDIN_RE),
+        ("GITHUB", GITHUB_RE),
+        ("URL", URL_RE),
+        ("EMAIL", EMAIL_RE),
+        ("TC_KIMLIK", TC_KIMLIK_RE),
+        ("BIRTH_DATE", BIRTH_DATE_RE),
+        ("PHONE", PHONE_90_RE),
+        ("PHONE", PHONE_TR_RE),
+        ("PHONE", PHONE_INTL_RE),
+    )
+
     def __init__(self):
         self._mapping: Dict[str, str] = {}   # placeholder → real value
+        self._placeholders: Dict[str, str] = {}   # real value → placeholder
         self._counters: Dict[str, int] = {}
         # Locally extracted PII (authoritative source)
         self.extracted_pii: Dict[str, Optional[str]] = {
@@ -96,27 +113,50 @@ class CVAnonymizer:
         self._counters[category] = count
         return f"[{category}_{count}]"
 
-    def _mask(self, text: str, pattern: re.Pattern, category: str) -> str:
-        """Find all matches for pattern and replace with placeholders."""
-        matches = list(pattern.finditer(text))
-        for match in reversed(matches):
-            original = match.group(0).strip()
-            if not original or len(original) < 3:
-                continue
-            # Skip regions that already have a placeholder
-            if _PLACEHOLDER_RE.search(match.group(0)):
-                continue
-            # Reuse placeholder for duplicate values
-            existing = None
-            for ph, val in self._mapping.items():
-                if val == original:
-                    existing = ph
-                    break
-            placeholder = existing or self._next_placeholder(category)
-            if not existing:
-                self._mapping[placeholder] = original
-            text = text[:match.start()] + placeholder + text[match.end():]
-        return text
+    def _placeholder_for(self, value: str, category: str) -> str:
+        """Placeholder for a value, reusing it for duplicate values"""
+        placeholder = self._placeholders.get(value)
+        if placeholder is None:
+            placeholder = self._next_placeholder(category)
+            self._placeholders[value] = placeholder
+            self._mapping[placeholder] = value
+        return placeholder
+
+    def _mask(self, text: str) -> str:
+        """
+        Replace PII matches with placeholders.
+
+        Matches are collected as (start, end, placeholder) spans over the
+        original text; each pattern scans only the gaps between spans claimed
+        by earlier patterns, and the masked text is built with one join.
+        """
+        spans: List[Tuple[int, int, str]] = []
+        for category, pattern in self.MASK_PATTERNS:
+            found: List[Tuple[int, int, str]] = []
+            gap_start = 0
+            for start, end in [(s, e) for s, e, _ in spans] + [(len(text), len(text))]:
+                for match in pattern.finditer(text, gap_start, start):
+                    original = match.group(0).strip()
+                    if not original or len(original) < 3:
+                        continue
+                    # Skip regions that already have a placeholder
+                    if _PLACEHOLDER_RE.search(match.group(0)):
+                        continue
+                    found.append((match.start(), match.end(), self._placeholder_for(original, category)))
+                gap_start = end
+            if found:
+                spans = sorted(spans + found)
+
+        if not spans:
+            return text
+        parts: List[str] = []
+        last = 0
+        for start, end, placeholder in spans:
+            parts.append(text[last:start])
+            parts.append(placeholder)
+            last = end
+        parts.append(text[last:])
+        return ''.join(parts)
 
     def _extract_first(self, text: str, pattern: re.Pattern) -> Optional[str]:
         """Extract first match of pattern from text."""
@@ -188,6 +228,7 @@ class CVAnonymizer:
 
         return ""
 
+    @traced()
     def anonymize(self, cv_text: str) -> Tuple[str, Dict[str, str]]:
         """
         Anonymize PII in CV text and extract PII locally.
@@ -199,6 +240,7 @@ class CVAnonymizer:
             Tuple of (anonymized_text, mapping_dict)
         """
         self._mapping = {}
+        self._placeholders = {}
         self._counters = {}
         self.extracted_pii = {
             'name': None, 'email': None, 'phone': None,
@@ -258,16 +300,7 @@ class CVAnonymizer:
 
         # ── Step 2: Mask PII in text ─────────────────────────────
 
-        # Order: URLs first (contain sub-patterns), then specific PII
-        text = self._mask(text, self.LINKEDIN_RE, "LINKEDIN")
-        text = self._mask(text, self.GITHUB_RE, "GITHUB")
-        text = self._mask(text, self.URL_RE, "URL")
-        text = self._mask(text, self.EMAIL_RE, "EMAIL")
-        text = self._mask(text, self.TC_KIMLIK_RE, "TC_KIMLIK")
-        text = self._mask(text, self.BIRTH_DATE_RE, "BIRTH_DATE")
-        text = self._mask(text, self.PHONE_90_RE, "PHONE")
-        text = self._mask(text, self.PHONE_TR_RE, "PHONE")
-        text = self._mask(text, self.PHONE_INTL_RE, "PHONE")
+        text = self._mask(text)
 
         # Mask name last (after other PII is masked)
         if name:
@@ -280,6 +313,7 @@ class CVAnonymizer:
 
         return text, dict(self._mapping)
 
+    @traced()
     def inject_pii_into_parsed(self, parsed_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Inject locally-extracted PII into the AI-parsed result.
@@ -297,12 +331,13 @@ class CVAnonymizer:
         """
         mapping = self._mapping
 
+        def _restore(match: re.Match) -> str:
+            return mapping.get(match.group(0), match.group(0))
+
         # ── Safety net: replace any remaining placeholders everywhere ──
         def _replace_in_value(value):
             if isinstance(value, str):
-                for placeholder, real_value in mapping.items():
-                    value = value.replace(placeholder, real_value)
-                return value
+                return _PLACEHOLDER_RE.sub(_restore, value) if '[' in value else value
             elif isinstance(value, dict):
                 return {k: _replace_in_value(v) for k, v in value.items()}
             elif isinstance(value, list):
@@ -7,7 +7,7 @@ import logging
 import re
 from typing import Any, Dict, Optional
 
-from app.services.openai_client import get_openai_client
+from app.services.llm_provider import get_llm
 from app.prompts.cv_compare_prompt import get_cv_compare_prompt
 
 logger = logging.getLogger(__name__)
@@ -120,13 +120,13 @@ def _build_fallback_evaluation(
 
 
 class CVCompareService:
-    def __init__(self, model: str = "gpt-4o-mini") -> None:
+    def __init__(self) -> None:
         try:
-            self.client = get_openai_client()
+            self.llm = get_llm()
+            self.llm.resolve("cv_compare")
         except Exception as e:
-            logger.warning(f"OpenAI client init failed, will use fallback: {e}")
-            self.client = None
-        self.model = model
+            logger.warning(f"LLM provider init failed, will use fallback: {e}")
+            self.llm = None
 
     async def compare_two_cvs(
         self,
@@ -137,8 +137,8 @@ class CVCompareService:
     ) -> Dict[str, Any]:
         prompt = get_cv_compare_prompt(candidate_a, candidate_b, job, language)
         
-        # If client is unavailable, skip AI and return fallback directly
-        if not self.client:
+        # If the provider is unavailable, skip AI and return fallback directly
+        if not self.llm:
             return _build_fallback_evaluation(candidate_a, candidate_b, job)
         
         try:
@@ -158,17 +158,14 @@ class CVCompareService:
                     "JSON anahtarlarını İngilizce olarak belirtildiği gibi kullan."
                 )
             
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_message},
-                    {"role": "user", "content": prompt},
-                ],
+            response = await self.llm.complete(
+                "cv_compare",
+                system_message,
+                prompt,
                 temperature=0.3,
                 max_tokens=1000,
-                response_format={"type": "json_object"},
             )
-            raw = response.choices[0].message.content or ""
+            raw = response.text
             data = _extract_json(raw)
             
             if not data:
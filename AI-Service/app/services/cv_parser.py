@@ -10,7 +10,9 @@ from io import BytesIO
 from typing import Dict, Any, Optional
 from app.services.openai_client import openai_client
 from app.services.anonymizer import CVAnonymizer
+from app.services.telemetry import traced
 from app.prompts.cv_parsing_prompt import SYSTEM_PROMPT, get_user_prompt
+from app.utils.cv_features import DERIVED_KEY, extract_cv_features
 
 logger = logging.getLogger(__name__)
 
@@ -68,6 +70,7 @@ class CVParserService:
             raise Exception(f"Failed to extract text from DOCX: {str(e)}")
     
     @staticmethod
+    @traced("extract_text")
     def extract_text(file_content: bytes, filename: str) -> str:
         """
         Extract text from CV file based on extension
@@ -88,6 +91,7 @@ class CVParserService:
         else:
             raise Exception(f"Unsupported file format: {extension}")
     
+    @traced()
     async def parse_cv(self, cv_text: str) -> Dict[str, Any]:
         """
         Parse CV text using AI with KVKK-compliant anonymization.
@@ -141,6 +145,9 @@ class CVParserService:
                 f"(name={anonymizer.extracted_pii.get('name', 'N/A')})"
             )
             
+            # ── Step 4: Derive matching features once (stored with the CV) ──
+            parsed_data[DERIVED_KEY] = extract_cv_features(parsed_data, cv_text)
+            
             return parsed_data
             
         except Exception as e:
@@ -0,0 +1,175 @@
+"""
+Embedding Service
+Text embeddings for semantic job/candidate search, with pluggable backends.
+
+Backends (``EMBEDDING_BACKEND``):
+- ``hashing``: signed feature hashing of word uni/bigrams. Fully offline,
+  deterministic, no model download; good enough for keyword-heavy CV text.
+- ``sentence_transformers``: a local sentence-transformers model
+  (``EMBEDDING_MODEL``); needs the optional ``sentence-transformers`` package.
+- ``openai``: OpenAI embeddings API (``EMBEDDING_MODEL``).
+
+Every backend returns L2-normalized vectors of ``EMBEDDING_DIMENSIONS`` so they
+fit the ``vector(1536)`` columns; shorter model outputs are zero-padded, which
+leaves cosine similarity unchanged.
+"""
+
+import hashlib
+import logging
+import re
+from typing import List, Optional
+
+import numpy as np
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_TR_MAP = str.maketrans({
+    'İ': 'i', 'I': 'i', 'Ğ': 'g', 'Ü': 'u', 'Ş': 's', 'Ö': 'o', 'Ç': 'c',
+    'ı': 'i', 'ğ': 'g', 'ü': 'u', 'ş': 's', 'ö': 'o', 'ç': 'c',
+})
+_TOKEN_RE = re.compile(r"[a-z0-9+#.]+")
+
+
+def _fit(vectors: np.ndarray, dimensions: int) -> np.ndarray:
+    """Pad/truncate to ``dimensions`` and L2-normalize each row"""
+    n, d = vectors.shape
+    if d < dimensions:
+        vectors = np.hstack([vectors, np.zeros((n, dimensions - d), dtype=vectors.dtype)])
+    elif d > dimensions:
+        vectors = vectors[:, :dimensions]
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms == 0, 1.0, norms)
+
+
+class EmbeddingBackend:
+    """Backend interface: texts -> (n, d) float array"""
+
+    name = "base"
+    model_name: Optional[str] = None
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        raise NotImplementedError
+
+
+class HashingEmbeddingBackend(EmbeddingBackend):
+    """Offline embeddings via the hashing trick (no model, no network)"""
+
+    name = "hashing"
+
+    def __init__(self, dimensions: int) -> None:
+        self.dimensions = dimensions
+
+    def _features(self, text: str) -> List[str]:
+        tokens = _TOKEN_RE.findall((text or "").translate(_TR_MAP).lower())
+        tokens = [t.strip(".") for t in tokens if t.strip(".")]
+        return tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dimensions), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature in self._features(text):
+                # Stable across processes (unlike hash()), so stored vectors stay comparable
+                digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+                value = int.from_bytes(digest, "little")
+                sign = 1.0 if value & 1 else -1.0
+                vectors[row, (value >> 1) % self.dimensions] += sign
+        # Sublinear term frequency keeps repeated words from dominating
+        return np.sign(vectors) * np.log1p(np.abs(vectors))
+
+
+class SentenceTransformerBackend(EmbeddingBackend):
+    """Local transformer model; loaded once on first use"""
+
+    name = "sentence_transformers"
+
+    def __init__(self, model_name: str) -> None:
+        from sentence_transformers import SentenceTransformer
+
+        self.model = SentenceTransformer(model_name)
+        self.model_name = model_name
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        return np.asarray(self.model.encode(texts, batch_size=32, show_progress_bar=False), dtype=np.float32)
+
+
+class OpenAIEmbeddingBackend(EmbeddingBackend):
+    """OpenAI embeddings API"""
+
+    name = "openai"
+
+    def __init__(self, model_name: str, dimensions: int) -> None:
+        from app.services.openai_client import get_openai_client
+
+        self.client = get_openai_client()
+        self.model_name = model_name
+        self.dimensions = dimensions
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        response = self.client.embeddings.create(model=self.model_name, input=texts)
+        return np.asarray([item.embedding for item in response.data], dtype=np.float32)
+
+
+class EmbeddingService:
+    """Embeds texts with the configured backend, in batches."""
+
+    def __init__(self, backend: EmbeddingBackend, dimensions: int, batch_size: int = 64) -> None:
+        self.backend = backend
+        self.dimensions = dimensions
+        self.batch_size = batch_size
+
+    @property
+    def model(self) -> str:
+        """Identifies the vector space: vectors with different ids must not be compared"""
+        parts = [self.backend.name, self.backend.model_name, str(self.dimensions)]
+        return ":".join(p for p in parts if p)
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed a list of texts.
+
+        Returns:
+            One L2-normalized vector of ``dimensions`` floats per text
+        """
+        if not texts:
+            return []
+        chunks = [
+            self.backend.embed(texts[i:i + self.batch_size])
+            for i in range(0, len(texts), self.batch_size)
+        ]
+        return _fit(np.vstack(chunks).astype(np.float32), self.dimensions).tolist()
+
+
+_DEFAULT_MODELS = {
+    "sentence_transformers": "paraphrase-multilingual-MiniLM-L12-v2",  # TR + EN, 384 dims
+    "openai": "text-embedding-3-small",  # 1536 dims
+}
+
+
+def _build_backend() -> EmbeddingBackend:
+    backend = settings.EMBEDDING_BACKEND
+    model_name = settings.EMBEDDING_MODEL or _DEFAULT_MODELS.get(backend)
+    if backend == "sentence_transformers":
+        try:
+            return SentenceTransformerBackend(model_name)
+        except Exception as e:
+            logger.warning(f"sentence-transformers unavailable ({e}); falling back to hashing embeddings")
+    elif backend == "openai":
+        return OpenAIEmbeddingBackend(model_name, settings.EMBEDDING_DIMENSIONS)
+    return HashingEmbeddingBackend(settings.EMBEDDING_DIMENSIONS)
+
+
+# Create a singleton instance
+_embedding_service: Optional[EmbeddingService] = None
+
+
+def get_embedding_service() -> EmbeddingService:
+    """Get or create the embedding service instance."""
+    global _embedding_service
+
+    if _embedding_service is None:
+        _embedding_service = EmbeddingService(_build_backend(), settings.EMBEDDING_DIMENSIONS)
+        logger.info(f"Embedding model: {_embedding_service.model}")
+
+    return _embedding_service
@@ -1,12 +1,13 @@
 """
 Interview Analyzer Service
-AI-powered interview response analysis using OpenAI
+AI-powered interview response analysis using the configured LLM provider
 """
 import json
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, AsyncIterator, List, Optional
 from datetime import datetime
 
-from app.services.openai_client import get_openai_client
+from app.services.llm_provider import get_llm
+from app.utils.json_stream import JSONStreamParser
 
 
 # ============================================
@@ -163,7 +164,7 @@ class InterviewAnalyzerService:
     """Service for analyzing interview responses using AI"""
     
     def __init__(self):
-        self.client = get_openai_client()
+        self.llm = get_llm()
     
     async def analyze_interview(
         self,
@@ -182,56 +183,21 @@ class InterviewAnalyzerService:
         Returns:
             Analysis results with categories and scores
         """
-        # Format Q&A for prompt
-        qa_text = ""
-        for qa in sorted(questions_answers, key=lambda x: x.get("order", 0)):
-            qa_text += f"Soru {qa.get('order', '?')}: {qa.get('question', '')}\n"
-            qa_text += f"Cevap: {qa.get('answer', '[Cevap verilmedi]')}\n\n"
-        
-        # Select prompt based on language
-        prompt_template = INTERVIEW_ANALYSIS_PROMPT_TR if language == "tr" else INTERVIEW_ANALYSIS_PROMPT_EN
-        
-        # Build prompt
-        prompt = prompt_template.format(
-            job_title=job_context.get("title", "Belirtilmemiş"),
-            job_description=job_context.get("description", "Belirtilmemiş"),
-            job_requirements=job_context.get("requirements", "Belirtilmemiş"),
-            questions_answers=qa_text,
-            current_time=datetime.utcnow().isoformat(),
-        )
+        prompt = self._build_prompt(job_context, questions_answers, language)
         
         try:
-            # Call OpenAI
-            response = self.client.chat.completions.create(
-                model="gpt-4o",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert HR interview evaluator. Always respond in valid JSON format."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
+            # Call the configured LLM provider (OpenAI default: gpt-4o)
+            response = await self.llm.complete(
+                "interview_analysis",
+                "You are an expert HR interview evaluator. Always respond in valid JSON format.",
+                prompt,
                 temperature=0.3,
                 max_tokens=2000,
-                response_format={"type": "json_object"}
             )
             
             # Parse response
-            result_text = response.choices[0].message.content
-            result = json.loads(result_text)
-            
-            # Validate and add timestamp if missing
-            if "analyzed_at" not in result:
-                result["analyzed_at"] = datetime.utcnow().isoformat()
-            
-            # Ensure overall_score is a float
-            if "overall_score" in result:
-                result["overall_score"] = float(result["overall_score"])
-            
-            return result
+            result_text = response.text
+            return self._finalize(json.loads(result_text))
             
         except json.JSONDecodeError as e:
             # If JSON parsing fails, return a default error response
@@ -250,6 +216,67 @@ class InterviewAnalyzerService:
                 "analyzed_at": datetime.utcnow().isoformat(),
                 "error": str(e)
             }
+    
+    async def stream_analysis(
+        self,
+        job_context: Dict[str, Any],
+        questions_answers: List[Dict[str, Any]],
+        language: str = "tr"
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streaming variant of analyze_interview.
+        
+        Yields JSONStreamParser events (each category as soon as it is
+        written, summary text deltas) and finally ``{"event": "done", "data": result}``.
+        Raises instead of returning an error result.
+        """
+        prompt = self._build_prompt(job_context, questions_answers, language)
+        parser = JSONStreamParser()
+        async for chunk in self.llm.stream(
+            "interview_analysis",
+            "You are an expert HR interview evaluator. Always respond in valid JSON format.",
+            prompt,
+            temperature=0.3,
+            max_tokens=2000,
+        ):
+            for event in parser.feed(chunk):
+                yield event
+        yield {"event": "done", "data": self._finalize(parser.result())}
+    
+    def _build_prompt(
+        self,
+        job_context: Dict[str, Any],
+        questions_answers: List[Dict[str, Any]],
+        language: str
+    ) -> str:
+        # Format Q&A for prompt
+        qa_text = ""
+        for qa in sorted(questions_answers, key=lambda x: x.get("order", 0)):
+            qa_text += f"Soru {qa.get('order', '?')}: {qa.get('question', '')}\n"
+            qa_text += f"Cevap: {qa.get('answer', '[Cevap verilmedi]')}\n\n"
+        
+        # Select prompt based on language
+        prompt_template = INTERVIEW_ANALYSIS_PROMPT_TR if language == "tr" else INTERVIEW_ANALYSIS_PROMPT_EN
+        
+        # Build prompt
+        return prompt_template.format(
+            job_title=job_context.get("title", "Belirtilmemiş"),
+            job_description=job_context.get("description", "Belirtilmemiş"),
+            job_requirements=job_context.get("requirements", "Belirtilmemiş"),
+            questions_answers=qa_text,
+            current_time=datetime.utcnow().isoformat(),
+        )
+    
+    def _finalize(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        # Validate and add timestamp if missing
+        if "analyzed_at" not in result:
+            result["analyzed_at"] = datetime.utcnow().isoformat()
+        
+        # Ensure overall_score is a float
+        if "overall_score" in result:
+            result["overall_score"] = float(result["overall_score"])
+        
+        return result
 
 
 # Singleton instance
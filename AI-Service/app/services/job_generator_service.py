@@ -1,15 +1,16 @@
 """
 Job Generator Service
-Generates professional job postings using OpenAI GPT-4o-mini.
+Generates professional job postings using the configured LLM provider.
 """
 
 import json
 import re
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, AsyncIterator, List, Tuple
 
-from app.services.openai_client import get_openai_client
+from app.services.llm_provider import get_llm
 from app.prompts.job_description_generator_prompt import get_job_description_generator_prompt
+from app.utils.json_stream import JSONStreamParser
 
 logger = logging.getLogger(__name__)
 
@@ -18,8 +19,7 @@ class JobGeneratorService:
     """Service for generating job descriptions with AI."""
     
     def __init__(self):
-        self.client = get_openai_client()
-        self.model = "gpt-4o-mini"
+        self.llm = get_llm()
     
     async def generate_job_description(
         self,
@@ -51,112 +51,170 @@ class JobGeneratorService:
             Dictionary containing generated job data matching DB schema
         
         Raises:
-            Exception: If OpenAI API call fails or validation fails
+            Exception: If the LLM call fails or validation fails
         """
         try:
-            # Generate the prompt
-            prompt = get_job_description_generator_prompt(
-                position=position,
-                department=department,
-                location=location,
-                employment_type=employment_type,
-                experience_level=experience_level,
-                required_skills=required_skills or [],
-                required_languages=required_languages or [],
-                additional_notes=additional_notes,
-                language=language
+            system_message, prompt = self._build_messages(
+                position, department, location, employment_type, experience_level,
+                required_skills, required_languages, additional_notes, language
             )
             
-            logger.info(
-                f"Generating job description for position: {position} "
-                f"in {language}"
-            )
-            
-            # Build skills context for system message
-            skills_list = required_skills or []
-            skills_context = ", ".join(skills_list) if skills_list else ""
-            
-            # Dynamic system message based on language
-            if language == "english":
-                skills_msg = ""
-                if skills_context:
-                    skills_msg = (
-                        f"CRITICAL: The user specified these competencies: \"{skills_context}\". "
-                        "These competencies define the DOMAIN/INDUSTRY of the job. "
-                        "ALL content (description, tasks, requirements, keywords) MUST be specific to this domain. "
-                    )
-                system_message = (
-                    "You are an expert HR specialist. "
-                    "Create professional job descriptions in English. "
-                    "Follow the exact JSON structure. "
-                    f"Title MUST be exactly \"{position}\". "
-                    f"{skills_msg}"
-                    "The department field is ONLY organizational and must NOT influence job content."
-                )
-            else:  # turkish (default)
-                skills_msg = ""
-                if skills_context:
-                    skills_msg = (
-                        f"KRİTİK: Kullanıcı şu yetkinlikleri belirtti: \"{skills_context}\". "
-                        "Bu yetkinlikler ilanın ALANINI/SEKTÖRÜNÜ belirler. "
-                        "TÜM içerik (tanım, görevler, nitelikler, anahtar kelimeler) bu alana ÖZGÜ olmalı. "
-                    )
-                system_message = (
-                    "Sen uzman bir İK uzmanısın. "
-                    "Profesyonel iş ilanları oluştur. Tüm çıktı Türkçe olmalı. "
-                    "JSON yapısına tam uy. "
-                    f"title MUTLAKA \"{position}\" olmalı. "
-                    f"{skills_msg}"
-                    "Departman sadece organizasyonel bilgidir, içeriği etkilemez."
-                )
-            
-            # Call OpenAI API
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": system_message
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
+            # Call the configured LLM provider
+            response = await self.llm.complete(
+                "job_generation",
+                system_message,
+                prompt,
                 temperature=0.35,  # Low temperature for strict instruction following
                 max_tokens=2500,
-                response_format={"type": "json_object"}  # Ensure JSON response
             )
             
             # Extract and parse the response
-            job_data_text = response.choices[0].message.content
-            job_data = json.loads(job_data_text)
-            
-            # Post-processing: Force title and ensure domain keywords from skills
-            job_data = self._enforce_position_fidelity(job_data, position, required_skills or [])
-            
-            # Validate the generated data
-            self._validate_generated_job(job_data)
-            
-            # Add metadata
-            job_data['generated_by_ai'] = True
-            job_data['language'] = language
-            
-            logger.info(
-                f"Job description generated successfully: {job_data.get('title')} "
-                f"with {len(job_data.get('keywords', []))} keywords"
-            )
-            
-            return job_data
+            job_data = json.loads(response.text)
+            return self._finalize(job_data, position, required_skills, language)
             
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse OpenAI response as JSON: {e}")
+            logger.error(f"Failed to parse AI response as JSON: {e}")
             raise Exception("Invalid JSON response from AI service")
         
         except Exception as e:
             logger.error(f"Error in job description generation: {str(e)}")
             raise Exception(f"Failed to generate job description: {str(e)}")
     
+    async def stream_job_description(
+        self,
+        position: str,
+        department: str = None,
+        location: str = None,
+        employment_type: str = "full_time",
+        experience_level: str = None,
+        required_skills: list = None,
+        required_languages: list = None,
+        additional_notes: str = None,
+        language: str = "turkish"
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streaming variant of generate_job_description.
+        
+        Yields JSONStreamParser events (title/description text deltas, keyword
+        items, finished fields) while the model writes, then
+        ``{"event": "done", "data": job_data}`` with the same post-processed,
+        validated result generate_job_description returns.
+        
+        Raises:
+            Exception: If the LLM call fails or validation fails
+        """
+        system_message, prompt = self._build_messages(
+            position, department, location, employment_type, experience_level,
+            required_skills, required_languages, additional_notes, language
+        )
+        parser = JSONStreamParser()
+        try:
+            async for chunk in self.llm.stream(
+                "job_generation",
+                system_message,
+                prompt,
+                temperature=0.35,
+                max_tokens=2500,
+            ):
+                for event in parser.feed(chunk):
+                    yield event
+            job_data = parser.result()
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse AI response as JSON: {e}")
+            raise Exception("Invalid JSON response from AI service")
+        
+        yield {"event": "done", "data": self._finalize(job_data, position, required_skills, language)}
+    
+    def _build_messages(
+        self,
+        position: str,
+        department: str = None,
+        location: str = None,
+        employment_type: str = "full_time",
+        experience_level: str = None,
+        required_skills: list = None,
+        required_languages: list = None,
+        additional_notes: str = None,
+        language: str = "turkish"
+    ) -> Tuple[str, str]:
+        """System message and user prompt for a generation request"""
+        # Generate the prompt
+        prompt = get_job_description_generator_prompt(
+            position=position,
+            department=department,
+            location=location,
+            employment_type=employment_type,
+            experience_level=experience_level,
+            required_skills=required_skills or [],
+            required_languages=required_languages or [],
+            additional_notes=additional_notes,
+            language=language
+        )
+        
+        logger.info(
+            f"Generating job description for position: {position} "
+            f"in {language}"
+        )
+        
+        # Build skills context for system message
+        skills_list = required_skills or []
+        skills_context = ", ".join(skills_list) if skills_list else ""
+        
+        # Dynamic system message based on language
+        if language == "english":
+            skills_msg = ""
+            if skills_context:
+                skills_msg = (
+                    f"CRITICAL: The user specified these competencies: \"{skills_context}\". "
+                    "These competencies define the DOMAIN/INDUSTRY of the job. "
+                    "ALL content (description, tasks, requirements, keywords) MUST be specific to this domain. "
+                )
+            system_message = (
+                "You are an expert HR specialist. "
+                "Create professional job descriptions in English. "
+                "Follow the exact JSON structure. "
+                f"Title MUST be exactly \"{position}\". "
+                f"{skills_msg}"
+                "The department field is ONLY organizational and must NOT influence job content."
+            )
+        else:  # turkish (default)
+            skills_msg = ""
+            if skills_context:
+                skills_msg = (
+                    f"KRİTİK: Kullanıcı şu yetkinlikleri belirtti: \"{skills_context}\". "
+                    "Bu yetkinlikler ilanın ALANINI/SEKTÖRÜNÜ belirler. "
+                    "TÜM içerik (tanım, görevler, nitelikler, anahtar kelimeler) bu alana ÖZGÜ olmalı. "
+                )
+            system_message = (
+                "Sen uzman bir İK uzmanısın. "
+                "Profesyonel iş ilanları oluştur. Tüm çıktı Türkçe olmalı. "
+                "JSON yapısına tam uy. "
+                f"title MUTLAKA \"{position}\" olmalı. "
+                f"{skills_msg}"
+                "Departman sadece organizasyonel bilgidir, içeriği etkilemez."
+            )
+        
+        return system_message, prompt
+    
+    def _finalize(self, job_data: Dict[str, Any], position: str, required_skills: list, language: str) -> Dict[str, Any]:
+        """Post-process and validate the model's JSON"""
+        # Post-processing: Force title and ensure domain keywords from skills
+        job_data = self._enforce_position_fidelity(job_data, position, required_skills or [])
+        
+        # Validate the generated data
+        self._validate_generated_job(job_data)
+        
+        # Add metadata
+        job_data['generated_by_ai'] = True
+        job_data['language'] = language
+        
+        logger.info(
+            f"Job description generated successfully: {job_data.get('title')} "
+            f"with {len(job_data.get('keywords', []))} keywords"
+        )
+        
+        return job_data
+    
     def _enforce_position_fidelity(self, data: Dict[str, Any], position: str, skills: List[str] = None) -> Dict[str, Any]:
         """
         Post-processing step to ensure the generated content faithfully
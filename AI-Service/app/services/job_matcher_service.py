@@ -1,17 +1,18 @@
 
 """
 Job Matcher Service
-Matches candidate CVs to job requirements using OpenAI.
+Matches candidate CVs to job requirements using the configured LLM provider.
 """
 
 import json
 import logging
-import unicodedata
 from typing import Dict, Any, Optional, Tuple
 
-from app.services.openai_client import get_openai_client
+from app.services.llm_provider import get_llm
 from app.prompts.cv_job_matching_prompt import get_cv_job_matching_prompt
-from app.utils.location_utils import compute_location_match
+from app.utils.cv_features import candidate_mentions_disability
+from app.utils.location_utils import compute_location_match, geocode_missing
+from app.utils.language_utils import norm_lang, norm_level
 
 logger = logging.getLogger(__name__)
 
@@ -38,8 +39,7 @@ class JobMatcherService:
     """Service for matching candidates to job requirements."""
     
     def __init__(self):
-        self.client = get_openai_client()
-        self.model = "gpt-4o-mini"  # Same model as CV parsing
+        self.llm = get_llm()
     
     async def match_cv_to_job(
         self,
@@ -58,7 +58,7 @@ class JobMatcherService:
             Dictionary containing analysis results with scores and recommendations
         
         Raises:
-            Exception: If OpenAI API call fails
+            Exception: If the LLM call fails
         """
         try:
             # Generate the matching prompt with language support
@@ -87,26 +87,17 @@ class JobMatcherService:
                     "Keep JSON keys and any enum/code values exactly as specified in English."
                 )
             
-            # Call OpenAI API
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": system_message
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
+            # Call the configured LLM provider
+            response = await self.llm.complete(
+                "job_matching",
+                system_message,
+                prompt,
                 temperature=0.3,  # Lower temperature for more consistent scoring
                 max_tokens=2000,
-                response_format={"type": "json_object"}  # Ensure JSON response
             )
             
             # Extract and parse the response
-            analysis_text = response.choices[0].message.content
+            analysis_text = response.text
             analysis_data = json.loads(analysis_text)
             
             # Validate the response structure
@@ -118,56 +109,20 @@ class JobMatcherService:
                 req_langs_raw = job_data.get('required_languages') or {}
                 req_langs_norm: Dict[str, Optional[str]] = {}
 
-                # Helper: normalize language names to canonical lowercase English
-                def _norm_lang(name: Any) -> str:
-                    if not isinstance(name, str):
-                        return ''
-                    s = name.strip().lower()
-                    # strip accents
-                    s = unicodedata.normalize('NFKD', s)
-                    s = ''.join(ch for ch in s if not unicodedata.combining(ch))
-                    # common mappings (TR -> EN and variants)
-                    mapping = {
-                        'turkce': 'turkish', 'türkçe': 'turkish', 'turkish': 'turkish',
-                        'ingilizce': 'english', 'english': 'english', 'en': 'english',
-                        'ispanyolca': 'spanish', 'spanish': 'spanish', 'espanol': 'spanish', 'español': 'spanish',
-                        'almanca': 'german', 'german': 'german', 'deutsch': 'german',
-                        'fransizca': 'french', 'francais': 'french', 'français': 'french', 'french': 'french',
-                        'italyanca': 'italian', 'italiano': 'italian', 'italian': 'italian',
-                        'portekizce': 'portuguese', 'portugues': 'portuguese', 'portuguese': 'portuguese',
-                        'arapca': 'arabic', 'arabic': 'arabic',
-                        'cince': 'chinese', 'chinese': 'chinese', 'mandarin': 'chinese',
-                        'japonca': 'japanese', 'japanese': 'japanese',
-                        'korece': 'korean', 'korean': 'korean',
-                        'hollandaca': 'dutch', 'dutch': 'dutch', 'nederlands': 'dutch',
-                        'yunanca': 'greek', 'greek': 'greek',
-                        'lehce': 'polish', 'polish': 'polish',
-                        'rusca': 'russian', 'russian': 'russian',
-                        'japonca': 'japanese',
-                    }
-                    return mapping.get(s, s)
-
-                # Helper: coerce levels to simple strings, keep as-is if unknown
-                def _norm_level(level: Any) -> Optional[str]:
-                    if not isinstance(level, str):
-                        return None
-                    lvl = level.strip()
-                    return lvl if lvl else None
-
                 # Build normalized required languages map
                 if isinstance(req_langs_raw, dict):
                     for k, v in req_langs_raw.items():
-                        nm = _norm_lang(k)
+                        nm = norm_lang(k)
                         if nm:
-                            req_langs_norm[nm] = _norm_level(v)
+                            req_langs_norm[nm] = norm_level(v)
                 elif isinstance(req_langs_raw, list):
                     for item in req_langs_raw:
                         if isinstance(item, dict):
-                            nm = _norm_lang(item.get('language') or item.get('name'))
+                            nm = norm_lang(item.get('language') or item.get('name'))
                             if nm:
-                                req_langs_norm[nm] = _norm_level(item.get('level'))
+                                req_langs_norm[nm] = norm_level(item.get('level'))
                         elif isinstance(item, str):
-                            nm = _norm_lang(item)
+                            nm = norm_lang(item)
                             if nm:
                                 req_langs_norm[nm] = None
 
@@ -181,7 +136,7 @@ class JobMatcherService:
                     for entry in lm:
                         if not isinstance(entry, dict):
                             continue
-                        lang_name = _norm_lang(entry.get('language'))
+                        lang_name = norm_lang(entry.get('language'))
                         if not lang_name:
                             continue
                         # Fill required_level from job if missing
@@ -308,6 +263,7 @@ class JobMatcherService:
                         personal = parsed.get('personal') or {}
                         cand_loc = personal.get('location') or personal.get('address')
                 # Always compute from our trusted sources (override AI-provided to ensure DB wins)
+                await geocode_missing([job_loc, cand_loc])
                 loc_match = compute_location_match(job_loc, cand_loc)
                 # Pretty-case city labels for UI
                 def _pretty_city(s):
@@ -402,132 +358,14 @@ class JobMatcherService:
         """
         Check if the candidate's CV mentions disability status.
         
-        Searches through:
-        - Parsed data (personal info, summary, experience descriptions)
-        - Raw CV text if available
-        - Name/title fields
+        Uses the flag derived at parse time (``parsed_data["_derived"]``, which
+        covers personal info, summary, experience, education, skills,
+        certifications, free-form sections and the raw CV text), plus the
+        name and raw text sent with the request.
         
         Returns True if disability-related keywords are found.
         """
-        import re
-        
-        # Disability-related keywords in Turkish and English
-        disability_keywords = [
-            # Turkish
-            'engelli', 'engellilik', 'engel durumu', 'engelli raporu',
-            'engelli sağlık kurulu', 'engelli kimlik', 'engelli kartı',
-            'bedensel engel', 'görme engel', 'işitme engel', 'ortopedik engel',
-            'zihinsel engel', 'süreğen hastalık', 'kronik hastalık',
-            'engelli oranı', 'engel oranı', '% engel',
-            'engelli personel', 'engelli çalışan', 'engelli aday',
-            'sağlık kurulu raporu', 'özürlü', 'özürlülük',
-            # English
-            'disabled', 'disability', 'handicap', 'impairment',
-            'disability report', 'disability certificate', 'disability card',
-            'physical disability', 'visual impairment', 'hearing impairment',
-            'orthopedic disability', 'chronic illness', 'chronic disease',
-            'disability rate', 'disability percentage',
-            'special needs', 'differently abled',
-        ]
-        
-        # Build a single regex pattern for efficiency
-        pattern = re.compile(
-            '|'.join(re.escape(kw) for kw in disability_keywords),
-            re.IGNORECASE
-        )
-        
-        # Collect all text from candidate data
-        text_parts = []
-        
-        # Name (might include "Engelli" designation)
-        if candidate_data.get('name'):
-            text_parts.append(str(candidate_data['name']))
-        
-        # Raw CV text
-        if candidate_data.get('cv_text'):
-            text_parts.append(str(candidate_data['cv_text']))
-        
-        # Parsed data
-        parsed = candidate_data.get('parsed_data') or {}
-        if isinstance(parsed, dict):
-            # Personal info
-            personal = parsed.get('personal') or {}
-            if isinstance(personal, dict):
-                for key, val in personal.items():
-                    if val:
-                        text_parts.append(str(val))
-            
-            # Summary
-            if parsed.get('summary'):
-                text_parts.append(str(parsed['summary']))
-            
-            # Experience descriptions
-            experiences = parsed.get('experience') or []
-            if isinstance(experiences, list):
-                for exp in experiences:
-                    if isinstance(exp, dict):
-                        for key in ['title', 'description', 'company']:
-                            if exp.get(key):
-                                text_parts.append(str(exp[key]))
-                    else:
-                        text_parts.append(str(exp))
-            
-            # Education
-            educations = parsed.get('education') or []
-            if isinstance(educations, list):
-                for edu in educations:
-                    if isinstance(edu, dict):
-                        for key, val in edu.items():
-                            if val:
-                                text_parts.append(str(val))
-                    else:
-                        text_parts.append(str(edu))
-            
-            # Skills (might mention disability-related skills)
-            skills = parsed.get('skills') or {}
-            if isinstance(skills, dict):
-                for key, val in skills.items():
-                    if isinstance(val, list):
-                        text_parts.extend(str(s) for s in val)
-                    elif val:
-                        text_parts.append(str(val))
-            
-            # Certifications (disability report could be listed)
-            certs = parsed.get('certifications') or []
-            if isinstance(certs, list):
-                for cert in certs:
-                    if isinstance(cert, dict):
-                        for key, val in cert.items():
-                            if val:
-                                text_parts.append(str(val))
-                    else:
-                        text_parts.append(str(cert))
-            
-            # Additional/other sections
-            for key in ['additional', 'other', 'notes', 'references', 'hobbies']:
-                if parsed.get(key):
-                    val = parsed[key]
-                    if isinstance(val, list):
-                        text_parts.extend(str(s) for s in val)
-                    elif isinstance(val, dict):
-                        for k, v in val.items():
-                            if v:
-                                text_parts.append(str(v))
-                    else:
-                        text_parts.append(str(val))
-        
-        # Search through all collected text
-        combined_text = ' '.join(text_parts)
-        
-        if pattern.search(combined_text):
-            return True
-        
-        # Also check for percentage patterns like "40% engelli" or "%40 engelli"
-        percent_pattern = re.compile(r'(%\s*\d+|\d+\s*%)\s*(engel|disability|handicap)', re.IGNORECASE)
-        if percent_pattern.search(combined_text):
-            return True
-        
-        return False
+        return candidate_mentions_disability(candidate_data)
 
     def _validate_analysis_data(self, data: Dict[str, Any]) -> None:
         """
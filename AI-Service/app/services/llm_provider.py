@@ -0,0 +1,502 @@
+"""
+LLM Provider
+Provider-agnostic JSON chat completions, routed per task.
+
+Providers:
+- ``openai``: OpenAI chat completions (``OPENAI_API_KEY``, ``MODEL_NAME``)
+- ``claude``: Anthropic messages API (``CLAUDE_API_KEY``, ``CLAUDE_MODEL_NAME``);
+  needs the optional ``anthropic`` package
+- ``stub``: deterministic local responses, no network. Lets the whole
+  parse -> match pipeline run offline (load tests, CI, local development).
+
+``AI_PROVIDER`` picks the default provider. ``LLM_TASK_ROUTES`` overrides it
+per task with ``"provider"``, ``"provider:model"`` or ``":model"`` (default
+provider, other model), e.g.
+``{"cv_parsing": "openai:gpt-4o-mini", "cv_compare": "claude"}``.
+
+Tasks: cv_parsing, job_matching, cv_compare, job_generation,
+interview_analysis, interview_questions, likert_questions.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Tuple
+
+from opentelemetry.trace import SpanKind, Status, StatusCode
+
+from app.config import settings
+from app.services.metrics import LLM_REQUESTS_IN_FLIGHT, observe_llm_call
+from app.services.telemetry import span, tracer
+from app.services.tracing import TraceRecord, get_trace_exporter, utcnow
+
+logger = logging.getLogger(__name__)
+
+# Models used before routing existed, kept as the OpenAI defaults per task
+_OPENAI_TASK_MODELS = {
+    "interview_analysis": "gpt-4o",
+}
+
+
+@dataclass
+class LLMResponse:
+    text: str
+    provider: str
+    model: str
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+    def json(self) -> Dict[str, Any]:
+        return json.loads(self.text)
+
+
+class LLMProvider:
+    """Provider interface: one system + user message in, (JSON) text out"""
+
+    name = "base"
+    default_model = ""
+
+    def model_for(self, task: str) -> str:
+        return self.default_model
+
+    async def complete(
+        self,
+        task: str,
+        system: str,
+        user: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        json_mode: bool = True,
+    ) -> LLMResponse:
+        raise NotImplementedError
+
+    async def stream(
+        self,
+        task: str,
+        system: str,
+        user: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        json_mode: bool = True,
+    ) -> AsyncIterator[str]:
+        """Text chunks of the completion as they are generated"""
+        response = await self.complete(task, system, user, model, temperature, max_tokens, json_mode)
+        yield response.text
+
+
+class OpenAIProvider(LLMProvider):
+    name = "openai"
+
+    def __init__(self, api_key: Optional[str], default_model: str) -> None:
+        from openai import AsyncOpenAI
+
+        self.client = AsyncOpenAI(api_key=api_key)
+        self.default_model = default_model
+
+    def model_for(self, task: str) -> str:
+        return _OPENAI_TASK_MODELS.get(task, self.default_model)
+
+    async def complete(self, task, system, user, model, temperature, max_tokens, json_mode=True) -> LLMResponse:
+        kwargs: Dict[str, Any] = {}
+        if json_mode:
+            kwargs["response_format"] = {"type": "json_object"}
+        response = await self.client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": system},
+                {"role": "user", "content": user},
+            ],
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs,
+        )
+        usage = response.usage
+        return LLMResponse(
+            text=response.choices[0].message.content or "",
+            provider=self.name,
+            model=model,
+            input_tokens=usage.prompt_tokens if usage else 0,
+            output_tokens=usage.completion_tokens if usage else 0,
+        )
+
+    async def stream(self, task, system, user, model, temperature, max_tokens, json_mode=True) -> AsyncIterator[str]:
+        kwargs: Dict[str, Any] = {}
+        if json_mode:
+            kwargs["response_format"] = {"type": "json_object"}
+        response = await self.client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": system},
+                {"role": "user", "content": user},
+            ],
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True,
+            **kwargs,
+        )
+        async for chunk in response:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+
+class AnthropicProvider(LLMProvider):
+    name = "claude"
+
+    def __init__(self, api_key: Optional[str], default_model: str) -> None:
+        from anthropic import AsyncAnthropic
+
+        self.client = AsyncAnthropic(api_key=api_key)
+        self.default_model = default_model
+
+    @staticmethod
+    def _messages(system: str, user: str, json_mode: bool) -> Tuple[str, list]:
+        messages = [{"role": "user", "content": user}]
+        if json_mode:
+            # No JSON mode in the messages API: ask for it and prefill the opening brace
+            system = f"{system}\n\nRespond with a single valid JSON object and nothing else."
+            messages.append({"role": "assistant", "content": "{"})
+        return system, messages
+
+    async def complete(self, task, system, user, model, temperature, max_tokens, json_mode=True) -> LLMResponse:
+        system, messages = self._messages(system, user, json_mode)
+        response = await self.client.messages.create(
+            model=model,
+            system=system,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        text = "".join(block.text for block in response.content if getattr(block, "type", "") == "text")
+        if json_mode:
+            text = "{" + text
+        return LLMResponse(
+            text=text,
+            provider=self.name,
+            model=model,
+            input_tokens=response.usage.input_tokens,
+            output_tokens=response.usage.output_tokens,
+        )
+
+    async def stream(self, task, system, user, model, temperature, max_tokens, json_mode=True) -> AsyncIterator[str]:
+        system, messages = self._messages(system, user, json_mode)
+        if json_mode:
+            yield "{"
+        async with self.client.messages.stream(
+            model=model,
+            system=system,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        ) as stream:
+            async for text in stream.text_stream:
+                yield text
+
+
+# ── Deterministic stub ────────────────────────────────────────────────
+
+_STUB_SKILLS = (
+    "python", "java", "javascript", "typescript", "react", "node.js", "sql", "postgresql",
+    "docker", "kubernetes", "aws", "git", "excel", "c#", ".net", "go", "graphql", "linux",
+)
+_STUB_CHUNK_CHARS = 16  # stream() chunk size, roughly a few tokens
+_STUB_LANGUAGES = {"ingilizce": "English", "english": "English", "almanca": "German", "german": "German"}
+
+
+def _digest(text: str) -> int:
+    return int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "big")
+
+
+def _section(text: str, header: str) -> str:
+    """Text after a ``**Header:**`` line up to the next blank line"""
+    match = re.search(rf"\*\*{re.escape(header)}:\*\*\n(.*?)(?:\n\n|$)", text, re.DOTALL)
+    return match.group(1).strip() if match else ""
+
+
+def _stub_cv_parsing(system: str, user: str) -> Dict[str, Any]:
+    lower = user.lower()
+    languages = list(dict.fromkeys(v for k, v in _STUB_LANGUAGES.items() if k in lower))
+    return {
+        "personal": {},
+        "summary": "Deterministic stub summary.",
+        "experience": [],
+        "education": [],
+        "skills": {
+            "technical": [s for s in _STUB_SKILLS if s in lower],
+            "languages": [{"language": lang, "level": "B2"} for lang in languages],
+        },
+        "certifications": [],
+        "projects": [],
+        "total_experience_years": _digest(user) % 15,
+    }
+
+
+def _stub_job_matching(system: str, user: str) -> Dict[str, Any]:
+    keywords = [k.strip() for k in _section(user, "Keywords/Skills Required").split(",") if k.strip() and k.strip() != "N/A"]
+    cv_text = user.split("**CANDIDATE CV INFORMATION:**", 1)[-1].lower()
+    matched = [k for k in keywords if k.lower() in cv_text]
+    seed = _digest(user)
+    breakdown = {
+        "experience_score": seed % 31,
+        "education_score": (seed >> 8) % 21,
+        "skills_score": round(30 * len(matched) / len(keywords)) if keywords else (seed >> 16) % 31,
+        "language_score": (seed >> 24) % 11,
+        "fit_score": (seed >> 32) % 11,
+    }
+    for part in ("experience", "education", "skills", "language", "fit"):
+        breakdown[f"{part}_reasoning"] = "Stub evaluation"
+    overall = sum(v for k, v in breakdown.items() if k.endswith("_score"))
+    recommendation = (
+        "highly_recommended" if overall >= 80 else
+        "recommended" if overall >= 65 else
+        "maybe" if overall >= 45 else
+        "not_recommended"
+    )
+    return {
+        "overall_score": overall,
+        "recommendation": recommendation,
+        "breakdown": breakdown,
+        "matched_skills": matched,
+        "missing_skills": [k for k in keywords if k not in matched],
+        "additional_skills": [],
+        "strengths": ["Stub strength"],
+        "weaknesses": ["Stub weakness"],
+        "summary": "Deterministic stub evaluation.",
+    }
+
+
+def _stub_job_generation(system: str, user: str) -> Dict[str, Any]:
+    return {
+        "title": "Stub Position",
+        "description": "<p>Stub job description.</p>",
+        "description_plain": "Stub job description.",
+        "requirements": "<ul><li>Stub requirement</li></ul>",
+        "requirements_plain": "Stub requirement",
+        "keywords": ["stub"],
+    }
+
+
+def _stub_interview_analysis(system: str, user: str) -> Dict[str, Any]:
+    score = 1 + _digest(user) % 5
+    return {
+        "overall_score": float(score),
+        "summary": "Deterministic stub evaluation.",
+        "categories": [],
+    }
+
+
+def _stub_questions(system: str, user: str) -> Dict[str, Any]:
+    questions = [{"text": f"Stub question {i}?", "type": "technical"} for i in range(1, 11)]
+    return {"questions": questions, "text": questions[0]["text"], "type": "technical"}
+
+
+def _stub_likert_questions(system: str, user: str) -> Dict[str, Any]:
+    questions = [{"text": f"Stub statement {i}.", "dimension": "leadership", "direction": "positive"} for i in range(1, 21)]
+    return {"questions": questions, **questions[0]}
+
+
+# cv_compare gets no stub payload: an answer without "aiEvaluation" makes
+# CVCompareService use its deterministic local evaluation
+_STUB_HANDLERS: Dict[str, Callable[[str, str], Dict[str, Any]]] = {
+    "cv_parsing": _stub_cv_parsing,
+    "job_matching": _stub_job_matching,
+    "job_generation": _stub_job_generation,
+    "interview_analysis": _stub_interview_analysis,
+    "interview_questions": _stub_questions,
+    "likert_questions": _stub_likert_questions,
+}
+
+
+class StubProvider(LLMProvider):
+    """Deterministic, offline responses shaped like each task's real output"""
+
+    name = "stub"
+    default_model = "stub"
+
+    async def complete(self, task, system, user, model, temperature, max_tokens, json_mode=True) -> LLMResponse:
+        if settings.STUB_LATENCY_MS > 0:
+            await asyncio.sleep(settings.STUB_LATENCY_MS / 1000)
+        handler = _STUB_HANDLERS.get(task)
+        text = json.dumps(handler(system, user) if handler else {}, ensure_ascii=False)
+        return LLMResponse(
+            text=text,
+            provider=self.name,
+            model=model,
+            input_tokens=(len(system) + len(user)) // 4,
+            output_tokens=len(text) // 4,
+        )
+
+    async def stream(self, task, system, user, model, temperature, max_tokens, json_mode=True) -> AsyncIterator[str]:
+        response = await self.complete(task, system, user, model, temperature, max_tokens, json_mode)
+        for start in range(0, len(response.text), _STUB_CHUNK_CHARS):
+            yield response.text[start:start + _STUB_CHUNK_CHARS]
+
+
+# ── Routing ───────────────────────────────────────────────────────────
+
+_PROVIDER_ALIASES = {"anthropic": "claude", "gpt": "openai"}
+
+
+def _build_provider(name: str) -> LLMProvider:
+    if name == "openai":
+        return OpenAIProvider(settings.OPENAI_API_KEY, settings.MODEL_NAME)
+    if name == "claude":
+        return AnthropicProvider(settings.CLAUDE_API_KEY, settings.CLAUDE_MODEL_NAME)
+    if name == "stub":
+        return StubProvider()
+    raise ValueError(f"Unknown AI provider: {name}")
+
+
+def _span_attributes(task: str, provider: LLMProvider, model: str) -> Dict[str, Any]:
+    return {"llm.task": task, "gen_ai.system": provider.name, "gen_ai.request.model": model}
+
+
+class LLMRouter:
+    """Resolves a task to (provider, model) and runs the completion."""
+
+    def __init__(self, default_provider: str, routes: Dict[str, str]) -> None:
+        self.default_provider = _PROVIDER_ALIASES.get(default_provider, default_provider)
+        self.routes = routes
+        self._providers: Dict[str, LLMProvider] = {}
+
+    def provider(self, name: str) -> LLMProvider:
+        if name not in self._providers:
+            self._providers[name] = _build_provider(name)
+        return self._providers[name]
+
+    def resolve(self, task: str) -> Tuple[LLMProvider, str]:
+        route = self.routes.get(task, "")
+        name, _, model = route.partition(":")
+        provider = self.provider(_PROVIDER_ALIASES.get(name, name) or self.default_provider)
+        return provider, model or provider.model_for(task)
+
+    async def complete(
+        self,
+        task: str,
+        system: str,
+        user: str,
+        temperature: float = 0.3,
+        max_tokens: int = 2000,
+        json_mode: bool = True,
+        trace_metadata: Optional[Dict[str, Any]] = None,
+    ) -> LLMResponse:
+        provider, model = self.resolve(task)
+        exporter = get_trace_exporter()
+        traced = exporter is not None and exporter.sampled(task)
+        in_flight = LLM_REQUESTS_IN_FLIGHT.labels(task)
+        in_flight.inc()
+        start = utcnow()
+        started = time.perf_counter()
+        response: Optional[LLMResponse] = None
+        error: Optional[str] = None
+        with span(f"llm {task}", SpanKind.CLIENT, **_span_attributes(task, provider, model)) as llm_span:
+            try:
+                response = await provider.complete(task, system, user, model, temperature, max_tokens, json_mode)
+                llm_span.set_attribute("gen_ai.usage.input_tokens", response.input_tokens)
+                llm_span.set_attribute("gen_ai.usage.output_tokens", response.output_tokens)
+                return response
+            except Exception as e:
+                error = str(e)
+                raise
+            finally:
+                in_flight.dec()
+                input_tokens = response.input_tokens if response else 0
+                output_tokens = response.output_tokens if response else 0
+                observe_llm_call(
+                    task, provider.name, model, time.perf_counter() - started,
+                    input_tokens, output_tokens, error is not None,
+                )
+                if traced:
+                    exporter.record(TraceRecord(
+                        name=task,
+                        model=model,
+                        provider=provider.name,
+                        system_prompt=system,
+                        user_prompt=user,
+                        output=response.text if response else None,
+                        input_tokens=input_tokens,
+                        output_tokens=output_tokens,
+                        start_time=start,
+                        end_time=utcnow(),
+                        error=error,
+                        metadata=trace_metadata or {},
+                    ))
+
+    async def stream(
+        self,
+        task: str,
+        system: str,
+        user: str,
+        temperature: float = 0.3,
+        max_tokens: int = 2000,
+        json_mode: bool = True,
+        trace_metadata: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[str]:
+        provider, model = self.resolve(task)
+        exporter = get_trace_exporter()
+        traced = exporter is not None and exporter.sampled(task)
+        in_flight = LLM_REQUESTS_IN_FLIGHT.labels(task)
+        in_flight.inc()
+        start = utcnow()
+        started = time.perf_counter()
+        chunks = []
+        error: Optional[str] = None
+        # Not made current: the generator may be resumed from another context
+        llm_span = tracer.start_span(f"llm {task}", kind=SpanKind.CLIENT, attributes=_span_attributes(task, provider, model))
+        try:
+            async for chunk in provider.stream(task, system, user, model, temperature, max_tokens, json_mode):
+                chunks.append(chunk)
+                yield chunk
+        except Exception as e:
+            error = str(e)
+            raise
+        finally:
+            in_flight.dec()
+            output = "".join(chunks)
+            # Streams report no usage; estimate like the stub does
+            input_tokens = (len(system) + len(user)) // 4
+            output_tokens = len(output) // 4
+            llm_span.set_attribute("gen_ai.usage.input_tokens", input_tokens)
+            llm_span.set_attribute("gen_ai.usage.output_tokens", output_tokens)
+            if error is not None:
+                llm_span.set_status(Status(StatusCode.ERROR, error))
+            llm_span.end()
+            observe_llm_call(
+                task, provider.name, model, time.perf_counter() - started,
+                input_tokens, output_tokens, error is not None,
+            )
+            if traced:
+                exporter.record(TraceRecord(
+                    name=task,
+                    model=model,
+                    provider=provider.name,
+                    system_prompt=system,
+                    user_prompt=user,
+                    output=output,
+                    input_tokens=input_tokens,
+                    output_tokens=output_tokens,
+                    start_time=start,
+                    end_time=utcnow(),
+                    error=error,
+                    metadata={**(trace_metadata or {}), "streamed": True},
+                ))
+
+
+# Create a singleton instance
+_llm_router: Optional[LLMRouter] = None
+
+
+def get_llm() -> LLMRouter:
+    """Get or create the LLM router instance."""
+    global _llm_router
+
+    if _llm_router is None:
+        _llm_router = LLMRouter(settings.AI_PROVIDER, settings.LLM_TASK_ROUTES)
+        logger.info(f"LLM provider: {_llm_router.default_provider} (routes: {settings.LLM_TASK_ROUTES or 'none'})")
+
+    return _llm_router
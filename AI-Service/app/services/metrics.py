@@ -0,0 +1,183 @@
+"""
+Prometheus Metrics
+Served at ``GET /metrics``.
+
+- HTTP latency per route template and requests in progress (queue depth)
+- LLM call latency, in-flight calls and token usage per task, provider and model
+- Cache lookups (prompt sections, coalesced AI results) and LangFuse export
+  counters, read from the existing objects at scrape time
+
+With several uvicorn workers set ``PROMETHEUS_MULTIPROC_DIR`` to a shared,
+empty directory: event metrics are then aggregated across workers, while
+scrape-time values describe the worker that answered.
+"""
+
+import os
+import time
+from typing import Any, Iterable, Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from prometheus_client.multiprocess import MultiProcessCollector
+from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# From local stub calls (ms) to long interview analyses (minutes)
+LATENCY_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120, 300)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "Requests being processed (AI-Service queue depth)",
+    multiprocess_mode="livesum",
+)
+
+LLM_REQUEST_DURATION = Histogram(
+    "llm_request_duration_seconds",
+    "LLM completion latency (streams: until the last chunk)",
+    ["task", "provider", "model", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+
+LLM_REQUESTS_IN_FLIGHT = Gauge(
+    "llm_requests_in_flight",
+    "LLM calls waiting on a provider",
+    ["task"],
+    multiprocess_mode="livesum",
+)
+
+LLM_TOKENS = Counter(
+    "llm_tokens_total",
+    "LLM token usage (streams are estimated)",
+    ["task", "provider", "model", "direction"],
+)
+
+CACHE_REQUESTS = Counter(
+    "cache_requests_total",
+    "Cache lookups by cache and result (hit/miss)",
+    ["cache", "result"],
+)
+
+
+def cache_outcome(cache: str) -> Tuple[Any, Any]:
+    """Pre-bound (hit, miss) counters for one cache"""
+    return CACHE_REQUESTS.labels(cache, "hit"), CACHE_REQUESTS.labels(cache, "miss")
+
+
+def observe_llm_call(
+    task: str,
+    provider: str,
+    model: str,
+    seconds: float,
+    input_tokens: int,
+    output_tokens: int,
+    error: bool,
+) -> None:
+    LLM_REQUEST_DURATION.labels(task, provider, model, "error" if error else "ok").observe(seconds)
+    if input_tokens:
+        LLM_TOKENS.labels(task, provider, model, "input").inc(input_tokens)
+    if output_tokens:
+        LLM_TOKENS.labels(task, provider, model, "output").inc(output_tokens)
+
+
+class RuntimeCollector:
+    """Counters and gauges the services already keep, read at scrape time"""
+
+    def describe(self) -> list:
+        # Registered at import time; do not touch the live objects until a scrape
+        return []
+
+    def collect(self) -> Iterable[Any]:
+        from app.services.tracing import get_trace_exporter
+        from app.utils.single_flight import get_single_flight
+
+        flight = get_single_flight()
+        results = CounterMetricFamily(
+            "ai_result_cache_requests",
+            "Match/compare requests by outcome: cached hit, coalesced onto an in-flight call, or miss",
+            labels=["result"],
+        )
+        results.add_metric(["hit"], flight.hits)
+        results.add_metric(["coalesced"], flight.coalesced)
+        results.add_metric(["miss"], flight.misses)
+        yield results
+
+        inflight = GaugeMetricFamily("ai_result_inflight_keys", "Distinct AI requests currently running")
+        inflight.add_metric([], len(flight._inflight))
+        yield inflight
+
+        exporter = get_trace_exporter()
+        if exporter is None:
+            return
+        buffered = GaugeMetricFamily("langfuse_buffer_depth", "Traces waiting for background export")
+        buffered.add_metric([], len(exporter._buffer))
+        yield buffered
+
+        traces = CounterMetricFamily("langfuse_traces", "Traces by outcome", labels=["outcome"])
+        traces.add_metric(["exported"], exporter.exported)
+        traces.add_metric(["dropped"], exporter.dropped)
+        traces.add_metric(["sampled_out"], exporter.sampled_out)
+        yield traces
+
+
+REGISTRY.register(RuntimeCollector())
+
+
+def metrics_response() -> Response:
+    """Prometheus text exposition of every metric in this process (or all workers)"""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        MultiProcessCollector(registry)
+        registry.register(RuntimeCollector())
+    else:
+        registry = REGISTRY
+    return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
+
+
+class MetricsMiddleware:
+    """ASGI middleware timing every HTTP request by its route template.
+
+    Streaming endpoints are timed until the last chunk was sent.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] == "/metrics":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        start = time.perf_counter()
+        HTTP_REQUESTS_IN_PROGRESS.inc()
+
+        async def send_wrapper(message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUESTS_IN_PROGRESS.dec()
+            route = scope.get("route")
+            path = getattr(route, "path", None) or "unmatched"
+            HTTP_REQUEST_DURATION.labels(scope["method"], path, str(status)).observe(
+                time.perf_counter() - start
+            )
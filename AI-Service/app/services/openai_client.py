@@ -1,42 +1,33 @@
 """
 OpenAI Client Wrapper
-Handles all OpenAI API calls with error handling
-Supports optional LangFuse integration for observability
+Structured (JSON) LLM calls with error handling, routed through the
+configured provider (see llm_provider), plus the raw OpenAI client for embeddings
+LangFuse tracing happens in the provider router (see tracing)
 """
 from openai import OpenAI
 from app.config import settings
 import json
 from typing import Dict, Any, Optional
-
-# LangFuse integration (optional)
-langfuse_client = None
-if settings.LANGFUSE_ENABLED and settings.LANGFUSE_SECRET_KEY and settings.LANGFUSE_PUBLIC_KEY:
-    try:
-        from langfuse import Langfuse
-        from langfuse.openai import openai as langfuse_openai
-        langfuse_client = Langfuse(
-            secret_key=settings.LANGFUSE_SECRET_KEY,
-            public_key=settings.LANGFUSE_PUBLIC_KEY,
-            host=settings.LANGFUSE_HOST
-        )
-        print("✅ LangFuse observability enabled")
-    except ImportError:
-        print("⚠️ LangFuse package not installed, running without observability")
-    except Exception as e:
-        print(f"⚠️ LangFuse initialization failed: {e}")
-else:
-    print("ℹ️ LangFuse disabled or not configured")
+from app.utils.token_utils import count_tokens
+from app.services.llm_provider import get_llm
 
 
 class OpenAIClient:
-    """Wrapper for OpenAI API calls with optional LangFuse tracing"""
+    """Wrapper for structured LLM calls"""
     
     def __init__(self):
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        self._client: Optional[OpenAI] = None
+        self.llm = get_llm()
         self.model = settings.MODEL_NAME
         self.max_tokens = settings.MAX_TOKENS
         self.temperature = settings.TEMPERATURE
-        self.langfuse = langfuse_client
+    
+    @property
+    def client(self) -> OpenAI:
+        """Raw OpenAI client, created on first use (not needed with other providers)"""
+        if self._client is None:
+            self._client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        return self._client
     
     async def get_structured_response(
         self, 
@@ -46,13 +37,13 @@ class OpenAIClient:
         trace_metadata: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
-        Get structured JSON response from OpenAI
+        Get structured JSON response from the LLM provider routed for the task
         
         Args:
             system_prompt: System role instructions
             user_prompt: User message with data to process
-            trace_name: Optional name for LangFuse trace (e.g., "cv_parsing", "job_matching")
-            trace_metadata: Optional metadata for LangFuse trace
+            trace_name: Routing task and LangFuse trace name (default "cv_parsing")
+            trace_metadata: Optional metadata for the LangFuse trace
             
         Returns:
             Parsed JSON response
@@ -60,77 +51,29 @@ class OpenAIClient:
         Raises:
             Exception: If API call fails or JSON parsing fails
         """
-        trace = None
-        generation = None
+        task = trace_name or "cv_parsing"
         
         try:
-            # Start LangFuse trace if enabled
-            if self.langfuse and trace_name:
-                trace = self.langfuse.trace(
-                    name=trace_name,
-                    metadata=trace_metadata or {}
-                )
-                generation = trace.generation(
-                    name=f"{trace_name}_generation",
-                    model=self.model,
-                    input={
-                        "system_prompt": system_prompt[:500] + "..." if len(system_prompt) > 500 else system_prompt,
-                        "user_prompt": user_prompt[:500] + "..." if len(user_prompt) > 500 else user_prompt
-                    }
-                )
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
+            response = await self.llm.complete(
+                task,
+                system_prompt,
+                user_prompt,
                 temperature=self.temperature,
                 max_tokens=self.max_tokens,
-                response_format={"type": "json_object"}  # Force JSON response
+                trace_metadata=trace_metadata,
             )
             
-            # Extract content
-            content = response.choices[0].message.content
-            
             # Parse JSON
-            parsed_data = json.loads(content)
-            
-            # Log to LangFuse if enabled
-            if generation:
-                generation.end(
-                    output=content[:1000] + "..." if len(content) > 1000 else content,
-                    usage={
-                        "input": response.usage.prompt_tokens if response.usage else 0,
-                        "output": response.usage.completion_tokens if response.usage else 0,
-                        "total": response.usage.total_tokens if response.usage else 0
-                    }
-                )
-            
-            if trace:
-                trace.update(status_message="success")
-            
-            return parsed_data
+            return json.loads(response.text)
             
         except json.JSONDecodeError as e:
-            if trace:
-                trace.update(status_message=f"JSON parse error: {str(e)}")
-            raise Exception(f"Failed to parse OpenAI response as JSON: {str(e)}")
+            raise Exception(f"Failed to parse AI response as JSON: {str(e)}")
         except Exception as e:
-            if trace:
-                trace.update(status_message=f"Error: {str(e)}")
-            raise Exception(f"OpenAI API call failed: {str(e)}")
-        finally:
-            # Flush LangFuse events
-            if self.langfuse:
-                try:
-                    self.langfuse.flush()
-                except:
-                    pass
+            raise Exception(f"AI API call failed: {str(e)}")
     
     def get_token_count(self, text: str) -> int:
-        """Estimate token count (rough approximation)"""
-        return len(text) // 4
+        """Token count with the model's tokenizer"""
+        return count_tokens(text, self.model)
 
 
 # Global client instance
@@ -0,0 +1,230 @@
+"""
+Candidate Prefilter Service
+Deterministic local ranking of candidates for a job, run before LLM matching.
+
+Each candidate gets five sub-scores in [0, 1] - experience, education, skills
+(job keyword overlap), languages and location - laid out as one row of a
+feature matrix. The overall score is that matrix times the same weights the
+matching prompt uses (30/20/30/10/10), so a prefilter score reads on the same
+0-100 scale as an LLM ``overall_score``, and ranking is one argsort.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from app.utils.cv_features import candidate_mentions_disability, get_cv_features
+from app.utils.language_utils import level_rank, norm_lang
+from app.utils.location_utils import compute_location_matches
+
+logger = logging.getLogger(__name__)
+
+FEATURES = ("experience", "education", "skills", "language", "location")
+WEIGHTS = np.array([30.0, 20.0, 30.0, 10.0, 10.0])
+
+# Expected months of experience per job level
+_EXPECTED_MONTHS = {"entry": 0, "junior": 12, "mid": 36, "senior": 60, "lead": 96}
+
+# Degree ranks; checked in order so "yüksek lisans"/"ön lisans" win over "lisans"
+_DEGREE_PATTERNS = (
+    (5, ("phd", "ph.d", "doctor", "doktora")),
+    (4, ("master", "msc", "m.sc", "mba", "yuksek lisans", "yüksek lisans")),
+    (2, ("associate", "on lisans", "ön lisans", "onlisans")),
+    (3, ("bachelor", "bsc", "b.sc", "b.a", "lisans", "undergraduate")),
+    (1, ("high school", "lise")),
+)
+_REQUIRED_DEGREE = {"high_school": 1, "associate": 2, "bachelor": 3, "master": 4, "phd": 5}
+
+
+def _degree_rank(text: Any) -> int:
+    if not isinstance(text, str):
+        return 0
+    s = text.lower()
+    for rank, patterns in _DEGREE_PATTERNS:
+        if any(p in s for p in patterns):
+            return rank
+    return 0
+
+
+def _parsed(candidate: Dict[str, Any]) -> Dict[str, Any]:
+    parsed = candidate.get("parsed_data") or {}
+    return parsed if isinstance(parsed, dict) else {}
+
+
+def _experience_months(candidate: Dict[str, Any]) -> float:
+    months = candidate.get("experience_months")
+    if isinstance(months, (int, float)) and months > 0:
+        return float(months)
+    parsed = _parsed(candidate)
+    years = parsed.get("total_experience_years")
+    if isinstance(years, (int, float)) and years > 0:
+        return float(years) * 12
+    total = 0.0
+    for exp in parsed.get("experience") or []:
+        if isinstance(exp, dict) and isinstance(exp.get("duration_months"), (int, float)):
+            total += exp["duration_months"]
+    return total
+
+
+def _candidate_languages(candidate: Dict[str, Any], features: Dict[str, Any]) -> Dict[str, int]:
+    ranks = dict(features["languages"])
+    # A Turkish CV means a native Turkish speaker (same rule as the matching prompt)
+    cv_language = candidate.get("cv_language") or _parsed(candidate).get("language")
+    if isinstance(cv_language, str) and cv_language.strip().upper() == "TR":
+        ranks["turkish"] = 5
+    return ranks
+
+
+def _required_languages(job_data: Dict[str, Any]) -> Dict[str, int]:
+    raw = job_data.get("required_languages") or {}
+    required: Dict[str, int] = {}
+    if isinstance(raw, dict):
+        items = list(raw.items())
+    elif isinstance(raw, list):
+        items = [
+            (item.get("language") or item.get("name"), item.get("level")) if isinstance(item, dict) else (item, None)
+            for item in raw
+        ]
+    else:
+        items = []
+    for name, level in items:
+        nm = norm_lang(name)
+        if nm:
+            required[nm] = level_rank(level)
+    return required
+
+
+def _candidate_location(candidate: Dict[str, Any]) -> Optional[str]:
+    loc = candidate.get("location") or candidate.get("city")
+    if not loc:
+        personal = _parsed(candidate).get("personal") or {}
+        if isinstance(personal, dict):
+            loc = personal.get("location") or personal.get("address")
+    return loc
+
+
+class CandidatePrefilterService:
+    """Scores and ranks candidates without calling the LLM."""
+
+    def locations(self, job_data: Dict[str, Any], candidates: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """Job and candidate locations used for the location feature"""
+        return [job_data.get("location") or job_data.get("city")] + [_candidate_location(c) for c in candidates]
+
+    def feature_matrix(self, job_data: Dict[str, Any], candidates: List[Dict[str, Any]]) -> np.ndarray:
+        """(n_candidates, len(FEATURES)) matrix of sub-scores in [0, 1]"""
+        n = len(candidates)
+        matrix = np.ones((n, len(FEATURES)))
+        if n == 0:
+            return matrix
+        features = [get_cv_features(c) for c in candidates]
+
+        # Experience: months relative to what the level expects
+        expected = _EXPECTED_MONTHS.get((job_data.get("experience_level") or "").lower())
+        if expected:
+            months = np.array([_experience_months(c) for c in candidates])
+            matrix[:, 0] = np.clip(months / expected, 0.0, 1.0)
+
+        # Education: full credit at or above the required degree, half one step below
+        required_degree = _REQUIRED_DEGREE.get((job_data.get("required_education") or "").lower())
+        if required_degree:
+            best = np.array([
+                max([_degree_rank(e.get("degree")) for e in _parsed(c).get("education") or [] if isinstance(e, dict)] or [0])
+                for c in candidates
+            ])
+            gap = required_degree - best
+            matrix[:, 1] = np.where(gap <= 0, 1.0, np.where(gap == 1, 0.5, 0.0))
+
+        # Skills: share of job keywords found in the candidate's skill text
+        keywords = [k.strip().lower() for k in job_data.get("keywords") or [] if isinstance(k, str) and k.strip()]
+        if keywords:
+            texts = [f["skill_text"] for f in features]
+            hits = np.array([[kw in text for kw in keywords] for text in texts], dtype=float)
+            matrix[:, 2] = hits.mean(axis=1)
+
+        # Languages: per required language, candidate level over required level (capped at 1)
+        required = _required_languages(job_data)
+        if required:
+            langs = list(required)
+            req = np.array([max(required[l], 1) for l in langs], dtype=float)
+            cand_langs = [_candidate_languages(c, f) for c, f in zip(candidates, features)]
+            cand = np.array([[ranks.get(l, 0) for l in langs] for ranks in cand_langs], dtype=float)
+            matrix[:, 3] = np.minimum(cand / req, 1.0).mean(axis=1)
+
+        # Location: compute_location_match score (exact=10, near=8, far=0); unknown is neutral
+        job_location = job_data.get("location") or job_data.get("city")
+        if job_location:
+            matches = compute_location_matches(job_location, [_candidate_location(c) for c in candidates])
+            matrix[:, 4] = np.array([
+                0.5 if not m or m.get("category") == "unknown" else m.get("location_score", 0) / 10.0
+                for m in matches
+            ])
+
+        return matrix
+
+    def rank(
+        self,
+        job_data: Dict[str, Any],
+        candidates: List[Dict[str, Any]],
+        top_k: Optional[int] = None,
+        min_score: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Rank candidates by local score and mark which should go to the LLM.
+
+        Args:
+            job_data: Job information (same shape as /match-cv-to-job)
+            candidates: Candidate payloads; an ``id`` key is echoed back
+            top_k: Select at most this many of the best candidates
+            min_score: Select only candidates scoring at least this (0-100)
+
+        Returns:
+            One entry per candidate, best first, with score, breakdown and selected flag
+        """
+        matrix = self.feature_matrix(job_data, candidates)
+        scores = matrix @ WEIGHTS
+
+        # Disabled-only positions: candidates without a disability mention cannot qualify
+        if job_data.get("is_disabled_friendly") and candidates:
+            eligible = np.array([candidate_mentions_disability(c) for c in candidates])
+            scores = np.where(eligible, scores, 0.0)
+
+        order = np.argsort(-scores, kind="stable")
+        selected = np.ones(len(candidates), dtype=bool)
+        if min_score is not None:
+            selected &= scores >= min_score
+        if top_k is not None:
+            in_top = np.zeros(len(candidates), dtype=bool)
+            in_top[order[:max(0, top_k)]] = True
+            selected &= in_top
+
+        results = []
+        for rank, idx in enumerate(order, start=1):
+            results.append({
+                "id": candidates[idx].get("id"),
+                "index": int(idx),
+                "rank": rank,
+                "score": round(float(scores[idx]), 1),
+                "breakdown": {f: round(float(matrix[idx, j]), 3) for j, f in enumerate(FEATURES)},
+                "selected": bool(selected[idx]),
+            })
+
+        logger.info(
+            f"Prefiltered {len(candidates)} candidates for job {job_data.get('title', 'Unknown')}: "
+            f"{int(selected.sum())} selected"
+        )
+        return results
+
+
+# Create a singleton instance
+_prefilter_service: Optional[CandidatePrefilterService] = None
+
+
+def get_prefilter_service() -> CandidatePrefilterService:
+    """Get or create the prefilter service instance."""
+    global _prefilter_service
+
+    if _prefilter_service is None:
+        _prefilter_service = CandidatePrefilterService()
+
+    return _prefilter_service
@@ -0,0 +1,141 @@
+"""
+Distributed Tracing (OpenTelemetry)
+Spans for requests, text extraction, anonymization and LLM calls.
+
+Requests from the Back-end carry a W3C ``traceparent`` header, so these
+spans join the caller's trace (CV upload -> AI-Service -> LLM).
+
+``OTEL_TRACES_EXPORTER`` selects the exporter:
+
+- ``none`` (default): spans are no-ops
+- ``otlp``: OTLP/HTTP to ``OTEL_EXPORTER_OTLP_ENDPOINT`` (a local collector)
+- ``file``: one JSON span per line in ``OTEL_TRACES_FILE``; works offline
+- ``console``: spans printed to stdout
+
+Sampling follows the standard ``OTEL_TRACES_SAMPLER`` / ``OTEL_TRACES_SAMPLER_ARG``.
+"""
+import functools
+import inspect
+import logging
+from typing import Any, Callable, Optional
+
+from opentelemetry import propagate, trace
+from opentelemetry.trace import SpanKind, Status, StatusCode
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+tracer = trace.get_tracer("ai-service")
+
+_enabled = False
+
+
+def setup_tracing() -> None:
+    """Install the configured exporter; a no-op when tracing is off"""
+    global _enabled
+
+    exporter_name = (settings.OTEL_TRACES_EXPORTER or "none").lower()
+    if exporter_name == "none" or _enabled:
+        return
+
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+
+    if exporter_name == "otlp":
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+
+        exporter = OTLPSpanExporter()  # endpoint from OTEL_EXPORTER_OTLP_ENDPOINT
+    elif exporter_name == "file":
+        exporter = ConsoleSpanExporter(
+            out=open(settings.OTEL_TRACES_FILE, "a", encoding="utf-8"),
+            formatter=lambda span: span.to_json(indent=None) + "\n",
+        )
+    elif exporter_name == "console":
+        exporter = ConsoleSpanExporter()
+    else:
+        logger.warning(f"Unknown OTEL_TRACES_EXPORTER '{exporter_name}', tracing disabled")
+        return
+
+    provider = TracerProvider(resource=Resource.create({"service.name": settings.OTEL_SERVICE_NAME}))
+    provider.add_span_processor(BatchSpanProcessor(exporter))
+    trace.set_tracer_provider(provider)
+    _enabled = True
+    logger.info(f"Tracing enabled ({exporter_name} exporter)")
+
+
+def shutdown_tracing() -> None:
+    """Export buffered spans before the process exits"""
+    if _enabled:
+        trace.get_tracer_provider().shutdown()
+
+
+def span(name: str, kind: SpanKind = SpanKind.INTERNAL, **attributes: Any):
+    """Context manager for a child span of the current one"""
+    return tracer.start_as_current_span(name, kind=kind, attributes=attributes or None)
+
+
+def traced(name: Optional[str] = None, kind: SpanKind = SpanKind.INTERNAL) -> Callable:
+    """Decorator wrapping each call of a (sync or async) function in a span"""
+    def decorator(fn: Callable) -> Callable:
+        span_name = name or fn.__qualname__
+
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                with span(span_name, kind):
+                    return await fn(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(span_name, kind):
+                return fn(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+class TracingMiddleware:
+    """ASGI middleware opening a server span per HTTP request.
+
+    Continues the trace of an incoming ``traceparent`` header and names the
+    span after the matched route template once routing is done.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not _enabled or scope["type"] != "http" or scope["path"] == "/metrics":
+            await self.app(scope, receive, send)
+            return
+
+        carrier = {k.decode("latin-1"): v.decode("latin-1") for k, v in scope["headers"]}
+        method = scope["method"]
+        status = 500
+
+        async def send_wrapper(message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        with tracer.start_as_current_span(
+            method,
+            context=propagate.extract(carrier),
+            kind=SpanKind.SERVER,
+            attributes={"http.request.method": method, "url.path": scope["path"]},
+        ) as server_span:
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = getattr(scope.get("route"), "path", None)
+                if route:
+                    server_span.update_name(f"{method} {route}")
+                    server_span.set_attribute("http.route", route)
+                server_span.set_attribute("http.response.status_code", status)
+                if status >= 500:
+                    server_span.set_status(Status(StatusCode.ERROR))
@@ -0,0 +1,212 @@
+"""
+LLM Tracing (LangFuse)
+Non-blocking, batched export of LLM call traces.
+
+The request path only samples and appends a small record to a bounded
+in-memory buffer; it never talks to LangFuse. A background task drains the
+buffer every LANGFUSE_FLUSH_INTERVAL_SECONDS, or as soon as it holds
+LANGFUSE_BATCH_SIZE records, and hands the batch to the LangFuse SDK plus
+one flush in a worker thread. When the buffer is full, new records are
+dropped (and counted) instead of slowing requests down.
+
+Sampling: LANGFUSE_SAMPLE_RATES maps trace names (cv_parsing,
+job_matching, cv_compare, ...) to a 0-1 rate; others use LANGFUSE_SAMPLE_RATE.
+"""
+
+import asyncio
+import logging
+import random
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_PREVIEW_CHARS = 500
+_OUTPUT_PREVIEW_CHARS = 1000
+
+
+def _preview(text: Optional[str], limit: int) -> Optional[str]:
+    if text is None or len(text) <= limit:
+        return text
+    return text[:limit] + "..."
+
+
+@dataclass
+class TraceRecord:
+    name: str
+    model: str
+    provider: str
+    system_prompt: str
+    user_prompt: str
+    output: Optional[str]
+    input_tokens: int
+    output_tokens: int
+    start_time: datetime
+    end_time: datetime
+    error: Optional[str] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+class TraceExporter:
+    """Bounded buffer of trace records, exported in batches off the hot path"""
+
+    def __init__(
+        self,
+        client: Any,
+        buffer_size: int,
+        batch_size: int,
+        flush_interval: float,
+        sample_rate: float,
+        sample_rates: Dict[str, float],
+    ) -> None:
+        self.client = client
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.sample_rate = sample_rate
+        self.sample_rates = sample_rates
+        self._buffer: Deque[TraceRecord] = deque()
+        self._buffer_size = buffer_size
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self.exported = 0
+        self.dropped = 0
+        self.sampled_out = 0
+
+    # ── Hot path ──────────────────────────────────────────────────────
+
+    def sampled(self, name: str) -> bool:
+        rate = self.sample_rates.get(name, self.sample_rate)
+        if rate >= 1:
+            return True
+        if rate <= 0 or random.random() >= rate:
+            self.sampled_out += 1
+            return False
+        return True
+
+    def record(self, record: TraceRecord) -> None:
+        """Queue a record; never blocks, drops it if the buffer is full"""
+        if len(self._buffer) >= self._buffer_size:
+            self.dropped += 1
+            return
+        self._buffer.append(record)
+        if self._task is None:
+            try:
+                self.start()
+            except RuntimeError:
+                pass  # no running loop yet; exported once the service starts
+        if len(self._buffer) >= self.batch_size and self._wakeup is not None:
+            self._wakeup.set()
+
+    # ── Background export ─────────────────────────────────────────────
+
+    def start(self) -> None:
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the exporter and export whatever is still buffered"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._flush()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self._flush()
+            except Exception as e:
+                logger.warning(f"LangFuse export failed: {e}")
+
+    async def _flush(self) -> None:
+        while self._buffer:
+            batch = [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+            await asyncio.to_thread(self._export, batch)
+            self.exported += len(batch)
+
+    def _export(self, batch: List[TraceRecord]) -> None:
+        for r in batch:
+            status = f"Error: {r.error}" if r.error else "success"
+            trace = self.client.trace(name=r.name, metadata={**r.metadata, "provider": r.provider})
+            trace.generation(
+                name=f"{r.name}_generation",
+                model=r.model,
+                start_time=r.start_time,
+                end_time=r.end_time,
+                input={
+                    "system_prompt": _preview(r.system_prompt, _PREVIEW_CHARS),
+                    "user_prompt": _preview(r.user_prompt, _PREVIEW_CHARS),
+                },
+                output=_preview(r.output, _OUTPUT_PREVIEW_CHARS),
+                usage={
+                    "input": r.input_tokens,
+                    "output": r.output_tokens,
+                    "total": r.input_tokens + r.output_tokens,
+                },
+                level="ERROR" if r.error else "DEFAULT",
+                status_message=status,
+            )
+            trace.update(status_message=status)
+        self.client.flush()
+
+
+def _create_exporter() -> Optional[TraceExporter]:
+    if not (settings.LANGFUSE_ENABLED and settings.LANGFUSE_SECRET_KEY and settings.LANGFUSE_PUBLIC_KEY):
+        logger.info("LangFuse disabled or not configured")
+        return None
+    try:
+        from langfuse import Langfuse
+
+        client = Langfuse(
+            secret_key=settings.LANGFUSE_SECRET_KEY,
+            public_key=settings.LANGFUSE_PUBLIC_KEY,
+            host=settings.LANGFUSE_HOST
+        )
+    except ImportError:
+        logger.warning("LangFuse package not installed, running without observability")
+        return None
+    except Exception as e:
+        logger.warning(f"LangFuse initialization failed: {e}")
+        return None
+    logger.info("LangFuse observability enabled")
+    return TraceExporter(
+        client,
+        buffer_size=settings.LANGFUSE_BUFFER_SIZE,
+        batch_size=settings.LANGFUSE_BATCH_SIZE,
+        flush_interval=settings.LANGFUSE_FLUSH_INTERVAL_SECONDS,
+        sample_rate=settings.LANGFUSE_SAMPLE_RATE,
+        sample_rates=settings.LANGFUSE_SAMPLE_RATES,
+    )
+
+
+# Create a singleton instance
+_exporter: Optional[TraceExporter] = None
+_initialized = False
+
+
+def get_trace_exporter() -> Optional[TraceExporter]:
+    """Get or create the trace exporter (None when LangFuse is off)."""
+    global _exporter, _initialized
+
+    if not _initialized:
+        _exporter = _create_exporter()
+        _initialized = True
+
+    return _exporter
+
+
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc)
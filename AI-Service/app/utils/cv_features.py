@@ -0,0 +1,170 @@
+"""
+CV feature extraction.
+
+Fields the matcher and prefilter derive from a CV (disability mention,
+normalized languages, flattened skill text) are computed once at parse time
+and stored under ``parsed_data["_derived"]``, so matching a candidate against
+many jobs only reads them. CVs parsed before this existed (or with an older
+``FEATURES_VERSION``) are derived on the fly by ``get_cv_features``.
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.utils.language_utils import level_rank, norm_lang
+
+DERIVED_KEY = "_derived"
+# Bump when extraction rules change so stored features are recomputed
+FEATURES_VERSION = 1
+
+
+class KeywordMatcher:
+    """
+    Multi-keyword matcher compiled once.
+
+    All keywords go into a single case-insensitive alternation (longest first,
+    so "engelli raporu" wins over "engelli"), which the regex engine scans in
+    one pass over the text instead of one ``in`` check per keyword.
+    """
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        self.keywords = sorted({k.lower() for k in keywords if k}, key=len, reverse=True)
+        self._pattern = re.compile('|'.join(re.escape(k) for k in self.keywords), re.IGNORECASE)
+
+    def search(self, text: str) -> bool:
+        return bool(text) and self._pattern.search(text) is not None
+
+
+DISABILITY_KEYWORDS = (
+    # Turkish
+    'engelli', 'engellilik', 'engel durumu', 'engelli raporu',
+    'engelli sağlık kurulu', 'engelli kimlik', 'engelli kartı',
+    'bedensel engel', 'görme engel', 'işitme engel', 'ortopedik engel',
+    'zihinsel engel', 'süreğen hastalık', 'kronik hastalık',
+    'engelli oranı', 'engel oranı', '% engel',
+    'engelli personel', 'engelli çalışan', 'engelli aday',
+    'sağlık kurulu raporu', 'özürlü', 'özürlülük',
+    # English
+    'disabled', 'disability', 'handicap', 'impairment',
+    'disability report', 'disability certificate', 'disability card',
+    'physical disability', 'visual impairment', 'hearing impairment',
+    'orthopedic disability', 'chronic illness', 'chronic disease',
+    'disability rate', 'disability percentage',
+    'special needs', 'differently abled',
+)
+
+DISABILITY_MATCHER = KeywordMatcher(DISABILITY_KEYWORDS)
+# Percentage patterns like "40% engelli" or "%40 engelli"
+_DISABILITY_PERCENT_RE = re.compile(r'(%\s*\d+|\d+\s*%)\s*(engel|disability|handicap)', re.IGNORECASE)
+
+
+def mentions_disability(text: str) -> bool:
+    return DISABILITY_MATCHER.search(text) or bool(text and _DISABILITY_PERCENT_RE.search(text))
+
+
+def _values(value: Any) -> List[str]:
+    """String values of a scalar, list or dict (one level deep)"""
+    if isinstance(value, dict):
+        return [str(v) for v in value.values() if v]
+    if isinstance(value, list):
+        return [str(v) for v in value if v]
+    return [str(value)] if value else []
+
+
+def flatten_cv_text(parsed: Dict[str, Any]) -> str:
+    """Personal info, summary, experience, education, skills, certifications and free-form sections"""
+    parts: List[str] = []
+    parts.extend(_values(parsed.get('personal')))
+    parts.extend(_values(parsed.get('summary')))
+    for exp in parsed.get('experience') or []:
+        if isinstance(exp, dict):
+            parts.extend(str(exp[k]) for k in ('title', 'description', 'company') if exp.get(k))
+        else:
+            parts.append(str(exp))
+    for section in ('education', 'certifications'):
+        for item in parsed.get(section) or []:
+            parts.extend(_values(item))
+    skills = parsed.get('skills') or {}
+    if isinstance(skills, dict):
+        for val in skills.values():
+            parts.extend(_values(val))
+    for key in ('additional', 'other', 'notes', 'references', 'hobbies'):
+        parts.extend(_values(parsed.get(key)))
+    return ' '.join(parts)
+
+
+def skill_text(parsed: Dict[str, Any]) -> str:
+    """Lowercased blob of skills, tools, project technologies, job titles and certifications"""
+    parts: List[str] = []
+    skills = parsed.get("skills") or {}
+    if isinstance(skills, dict):
+        for key in ("technical", "tools", "soft"):
+            values = skills.get(key) or []
+            if isinstance(values, list):
+                parts.extend(str(v) for v in values if v)
+    elif isinstance(skills, list):
+        parts.extend(str(v) for v in skills if v)
+    for project in parsed.get("projects") or []:
+        if isinstance(project, dict):
+            parts.extend(str(t) for t in project.get("technologies") or [] if t)
+    for exp in parsed.get("experience") or []:
+        if isinstance(exp, dict) and exp.get("title"):
+            parts.append(str(exp["title"]))
+    for cert in parsed.get("certifications") or []:
+        if isinstance(cert, dict) and cert.get("name"):
+            parts.append(str(cert["name"]))
+    return " | ".join(parts).lower()
+
+
+def language_ranks(parsed: Dict[str, Any]) -> Dict[str, int]:
+    """Normalized language -> level rank (1-5) from skills.languages"""
+    skills = parsed.get("skills") or {}
+    entries = skills.get("languages") if isinstance(skills, dict) else None
+    ranks: Dict[str, int] = {}
+    for entry in entries or []:
+        if isinstance(entry, dict):
+            name, rank = norm_lang(entry.get("language") or entry.get("name")), level_rank(entry.get("level"))
+        else:
+            name, rank = norm_lang(entry), 0
+        if name:
+            ranks[name] = max(ranks.get(name, 0), rank or 1)
+    return ranks
+
+
+def extract_cv_features(parsed: Dict[str, Any], cv_text: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Derive matching features from a parsed CV.
+
+    Args:
+        parsed: Structured CV data
+        cv_text: Raw CV text, if available (widens the disability check)
+
+    Returns:
+        Feature dict suitable for ``parsed_data["_derived"]``
+    """
+    text = flatten_cv_text(parsed)
+    return {
+        "version": FEATURES_VERSION,
+        "disability_mentioned": mentions_disability(text) or mentions_disability(cv_text or ""),
+        "languages": language_ranks(parsed),
+        "skill_text": skill_text(parsed),
+    }
+
+
+def get_cv_features(candidate_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Stored features of a candidate payload, or freshly derived ones if missing/stale"""
+    parsed = candidate_data.get("parsed_data") or {}
+    if not isinstance(parsed, dict):
+        parsed = {}
+    features = parsed.get(DERIVED_KEY)
+    if isinstance(features, dict) and features.get("version") == FEATURES_VERSION:
+        return features
+    return extract_cv_features(parsed, candidate_data.get("cv_text"))
+
+
+def candidate_mentions_disability(candidate_data: Dict[str, Any]) -> bool:
+    """Parse-time disability flag, plus the name and raw text sent with the payload"""
+    if get_cv_features(candidate_data).get("disability_mentioned"):
+        return True
+    # Fields outside parsed_data (name might include "Engelli" designation)
+    return mentions_disability(" ".join(str(candidate_data[k]) for k in ("name", "cv_text") if candidate_data.get(k)))
@@ -0,0 +1,146 @@
+"""
+Incremental parsing of a streamed JSON object.
+
+The LLM writes one top-level JSON object token by token. ``JSONStreamParser``
+is fed the raw chunks and reports content as soon as it is complete, without
+re-parsing the whole buffer:
+
+- ``{"event": "delta", "key": k, "text": t}``: more characters of a
+  top-level string value (e.g. the job description while it is written)
+- ``{"event": "item", "key": k, "index": i, "value": v}``: one finished
+  element of a top-level array (e.g. a generated question)
+- ``{"event": "field", "key": k, "value": v}``: a finished top-level value
+"""
+
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+# Trailing backslash escape that is not complete yet: "\" or "\u12"
+_PARTIAL_ESCAPE = re.compile(r'\\(?:u[0-9a-fA-F]{0,3})?$')
+
+
+class JSONStreamParser:
+    """Character-level scanner over one streamed top-level JSON object"""
+
+    def __init__(self) -> None:
+        self.text = ""
+        self._pos = 0
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape = False
+        self._expect_key = False
+        self._key_start: Optional[int] = None
+        self._key: Optional[str] = None
+        self._value_start: Optional[int] = None
+        self._item_start: Optional[int] = None
+        self._item_index = 0
+        self._string_start: Optional[int] = None  # top-level string value being streamed
+        self._string_emitted = ""
+        self.done = False
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """Consume a chunk and return the events it completes"""
+        events: List[Dict[str, Any]] = []
+        self.text += chunk
+        text = self.text
+        for i in range(self._pos, len(text)):
+            if self.done:
+                break
+            c = text[i]
+            depth = len(self._stack)
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == '\\':
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+                    if self._key_start is not None:
+                        self._key = json.loads(text[self._key_start:i + 1])
+                        self._key_start = None
+                    elif self._string_start is not None:
+                        self._emit_delta(events, i)
+                        self._string_start = None
+                continue
+
+            if c.isspace():
+                continue
+
+            in_array = depth == 2 and self._stack[1] == '['
+
+            if c == '"':
+                self._in_string = True
+                if depth == 1 and self._expect_key:
+                    self._key_start = i
+                elif depth == 1 and self._value_start is None:
+                    self._value_start = self._string_start = i
+                    self._string_emitted = ""
+                elif in_array and self._item_start is None:
+                    self._item_start = i
+            elif c in '{[':
+                if depth == 0:
+                    self._expect_key = c == '{'
+                elif depth == 1 and self._value_start is None:
+                    self._value_start = i
+                elif in_array and self._item_start is None:
+                    self._item_start = i
+                self._stack.append(c)
+            elif c in '}]':
+                if in_array and c == ']':
+                    self._emit_item(events, i)
+                self._stack.pop()
+                if depth == 1:
+                    self._emit_field(events, i)
+                    self.done = True
+            elif c == ':' and depth == 1:
+                self._expect_key = False
+            elif c == ',' and depth == 1:
+                self._emit_field(events, i)
+                self._expect_key = True
+            elif c == ',' and in_array:
+                self._emit_item(events, i)
+            elif depth == 1 and not self._expect_key and self._value_start is None:
+                self._value_start = i  # number, true, false, null
+            elif in_array and self._item_start is None:
+                self._item_start = i
+
+        self._pos = len(text)
+        if self._in_string and self._string_start is not None:
+            self._emit_delta(events, len(text))
+        return events
+
+    def result(self) -> Dict[str, Any]:
+        """The whole object once streaming finished (raises if it is invalid)"""
+        return json.loads(self.text)
+
+    def _emit_delta(self, events: List[Dict[str, Any]], end: int) -> None:
+        raw = _PARTIAL_ESCAPE.sub('', self.text[self._string_start + 1:end])
+        try:
+            decoded = json.loads(f'"{raw}"')
+        except ValueError:
+            return
+        if decoded and '\ud800' <= decoded[-1] <= '\udbff':
+            decoded = decoded[:-1]  # first half of an escaped surrogate pair
+        if decoded.startswith(self._string_emitted) and len(decoded) > len(self._string_emitted):
+            events.append({"event": "delta", "key": self._key, "text": decoded[len(self._string_emitted):]})
+            self._string_emitted = decoded
+
+    def _emit_item(self, events: List[Dict[str, Any]], end: int) -> None:
+        if self._item_start is None:
+            return
+        value = json.loads(self.text[self._item_start:end])
+        events.append({"event": "item", "key": self._key, "index": self._item_index, "value": value})
+        self._item_start = None
+        self._item_index += 1
+
+    def _emit_field(self, events: List[Dict[str, Any]], end: int) -> None:
+        if self._value_start is None:
+            return
+        value = json.loads(self.text[self._value_start:end])
+        events.append({"event": "field", "key": self._key, "value": value})
+        self._value_start = None
+        self._string_start = None
+        self._item_start = None
+        self._item_index = 0
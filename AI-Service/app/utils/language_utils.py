@@ -0,0 +1,67 @@
+import unicodedata
+from typing import Any, Optional
+
+# common mappings (TR -> EN and variants), keyed by accent-stripped lowercase name
+_LANGUAGE_NAMES = {
+    'turkce': 'turkish', 'türkçe': 'turkish', 'turkish': 'turkish',
+    'ingilizce': 'english', 'english': 'english', 'en': 'english',
+    'ispanyolca': 'spanish', 'spanish': 'spanish', 'espanol': 'spanish', 'español': 'spanish',
+    'almanca': 'german', 'german': 'german', 'deutsch': 'german',
+    'fransizca': 'french', 'francais': 'french', 'français': 'french', 'french': 'french',
+    'italyanca': 'italian', 'italiano': 'italian', 'italian': 'italian',
+    'portekizce': 'portuguese', 'portugues': 'portuguese', 'portuguese': 'portuguese',
+    'arapca': 'arabic', 'arabic': 'arabic',
+    'cince': 'chinese', 'chinese': 'chinese', 'mandarin': 'chinese',
+    'japonca': 'japanese', 'japanese': 'japanese',
+    'korece': 'korean', 'korean': 'korean',
+    'hollandaca': 'dutch', 'dutch': 'dutch', 'nederlands': 'dutch',
+    'yunanca': 'greek', 'greek': 'greek',
+    'lehce': 'polish', 'polish': 'polish',
+    'rusca': 'russian', 'russian': 'russian',
+}
+
+# Native > Fluent > Advanced > Intermediate > Basic (CEFR: C2≈Native, C1≈Fluent,
+# B2≈Advanced, B1≈Intermediate, A2/A1≈Basic) - same scale as the matching prompt
+_LEVEL_RANKS = {
+    'native': 5, 'anadil': 5, 'c2': 5,
+    'fluent': 4, 'akici': 4, 'c1': 4,
+    'advanced': 3, 'ileri': 3, 'b2': 3,
+    'intermediate': 2, 'orta': 2, 'b1': 2,
+    'basic': 1, 'beginner': 1, 'baslangic': 1, 'temel': 1, 'a2': 1, 'a1': 1,
+}
+
+
+def _strip_accents(text: str) -> str:
+    text = unicodedata.normalize('NFKD', text)
+    return ''.join(ch for ch in text if not unicodedata.combining(ch))
+
+
+def norm_lang(name: Any) -> str:
+    """Normalize a language name to canonical lowercase English"""
+    if not isinstance(name, str):
+        return ''
+    s = _strip_accents(name.strip().lower())
+    return _LANGUAGE_NAMES.get(s, s)
+
+
+def norm_level(level: Any) -> Optional[str]:
+    """Coerce a level to a simple string, keep as-is if unknown"""
+    if not isinstance(level, str):
+        return None
+    lvl = level.strip()
+    return lvl if lvl else None
+
+
+def level_rank(level: Any) -> int:
+    """1 (basic) .. 5 (native); 0 when missing or unrecognized"""
+    lvl = norm_level(level)
+    if not lvl:
+        return 0
+    s = _strip_accents(lvl.lower()).replace('ı', 'i')
+    if s in _LEVEL_RANKS:
+        return _LEVEL_RANKS[s]
+    # "B2 - Upper Intermediate", "Advanced (C1)" ...
+    for token in s.replace('(', ' ').replace(')', ' ').replace('-', ' ').split():
+        if token in _LEVEL_RANKS:
+            return _LEVEL_RANKS[token]
+    return 0
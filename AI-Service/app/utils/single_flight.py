@@ -0,0 +1,112 @@
+"""
+Request coalescing for identical concurrent AI calls.
+
+``SingleFlight.do(key, fn)`` runs ``fn`` once per key at a time: callers
+arriving while it is in flight await the same result, and a successful
+result is kept for ``ttl`` seconds so immediate repeats (double submits,
+several recruiters opening the same comparison) do not reach the LLM again.
+Failures are shared with the waiting callers but never cached.
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def canonical_key(endpoint: str, payload: Any, model: str, prompt_version: str) -> str:
+    """Stable hash of (endpoint, payload, model, prompt version); dict key order does not matter"""
+    blob = json.dumps(
+        [endpoint, payload, model, prompt_version],
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class SingleFlight:
+    """In-flight deduplication plus a small TTL result cache"""
+
+    def __init__(self, ttl: float, max_entries: int) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._results: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.coalesced = 0
+        self.misses = 0
+
+    def _cached(self, key: str) -> Optional[Tuple[float, Any]]:
+        entry = self._results.get(key)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del self._results[key]
+            return None
+        self._results.move_to_end(key)
+        return entry
+
+    def _store(self, key: str, value: Any) -> None:
+        if self.ttl <= 0 or self.max_entries <= 0:
+            return
+        self._results[key] = (time.monotonic() + self.ttl, value)
+        self._results.move_to_end(key)
+        while len(self._results) > self.max_entries:
+            self._results.popitem(last=False)
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Result of ``fn()`` shared by every concurrent caller with the same key.
+
+        Each caller gets its own deep copy, so mutating a result cannot leak
+        into the cache or into another request.
+        """
+        entry = self._cached(key)
+        if entry is not None:
+            self.hits += 1
+            return copy.deepcopy(entry[1])
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            logger.info(f"Coalesced duplicate AI request {key[:12]}")
+        else:
+            self.misses += 1
+            # Own task: a caller that disconnects (is cancelled) must not cancel the others
+            task = asyncio.ensure_future(self._run(key, fn))
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())  # retrieved even if every caller left
+            self._inflight[key] = task
+
+        return copy.deepcopy(await asyncio.shield(task))
+
+    async def _run(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            value = await fn()
+            self._store(key, value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+
+# Create a singleton instance
+_single_flight: Optional[SingleFlight] = None
+
+
+def get_single_flight() -> SingleFlight:
+    """Get or create the shared single-flight instance."""
+    global _single_flight
+
+    if _single_flight is None:
+        _single_flight = SingleFlight(settings.AI_RESULT_CACHE_TTL_SECONDS, settings.AI_RESULT_CACHE_MAX_ENTRIES)
+
+    return _single_flight
@@ -0,0 +1,57 @@
+"""
+Token counting with the model's tokenizer (tiktoken).
+
+Falls back to the ~4 characters/token estimate when tiktoken is not
+installed or the encoding cannot be loaded (it is fetched once and cached).
+"""
+
+import logging
+from functools import lru_cache
+from typing import Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_CHARS_PER_TOKEN = 4
+
+
+@lru_cache(maxsize=8)
+def _encoding(model: str):
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        # Unknown model name: current OpenAI chat models use o200k_base
+        return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        logger.warning(f"Tokenizer unavailable ({e}); using character estimate")
+        return None
+
+
+def count_tokens(text: str, model: Optional[str] = None) -> int:
+    if not text:
+        return 0
+    encoding = _encoding(model or settings.MODEL_NAME)
+    if encoding is None:
+        return len(text) // _CHARS_PER_TOKEN
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model: Optional[str] = None, marker: str = " […]") -> str:
+    """Cut text to at most ``max_tokens`` tokens (plus ``marker`` if cut)"""
+    if max_tokens <= 0:
+        return ""
+    if not text:
+        return text
+    encoding = _encoding(model or settings.MODEL_NAME)
+    if encoding is None:
+        limit = max_tokens * _CHARS_PER_TOKEN
+        return text if len(text) <= limit else text[:limit].rstrip() + marker
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens]).rstrip() + marker
@@ -0,0 +1,154 @@
+"""
+Benchmark CVAnonymizer on large synthetic CVs.
+
+Compares the current span-based masking and placeholder restore with the
+previous implementation (one rebuild of the whole string per match and a
+linear duplicate lookup, re-implemented below as LegacyAnonymizer), checks
+that both mask the same values, and prints timings.
+
+Usage:
+    python scripts/benchmark_anonymizer.py [--sizes 200 1000 4000] [--repeat 3]
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.services.anonymizer import CVAnonymizer, _PLACEHOLDER_RE
+
+
+class LegacyAnonymizer(CVAnonymizer):
+    """Previous masking/restore algorithm, kept here as the baseline."""
+
+    def _mask_pattern(self, text: str, pattern: re.Pattern, category: str) -> str:
+        matches = list(pattern.finditer(text))
+        for match in reversed(matches):
+            original = match.group(0).strip()
+            if not original or len(original) < 3:
+                continue
+            if _PLACEHOLDER_RE.search(match.group(0)):
+                continue
+            existing = None
+            for ph, val in self._mapping.items():
+                if val == original:
+                    existing = ph
+                    break
+            placeholder = existing or self._next_placeholder(category)
+            if not existing:
+                self._mapping[placeholder] = original
+            text = text[:match.start()] + placeholder + text[match.end():]
+        return text
+
+    def _mask(self, text: str) -> str:
+        for category, pattern in self.MASK_PATTERNS:
+            text = self._mask_pattern(text, pattern, category)
+        return text
+
+    def inject_pii_into_parsed(self, parsed_data):
+        mapping = self._mapping
+
+        def _replace_in_value(value):
+            if isinstance(value, str):
+                for placeholder, real_value in mapping.items():
+                    value = value.replace(placeholder, real_value)
+                return value
+            elif isinstance(value, dict):
+                return {k: _replace_in_value(v) for k, v in value.items()}
+            elif isinstance(value, list):
+                return [_replace_in_value(item) for item in value]
+            return value
+
+        return _replace_in_value(parsed_data)
+
+
+WORDS = (
+    "yazılım geliştirme proje yönetimi python java react docker kubernetes "
+    "mikroservis analiz raporlama müşteri ekip liderliği test otomasyonu "
+    "developed maintained designed scalable services database performance"
+).split()
+
+
+def _phone(rng: random.Random) -> str:
+    return rng.choice([
+        "+90 5{}{} {}{}{} {}{} {}{}",
+        "0 (5{}{}) {}{}{} {}{} {}{}",
+        "05{}{}{}{}{}{}{}{}{}",
+        "+44 20 {}{}{}{} {}{}{}{}",
+    ]).format(*(rng.randint(0, 9) for _ in range(10)))
+
+
+def synthetic_cv(lines: int, seed: int = 0) -> str:
+    """CV text with ``lines`` body lines, a third of them carrying PII"""
+    rng = random.Random(seed)
+    out = ["Ayşe Nur YILMAZ, Senior Backend Developer", "İstanbul, Türkiye"]
+    for i in range(lines):
+        words = " ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 14)))
+        kind = rng.randint(0, 8)
+        if kind == 0:
+            words += f" iletişim: user{rng.randint(0, lines // 4)}@example.com"
+        elif kind == 1:
+            words += f" tel {_phone(rng)}"
+        elif kind == 2:
+            words += f" https://project{rng.randint(0, lines // 4)}.example.org/docs/{i}"
+        elif kind == 3:
+            words += f" https://github.com/user/repo{i}"
+        elif kind == 4:
+            words += f" {rng.randint(1, 28):02d}.{rng.randint(1, 12):02d}.19{rng.randint(60, 99)}"
+        out.append(words)
+    out.append("https://www.linkedin.com/in/ayse-nur-yilmaz")
+    return "\n".join(out)
+
+
+def _time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(sizes, repeat: int) -> None:
+    print(f"{'lines':>7} {'chars':>9} {'pii':>6} {'legacy (s)':>11} {'current (s)':>12} {'speedup':>8}")
+    for size in sizes:
+        text = synthetic_cv(size, seed=size)
+
+        current, legacy = CVAnonymizer(), LegacyAnonymizer()
+        masked, mapping = current.anonymize(text)
+        legacy_masked, legacy_mapping = legacy.anonymize(text)
+        assert set(mapping.values()) == set(legacy_mapping.values()), "masked values differ"
+        assert not _PLACEHOLDER_RE.sub("", masked).count("@example.com"), "email leaked"
+
+        # AI output echoing the placeholders back
+        parsed = {
+            "personal": {},
+            "summary": masked[:2000],
+            "experience": [{"description": line} for line in masked.split("\n")],
+        }
+        legacy_parsed = {
+            **parsed,
+            "experience": [{"description": line} for line in legacy_masked.split("\n")],
+        }
+        restored = current.inject_pii_into_parsed(parsed)
+        legacy_restored = legacy.inject_pii_into_parsed(legacy_parsed)
+        assert restored["experience"] == legacy_restored["experience"], "restored text differs"
+
+        legacy_time = _time(lambda: (legacy.anonymize(text), legacy.inject_pii_into_parsed(legacy_parsed)), repeat)
+        current_time = _time(lambda: (current.anonymize(text), current.inject_pii_into_parsed(parsed)), repeat)
+        print(
+            f"{size:>7} {len(text):>9} {len(mapping):>6} {legacy_time:>11.4f} "
+            f"{current_time:>12.4f} {legacy_time / current_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[200, 1000, 4000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.sizes, args.repeat)
@@ -0,0 +1,247 @@
+"""
+Benchmark AI-Service parse/match throughput on synthetic CVs.
+
+Runs the CV parsing pipeline (PDF text extraction, anonymization, LLM call,
+PII restore) and CV-job matching in process, ``--concurrency`` calls at a
+time, against the stub provider by default. With ``STUB_LATENCY_MS`` the
+stub waits like a real provider, so the numbers show how concurrency is
+handled; with 0 they show the service's own CPU cost per call. Services are
+called directly: the HTTP layer and the result cache in front of
+/match-cv-to-job are not measured.
+
+Writes a JSON report in the same format as the Back-end benchmark
+(``Back-end/scripts/benchmark.py``), so two releases can be compared with
+``python Back-end/scripts/benchmark.py compare old.json new.json``.
+
+Usage:
+    python scripts/benchmark_throughput.py [--cvs 200] [--concurrency 8] [--output ai_benchmark.json]
+    STUB_LATENCY_MS=800 python scripts/benchmark_throughput.py --concurrency 32
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+REPORT_VERSION = 1
+
+SKILLS = [
+    "Python", "Java", "React", "Docker", "Kubernetes", "PostgreSQL", "AWS",
+    "TypeScript", "Go", "Kafka", "Redis", "GraphQL", "Terraform", "Django",
+]
+CITIES = ["İstanbul", "Ankara", "İzmir", "Bursa", "Antalya", "Remote"]
+
+
+def synthetic_cv_text(rng: random.Random, index: int) -> str:
+    """A plain-text CV with contact details, experience and skills"""
+    skills = rng.sample(SKILLS, 5)
+    lines = [
+        f"Aday {index} Yılmaz",
+        f"aday{index}@example.com | +90 5{rng.randint(10, 59)} {rng.randint(100, 999)} {rng.randint(10, 99)} {rng.randint(10, 99)}",
+        f"{rng.choice(CITIES)}, Türkiye",
+        "",
+        "Deneyim",
+    ]
+    for job in range(rng.randint(2, 4)):
+        start = rng.randint(2010, 2020)
+        lines.append(f"Software Engineer, Firma {job} A.Ş. ({start} - {start + rng.randint(1, 4)})")
+        lines.append(f"Developed services with {', '.join(rng.sample(skills, 3))}; improved performance and test coverage.")
+    lines += ["", "Eğitim", "Bilgisayar Mühendisliği, Orta Doğu Teknik Üniversitesi (2006 - 2010)", ""]
+    lines.append("Yetenekler: " + ", ".join(skills))
+    lines.append("Diller: Türkçe (anadil), İngilizce (ileri)")
+    return "\n".join(lines)
+
+
+def _pdf_escape(line: str) -> str:
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def text_pdf(text: str) -> bytes:
+    """Single-page PDF with one text line per input line (no PDF library needed)"""
+    # Helvetica/WinAnsi has no Turkish glyphs; fold them so the extracted text stays readable
+    text = text.translate(str.maketrans("ıİşŞğĞ", "iISsGg"))
+    content = ["BT", "/F1 10 Tf", "12 TL", "50 800 Td"]
+    for line in text.split("\n"):
+        content.append(f"({_pdf_escape(line)}) Tj T*")
+    content.append("ET")
+    stream = "\n".join(content).encode("latin-1", "replace")
+
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+        b"/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+        b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream",
+    ]
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+def synthetic_job(rng: random.Random) -> dict:
+    skills = rng.sample(SKILLS, 6)
+    return {
+        "title": "Senior Backend Developer",
+        "department": "Engineering",
+        "description_plain": "We build recruitment software used by hundreds of companies. " * 6,
+        "requirements_plain": f"5+ years of experience with {', '.join(skills)}. " * 4,
+        "keywords": skills,
+        "location": rng.choice(CITIES),
+        "employment_type": "full-time",
+        "experience_level": "senior",
+        "required_education": "bachelor",
+        "preferred_majors": ["Computer Engineering"],
+        "required_languages": {"English": "business"},
+        "is_disabled_friendly": False,
+    }
+
+
+def summarize(latencies, errors: int, wall: float, concurrency: int) -> dict:
+    """Scenario result in the shared report format (latencies in seconds)"""
+    ms = sorted(x * 1000 for x in latencies)
+
+    def pct(p: float) -> float:
+        if not ms:
+            return 0.0
+        return round(ms[min(len(ms) - 1, int(round(p / 100 * (len(ms) - 1))))], 2)
+
+    return {
+        "count": len(ms) + errors,
+        "errors": errors,
+        "concurrency": concurrency,
+        "wall_s": round(wall, 3),
+        "throughput_per_s": round(len(ms) / wall, 2) if wall > 0 else 0.0,
+        "latency_ms": {
+            "p50": pct(50),
+            "p95": pct(95),
+            "p99": pct(99),
+            "mean": round(statistics.fmean(ms), 2) if ms else 0.0,
+            "max": round(ms[-1], 2) if ms else 0.0,
+        },
+    }
+
+
+async def run_concurrently(calls, concurrency: int) -> dict:
+    """Run zero-argument coroutine factories with at most ``concurrency`` in flight"""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    errors = 0
+
+    async def one(call):
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await call()
+            except Exception as e:
+                errors += 1
+                if errors == 1:
+                    print(f"  first error: {e}")
+                return
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(call) for call in calls))
+    return summarize(latencies, errors, time.perf_counter() - start, concurrency)
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+async def run(args) -> dict:
+    from app.config import settings
+    from app.services.cv_parser import cv_parser_service
+    from app.services.job_matcher_service import get_job_matcher_service
+
+    rng = random.Random(args.seed)
+    texts = [synthetic_cv_text(rng, i) for i in range(args.cvs)]
+    pdfs = [text_pdf(text) for text in texts]
+    job = synthetic_job(rng)
+    matcher = get_job_matcher_service()
+
+    scenarios = {}
+
+    print(f"parse_cv_file: {len(pdfs)} PDFs, concurrency {args.concurrency}")
+    parsed = []
+
+    async def parse(pdf: bytes, index: int):
+        parsed.append(await cv_parser_service.parse_cv_file(pdf, f"cv_{index}.pdf"))
+
+    scenarios["ai.parse_cv_file"] = await run_concurrently(
+        [lambda pdf=pdf, i=i: parse(pdf, i) for i, pdf in enumerate(pdfs)], args.concurrency
+    )
+
+    print(f"match_cv_to_job: {len(parsed)} candidates, concurrency {args.concurrency}")
+    scenarios["ai.match_cv_to_job"] = await run_concurrently(
+        [lambda cv=cv: matcher.match_cv_to_job(job_data=job, candidate_data=cv, language="turkish") for cv in parsed],
+        args.concurrency,
+    )
+
+    return {
+        "benchmark": "ai-service",
+        "version": REPORT_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git_commit": git_commit(),
+        "params": {
+            "cvs": args.cvs,
+            "concurrency": args.concurrency,
+            "seed": args.seed,
+            "provider": settings.AI_PROVIDER,
+            "stub_latency_ms": settings.STUB_LATENCY_MS,
+        },
+        "scenarios": scenarios,
+    }
+
+
+def print_report(report: dict) -> None:
+    print(f"\n{'scenario':<22} {'n':>6} {'err':>5} {'ops/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for name, result in report["scenarios"].items():
+        latency = result["latency_ms"]
+        print(
+            f"{name:<22} {result['count']:>6} {result['errors']:>5} {result['throughput_per_s']:>9.2f} "
+            f"{latency['p50']:>9.2f} {latency['p95']:>9.2f} {latency['p99']:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cvs", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--provider", default="stub", help="AI_PROVIDER to benchmark (default: stub)")
+    parser.add_argument("--output", default="ai_benchmark.json")
+    args = parser.parse_args()
+
+    # Must be set before app.config is imported
+    os.environ["AI_PROVIDER"] = args.provider
+
+    report = asyncio.run(run(args))
+    print_report(report)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"\nReport written to {args.output}")
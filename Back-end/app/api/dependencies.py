@@ -1,61 +1,27 @@
 from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
+from app.core.config import settings
 from app.core.database import get_db
 from app.utils.security import decode_token
 from app.services.auth import AuthService
+from app.services.principal_cache import Principal, user_principal_cache
+from app.services.rate_limiter import rate_limiter
 from app.models.user import User
-from collections import defaultdict
-from datetime import datetime, timedelta
 from typing import Optional
 from uuid import UUID
+import ipaddress
+import math
 
 security = HTTPBearer()
 
-# Simple in-memory rate limiter (for production, use Redis)
-_rate_limit_storage = defaultdict(list)
-
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
 ) -> User:
     """Get current authenticated user"""
-    
-    token = credentials.credentials
-    
-    # Decode token
-    payload = decode_token(token)
-    if not payload:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Geçersiz veya süresi dolmuş token"
-        )
-    
-    # Check token type
-    if payload.get("type") != "access":
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Geçersiz token tipi"
-        )
-    
-    # Get user
-    user_id = int(payload.get("sub"))
-    user = AuthService.get_user_by_id(db, user_id)
-    
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Kullanıcı bulunamadı"
-        )
-    
-    if not user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Hesabınız devre dışı bırakılmış"
-        )
-    
-    return user
+    return _resolve_user(credentials.credentials, db)
 
 
 async def get_current_active_user(
@@ -76,7 +42,11 @@ def get_current_user_from_token(token: str, db: Session) -> User:
     This is useful in contexts where FastAPI dependency injection is not available
     (e.g., Strawberry GraphQL resolvers).
     """
-    # Decode token
+    return _resolve_user(token, db)
+
+
+def _decode_access_token(token: str) -> dict:
+    """Decode a Bearer token and require it to be an access token"""
     payload = decode_token(token)
     if not payload:
         raise HTTPException(
@@ -84,15 +54,25 @@ def get_current_user_from_token(token: str, db: Session) -> User:
             detail="Geçersiz veya süresi dolmuş token"
         )
 
-    # Check token type
     if payload.get("type") != "access":
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Geçersiz token tipi"
         )
 
-    # Get user
+    return payload
+
+
+def _resolve_user(token: str, db: Session) -> User:
+    """Resolve the active user for a token, hitting the DB only on cache miss"""
+    payload = _decode_access_token(token)
     user_id = int(payload.get("sub"))
+    token_version = int(payload.get("tv") or 0)
+
+    user = user_principal_cache.get(db, user_id, token_version)
+    if user is not None:
+        return user
+
     user = AuthService.get_user_by_id(db, user_id)
 
     if not user:
@@ -101,52 +81,117 @@ def get_current_user_from_token(token: str, db: Session) -> User:
             detail="Kullanıcı bulunamadı"
         )
 
+    if (user.token_version or 0) != token_version:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Geçersiz veya süresi dolmuş token"
+        )
+
     if not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Hesabınız devre dışı bırakılmış"
         )
 
+    user_principal_cache.put(user)
     return user
 
 
-def rate_limit_public(request: Request, max_requests: int = 5, window_minutes: int = 60):
+def get_request_principal(request: Request, db: Session) -> Principal:
+    """Resolve the caller once per request and memoize it on request.state.
+
+    Subsequent calls within the same HTTP request (e.g. several GraphQL
+    fields) reuse the principal without decoding the token again.
     """
-    Rate limiting for public endpoints.
-    
-    Limits requests per IP address.
-    Default: 5 requests per 60 minutes (1 hour)
-    
-    Args:
-        request: FastAPI request object
-        max_requests: Maximum number of requests allowed
-        window_minutes: Time window in minutes
-    
-    Raises:
-        HTTPException: If rate limit is exceeded
+    principal = getattr(request.state, "principal", None)
+    if principal is not None:
+        return principal
+
+    auth_header = request.headers.get("authorization")
+    if not auth_header:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
+    try:
+        scheme, token = auth_header.split()
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid authorization header")
+    if scheme.lower() != "bearer":
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid authentication scheme")
+
+    user = _resolve_user(token, db)
+    payload = decode_token(token) or {}
+    principal = Principal(
+        user_id=user.id,
+        email=user.email,
+        role=payload.get("role"),
+        company_id=get_company_id_from_token(token),
+        token_version=user.token_version or 0,
+    )
+    request.state.principal = principal
+    request.state.token = token
+    return principal
+
+
+_trusted_proxies = [ipaddress.ip_network(net, strict=False) for net in settings.RATE_LIMIT_TRUSTED_PROXIES]
+
+
+def _is_trusted_proxy(address: str) -> bool:
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in net for net in _trusted_proxies)
+
+
+def client_ip(request: Request) -> str:
     """
-    # Get client IP
-    client_ip = request.client.host
+    Client address used as the rate limit key.
     
-    # Get current time
-    now = datetime.now()
-    cutoff_time = now - timedelta(minutes=window_minutes)
-    
-    # Clean old entries
-    _rate_limit_storage[client_ip] = [
-        timestamp for timestamp in _rate_limit_storage[client_ip]
-        if timestamp > cutoff_time
+    Behind Caddy every connection comes from the proxy, so X-Forwarded-For is
+    walked from the right (entries appended by our proxies) and the first
+    address not in RATE_LIMIT_TRUSTED_PROXIES is the client. The header is
+    ignored unless the peer itself is a trusted proxy, so it cannot be spoofed.
+    """
+    peer = request.client.host if request.client else "unknown"
+    if not _is_trusted_proxy(peer):
+        return peer
+    forwarded = [
+        hop.strip()
+        for header in request.headers.getlist("x-forwarded-for")
+        for hop in header.split(",")
+        if hop.strip()
     ]
+    for hop in reversed(forwarded):
+        if not _is_trusted_proxy(hop):
+            return hop
+    return forwarded[0] if forwarded else peer
+
+
+def enforce_rate_limit(request: Request, rule_name: str) -> None:
+    """
+    Count a request against a named rule (see settings.RATE_LIMIT_RULES).
     
-    # Check if limit exceeded
-    if len(_rate_limit_storage[client_ip]) >= max_requests:
+    Raises:
+        HTTPException: 429 with Retry-After if the client is over the limit
+    """
+    result = rate_limiter.check(rule_name, client_ip(request))
+    if not result.allowed:
+        minutes = max(1, math.ceil(result.retry_after / 60))
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail=f"Rate limit exceeded. Please try again in {window_minutes} minutes."
+            detail=f"Rate limit exceeded. Please try again in {minutes} minutes.",
+            headers={"Retry-After": str(result.retry_after)},
         )
-    
-    # Add current request
-    _rate_limit_storage[client_ip].append(now)
+
+
+def rate_limit(rule_name: str):
+    """Build a route dependency that enforces a named rate limit rule per client IP"""
+    def dependency(request: Request) -> None:
+        enforce_rate_limit(request, rule_name)
+    return dependency
+
+
+# Public application form: 5 requests per hour per IP by default
+rate_limit_public = rate_limit("public_apply")
 
 
 async def get_company_id(
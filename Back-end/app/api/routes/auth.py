@@ -149,9 +149,13 @@ async def refresh_token(data: RefreshTokenRequest, db: Session = Depends(get_db)
         if not user.is_active:
             raise HTTPException(status_code=401, detail="Hesap devre dışı")
         
+        # Tokens issued before a password reset are revoked
+        if payload.get("tv", 0) != (user.token_version or 0):
+            raise HTTPException(status_code=401, detail="Geçersiz veya süresi dolmuş token")
+        
         # Create new tokens
-        new_access_token = create_access_token(data={"sub": str(user.id)})
-        new_refresh_token = create_refresh_token(data={"sub": str(user.id)})
+        new_access_token = create_access_token(data={"sub": str(user.id), "tv": user.token_version or 0})
+        new_refresh_token = create_refresh_token(data={"sub": str(user.id), "tv": user.token_version or 0})
         
         return TokenResponse(
             access_token=new_access_token,
@@ -3,16 +3,19 @@ Public API Routes
 These endpoints are accessible without authentication for the public career page.
 Includes: job listings, job details, and public application submission.
 """
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Request, Response
 from fastapi import BackgroundTasks
 from sqlalchemy.orm import Session
-from typing import Optional, List
+from typing import Dict, Optional, List
 import logging
 
 from app.core.database import get_db
 from app.services.job import JobService
 from app.services.application_service import ApplicationService
-from app.api.dependencies import rate_limit_public
+from app.api.dependencies import rate_limit, rate_limit_public
+from app.models.application import Application
+from app.models.job import Job
+from app.services.public_job_cache import JOB_BOARD_KEY, encode_response, public_job_cache
 from app.models.company import Company
 from app.modules.job_intro.models import JobIntroTemplate
 from app.modules.job_outro.models import JobOutroTemplate
@@ -26,8 +29,127 @@ router = APIRouter(
 )
 
 
+def _company_info(company: Optional[Company]) -> Optional[dict]:
+    if not company:
+        return None
+    return {
+        "name": company.name,
+        "logo_url": company.logo_url,
+        "about": company.about
+    }
+
+
+def _first_active_templates(db: Session, model, company_ids: List) -> Dict:
+    """company_id -> content of its first active template, in one query"""
+    if not company_ids:
+        return {}
+    templates = db.query(model.company_id, model.content).filter(
+        model.company_id.in_(company_ids),
+        model.is_active == True
+    ).order_by(model.created_at).all()
+    contents = {}
+    for company_id, content in templates:
+        contents.setdefault(company_id, content)
+    return contents
+
+
+def _serialize_public_job(job: Job, company: Optional[Company], intros: Dict, outros: Dict) -> dict:
+    """Public-safe job fields with intro/outro from templates if not set on job"""
+    intro_text = job.intro_text
+    outro_text = job.outro_text
+    if company:
+        if not intro_text:
+            intro_text = intros.get(job.company_id)
+        if not outro_text:
+            outro_text = outros.get(job.company_id)
+    
+    return {
+        "id": job.id,
+        "title": job.title,
+        "department_id": job.department_id,
+        "intro_text": intro_text,  # Job introduction/preamble (or default template)
+        "outro_text": outro_text,  # Job conclusion/what we offer (or default template)
+        "description": job.description,
+        "description_plain": job.description_plain,
+        "requirements": job.requirements,
+        "requirements_plain": job.requirements_plain,
+        "keywords": job.keywords,
+        "location": job.location,
+        "remote_policy": job.remote_policy,
+        "employment_type": job.employment_type,
+        "experience_level": job.experience_level,
+        "required_education": job.required_education,
+        "preferred_majors": job.preferred_majors,
+        "required_languages": job.required_languages,
+        "salary_min": job.salary_min,
+        "salary_max": job.salary_max,
+        "salary_currency": job.salary_currency,
+        "deadline": job.deadline.isoformat() if job.deadline else None,
+        "start_date": job.start_date,
+        "created_at": job.created_at.isoformat(),
+    }
+
+
+def _build_job_board(db: Session):
+    """All active jobs with companies and default templates prefetched in bulk"""
+    jobs = JobService.list_all(
+        db=db,
+        include_inactive=False,
+        status="active"
+    )
+    
+    company_ids = list({job.company_id for job in jobs if job.company_id})
+    companies = {
+        company.id: company
+        for company in db.query(Company).filter(Company.id.in_(company_ids)).all()
+    } if company_ids else {}
+    intros = _first_active_templates(db, JobIntroTemplate, company_ids)
+    outros = _first_active_templates(db, JobOutroTemplate, company_ids)
+    
+    result = []
+    for job in jobs:
+        company = companies.get(job.company_id)
+        item = _serialize_public_job(job, company, intros, outros)
+        item["company"] = _company_info(company)
+        result.append(item)
+    return result, None
+
+
+def _build_job_detail(db: Session, job_id: str):
+    job = JobService.get_by_id(db=db, job_id=job_id)
+    
+    # Only allow access to active jobs
+    if job.status != "active" or not job.is_active:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    company = None
+    intros, outros = {}, {}
+    if job.company_id:
+        company = db.query(Company).filter(Company.id == job.company_id).first()
+        if company:
+            intros = _first_active_templates(db, JobIntroTemplate, [job.company_id])
+            outros = _first_active_templates(db, JobOutroTemplate, [job.company_id])
+    
+    payload = {
+        "success": True,
+        "job": _serialize_public_job(job, company, intros, outros),
+        "company": _company_info(company)
+    }
+    return payload, job.company_id
+
+
+def _json_response(request: Request, body: bytes, etag: str) -> Response:
+    """200 with ETag, or 304 when the client already has this representation"""
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=0, must-revalidate"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 @router.get("/jobs")
 async def get_public_jobs(
+    request: Request,
     location: Optional[str] = None,
     department_id: Optional[str] = None,
     employment_type: Optional[str] = None,
@@ -46,101 +168,40 @@ async def get_public_jobs(
     - search: Search in title, description, keywords
     
     Returns:
-    - List of active jobs with basic information
+    - List of active jobs with basic information (supports If-None-Match)
     """
     try:
-        # Only return active jobs for public
-        jobs = JobService.list_all(
-            db=db,
-            include_inactive=False,
-            status="active"
-        )
+        board = public_job_cache.get_or_build(JOB_BOARD_KEY, lambda: _build_job_board(db))
+        filters = (location, department_id, employment_type, experience_level, search)
+        if not any(filters):
+            return _json_response(request, board.body, board.etag)
+        
+        jobs = board.payload
         
         # Apply filters
         if location:
-            jobs = [j for j in jobs if j.location.lower() == location.lower()]
+            jobs = [j for j in jobs if (j["location"] or "").lower() == location.lower()]
         
         if department_id:
-            jobs = [j for j in jobs if j.department_id == department_id]
+            jobs = [j for j in jobs if j["department_id"] == department_id]
         
         if employment_type:
-            jobs = [j for j in jobs if j.employment_type == employment_type]
+            jobs = [j for j in jobs if j["employment_type"] == employment_type]
         
         if experience_level:
-            jobs = [j for j in jobs if j.experience_level == experience_level]
+            jobs = [j for j in jobs if j["experience_level"] == experience_level]
         
         if search:
             search_lower = search.lower()
             jobs = [
                 j for j in jobs 
-                if search_lower in j.title.lower() 
-                or search_lower in (j.description_plain or j.description or "").lower()
-                or any(search_lower in k.lower() for k in (j.keywords or []))
+                if search_lower in j["title"].lower() 
+                or search_lower in (j["description_plain"] or j["description"] or "").lower()
+                or any(search_lower in k.lower() for k in (j["keywords"] or []))
             ]
         
-        # Return public-safe data with intro/outro from templates if not set on job
-        result = []
-        for job in jobs:
-            intro_text = job.intro_text
-            outro_text = job.outro_text
-            company_info = None
-            
-            # Get company info and default templates if available
-            if job.company_id:
-                company = db.query(Company).filter(Company.id == job.company_id).first()
-                if company:
-                    company_info = {
-                        "name": company.name,
-                        "logo_url": company.logo_url,
-                        "about": company.about
-                    }
-                    
-                    # If job doesn't have intro_text, get the first active intro template
-                    if not intro_text:
-                        intro_template = db.query(JobIntroTemplate).filter(
-                            JobIntroTemplate.company_id == job.company_id,
-                            JobIntroTemplate.is_active == True
-                        ).first()
-                        if intro_template:
-                            intro_text = intro_template.content
-                    
-                    # If job doesn't have outro_text, get the first active outro template
-                    if not outro_text:
-                        outro_template = db.query(JobOutroTemplate).filter(
-                            JobOutroTemplate.company_id == job.company_id,
-                            JobOutroTemplate.is_active == True
-                        ).first()
-                        if outro_template:
-                            outro_text = outro_template.content
-            
-            result.append({
-                "id": job.id,
-                "title": job.title,
-                "department_id": job.department_id,
-                "intro_text": intro_text,
-                "outro_text": outro_text,
-                "description": job.description,
-                "description_plain": job.description_plain,
-                "requirements": job.requirements,
-                "requirements_plain": job.requirements_plain,
-                "keywords": job.keywords,
-                "location": job.location,
-                "remote_policy": job.remote_policy,
-                "employment_type": job.employment_type,
-                "experience_level": job.experience_level,
-                "required_education": job.required_education,
-                "preferred_majors": job.preferred_majors,
-                "required_languages": job.required_languages,
-                "salary_min": job.salary_min,
-                "salary_max": job.salary_max,
-                "salary_currency": job.salary_currency,
-                "deadline": job.deadline.isoformat() if job.deadline else None,
-                "start_date": job.start_date,
-                "created_at": job.created_at.isoformat(),
-                "company": company_info
-            })
-        
-        return result
+        filtered = encode_response(jobs)
+        return _json_response(request, filtered.body, filtered.etag)
     
     except Exception as e:
         logger.error(f"Error fetching public jobs: {str(e)}")
@@ -150,6 +211,7 @@ async def get_public_jobs(
 @router.get("/jobs/{job_id}")
 async def get_public_job_detail(
     job_id: str,
+    request: Request,
     db: Session = Depends(get_db)
 ):
     """
@@ -159,79 +221,11 @@ async def get_public_job_detail(
     - job_id: Job UUID
     
     Returns:
-    - Detailed job information with company info and intro/outro texts
+    - Detailed job information with company info and intro/outro texts (supports If-None-Match)
     """
     try:
-        job = JobService.get_by_id(db=db, job_id=job_id)
-        
-        if not job:
-            raise HTTPException(status_code=404, detail="Job not found")
-        
-        # Only allow access to active jobs
-        if job.status != "active" or not job.is_active:
-            raise HTTPException(status_code=404, detail="Job not found")
-        
-        # Get company information and default templates
-        company_info = None
-        intro_text = job.intro_text
-        outro_text = job.outro_text
-        
-        if job.company_id:
-            company = db.query(Company).filter(Company.id == job.company_id).first()
-            if company:
-                company_info = {
-                    "name": company.name,
-                    "logo_url": company.logo_url,
-                    "about": company.about
-                }
-                
-                # If job doesn't have intro_text, get the first active intro template for the company
-                if not intro_text:
-                    intro_template = db.query(JobIntroTemplate).filter(
-                        JobIntroTemplate.company_id == job.company_id,
-                        JobIntroTemplate.is_active == True
-                    ).first()
-                    if intro_template:
-                        intro_text = intro_template.content
-                
-                # If job doesn't have outro_text, get the first active outro template for the company
-                if not outro_text:
-                    outro_template = db.query(JobOutroTemplate).filter(
-                        JobOutroTemplate.company_id == job.company_id,
-                        JobOutroTemplate.is_active == True
-                    ).first()
-                    if outro_template:
-                        outro_text = outro_template.content
-        
-        return {
-            "success": True,
-            "job": {
-                "id": job.id,
-                "title": job.title,
-                "department_id": job.department_id,
-                "intro_text": intro_text,  # Job introduction/preamble (or default template)
-                "outro_text": outro_text,  # Job conclusion/what we offer (or default template)
-                "description": job.description,
-                "description_plain": job.description_plain,
-                "requirements": job.requirements,
-                "requirements_plain": job.requirements_plain,
-                "keywords": job.keywords,
-                "location": job.location,
-                "remote_policy": job.remote_policy,
-                "employment_type": job.employment_type,
-                "experience_level": job.experience_level,
-                "required_education": job.required_education,
-                "preferred_majors": job.preferred_majors,
-                "required_languages": job.required_languages,
-                "salary_min": job.salary_min,
-                "salary_max": job.salary_max,
-                "salary_currency": job.salary_currency,
-                "deadline": job.deadline.isoformat() if job.deadline else None,
-                "start_date": job.start_date,
-                "created_at": job.created_at.isoformat(),
-            },
-            "company": company_info
-        }
+        detail = public_job_cache.get_or_build(job_id, lambda: _build_job_detail(db, job_id))
+        return _json_response(request, detail.body, detail.etag)
     
     except HTTPException:
         raise
@@ -262,15 +256,15 @@ async def submit_public_application(
     
     Process:
     1. Validate job exists and is active
-    2. Upload and parse CV
+    2. Upload CV
     3. Create/update candidate record
-    4. Perform AI matching analysis
-    5. Create application record with match score
-    6. Send notification email to HR
-    7. Send confirmation email to applicant
+    4. Create application record (processing_status=queued)
+    
+    CV parsing, AI matching and the HR/applicant emails run in the background;
+    poll /api/public/applications/{application_id}/status for progress.
     
     Returns:
-    - Application ID and success message
+    - Application ID, processing status and success message
     """
     try:
         # Initialize application service
@@ -296,3 +290,35 @@ async def submit_public_application(
             status_code=500,
             detail="Failed to process application. Please try again later."
         )
+
+
+@router.get(
+    "/applications/{application_id}/status",
+    dependencies=[Depends(rate_limit("public_status"))]
+)
+async def get_public_application_status(
+    application_id: str,
+    db: Session = Depends(get_db)
+):
+    """
+    Get processing status of a submitted application (public access).
+    
+    Returns:
+    - processing_status: queued, processing, completed or failed
+    - error: reason when processing failed
+    
+    An application whose file is not a usable CV is discarded, so a 404 after a
+    queued/processing status means the CV was rejected and can be resubmitted.
+    """
+    application = db.query(Application).filter(
+        Application.id == application_id,
+        Application.source == "public_application"
+    ).first()
+    if not application:
+        raise HTTPException(status_code=404, detail="Application not found")
+    
+    return {
+        "application_id": application.id,
+        "processing_status": application.processing_status,
+        "error": application.processing_error,
+    }
@@ -12,6 +12,10 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 480
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    # Verified-token and active-user caches (per worker)
+    TOKEN_DECODE_CACHE_SIZE: int = 4096
+    AUTH_USER_CACHE_SIZE: int = 1024
+    AUTH_USER_CACHE_TTL_SECONDS: float = 30.0
     
     # File Uploads
     UPLOAD_DIR: Path = Path(__file__).parent.parent.parent / "uploads"
@@ -21,6 +25,14 @@ class Settings(BaseSettings):
     
     # AI Service
     AI_SERVICE_URL: str = "http://127.0.0.1:8001"
+    # Semantic search: texts per /embed call, and max missing CV embeddings filled per search
+    EMBEDDING_BATCH_SIZE: int = 64
+    EMBEDDING_BACKFILL_LIMIT: int = 500
+    # How long the AI-Service embedding model id is trusted before asking again;
+    # vectors of another model are re-embedded, never compared
+    EMBEDDING_MODEL_CACHE_SECONDS: int = 300
+    # Share of the job's requirements (vs. description) in the search vector
+    EMBEDDING_REQUIREMENTS_WEIGHT: float = 0.5
     
     # Email
     MAIL_USERNAME: Optional[str] = None
@@ -51,6 +63,58 @@ class Settings(BaseSettings):
     # Reset Password
     RESET_PASSWORD_TOKEN_EXPIRE_MINUTES: int = 15
 
+    # Rate limiting for public endpoints: "memory" (per worker) or "postgres" (shared
+    # across workers and hosts; docker-compose.prod.yml sets it, since it runs 2 workers)
+    RATE_LIMIT_BACKEND: str = "memory"
+    RATE_LIMIT_MAX_KEYS: int = 100_000
+    # rule name -> "<limit>/<window seconds>"; override with a JSON object in env
+    RATE_LIMIT_RULES: dict = {
+        "public_apply": "5/3600",
+        "public_offer": "30/60",
+        "public_shortlist": "60/60",
+        "public_interview": "120/60",
+        "public_likert": "120/60",
+        "public_status": "60/60",
+    }
+    # Peers allowed to set X-Forwarded-For (Caddy on the compose network); the
+    # rate limit key is the first untrusted address in the chain. JSON list in env
+    RATE_LIMIT_TRUSTED_PROXIES: list = ["127.0.0.1/32", "::1/128", "10.0.0.0/8", "172.16.0.0/12", "192.168.0.0/16"]
+
+    # Background processing of public applications (CV parse + AI match + emails)
+    PUBLIC_APPLICATION_WORKERS: int = 2
+    PUBLIC_APPLICATION_STALE_MINUTES: int = 10
+    PUBLIC_APPLICATION_RECOVER_INTERVAL_SECONDS: int = 60  # how often stale rows are re-claimed
+
+    # Monthly partitions of application_history / usage_tracking (migration 058)
+    PARTITION_MAINTENANCE_ENABLED: bool = True
+    PARTITION_MONTHS_AHEAD: int = 3
+    PARTITION_MAINTENANCE_INTERVAL_HOURS: float = 6.0
+    # Months kept row by row before the current one; older partitions are rolled
+    # into the *_monthly summary tables and dropped (0 = keep forever)
+    USAGE_TRACKING_RETENTION_MONTHS: int = 24
+    APPLICATION_HISTORY_RETENTION_MONTHS: int = 0
+
+    # Career page response cache (per worker; explicit invalidation + TTL)
+    PUBLIC_JOB_CACHE_TTL_SECONDS: float = 60.0
+
+    # Plan limits and monthly usage counters per company (per worker; bounds cross-worker staleness)
+    ENTITLEMENT_CACHE_SIZE: int = 1024
+    ENTITLEMENT_CACHE_TTL_SECONDS: float = 30.0
+    # Quota held by an upload/analysis batch is freed after this long without a
+    # refresh (covers workers that died mid-batch); running batches refresh it
+    USAGE_RESERVATION_TTL_SECONDS: int = 900
+
+    # GraphQL query profiler: log operations above either threshold; with
+    # GRAPHQL_PROFILE_DEBUG, "X-GraphQL-Profile: 1" returns the breakdown
+    GRAPHQL_SLOW_OPERATION_MS: float = 1000.0
+    GRAPHQL_SLOW_OPERATION_SQL: int = 50
+    GRAPHQL_PROFILE_DEBUG: bool = False
+
+    # OpenTelemetry tracing: none, otlp (OTEL_EXPORTER_OTLP_ENDPOINT), file or console
+    OTEL_TRACES_EXPORTER: str = "none"
+    OTEL_TRACES_FILE: str = "traces.jsonl"
+    OTEL_SERVICE_NAME: str = "cv-manager-api"
+
     # Optional initial admin seed
     ADMIN_EMAIL: Optional[str] = None
     ADMIN_PASSWORD: Optional[str] = None
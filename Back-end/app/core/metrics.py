@@ -0,0 +1,168 @@
+"""
+Prometheus metrics for the API, served at ``GET /metrics``.
+
+Event metrics (request latency, emails, cache lookups) are module-level
+collectors updated where the event happens. Point-in-time state (DB pool,
+pubsub subscribers, application queue) is read at scrape time by
+``RuntimeCollector``, so the hot path pays nothing for it.
+
+With several uvicorn workers set ``PROMETHEUS_MULTIPROC_DIR`` to a shared,
+empty directory: event metrics are then aggregated across workers, while
+runtime gauges describe the worker that answered the scrape.
+"""
+from __future__ import annotations
+
+import os
+import time
+from typing import Any, Iterable, Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.multiprocess import MultiProcessCollector
+from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# Requests range from cached public pages (ms) to AI-backed mutations (tens of s)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+
+GRAPHQL_OPERATION_DURATION = Histogram(
+    "graphql_operation_duration_seconds",
+    "GraphQL operation latency by operation name",
+    ["operation", "type", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+
+GRAPHQL_OPERATION_SQL_STATEMENTS = Histogram(
+    "graphql_operation_sql_statements",
+    "SQL statements issued per GraphQL operation",
+    ["operation"],
+    buckets=(0, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000),
+)
+
+EMAILS_SENT = Counter(
+    "emails_sent_total",
+    "Email send attempts by transport and outcome",
+    ["transport", "outcome"],
+)
+
+CACHE_REQUESTS = Counter(
+    "cache_requests_total",
+    "Cache lookups by cache and result (hit/miss)",
+    ["cache", "result"],
+)
+
+
+def cache_outcome(cache: str) -> Tuple[Any, Any]:
+    """Pre-bound (hit, miss) counters for one cache"""
+    return CACHE_REQUESTS.labels(cache, "hit"), CACHE_REQUESTS.labels(cache, "miss")
+
+
+class RuntimeCollector:
+    """Gauges read from live objects at scrape time"""
+
+    def describe(self) -> list:
+        # Registered at import time; do not touch the live objects until a scrape
+        return []
+
+    def collect(self) -> Iterable[GaugeMetricFamily]:
+        from app.core.database import async_engine, engine
+        from app.graphql.pubsub import pubsub
+        from app.services.application_pipeline import public_application_processor
+
+        pool = GaugeMetricFamily(
+            "db_pool_connections",
+            "SQLAlchemy pool connections by engine and state",
+            labels=["engine", "state"],
+        )
+        for name, eng in (("sync", engine), ("async", async_engine.sync_engine)):
+            p = eng.pool
+            if not hasattr(p, "checkedout"):
+                continue  # NullPool/StaticPool keep no statistics
+            pool.add_metric([name, "size"], p.size())
+            pool.add_metric([name, "checked_out"], p.checkedout())
+            pool.add_metric([name, "checked_in"], p.checkedin())
+            pool.add_metric([name, "overflow"], max(p.overflow(), 0))
+        yield pool
+
+        subscribers = GaugeMetricFamily(
+            "pubsub_subscribers",
+            "Active GraphQL subscription listeners",
+        )
+        subscribers.add_metric([], pubsub.subscriber_count())
+        yield subscribers
+
+        topics = GaugeMetricFamily("pubsub_topics", "Topics with at least one listener")
+        topics.add_metric([], pubsub.topic_count())
+        yield topics
+
+        queue = GaugeMetricFamily(
+            "application_queue_depth",
+            "Public applications waiting for a processing worker",
+        )
+        queue.add_metric([], public_application_processor.queue_depth)
+        yield queue
+
+
+REGISTRY.register(RuntimeCollector())
+
+
+def metrics_response() -> Response:
+    """Prometheus text exposition of every metric in this process (or all workers)"""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        MultiProcessCollector(registry)
+        registry.register(RuntimeCollector())
+    else:
+        registry = REGISTRY
+    return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
+
+
+class MetricsMiddleware:
+    """ASGI middleware timing every HTTP request by its route template.
+
+    The route is read after the router matched it, so ``/api/public/jobs/{job_id}``
+    is one series, not one per job; unmatched paths and static files are
+    grouped as ``unmatched``. GraphQL requests are additionally broken down per
+    operation by :class:`app.graphql.extensions.OperationMetrics`.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            path = getattr(route, "path", None) or "unmatched"
+            if path != "/metrics":
+                HTTP_REQUEST_DURATION.labels(scope["method"], path, str(status)).observe(
+                    time.perf_counter() - start
+                )
@@ -0,0 +1,243 @@
+"""
+Schema Migrations
+Applies the numbered SQL files in ``Back-end/migrations`` once per database.
+
+Runs once per deploy, before the API starts (``python scripts/migrate.py``);
+the API itself never touches the schema. A run:
+
+1. takes a Postgres advisory lock, so concurrent runs wait for each other
+   instead of racing on DDL;
+2. enables pgvector and creates tables for models that have none yet
+   (``Base.metadata.create_all``);
+3. applies each pending ``NNN_*.sql`` file in its own transaction, recording
+   it in ``schema_migrations`` in that same transaction;
+4. seeds default roles, the first admin and system talent pool tags.
+
+Files numbered up to ``BASELINE_VERSION`` predate the runner. They were applied
+by hand and several cannot be re-run, so the first run on a database records
+them as applied without executing them. A file whose first line is
+``-- migrate: no-transaction`` runs in autocommit mode (for statements such as
+``CREATE INDEX CONCURRENTLY``).
+"""
+from __future__ import annotations
+
+import hashlib
+import importlib
+import os
+import pkgutil
+import re
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "migrations")
+
+# Last file applied by hand before the runner existed
+BASELINE_VERSION = 51
+
+_FILENAME = re.compile(r"^(\d+)_([\w-]+)\.sql$")
+_NO_TRANSACTION = "-- migrate: no-transaction"
+
+
+class MigrationError(Exception):
+    """Raised when the migration files or their history are inconsistent"""
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    path: str
+    checksum: str
+
+    @property
+    def filename(self) -> str:
+        return os.path.basename(self.path)
+
+    def read(self) -> str:
+        with open(self.path, encoding="utf-8") as f:
+            return f.read()
+
+
+@dataclass(frozen=True)
+class AppliedMigration:
+    version: int
+    name: str
+    checksum: str
+    execution_ms: Optional[int]  # None = baselined, never executed
+
+
+def discover(directory: str = MIGRATIONS_DIR) -> List[Migration]:
+    """Migration files ordered by version"""
+    migrations: Dict[int, Migration] = {}
+    for filename in sorted(os.listdir(directory)):
+        match = _FILENAME.match(filename)
+        if match is None:
+            continue
+        path = os.path.join(directory, filename)
+        with open(path, "rb") as f:
+            checksum = hashlib.sha256(f.read()).hexdigest()
+        version = int(match.group(1))
+        if version in migrations:
+            raise MigrationError(f"Duplicate migration version {version}: {migrations[version].filename}, {filename}")
+        migrations[version] = Migration(version, match.group(2), path, checksum)
+    return [migrations[v] for v in sorted(migrations)]
+
+
+def import_all_models() -> None:
+    """Register every model with Base (module models are not imported by app.models)"""
+    import app.models  # noqa: F401
+    import app.modules
+
+    for module in pkgutil.iter_modules(app.modules.__path__):
+        if os.path.exists(os.path.join(app.modules.__path__[0], module.name, "models.py")):
+            importlib.import_module(f"app.modules.{module.name}.models")
+
+
+class MigrationRunner:
+    """Tracks applied migrations in ``schema_migrations`` and applies pending ones"""
+
+    _LOCK_SQL = text("SELECT pg_advisory_lock(hashtext('schema_migrations'))")
+    _UNLOCK_SQL = text("SELECT pg_advisory_unlock(hashtext('schema_migrations'))")
+    _CREATE_TABLE_SQL = text(
+        """
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version INTEGER PRIMARY KEY,
+            name VARCHAR(255) NOT NULL,
+            checksum VARCHAR(64) NOT NULL,
+            execution_ms INTEGER,
+            applied_at TIMESTAMPTZ NOT NULL DEFAULT now()
+        )
+        """
+    )
+    # Model columns use pgvector types, so create_all needs the extension first
+    _EXTENSIONS_SQL = text("CREATE EXTENSION IF NOT EXISTS vector")
+    _TABLE_EXISTS_SQL = text("SELECT to_regclass('schema_migrations') IS NOT NULL")
+    _APPLIED_SQL = text("SELECT version, name, checksum, execution_ms FROM schema_migrations ORDER BY version")
+    _RECORD_SQL = text(
+        """
+        INSERT INTO schema_migrations (version, name, checksum, execution_ms)
+        VALUES (:version, :name, :checksum, :execution_ms)
+        """
+    )
+
+    def __init__(self, engine: Engine, directory: str = MIGRATIONS_DIR, baseline: int = BASELINE_VERSION) -> None:
+        self.engine = engine
+        self.directory = directory
+        self.baseline = baseline
+
+    def applied(self) -> Dict[int, AppliedMigration]:
+        with self.engine.connect() as conn:
+            if not conn.execute(self._TABLE_EXISTS_SQL).scalar():
+                return {}
+            return {row.version: AppliedMigration(*row) for row in conn.execute(self._APPLIED_SQL)}
+
+    def pending(self) -> List[Migration]:
+        applied = self.applied()
+        baselining = not applied
+        return [
+            m for m in discover(self.directory)
+            if m.version not in applied and not (baselining and m.version <= self.baseline)
+        ]
+
+    def changed(self) -> List[Migration]:
+        """Applied files edited afterwards (their new content never ran)"""
+        applied = self.applied()
+        return [
+            m for m in discover(self.directory)
+            if m.version in applied and applied[m.version].checksum != m.checksum
+        ]
+
+    def upgrade(self, create_tables: bool = True, seed: bool = True) -> List[Migration]:
+        """Bring the database up to date; returns the migrations that ran"""
+        migrations = discover(self.directory)
+        ran: List[Migration] = []
+        with self.engine.connect() as lock_conn:
+            lock_conn.execute(self._LOCK_SQL)  # waits for a concurrent run to finish
+            lock_conn.commit()
+            try:
+                if create_tables:
+                    self._create_tables()
+
+                with self.engine.begin() as conn:
+                    first_run = not conn.execute(self._TABLE_EXISTS_SQL).scalar()
+                    conn.execute(self._CREATE_TABLE_SQL)
+                    if first_run:
+                        self._baseline(conn, [m for m in migrations if m.version <= self.baseline])
+
+                applied = self.applied()
+                for migration in migrations:
+                    if migration.version in applied:
+                        if applied[migration.version].checksum != migration.checksum:
+                            print(f"⚠️  {migration.filename} changed after it was applied; the new content was not run")
+                        continue
+                    self._apply(migration)
+                    ran.append(migration)
+
+                if seed:
+                    self._seed()
+            finally:
+                lock_conn.execute(self._UNLOCK_SQL)
+                lock_conn.commit()
+        return ran
+
+    def _create_tables(self) -> None:
+        from app.core.database import Base
+
+        import_all_models()
+        with self.engine.begin() as conn:
+            conn.execute(self._EXTENSIONS_SQL)
+        Base.metadata.create_all(bind=self.engine)
+
+    def _baseline(self, conn: Connection, migrations: List[Migration]) -> None:
+        for migration in migrations:
+            conn.execute(self._RECORD_SQL, {
+                "version": migration.version,
+                "name": migration.name,
+                "checksum": migration.checksum,
+                "execution_ms": None,
+            })
+        if migrations:
+            print(f"📌 Baselined {len(migrations)} migrations up to {migrations[-1].filename}")
+
+    def _apply(self, migration: Migration) -> None:
+        sql = migration.read()
+        print(f"▶️  Applying {migration.filename}")
+        start = time.perf_counter()
+        if sql.lstrip().startswith(_NO_TRANSACTION):
+            with self.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                self._execute_script(conn, sql)
+                self._record(conn, migration, start)
+        else:
+            with self.engine.begin() as conn:
+                self._execute_script(conn, sql)
+                self._record(conn, migration, start)
+        print(f"✅ {migration.filename} ({(time.perf_counter() - start) * 1000:.0f} ms)")
+
+    @staticmethod
+    def _execute_script(conn: Connection, sql: str) -> None:
+        # Through the DBAPI cursor without parameters: the file may hold several
+        # statements, and "%" in format() calls must not be read as placeholders
+        cursor = conn.connection.cursor()
+        try:
+            cursor.execute(sql)
+        finally:
+            cursor.close()
+
+    def _record(self, conn: Connection, migration: Migration, start: float) -> None:
+        conn.execute(self._RECORD_SQL, {
+            "version": migration.version,
+            "name": migration.name,
+            "checksum": migration.checksum,
+            "execution_ms": int((time.perf_counter() - start) * 1000),
+        })
+
+    def _seed(self) -> None:
+        from app.core.seed import seed_defaults
+
+        with Session(self.engine) as db:
+            seed_defaults(db)
@@ -0,0 +1,106 @@
+"""
+Default Data
+Roles, the first admin user and system talent pool tags. Run by the migration
+runner after the schema is up to date; every step is idempotent.
+"""
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.role import Role
+from app.models.user import User
+
+
+def seed_roles_and_admin(db: Session) -> None:
+    # Seed default roles
+    existing = {r.name for r in db.query(Role).all()}
+    for name in ('admin', 'user'):
+        if name not in existing:
+            db.add(Role(name=name))
+    db.commit()
+
+    # Backfill users without role to 'user'
+    user_role = db.query(Role).filter(Role.name == 'user').first()
+    if user_role:
+        db.query(User).filter((User.role_id.is_(None))).update({User.role_id: user_role.id}, synchronize_session=False)
+        db.commit()
+
+    # First-run seed: if no users exist, create an admin
+    users_count = db.query(User).count()
+    if users_count == 0:
+        from app.utils.security import hash_password
+        admin_role = db.query(Role).filter(Role.name == 'admin').first()
+        email = settings.ADMIN_EMAIL or 'admin@example.com'
+        pwd = settings.ADMIN_PASSWORD or 'admin'
+        full_name = settings.ADMIN_FULL_NAME or 'Admin'
+        admin = User(
+            email=email,
+            full_name=full_name,
+            password_hash=hash_password(pwd),
+            role_id=admin_role.id if admin_role else None,
+            is_verified=True
+        )
+        db.add(admin)
+        db.commit()
+    else:
+        # Optional: seed initial admin if explicitly configured and not present
+        if settings.ADMIN_EMAIL and settings.ADMIN_PASSWORD:
+            admin_exists = db.query(User).filter(User.email == settings.ADMIN_EMAIL).first()
+            if not admin_exists:
+                admin_role = db.query(Role).filter(Role.name == 'admin').first()
+                from app.utils.security import hash_password
+                admin = User(
+                    email=settings.ADMIN_EMAIL,
+                    full_name=settings.ADMIN_FULL_NAME or 'Admin',
+                    password_hash=hash_password(settings.ADMIN_PASSWORD),
+                    role_id=admin_role.id if admin_role else None,
+                    is_verified=True
+                )
+                db.add(admin)
+                db.commit()
+
+    # One-time migration: if there is a seeded admin with admin@local.test, update to admin@example.com
+    legacy = db.query(User).filter(User.email == 'admin@local.test').first()
+    if legacy:
+        exists_new = db.query(User).filter(User.email == 'admin@example.com').first()
+        if not exists_new:
+            legacy.email = 'admin@example.com'
+            db.commit()
+
+
+def seed_talent_pool_tags(db: Session) -> None:
+    """Seed system talent pool tags"""
+    from app.modules.talent_pool.models import TalentPoolTag
+
+    system_tags = [
+        {"name": "İletişim Güçlü", "color": "#10b981"},
+        {"name": "Dil Becerisi", "color": "#3b82f6"},
+        {"name": "Teknik Yetkinlik", "color": "#8b5cf6"},
+        {"name": "Liderlik Potansiyeli", "color": "#f59e0b"},
+        {"name": "Yeni Mezun", "color": "#06b6d4"},
+        {"name": "Deneyimli (5+ yıl)", "color": "#ef4444"},
+        {"name": "Uzaktan Çalışmaya Uygun", "color": "#84cc16"},
+        {"name": "Esnek Çalışma Saatleri", "color": "#ec4899"},
+    ]
+
+    for tag_data in system_tags:
+        existing = db.query(TalentPoolTag).filter(
+            TalentPoolTag.is_system == True,
+            TalentPoolTag.name == tag_data["name"]
+        ).first()
+
+        if not existing:
+            tag = TalentPoolTag(
+                name=tag_data["name"],
+                color=tag_data["color"],
+                is_system=True,
+                is_active=True,
+                company_id=None  # System tags have no company
+            )
+            db.add(tag)
+
+    db.commit()
+
+
+def seed_defaults(db: Session) -> None:
+    seed_roles_and_admin(db)
+    seed_talent_pool_tags(db)
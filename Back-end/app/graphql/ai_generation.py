@@ -0,0 +1,246 @@
+"""
+AI Question Generation Resolvers
+Interview and Likert question generation for the template editors.
+
+Loaded on first use by ``app.graphql.lazy_resolvers`` rather than at startup.
+"""
+import httpx
+
+from app.core.config import settings
+from app.core.telemetry import trace_headers
+from app.graphql.types import (
+    GenerateInterviewQuestionsInput,
+    GenerateInterviewQuestionsResultType,
+    GeneratedQuestionType,
+    RegenerateSingleQuestionInput,
+    RegenerateSingleQuestionResultType,
+    GenerateLikertQuestionsInput,
+    GenerateLikertQuestionsResultType,
+    GeneratedLikertQuestionType,
+    RegenerateSingleLikertQuestionInput,
+    RegenerateSingleLikertQuestionResultType,
+)
+
+
+async def generate_interview_questions(input: GenerateInterviewQuestionsInput) -> GenerateInterviewQuestionsResultType:
+    """Generate interview questions using AI based on description"""
+    try:
+        # Call AI Service with new parameters
+        async with httpx.AsyncClient(timeout=60.0, headers=trace_headers()) as client:
+            response = await client.post(
+                f"{settings.AI_SERVICE_URL}/generate-interview-questions",
+                json={
+                    "description": input.description,
+                    "question_count": input.question_count,
+                    "language": input.language,
+                    "question_type": input.question_type,
+                    "difficulty": input.difficulty
+                }
+            )
+
+            if response.status_code != 200:
+                return GenerateInterviewQuestionsResultType(
+                    success=False,
+                    error=f"AI Service error: {response.status_code}"
+                )
+
+            data = response.json()
+
+            if data.get("success"):
+                # Convert to GeneratedQuestionType objects
+                questions = []
+                for q in data.get("questions", []):
+                    if isinstance(q, dict):
+                        questions.append(GeneratedQuestionType(
+                            text=q.get("text", ""),
+                            question_type=q.get("type", "behavioral")
+                        ))
+                    elif isinstance(q, str):
+                        questions.append(GeneratedQuestionType(
+                            text=q,
+                            question_type="behavioral"
+                        ))
+
+                return GenerateInterviewQuestionsResultType(
+                    success=True,
+                    questions=questions
+                )
+            else:
+                return GenerateInterviewQuestionsResultType(
+                    success=False,
+                    error=data.get("error", "Unknown error")
+                )
+
+    except httpx.TimeoutException:
+        return GenerateInterviewQuestionsResultType(
+            success=False,
+            error="AI Service timeout - please try again"
+        )
+    except Exception as e:
+        return GenerateInterviewQuestionsResultType(
+            success=False,
+            error=str(e)
+        )
+
+
+async def regenerate_single_question(input: RegenerateSingleQuestionInput) -> RegenerateSingleQuestionResultType:
+    """Regenerate a single interview question"""
+    try:
+        # Call AI Service
+        async with httpx.AsyncClient(timeout=30.0, headers=trace_headers()) as client:
+            response = await client.post(
+                f"{settings.AI_SERVICE_URL}/regenerate-single-question",
+                json={
+                    "description": input.description,
+                    "question_type": input.question_type,
+                    "difficulty": input.difficulty,
+                    "language": input.language,
+                    "existing_questions": input.existing_questions or []
+                }
+            )
+
+            if response.status_code != 200:
+                return RegenerateSingleQuestionResultType(
+                    success=False,
+                    error=f"AI Service error: {response.status_code}"
+                )
+
+            data = response.json()
+
+            if data.get("success"):
+                q_data = data.get("question", {})
+                question = GeneratedQuestionType(
+                    text=q_data.get("text", ""),
+                    question_type=q_data.get("type", input.question_type)
+                )
+                return RegenerateSingleQuestionResultType(
+                    success=True,
+                    question=question
+                )
+            else:
+                return RegenerateSingleQuestionResultType(
+                    success=False,
+                    error=data.get("error", "Unknown error")
+                )
+
+    except httpx.TimeoutException:
+        return RegenerateSingleQuestionResultType(
+            success=False,
+            error="AI Service timeout - please try again"
+        )
+    except Exception as e:
+        return RegenerateSingleQuestionResultType(
+            success=False,
+            error=str(e)
+        )
+
+
+async def generate_likert_questions(input: GenerateLikertQuestionsInput) -> GenerateLikertQuestionsResultType:
+    """Generate Likert questions using AI based on dimension and settings"""
+    try:
+        # Call AI Service
+        async with httpx.AsyncClient(timeout=60.0, headers=trace_headers()) as client:
+            response = await client.post(
+                f"{settings.AI_SERVICE_URL}/generate-likert-questions",
+                json={
+                    "description": input.description,
+                    "question_count": input.question_count,
+                    "language": input.language,
+                    "dimension": input.dimension,
+                    "direction": input.direction,
+                    "scale_type": input.scale_type
+                }
+            )
+
+            if response.status_code != 200:
+                return GenerateLikertQuestionsResultType(
+                    success=False,
+                    error=f"AI Service error: {response.status_code}"
+                )
+
+            data = response.json()
+
+            if data.get("success"):
+                # Convert to GeneratedLikertQuestionType objects
+                questions = []
+                for q in data.get("questions", []):
+                    if isinstance(q, dict):
+                        questions.append(GeneratedLikertQuestionType(
+                            text=q.get("text", ""),
+                            dimension=q.get("dimension", "leadership"),
+                            direction=q.get("direction", "positive")
+                        ))
+
+                return GenerateLikertQuestionsResultType(
+                    success=True,
+                    questions=questions
+                )
+            else:
+                return GenerateLikertQuestionsResultType(
+                    success=False,
+                    error=data.get("error", "Unknown error")
+                )
+
+    except httpx.TimeoutException:
+        return GenerateLikertQuestionsResultType(
+            success=False,
+            error="AI Service timeout - please try again"
+        )
+    except Exception as e:
+        return GenerateLikertQuestionsResultType(
+            success=False,
+            error=str(e)
+        )
+
+
+async def regenerate_single_likert_question(input: RegenerateSingleLikertQuestionInput) -> RegenerateSingleLikertQuestionResultType:
+    """Regenerate a single Likert question"""
+    try:
+        # Call AI Service
+        async with httpx.AsyncClient(timeout=30.0, headers=trace_headers()) as client:
+            response = await client.post(
+                f"{settings.AI_SERVICE_URL}/regenerate-single-likert-question",
+                json={
+                    "description": input.description,
+                    "dimension": input.dimension,
+                    "direction": input.direction,
+                    "language": input.language,
+                    "existing_questions": input.existing_questions or []
+                }
+            )
+
+            if response.status_code != 200:
+                return RegenerateSingleLikertQuestionResultType(
+                    success=False,
+                    error=f"AI Service error: {response.status_code}"
+                )
+
+            data = response.json()
+
+            if data.get("success"):
+                q_data = data.get("question", {})
+                question = GeneratedLikertQuestionType(
+                    text=q_data.get("text", ""),
+                    dimension=q_data.get("dimension", input.dimension),
+                    direction=q_data.get("direction", input.direction)
+                )
+                return RegenerateSingleLikertQuestionResultType(
+                    success=True,
+                    question=question
+                )
+            else:
+                return RegenerateSingleLikertQuestionResultType(
+                    success=False,
+                    error=data.get("error", "Unknown error")
+                )
+
+    except httpx.TimeoutException:
+        return RegenerateSingleLikertQuestionResultType(
+            success=False,
+            error="AI Service timeout - please try again"
+        )
+    except Exception as e:
+        return RegenerateSingleLikertQuestionResultType(
+            success=False,
+            error=str(e)
+        )
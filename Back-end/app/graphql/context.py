@@ -0,0 +1,237 @@
+"""
+Request-scoped GraphQL context.
+Parses auth once, holds one DB connection and transaction per operation and the
+per-request loaders.
+"""
+from __future__ import annotations
+
+import logging
+from contextvars import ContextVar
+from typing import Any, AsyncGenerator, Optional
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from starlette.requests import HTTPConnection
+from strawberry.fastapi import BaseContext
+
+from app.core.database import SessionLocal, engine
+from app.api.dependencies import (
+    get_company_id_from_token,
+    get_current_user_from_token,
+    get_request_principal,
+)
+from app.models.user import User
+from app.services.principal_cache import Principal
+
+logger = logging.getLogger(__name__)
+
+
+class RequestSession(Session):
+    """Session shared by every field of one GraphQL operation.
+
+    Query fields resolve concurrently, so one resolver's ``commit()`` or
+    ``close()`` must not end the transaction (or detach objects) under its
+    siblings: ``commit()`` only flushes, ``close()`` does nothing, and the
+    operation's transaction is committed once by ``complete()`` when execution
+    ends, before the result goes out (``RequestTransaction`` extension).
+    Mutation fields run one after another, so there ``commit()`` is real and
+    each mutation is durable (and visible to subscribers) when it returns.
+    """
+
+    request_scope: "RequestDatabase"
+
+    def commit(self) -> None:
+        if self.request_scope.serial:
+            super().commit()
+            return
+        self.flush()
+        self.request_scope.commit_requested = True
+
+    def close(self) -> None:
+        pass
+
+    def complete(self) -> None:
+        """Commit what resolvers committed; raises (after rolling back) if the commit fails"""
+        if not (self.request_scope.commit_requested and self.in_transaction()):
+            return
+        self.request_scope.commit_requested = False
+        try:
+            super().commit()
+        except Exception:
+            super().rollback()
+            raise
+
+    def finish(self) -> None:
+        """Discard anything not committed and release the session"""
+        try:
+            super().rollback()
+        finally:
+            super().close()
+
+
+class RequestDatabase:
+    """One pooled connection and one session per GraphQL operation, checked out lazily.
+
+    Every resolver gets the same ``RequestSession``; its transaction is
+    committed (if a resolver asked for it) when execution ends, and the
+    connection goes back to the pool once, when the request finishes.
+    """
+
+    def __init__(self) -> None:
+        self._connection: Optional[Connection] = None
+        self._session: Optional[RequestSession] = None
+        self.closed = False
+        self.serial = False  # mutation operation: fields never overlap
+        self.commit_requested = False
+
+    def session(self) -> Session:
+        if self._session is None:
+            self._connection = engine.connect()
+            self._session = RequestSession(**{**SessionLocal.kw, "bind": self._connection})
+            self._session.request_scope = self
+        return self._session
+
+    def complete(self) -> None:
+        if self._session is not None:
+            self._session.complete()
+
+    def close(self) -> None:
+        self.closed = True
+        try:
+            if self._session is not None:
+                self._session.finish()
+        finally:
+            if self._connection is not None:
+                self._connection.close()
+            self._session = None
+            self._connection = None
+
+
+_request_db: ContextVar[Optional[RequestDatabase]] = ContextVar("graphql_request_db", default=None)
+
+
+def get_request_scoped_session() -> Optional[Session]:
+    """Return the current operation's session, or None outside a GraphQL request"""
+    scope = _request_db.get()
+    if scope is None or scope.closed:
+        return None
+    return scope.session()
+
+
+class GraphQLContext(BaseContext):
+    """Strawberry context with lazily resolved auth, DB session and loaders.
+
+    Supports ``info.context["request"]`` so existing resolvers keep working.
+    """
+
+    def __init__(self, db_scope: RequestDatabase) -> None:
+        super().__init__()
+        self._db_scope = db_scope
+        self._token: Optional[str] = None
+        self._role_name: Optional[str] = None
+        self._loaders = None
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+    @property
+    def db(self) -> Session:
+        return self._db_scope.session()
+
+    def mark_serial(self) -> None:
+        """Called for mutations: resolver commits on the shared session take effect immediately"""
+        self._db_scope.serial = True
+
+    def complete_transaction(self) -> None:
+        """Called when execution ends: commit the operation's deferred writes"""
+        self._db_scope.complete()
+
+    @property
+    def token(self) -> str:
+        """Bearer token from the Authorization header (parsed once)"""
+        if self._token is None:
+            auth_header = self.request.headers.get("authorization") if self.request else None
+            if not auth_header and self.connection_params:
+                # WebSocket subscriptions: browsers send auth in connection_init
+                auth_header = self.connection_params.get("authorization") or self.connection_params.get("Authorization")
+            if not auth_header:
+                raise Exception("Not authenticated")
+            try:
+                scheme, token = auth_header.split()
+            except ValueError:
+                raise Exception("Invalid authorization header")
+            if scheme.lower() != "bearer":
+                raise Exception("Invalid authentication scheme")
+            self._token = token
+        return self._token
+
+    @property
+    def principal(self) -> Principal:
+        try:
+            return get_request_principal(self.request, self.db)
+        except HTTPException as e:
+            raise Exception(e.detail)
+
+    @property
+    def company_id(self) -> Optional[UUID]:
+        return get_company_id_from_token(self.token)
+
+    def require_company_id(self) -> UUID:
+        company_id = self.company_id
+        if not company_id:
+            raise Exception("Company context required")
+        return company_id
+
+    def current_user(self) -> User:
+        """Authenticated user bound to the request session.
+
+        Not memoized: a resolver's commit/close may expire or detach it, and
+        the principal cache makes repeat lookups free.
+        """
+        return get_current_user_from_token(self.token, self.db)
+
+    def role_name(self) -> Optional[str]:
+        if self._role_name is None:
+            from app.models.role import Role
+
+            user = self.current_user()
+            if user.role_id:
+                role = self.db.query(Role).filter(Role.id == user.role_id).first()
+                self._role_name = role.name if role else None
+        return self._role_name
+
+    @property
+    def loaders(self):
+        if self._loaders is None:
+            from app.graphql.loaders import Loaders
+
+            self._loaders = Loaders(self.db)
+        return self._loaders
+
+
+async def get_graphql_context(connection: HTTPConnection) -> AsyncGenerator[GraphQLContext, None]:
+    """Strawberry ``context_getter``: one context (and at most one connection) per operation.
+
+    Only plain HTTP operations route ``get_db_session()`` through the shared
+    connection; a long-lived WebSocket subscription must not pin one.
+    """
+    scope = RequestDatabase()
+    reset_token = _request_db.set(scope) if connection.scope.get("type") == "http" else None
+    try:
+        yield GraphQLContext(scope)
+    finally:
+        scope.close()
+        if reset_token is not None:
+            try:
+                _request_db.reset(reset_token)
+            except ValueError:
+                # Exit ran in a different context; the closed scope is ignored anyway
+                pass
@@ -0,0 +1,260 @@
+"""
+Strawberry schema extensions.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from inspect import isawaitable
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from opentelemetry import trace
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from strawberry.extensions import SchemaExtension
+from strawberry.types.graphql import OperationType
+
+from app.core.config import settings
+from app.core.metrics import GRAPHQL_OPERATION_DURATION, GRAPHQL_OPERATION_SQL_STATEMENTS
+
+logger = logging.getLogger(__name__)
+
+# Operation names come from the client; cap them so a label stays bounded
+_MAX_OPERATION_NAME = 64
+
+
+def _operation_labels(ctx) -> tuple:
+    """(name, type) of the executed operation; type is None if it never parsed"""
+    try:
+        operation_type = ctx.operation_type
+    except Exception:
+        operation_type = None  # unparsable document or unknown operation name
+    return (ctx.operation_name or "anonymous")[:_MAX_OPERATION_NAME], operation_type
+
+
+class OperationMetrics(SchemaExtension):
+    """Records query/mutation latency per operation name.
+
+    Subscriptions are skipped: their "duration" is the lifetime of the
+    WebSocket stream, not the cost of a request.
+    """
+
+    def on_operation(self) -> Iterator[None]:
+        start = time.perf_counter()
+        yield
+        ctx = self.execution_context
+        name, operation_type = _operation_labels(ctx)
+        if operation_type == OperationType.SUBSCRIPTION:
+            return
+
+        # Label the request's server span with the operation it ran
+        request_span = trace.get_current_span()
+        request_span.set_attribute("graphql.operation.name", name)
+        if operation_type:
+            request_span.set_attribute("graphql.operation.type", operation_type.value)
+
+        failed = bool(ctx.pre_execution_errors) or bool(ctx.result and ctx.result.errors)
+        GRAPHQL_OPERATION_DURATION.labels(
+            name,
+            operation_type.value if operation_type else "invalid",
+            "error" if failed else "ok",
+        ).observe(time.perf_counter() - start)
+
+
+class RequestTransaction(SchemaExtension):
+    """Drives the request session's transaction (see ``app.graphql.context.RequestSession``).
+
+    Mutation fields run one at a time, so their commits are real; query fields
+    share the session concurrently, so their writes are committed once, after
+    execution and before the result is returned. A failed commit replaces the
+    result with an error instead of reporting success for discarded writes.
+    """
+
+    def on_execute(self) -> Iterator[None]:
+        ctx = self.execution_context
+        _, operation_type = _operation_labels(ctx)
+        if operation_type == OperationType.MUTATION and hasattr(ctx.context, "mark_serial"):
+            ctx.context.mark_serial()
+        yield
+        complete_transaction = getattr(ctx.context, "complete_transaction", None)
+        if complete_transaction is None:
+            return
+        try:
+            complete_transaction()
+        except Exception as e:
+            logger.error(f"Committing GraphQL operation '{ctx.operation_name or 'anonymous'}' failed: {str(e)}")
+            raise Exception("Changes could not be saved, please try again")
+
+
+# ── Query profiler ────────────────────────────────────────────────────
+
+
+@dataclass
+class FieldProfile:
+    calls: int = 0
+    seconds: float = 0.0
+    sql_count: int = 0
+
+
+@dataclass
+class OperationProfile:
+    """SQL statements, DB time and resolver time collected for one operation"""
+    sql_count: int = 0
+    sql_seconds: float = 0.0
+    fields: Dict[str, FieldProfile] = field(default_factory=dict)
+
+    def field(self, key: str) -> FieldProfile:
+        stats = self.fields.get(key)
+        if stats is None:
+            stats = self.fields[key] = FieldProfile()
+        return stats
+
+    def top_fields(self, limit: int = 10) -> list:
+        ranked = sorted(self.fields.items(), key=lambda kv: (kv[1].sql_count, kv[1].seconds), reverse=True)
+        return [
+            {
+                "field": key,
+                "calls": stats.calls,
+                "sql": stats.sql_count,
+                "ms": round(stats.seconds * 1000, 2),
+            }
+            for key, stats in ranked[:limit]
+        ]
+
+
+_current_profile: ContextVar[Optional[OperationProfile]] = ContextVar("graphql_profile", default=None)
+# Resolver-backed field being executed; statements it issues are charged to it
+_current_field: ContextVar[Optional[FieldProfile]] = ContextVar("graphql_profile_field", default=None)
+
+# (parent type, field) -> whether the field has its own resolver
+_resolver_fields: Dict[tuple, bool] = {}
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if _current_profile.get() is not None:
+        conn.info.setdefault("graphql_profile_start", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    profile = _current_profile.get()
+    if profile is None:
+        return
+    starts = conn.info.get("graphql_profile_start")
+    elapsed = time.perf_counter() - starts.pop() if starts else 0.0
+    profile.sql_count += 1
+    profile.sql_seconds += elapsed
+    stats = _current_field.get()
+    if stats is not None:
+        stats.sql_count += 1
+
+
+def _has_resolver(info) -> bool:
+    key = (info.parent_type.name, info.field_name)
+    has = _resolver_fields.get(key)
+    if has is None:
+        definition = info.parent_type.fields[info.field_name].extensions.get("strawberry-definition")
+        has = _resolver_fields[key] = getattr(definition, "base_resolver", None) is not None
+    return has
+
+
+class QueryProfiler(SchemaExtension):
+    """Per-operation SQL count, DB time, resolver time per field and payload size.
+
+    Statements are counted through SQLAlchemy cursor events and charged to
+    the operation (and to the resolver-backed field running them) via
+    context variables. Plain attribute fields are not timed, so the overhead
+    stays off the hot path of large lists; lazy loads they trigger are
+    charged to the enclosing resolver.
+
+    Operations slower than ``GRAPHQL_SLOW_OPERATION_MS`` or issuing more
+    than ``GRAPHQL_SLOW_OPERATION_SQL`` statements are logged with their
+    top fields. When ``GRAPHQL_PROFILE_DEBUG`` is on, a request sending
+    ``X-GraphQL-Profile: 1`` gets the breakdown in ``extensions.profile``.
+    """
+
+    def __init__(self, *, execution_context=None) -> None:
+        self.execution_context = execution_context
+        self._report: Optional[Dict[str, Any]] = None
+
+    def on_operation(self) -> Iterator[None]:
+        profile = OperationProfile()
+        token = _current_profile.set(profile)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            try:
+                _current_profile.reset(token)
+            except ValueError:
+                pass
+        self._finish(profile, time.perf_counter() - start)
+
+    def resolve(self, _next: Callable, root: Any, info, *args: Any, **kwargs: Any) -> Any:
+        # Strawberry reuses the first operation's instance here: no state on self
+        if _current_profile.get() is None or not _has_resolver(info):
+            return _next(root, info, *args, **kwargs)
+
+        stats = _current_profile.get().field(f"{info.parent_type.name}.{info.field_name}")
+        stats.calls += 1
+        token = _current_field.set(stats)
+        start = time.perf_counter()
+        try:
+            result = _next(root, info, *args, **kwargs)
+        finally:
+            _current_field.reset(token)
+        if isawaitable(result):
+            return self._await_field(result, stats, start)
+        stats.seconds += time.perf_counter() - start
+        return result
+
+    @staticmethod
+    async def _await_field(result, stats: FieldProfile, start: float) -> Any:
+        token = _current_field.set(stats)
+        try:
+            return await result
+        finally:
+            _current_field.reset(token)
+            stats.seconds += time.perf_counter() - start
+
+    def get_results(self) -> Dict[str, Any]:
+        return {"profile": self._report} if self._report is not None else {}
+
+    def _debug_requested(self) -> bool:
+        if not settings.GRAPHQL_PROFILE_DEBUG:
+            return False
+        request = getattr(self.execution_context.context, "request", None)
+        return bool(request) and request.headers.get("x-graphql-profile") in ("1", "true")
+
+    def _finish(self, profile: OperationProfile, seconds: float) -> None:
+        ctx = self.execution_context
+        name, operation_type = _operation_labels(ctx)
+        if operation_type == OperationType.SUBSCRIPTION:
+            return
+        GRAPHQL_OPERATION_SQL_STATEMENTS.labels(name).observe(profile.sql_count)
+
+        slow = (
+            seconds * 1000 >= settings.GRAPHQL_SLOW_OPERATION_MS
+            or profile.sql_count >= settings.GRAPHQL_SLOW_OPERATION_SQL
+        )
+        debug = self._debug_requested()
+        if not (slow or debug):
+            return
+
+        data = ctx.result.data if ctx.result else None
+        report = {
+            "operation": name,
+            "ms": round(seconds * 1000, 2),
+            "sql": profile.sql_count,
+            "sqlMs": round(profile.sql_seconds * 1000, 2),
+            "payloadBytes": len(json.dumps(data, default=str, separators=(",", ":"))) if data else 0,
+            "fields": profile.top_fields(),
+        }
+        if slow:
+            logger.warning(f"Slow GraphQL operation {json.dumps(report)}")
+        if debug:
+            self._report = report
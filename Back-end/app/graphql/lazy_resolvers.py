@@ -0,0 +1,408 @@
+"""
+Lazily Loaded GraphQL Resolvers
+Fields of rarely used subsystems: offers, benefits, calendar, Likert and AI
+interview email templates, and AI question generation.
+
+Strawberry needs every field when the schema is built, so the declarations
+live here and ``Query`` / ``Mutation`` inherit them. The implementations
+(``app.modules.<name>.resolvers``, ``app.graphql.ai_generation``) are imported
+inside each field and load on the first request that uses them, not at
+startup. Keep it that way: do not import resolver modules at the top of this
+file or from the module packages' ``__init__``.
+"""
+import strawberry
+from strawberry.types import Info
+from typing import Optional, List
+
+from app.graphql.permissions import rate_limited
+from app.graphql.types import (
+    MessageType,
+    # Calendar types
+    CalendarEventsResponse,
+    # AI Interview Email Template types
+    AIInterviewEmailTemplateInput,
+    AIInterviewEmailTemplateUpdateInput,
+    AIInterviewEmailTemplateResponse,
+    AIInterviewEmailTemplateListResponse,
+    # Likert Email Template types
+    LikertEmailTemplateGQLType,
+    LikertEmailTemplateInput,
+    LikertEmailTemplateUpdateInput,
+    LikertEmailTemplateResponse,
+    LikertEmailTemplateVariablesResponse,
+    # Benefits types
+    BenefitType,
+    BenefitInput,
+    BenefitResponseType,
+    # Offer types
+    OfferTemplateType,
+    OfferTemplateInput,
+    OfferTemplateResponseType,
+    OfferType,
+    OfferInput,
+    OfferResponseType,
+    PublicOfferType,
+    OfferResponseInput,
+    # AI question generation types
+    GenerateInterviewQuestionsInput,
+    GenerateInterviewQuestionsResultType,
+    RegenerateSingleQuestionInput,
+    RegenerateSingleQuestionResultType,
+    GenerateLikertQuestionsInput,
+    GenerateLikertQuestionsResultType,
+    RegenerateSingleLikertQuestionInput,
+    RegenerateSingleLikertQuestionResultType,
+)
+
+
+@strawberry.type
+class LazyQuery:
+    """Query fields whose resolvers load on first use"""
+
+    # ============ Calendar Queries ============
+    @strawberry.field
+    def calendar_events(
+        self,
+        info: Info,
+        start_date: str = strawberry.argument(name="startDate"),
+        end_date: str = strawberry.argument(name="endDate"),
+        event_types: Optional[List[str]] = None,
+    ) -> CalendarEventsResponse:
+        """Get calendar events within a date range"""
+        from app.modules.calendar.resolvers import get_calendar_events
+        return get_calendar_events(info, start_date, end_date, event_types)
+
+    # ============================================
+    # AI Interview Email Template Queries
+    # ============================================
+    
+    @strawberry.field
+    def ai_interview_email_templates(
+        self, 
+        info: Info, 
+        language: Optional[str] = None,
+        active_only: bool = False
+    ) -> AIInterviewEmailTemplateListResponse:
+        """Get all AI interview email templates for the company"""
+        from app.modules.ai_interview_template.resolvers import ai_interview_email_templates as get_templates
+        return get_templates(info, language, active_only)
+
+    # ============================================
+    # Likert Email Template Queries
+    # ============================================
+    
+    @strawberry.field
+    def likert_email_templates(self, info: Info) -> List[LikertEmailTemplateGQLType]:
+        """Get all Likert email templates for the company"""
+        from app.modules.likert_template.resolvers import get_likert_templates
+        return get_likert_templates(info)
+
+    @strawberry.field
+    def likert_email_template(self, info: Info, id: str) -> Optional[LikertEmailTemplateGQLType]:
+        """Get a single Likert email template by ID"""
+        from app.modules.likert_template.resolvers import get_likert_template
+        return get_likert_template(info, id)
+
+    @strawberry.field
+    def likert_email_template_variables(self, info: Info) -> LikertEmailTemplateVariablesResponse:
+        """Get available template variables for Likert email templates"""
+        from app.modules.likert_template.resolvers import get_likert_template_variables
+        return get_likert_template_variables(info)
+
+    # ============================================
+    # Benefits Queries (Yan Haklar)
+    # ============================================
+    
+    @strawberry.field
+    def benefits(
+        self, 
+        info: Info, 
+        category: Optional[str] = None,
+        is_active: Optional[bool] = None
+    ) -> List[BenefitType]:
+        """Get all benefits for the company"""
+        from app.modules.benefits.resolvers import get_benefits
+        return get_benefits(info, category, is_active)
+
+    @strawberry.field
+    def benefit(self, info: Info, id: str) -> Optional[BenefitType]:
+        """Get a single benefit by ID"""
+        from app.modules.benefits.resolvers import get_benefit
+        return get_benefit(info, id)
+
+    # ============================================
+    # Offer Template Queries (Teklif Şablonları)
+    # ============================================
+    
+    @strawberry.field
+    def offer_templates(
+        self, 
+        info: Info, 
+        is_active: Optional[bool] = None
+    ) -> List[OfferTemplateType]:
+        """Get all offer templates for the company"""
+        from app.modules.offer.resolvers import get_offer_templates
+        return get_offer_templates(info, is_active)
+
+    @strawberry.field
+    def offer_template(self, info: Info, id: str) -> Optional[OfferTemplateType]:
+        """Get a single offer template by ID"""
+        from app.modules.offer.resolvers import get_offer_template
+        return get_offer_template(info, id)
+
+    # ============================================
+    # Offer Queries (Teklifler)
+    # ============================================
+    
+    @strawberry.field
+    def offers(
+        self, 
+        info: Info, 
+        status: Optional[str] = None
+    ) -> List[OfferType]:
+        """Get all offers for the company"""
+        from app.modules.offer.resolvers import get_offers
+        return get_offers(info, status)
+
+    @strawberry.field
+    def offer(self, info: Info, id: str) -> Optional[OfferType]:
+        """Get a single offer by ID"""
+        from app.modules.offer.resolvers import get_offer
+        return get_offer(info, id)
+
+    @strawberry.field
+    def offer_by_application(
+        self, 
+        info: Info, 
+        application_id: str = strawberry.argument(name="applicationId")
+    ) -> Optional[OfferType]:
+        """Get offer for a specific application"""
+        from app.modules.offer.resolvers import get_offer_by_application
+        return get_offer_by_application(info, application_id)
+
+    @strawberry.field(permission_classes=[rate_limited("public_offer")])
+    def offer_by_token(self, token: str) -> Optional[PublicOfferType]:
+        """Get offer by token (public - for candidate portal)"""
+        from app.modules.offer.resolvers import get_offer_by_token
+        return get_offer_by_token(token)
+
+
+@strawberry.type
+class LazyMutation:
+    """Mutation fields whose resolvers load on first use"""
+
+    # ============================================
+    # AI Interview Email Template Mutations
+    # ============================================
+
+    @strawberry.mutation
+    def create_ai_interview_email_template(
+        self, 
+        info: Info, 
+        input: AIInterviewEmailTemplateInput
+    ) -> AIInterviewEmailTemplateResponse:
+        """Create a new AI interview email template"""
+        from app.modules.ai_interview_template.resolvers import create_ai_interview_email_template
+        return create_ai_interview_email_template(info, input)
+
+    @strawberry.mutation
+    def update_ai_interview_email_template(
+        self, 
+        info: Info, 
+        id: str,
+        input: AIInterviewEmailTemplateUpdateInput
+    ) -> AIInterviewEmailTemplateResponse:
+        """Update an AI interview email template"""
+        from app.modules.ai_interview_template.resolvers import update_ai_interview_email_template
+        return update_ai_interview_email_template(info, id, input)
+
+    @strawberry.mutation
+    def delete_ai_interview_email_template(
+        self, 
+        info: Info, 
+        id: str
+    ) -> AIInterviewEmailTemplateResponse:
+        """Delete an AI interview email template"""
+        from app.modules.ai_interview_template.resolvers import delete_ai_interview_email_template
+        return delete_ai_interview_email_template(info, id)
+
+    # ============================================
+    # Likert Email Template Mutations
+    # ============================================
+
+    @strawberry.mutation
+    async def create_likert_email_template(
+        self, 
+        info: Info, 
+        input: LikertEmailTemplateInput
+    ) -> LikertEmailTemplateResponse:
+        """Create a new Likert test email template"""
+        from app.modules.likert_template.resolvers import create_likert_template
+        return await create_likert_template(info, input)
+
+    @strawberry.mutation
+    async def update_likert_email_template(
+        self, 
+        info: Info, 
+        id: str,
+        input: LikertEmailTemplateUpdateInput
+    ) -> LikertEmailTemplateResponse:
+        """Update a Likert test email template"""
+        from app.modules.likert_template.resolvers import update_likert_template
+        return await update_likert_template(info, id, input)
+
+    @strawberry.mutation
+    async def delete_likert_email_template(
+        self, 
+        info: Info, 
+        id: str
+    ) -> MessageType:
+        """Delete a Likert test email template"""
+        from app.modules.likert_template.resolvers import delete_likert_template
+        return await delete_likert_template(info, id)
+
+    # ============================================
+    # AI Question Generation Mutations
+    # ============================================
+
+    @strawberry.mutation
+    async def generate_interview_questions(
+        self, 
+        info: Info, 
+        input: GenerateInterviewQuestionsInput
+    ) -> GenerateInterviewQuestionsResultType:
+        """Generate interview questions using AI based on description"""
+        from app.graphql.ai_generation import generate_interview_questions
+        return await generate_interview_questions(input)
+
+    @strawberry.mutation
+    async def regenerate_single_question(
+        self, 
+        info: Info, 
+        input: RegenerateSingleQuestionInput
+    ) -> RegenerateSingleQuestionResultType:
+        """Regenerate a single interview question"""
+        from app.graphql.ai_generation import regenerate_single_question
+        return await regenerate_single_question(input)
+
+    @strawberry.mutation
+    async def generate_likert_questions(
+        self, 
+        info: Info, 
+        input: GenerateLikertQuestionsInput
+    ) -> GenerateLikertQuestionsResultType:
+        """Generate Likert questions using AI based on dimension and settings"""
+        from app.graphql.ai_generation import generate_likert_questions
+        return await generate_likert_questions(input)
+
+    @strawberry.mutation
+    async def regenerate_single_likert_question(
+        self, 
+        info: Info, 
+        input: RegenerateSingleLikertQuestionInput
+    ) -> RegenerateSingleLikertQuestionResultType:
+        """Regenerate a single Likert question"""
+        from app.graphql.ai_generation import regenerate_single_likert_question
+        return await regenerate_single_likert_question(input)
+
+    # ============================================
+    # Benefits Mutations (Yan Haklar)
+    # ============================================
+    
+    @strawberry.mutation
+    def create_benefit(self, info: Info, input: BenefitInput) -> BenefitResponseType:
+        """Create a new benefit"""
+        from app.modules.benefits.resolvers import create_benefit
+        return create_benefit(info, input)
+
+    @strawberry.mutation
+    def update_benefit(self, info: Info, id: str, input: BenefitInput) -> BenefitResponseType:
+        """Update an existing benefit"""
+        from app.modules.benefits.resolvers import update_benefit
+        return update_benefit(info, id, input)
+
+    @strawberry.mutation
+    def delete_benefit(self, info: Info, id: str) -> BenefitResponseType:
+        """Delete a benefit"""
+        from app.modules.benefits.resolvers import delete_benefit
+        return delete_benefit(info, id)
+
+    # ============================================
+    # Offer Template Mutations (Teklif Şablonları)
+    # ============================================
+    
+    @strawberry.mutation
+    def create_offer_template(self, info: Info, input: OfferTemplateInput) -> OfferTemplateResponseType:
+        """Create a new offer template"""
+        from app.modules.offer.resolvers import create_offer_template
+        return create_offer_template(info, input)
+
+    @strawberry.mutation
+    def update_offer_template(self, info: Info, id: str, input: OfferTemplateInput) -> OfferTemplateResponseType:
+        """Update an existing offer template"""
+        from app.modules.offer.resolvers import update_offer_template
+        return update_offer_template(info, id, input)
+
+    @strawberry.mutation
+    def delete_offer_template(self, info: Info, id: str) -> OfferTemplateResponseType:
+        """Delete an offer template"""
+        from app.modules.offer.resolvers import delete_offer_template
+        return delete_offer_template(info, id)
+
+    @strawberry.mutation
+    def toggle_offer_template(self, info: Info, id: str) -> OfferTemplateResponseType:
+        """Toggle offer template active status"""
+        from app.modules.offer.resolvers import toggle_offer_template
+        return toggle_offer_template(info, id)
+
+    # ============================================
+    # Offer Mutations (Teklifler)
+    # ============================================
+    
+    @strawberry.mutation
+    def create_offer(self, info: Info, input: OfferInput) -> OfferResponseType:
+        """Create a new offer"""
+        from app.modules.offer.resolvers import create_offer
+        return create_offer(info, input)
+
+    @strawberry.mutation
+    def update_offer(self, info: Info, id: str, input: OfferInput) -> OfferResponseType:
+        """Update an existing offer"""
+        from app.modules.offer.resolvers import update_offer
+        return update_offer(info, id, input)
+
+    @strawberry.mutation
+    def delete_offer(self, info: Info, id: str) -> OfferResponseType:
+        """Delete an offer"""
+        from app.modules.offer.resolvers import delete_offer
+        return delete_offer(info, id)
+
+    @strawberry.mutation
+    def send_offer(self, info: Info, id: str) -> OfferResponseType:
+        """Send an offer to the candidate"""
+        from app.modules.offer.resolvers import send_offer
+        return send_offer(info, id)
+
+    @strawberry.mutation
+    def withdraw_offer(self, info: Info, id: str) -> OfferResponseType:
+        """Withdraw an offer"""
+        from app.modules.offer.resolvers import withdraw_offer
+        return withdraw_offer(info, id)
+
+    @strawberry.mutation
+    def update_offer_status(
+        self, 
+        info: Info, 
+        offer_id: str = strawberry.argument(name="offerId"),
+        status: str = strawberry.argument(name="status"),
+        note: Optional[str] = None
+    ) -> OfferResponseType:
+        """HR updates offer status (accept/reject)"""
+        from app.modules.offer.resolvers import update_offer_status
+        return update_offer_status(info, offer_id, status, note)
+
+    @strawberry.mutation(permission_classes=[rate_limited("public_offer")])
+    def respond_to_offer(self, input: OfferResponseInput) -> OfferResponseType:
+        """Candidate response to an offer (public)"""
+        from app.modules.offer.resolvers import respond_to_offer
+        return respond_to_offer(input)
@@ -0,0 +1,30 @@
+"""
+Per-request DataLoaders.
+Batch the small lookups (roles, companies) that resolvers otherwise repeat per row.
+"""
+from typing import List, Optional
+
+from sqlalchemy.orm import Session
+from strawberry.dataloader import DataLoader
+
+from app.models.company import Company
+from app.models.role import Role
+
+
+class Loaders:
+    """DataLoaders bound to the operation's DB session; built once per request"""
+
+    def __init__(self, db: Session) -> None:
+        self._db = db
+        self.role_name = DataLoader(load_fn=self._load_role_names)
+        self.company = DataLoader(load_fn=self._load_companies)
+
+    async def _load_role_names(self, role_ids: List[str]) -> List[Optional[str]]:
+        rows = self._db.query(Role.id, Role.name).filter(Role.id.in_(role_ids)).all()
+        by_id = {str(rid): name for rid, name in rows}
+        return [by_id.get(str(rid)) for rid in role_ids]
+
+    async def _load_companies(self, company_ids: list) -> List[Optional[Company]]:
+        rows = self._db.query(Company).filter(Company.id.in_(company_ids)).all()
+        by_id = {str(c.id): c for c in rows}
+        return [by_id.get(str(cid)) for cid in company_ids]
@@ -41,19 +41,9 @@ async def get_db_session():
 
 async def get_company_id_from_context(info: Info) -> Optional[UUID]:
     """Extract company_id from JWT token in GraphQL context"""
-    request = info.context["request"]
-    auth_header = request.headers.get("authorization")
-    
-    if not auth_header:
-        return None
-    
     try:
-        scheme, token = auth_header.split()
-        if scheme.lower() != "bearer":
-            return None
-        
-        return get_company_id_from_token(token)
-    except (ValueError, AttributeError):
+        return get_company_id_from_token(info.context.token)
+    except Exception:
         return None
 
 
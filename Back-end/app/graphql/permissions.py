@@ -0,0 +1,41 @@
+"""
+GraphQL permission classes.
+"""
+from typing import Any, Dict, Type
+
+from strawberry.permission import BasePermission
+from strawberry.types import Info
+
+from app.api.dependencies import client_ip
+from app.services.rate_limiter import rate_limiter
+
+
+class IsAdmin(BasePermission):
+    """Caller must be an active user with the admin role.
+
+    Authentication failures propagate with their own message.
+    """
+    message = "Bu işlem için yetkiniz yok"
+
+    def has_permission(self, source: Any, info: Info, **kwargs: Any) -> bool:
+        return info.context.role_name() == "admin"
+
+
+_rate_limit_permissions: Dict[str, Type[BasePermission]] = {}
+
+
+def rate_limited(rule_name: str) -> Type[BasePermission]:
+    """Permission class enforcing a named rate limit rule per client IP.
+
+    Used on public token-based fields (offers, shortlists, interviews, likert).
+    """
+    if rule_name not in _rate_limit_permissions:
+        class _RateLimited(BasePermission):
+            message = "Rate limit exceeded. Please try again later."
+
+            def has_permission(self, source: Any, info: Info, **kwargs: Any) -> bool:
+                return rate_limiter.check(rule_name, client_ip(info.context["request"])).allowed
+
+        _RateLimited.__name__ = f"RateLimited[{rule_name}]"
+        _rate_limit_permissions[rule_name] = _RateLimited
+    return _rate_limit_permissions[rule_name]
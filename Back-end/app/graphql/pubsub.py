@@ -29,6 +29,12 @@ class SimplePubSub:
                     pass
                 await q.put(payload)
 
+    def subscriber_count(self) -> int:
+        return sum(len(queues) for queues in self._topics.values())
+
+    def topic_count(self) -> int:
+        return sum(1 for queues in self._topics.values() if queues)
+
     async def subscribe(self, topic: str) -> AsyncIterator[dict]:
         queue: asyncio.Queue = asyncio.Queue(maxsize=100)
         async with self._lock:
@@ -3,10 +3,23 @@ GraphQL Resolvers
 """
 import strawberry
 from strawberry.types import Info
+import asyncio
+import json
+import locale
 import logging
+import os
+import random
+import re
+import traceback
+import uuid
+import httpx
 from typing import Optional, List, AsyncGenerator
-from datetime import datetime, timedelta
+from datetime import datetime, date, timedelta
 from app.graphql.multi_tenancy_resolvers import CompanyMutation
+from app.graphql.lazy_resolvers import LazyQuery, LazyMutation
+from app.graphql.extensions import OperationMetrics, QueryProfiler, RequestTransaction
+from app.core.telemetry import trace_headers
+from sqlalchemy import func, case, and_, text
 from sqlalchemy.orm import Session
 from strawberry.file_uploads import Upload
 
@@ -38,18 +51,16 @@ from app.graphql.types import (
     AnalyzeJobCandidatesInput,
     GenerateJobWithAIInput,
     GenerateJobResultType,
-    GenerateInterviewQuestionsInput,
-    RegenerateSingleQuestionInput,
-    RegenerateSingleQuestionResultType,
-    GenerateInterviewQuestionsResultType,
     GenerateLikertQuestionsInput,
-    GenerateLikertQuestionsResultType,
-    GeneratedLikertQuestionType,
-    RegenerateSingleLikertQuestionInput,
-    RegenerateSingleLikertQuestionResultType,
     StatsType,
     DailyActivityStatsType,
     ComparisonResultType,
+    LanguageInfoType,
+    EducationInfoType,
+    SkillsCompareType,
+    CandidateCompareType,
+    AIEvaluationType,
+    AIEvaluationBothType,
     SubscriptionUsageType,
     UsageHistoryItem,
     UsageSessionDetail,
@@ -92,19 +103,6 @@ from app.graphql.types import (
     # Full session types for public access
     InterviewSessionFullType,
     LikertSessionFullType,
-    # Benefits types
-    BenefitType,
-    BenefitInput,
-    BenefitResponseType,
-    # Offer types
-    OfferTemplateType,
-    OfferTemplateInput,
-    OfferTemplateResponseType,
-    OfferType,
-    OfferInput,
-    OfferResponseType,
-    PublicOfferType,
-    OfferResponseInput,
     InterviewJobType,
     InterviewCandidateType,
     # Shortlist types
@@ -167,8 +165,6 @@ from app.graphql.types import (
     SecondInterviewInviteInput,
     SecondInterviewFeedbackInput,
     SecondInterviewResponse,
-    # Calendar types
-    CalendarEventsResponse,
     # Company Address types
     CompanyAddressGQLType,
     CompanyAddressInput,
@@ -183,68 +179,57 @@ from app.graphql.types import (
     TemplateVariablesResponse,
     # AI Interview Email Template types
     AIInterviewEmailTemplateType,
-    AIInterviewEmailTemplateInput,
-    AIInterviewEmailTemplateUpdateInput,
-    AIInterviewEmailTemplateResponse,
-    AIInterviewEmailTemplateListResponse,
-    # Likert Email Template types
-    LikertEmailTemplateGQLType,
-    LikertEmailTemplateInput,
-    LikertEmailTemplateUpdateInput,
-    LikertEmailTemplateResponse,
-    LikertEmailTemplateVariablesResponse,
+    # Candidate Search types
+    SimilarCandidateType,
+    CandidateSearchResultType,
 )
 from app.services.auth import AuthService
 from app.services.department import DepartmentService
 from app.services.job import JobService
+from app.services.public_job_cache import public_job_cache
 from app.services.file_upload import FileUploadService
 from app.services.ai_service_client import ai_service_client
-from app.core.database import get_db
 from app.api.dependencies import get_current_user_from_token, get_company_id_from_token
+from app.core.config import settings
 from app.models.user import User
 from app.models.role import Role
 from app.models.company import Company
+from app.models.candidate import Candidate
+from app.models.job import Job
+from app.models.department import Department
+from app.models.application import Application, ApplicationStatus
+from app.models.subscription import ResourceType, UsageTracking, UsageTrackingMonthly
+from app.models.interview import InterviewTemplate, InterviewSession
+from app.modules.likert.models import LikertTemplate, LikertQuestion, LikertSession, LikertAnswer
+from app.modules.agreement.models import AgreementTemplate
+from app.modules.talent_pool.models import TalentPoolEntry, TalentPoolCandidateTag, TalentPoolTag
+from app.modules.history.models import ApplicationHistory, ActionType
+from app.modules.second_interview.models import SecondInterview, SecondInterviewStatus
+from app.schemas.user import UserRegister, UserLogin
+from app.schemas.department import DepartmentCreate, DepartmentUpdate
+from app.schemas.job import JobCreate, JobUpdate
+from app.services.usage_service import UsageService
+from app.services.entitlement_cache import entitlement_cache
 from app.api.authorization import ensure_admin
 from app.graphql.pubsub import pubsub
-
-
-def get_db_session() -> Session:
-    """Get database session for GraphQL (caller is responsible for closing)."""
-    return next(get_db())
+from app.graphql.permissions import IsAdmin, rate_limited
+from app.modules.common.database import get_db_session
+from app.modules.common import AIStreamEventType, ai_stream_event
 
 
 @strawberry.type
-class Query:
+class Query(LazyQuery):
     """GraphQL Query root"""
 
     @strawberry.field
-    def me(self, info: Info) -> Optional[UserType]:
+    async def me(self, info: Info) -> Optional[UserType]:
         """Get current logged-in user"""
-        # Get authorization header
-        request = info.context["request"]
-        auth_header = request.headers.get("authorization")
-        
-        if not auth_header:
-            raise Exception("Not authenticated")
-        
-        # Extract token
-        try:
-            scheme, token = auth_header.split()
-            if scheme.lower() != "bearer":
-                raise Exception("Invalid authentication scheme")
-        except ValueError:
-            raise Exception("Invalid authorization header")
-        
-        # Get user from token
-        db = get_db_session()
         try:
-            user = get_current_user_from_token(token, db)
+            user = info.context.current_user()
             # Resolve role name if present
             role_name = None
             try:
-                if user.role_id:
-                    db_role = db.query(Role).filter(Role.id == user.role_id).first()
-                    role_name = db_role.name if db_role else None
+                role_name = info.context.role_name()
             except Exception:
                 role_name = None
 
@@ -253,7 +238,7 @@ class Query:
             company_logo = None
             try:
                 if user.company_id:
-                    company = db.query(Company).filter(Company.id == user.company_id).first()
+                    company = await info.context.loaders.company.load(user.company_id)
                     if company:
                         company_name = company.name
                         company_logo = company.logo_url
@@ -275,82 +260,46 @@ class Query:
             )
         except Exception as e:
             raise Exception(f"Authentication failed: {str(e)}")
-        finally:
-            db.close()
 
-    @strawberry.field
-    def users(self, info: Info) -> list[UserType]:
+    @strawberry.field(permission_classes=[IsAdmin])
+    async def users(self, info: Info) -> list[UserType]:
         """List all users (admin only)"""
-        request = info.context["request"]
-        auth_header = request.headers.get("authorization")
-        if not auth_header:
-            raise Exception("Not authenticated")
-        try:
-            scheme, token = auth_header.split()
-            if scheme.lower() != "bearer":
-                raise Exception("Invalid authentication scheme")
-        except ValueError:
-            raise Exception("Invalid authorization header")
-
-        db = get_db_session()
-        try:
-            current = get_current_user_from_token(token, db)
-            ensure_admin(current, db)
-            # Multi-tenancy: restrict to same company
-            from app.api.dependencies import get_company_id_from_token
-            company_id = get_company_id_from_token(token)
-            if not company_id:
-                raise Exception("Company context required")
-            rows = db.query(User).filter(User.company_id == company_id).all()
-            out = []
-            for u in rows:
-                role_name = None
-                if u.role_id:
-                    r = db.query(Role).filter(Role.id == u.role_id).first()
-                    role_name = r.name if r else None
-                out.append(UserType(
-                    id=u.id,
-                    email=u.email,
-                    full_name=u.full_name,
-                    is_active=u.is_active,
-                    is_verified=u.is_verified,
-                    role=role_name,
-                    created_at=u.created_at,
-                    updated_at=u.updated_at,
-                ))
-            return out
-        finally:
-            db.close()
+        # Multi-tenancy: restrict to same company
+        company_id = info.context.require_company_id()
+        db = info.context.db
+        rows = db.query(User).filter(User.company_id == company_id).all()
+        role_names = await info.context.loaders.role_name.load_many(
+            [u.role_id for u in rows if u.role_id]
+        )
+        roles_by_id = dict(zip([u.role_id for u in rows if u.role_id], role_names))
+        return [
+            UserType(
+                id=u.id,
+                email=u.email,
+                full_name=u.full_name,
+                is_active=u.is_active,
+                is_verified=u.is_verified,
+                role=roles_by_id.get(u.role_id),
+                created_at=u.created_at,
+                updated_at=u.updated_at,
+            )
+            for u in rows
+        ]
 
     @strawberry.field
     def stats(self, info: Info) -> StatsType:
         """Return per-company counts for dashboard cards (multi-tenancy)"""
-        request = info.context["request"]
-        auth_header = request.headers.get("authorization")
-        if not auth_header:
-            raise Exception("Not authenticated")
-        try:
-            scheme, token = auth_header.split()
-            if scheme.lower() != "bearer":
-                raise Exception("Invalid authentication scheme")
-        except ValueError:
-            raise Exception("Invalid authorization header")
+        token = info.context.token
 
         db = get_db_session()
         try:
             # Validate user (auth required)
             current = get_current_user_from_token(token, db)
-            from app.api.dependencies import get_company_id_from_token
             company_id = get_company_id_from_token(token)
             if not company_id:
                 # If user has no company (system user), return zeros to avoid leaking global data
                 return StatsType(candidate_count=0, job_count=0, application_count=0, department_count=0)
 
-            from app.models.candidate import Candidate
-            from app.models.job import Job
-            from app.models.application import Application
-            from app.models.department import Department
-
             cand_count = db.query(Candidate).filter(Candidate.company_id == company_id).count()
             job_count = db.query(Job).filter(Job.company_id == company_id).count()
             app_count = db.query(Application).filter(Application.company_id == company_id).count()
@@ -373,30 +322,15 @@ class Query:
         CV uploads are counted from usage_tracking (all uploads).
         Other metrics come from application_history (job-specific events).
         """
-        from datetime import datetime, date as date_type
-        from app.modules.history.models import ApplicationHistory, ActionType
-        from app.models.subscription import UsageTracking
-        from sqlalchemy import func, and_, cast, Date
-        
-        request = info.context["request"]
-        auth_header = request.headers.get("authorization")
-        if not auth_header:
-            raise Exception("Not authenticated")
-        try:
-            scheme, token = auth_header.split()
-            if scheme.lower() != "bearer":
-                raise Exception("Invalid authentication scheme")
-        except ValueError:
-            raise Exception("Invalid authorization header")
+        token = info.context.token
 
         db = get_db_session()
         try:
             current = get_current_user_from_token(token, db)
-            from app.api.dependencies import get_company_id_from_token
             company_id = get_company_id_from_token(token)
             if not company_id:
                 return DailyActivityStatsType(
-                    date=date or date_type.today().isoformat(),
+                    date=date or datetime.now().date().isoformat(),
                     cv_uploads=0,
                     cv_analyses=0,
                     interview_invitations=0,
@@ -409,54 +343,54 @@ class Query:
                 try:
                     target_date = datetime.fromisoformat(date).date()
                 except ValueError:
-                    target_date = date_type.today()
+                    target_date = datetime.now().date()
             else:
-                target_date = date_type.today()
+                target_date = datetime.now().date()
 
-            # Get action types for the codes we need
-            action_type_map = {}
-            action_types = db.query(ActionType).filter(
-                ActionType.code.in_(['cv_uploaded', 'cv_analyzed', 'interview_sent', 'rejected', 'likert_sent'])
-            ).all()
-            for at in action_types:
-                action_type_map[at.code] = at.id
+            # Range predicates (not cast(created_at, Date)) so the indexes and the
+            # monthly partitions are used; usage rows are also pinned to their month
+            day_start = datetime.combine(target_date, datetime.min.time())
+            day_end = day_start + timedelta(days=1)
+            month_start = target_date.replace(day=1)
 
             # Count actions for each type on the target date (from application_history)
-            def count_actions(action_code):
-                action_type_id = action_type_map.get(action_code)
-                if not action_type_id:
-                    return 0
-                count = db.query(func.count(ApplicationHistory.id)).filter(
+            action_counts = dict(
+                db.query(ActionType.code, func.count(ApplicationHistory.id))
+                .join(ApplicationHistory, ApplicationHistory.action_type_id == ActionType.id)
+                .filter(
                     and_(
+                        ActionType.code.in_(['interview_sent', 'rejected', 'likert_sent']),
                         ApplicationHistory.company_id == company_id,
-                        ApplicationHistory.action_type_id == action_type_id,
-                        cast(ApplicationHistory.created_at, Date) == target_date
+                        ApplicationHistory.created_at >= day_start,
+                        ApplicationHistory.created_at < day_end
                     )
-                ).scalar() or 0
-                return count
-
-            # CV uploads: count from usage_tracking (includes all bulk uploads)
-            cv_uploads = db.query(func.coalesce(func.sum(UsageTracking.count), 0)).filter(
-                and_(
-                    UsageTracking.company_id == company_id,
-                    UsageTracking.resource_type == "cv_upload",
-                    cast(UsageTracking.created_at, Date) == target_date
                 )
-            ).scalar() or 0
-            
-            # CV analyses: count from usage_tracking (ai_analysis resource type)
-            cv_analyses = db.query(func.coalesce(func.sum(UsageTracking.count), 0)).filter(
-                and_(
-                    UsageTracking.company_id == company_id,
-                    UsageTracking.resource_type == "ai_analysis",
-                    cast(UsageTracking.created_at, Date) == target_date
+                .group_by(ActionType.code)
+                .all()
+            )
+
+            # CV uploads and analyses: count from usage_tracking (includes all bulk uploads)
+            usage_counts = dict(
+                db.query(UsageTracking.resource_type, func.coalesce(func.sum(UsageTracking.count), 0))
+                .filter(
+                    and_(
+                        UsageTracking.company_id == company_id,
+                        UsageTracking.resource_type.in_(["cv_upload", "ai_analysis"]),
+                        UsageTracking.period_start == month_start,
+                        UsageTracking.created_at >= day_start,
+                        UsageTracking.created_at < day_end
+                    )
                 )
-            ).scalar() or 0
+                .group_by(UsageTracking.resource_type)
+                .all()
+            )
+            cv_uploads = usage_counts.get("cv_upload", 0)
+            cv_analyses = usage_counts.get("ai_analysis", 0)
             
             # Other metrics from application_history
-            interview_invitations = count_actions('interview_sent')
-            rejections = count_actions('rejected')
-            likert_invitations = count_actions('likert_sent')
+            interview_invitations = action_counts.get('interview_sent', 0)
+            rejections = action_counts.get('rejected', 0)
+            likert_invitations = action_counts.get('likert_sent', 0)
 
             return DailyActivityStatsType(
                 date=target_date.isoformat(),
@@ -472,50 +406,18 @@ class Query:
     @strawberry.field(name="subscriptionUsage")
     def subscriptionUsage(self, info: Info) -> SubscriptionUsageType:
         """Return current company's subscription usage from usage_tracking table."""
-        request = info.context["request"]
-        auth_header = request.headers.get("authorization")
-        if not auth_header:
-            raise Exception("Not authenticated")
-        try:
-            scheme, token = auth_header.split()
-            if scheme.lower() != "bearer":
-                raise Exception("Invalid authentication scheme")
-        except ValueError:
-            raise Exception("Invalid authorization header")
+        token = info.context.token
 
         db = get_db_session()
         try:
             current = get_current_user_from_token(token, db)
-            from app.api.dependencies import get_company_id_from_token
             company_id = get_company_id_from_token(token)
             if not company_id:
                 raise Exception("Company context required")
 
-            from app.models.subscription import SubscriptionPlan, CompanySubscription, UsageTracking, ResourceType
-            from sqlalchemy import func
-            from datetime import date
-
-            # 1. Get active subscription (trial or active status)
-            sub = db.query(CompanySubscription).filter(
-                CompanySubscription.company_id == company_id,
-                CompanySubscription.status.in_(["trial", "active"])
-            ).order_by(CompanySubscription.created_at.desc()).first()
-
-            if not sub:
-                return SubscriptionUsageType(
-                    plan_name=None,
-                    cv_limit=0,
-                    used_cv_count=0,
-                    usage_percent=0.0,
-                    job_limit=0,
-                    used_job_count=0,
-                    user_limit=0,
-                    used_user_count=0
-                )
-
-            # 2. Get plan details (name, cv_limit, job_limit, user_limit)
-            plan = db.query(SubscriptionPlan).filter(SubscriptionPlan.id == sub.plan_id).first()
-            if not plan:
+            # Active plan (trial or active status) and current month's usage, usually cached
+            entitlements = entitlement_cache.get_or_load(db, company_id)
+            if not entitlements.has_subscription:
                 return SubscriptionUsageType(
                     plan_name=None,
                     cv_limit=0,
@@ -527,50 +429,22 @@ class Query:
                     used_user_count=0
                 )
 
-            # 3. Get usage from usage_tracking table (sum current month sessions)
-            today = date.today()
-            month_start = date(today.year, today.month, 1)
-            from sqlalchemy import func
-            
             # CV-related usage (sum of uploads and AI analyses)
-            used_cv_upload = db.query(func.coalesce(func.sum(UsageTracking.count), 0)).filter(
-                UsageTracking.company_id == company_id,
-                UsageTracking.resource_type == "cv_upload",
-                UsageTracking.period_start >= month_start
-            ).scalar() or 0
-            used_ai_analysis = db.query(func.coalesce(func.sum(UsageTracking.count), 0)).filter(
-                UsageTracking.company_id == company_id,
-                UsageTracking.resource_type == "ai_analysis",
-                UsageTracking.period_start >= month_start
-            ).scalar() or 0
-            used_cv = (used_cv_upload or 0) + (used_ai_analysis or 0)
-
-            # Job Post usage (sum)
-            used_job = db.query(func.coalesce(func.sum(UsageTracking.count), 0)).filter(
-                UsageTracking.company_id == company_id,
-                UsageTracking.resource_type == "job_post",
-                UsageTracking.period_start >= month_start
-            ).scalar() or 0
-
-            # User Account usage (sum)
-            used_user = db.query(func.coalesce(func.sum(UsageTracking.count), 0)).filter(
-                UsageTracking.company_id == company_id,
-                UsageTracking.resource_type == "user_account",
-                UsageTracking.period_start >= month_start
-            ).scalar() or 0
+            used_cv = entitlements.used(ResourceType.CV_UPLOAD) + entitlements.used(ResourceType.AI_ANALYSIS)
+            used_job = entitlements.used(ResourceType.JOB_POST)
+            used_user = entitlements.used(ResourceType.USER_ACCOUNT)
 
-            # 4. Get limits from plan
-            cv_limit = plan.cv_limit or 0
-            job_limit = plan.job_limit or 0
-            user_limit = plan.user_limit or 0
+            # Limits from plan
+            cv_limit = entitlements.cv_limit or 0
+            job_limit = entitlements.job_limit or 0
+            user_limit = entitlements.user_limit or 0
 
-            # 5. Calculate usage percentage
             usage_percent = 0.0
             if cv_limit and cv_limit > 0:
                 usage_percent = round((used_cv / cv_limit) * 100, 2)
 
             return SubscriptionUsageType(
-                plan_name=plan.name,
+                plan_name=entitlements.plan_name,
                 cv_limit=cv_limit,
                 used_cv_count=used_cv,
                 usage_percent=usage_percent,
@@ -582,27 +456,15 @@ class Query:
         finally:
             db.close()
 
-    @strawberry.field
+    @strawberry.field(permission_classes=[IsAdmin])
     def departments(self, info: Info, include_inactive: bool = False) -> list[DepartmentType]:
         """List all departments (admin only)"""
-        request = info.context["request"]
-        auth_header = request.headers.get("authorization")
-        if not auth_header:
-            raise Exception("Not authenticated")
-        try:
-            scheme, token = auth_header.split()
-            if scheme.lower() != "bearer":
-                raise Exception("Invalid authentication scheme")
-        except ValueError:
-            raise Exception("Invalid authorization header")
+        token = info.context.token
 
         db = get_db_session()
         try:
-            current = get_current_user_from_token(token, db)
-            ensure_admin(current, db)
             
             # Extract company_id from token for multi-tenancy filtering
-            from app.api.dependencies import get_company_id_from_token
             company_id = get_company_id_from_token(token)
             if not company_id:
                 raise Exception("Company context required")
@@ -610,9 +472,6 @@ class Query:
             departments = DepartmentService.list_all(db, include_inactive=include_inactive, company_id=company_id)
             
             # Get job counts per department
-            from app.models.job import Job
-            from app.models.candidate import Candidate
-            from sqlalchemy import func
             job_counts = dict(
                 db.query(Job.department_id, func.count(Job.id))
                 .filter(Job.company_id == company_id)
@@ -645,54 +504,25 @@ class Query:
         finally:
             db.close()
 
-    @strawberry.field
+    @strawberry.field(permission_classes=[IsAdmin])
     def department_has_related_records(self, info: Info, id: str) -> bool:
         """Check if department has related candidates or jobs"""
-        request = info.context["request"]
-        auth_header = request.headers.get("authorization")
-        if not auth_header:
-            raise Exception("Not authenticated")
-        try:
-            scheme, token = auth_header.split()
-            if scheme.lower() != "bearer":
-                raise Exception("Invalid authentication scheme")
-        except ValueError:
-            raise Exception("Invalid authorization header")
-
         db = get_db_session()
         try:
-            current = get_current_user_from_token(token, db)
-            ensure_admin(current, db)
             return DepartmentService.has_related_records(db, id)
         finally:
             db.close()
 
-    @strawberry.field
+    @strawberry.field(permission_classes=[IsAdmin])
     def candidate_has_analysis(self, info: Info, candidateId: str) -> bool:
         """Check if candidate has been analyzed (has applications, interviews, or likert sessions)"""
-        request = info.context["request"]
-        auth_header = request.headers.get("authorization")
-        if not auth_header:
-            raise Exception("Not authenticated")
-        try:
-            scheme, token = auth_header.split()
-            if scheme.lower() != "bearer":
-                raise Exception("Invalid authentication scheme")
-        except ValueError:
-            raise Exception("Invalid authorization header")
+        token = info.context.token
 
         db = get_db_session()
         try:
-            current = get_current_user_from_token(token, db)
-            ensure_admin(current, db)
             
-            from app.api.dependencies import get_company_id_from_token
             company_id = get_company_id_from_token(token)
             
-            from app.models.application import Application
-            from app.modules.interview.models import InterviewSession
-            from app.modules.likert.models import LikertSession
-            
             # Check if candidate has any applications
             app_count = db.query(Application).filter(
                 Application.candidate_id == candidateId,
@@ -715,37 +545,23 @@ class Query:
         finally:
             db.close()
 
-    @strawberry.field
+    @strawberry.field(permission_classes=[IsAdmin])
     def job(self, info: Info, id: str) -> Optional[JobType]:
         """Get a single job by ID (admin only)"""
-        request = info.context["request"]
-        auth_header = request.headers.get("authorization")
-        if not auth_header:
-            raise Exception("Not authenticated")
-        try:
-            scheme, token = auth_header.split()
-            if scheme.lower() != "bearer":
-                raise Exception("Invalid authentication scheme")
-        except ValueError:
-            raise Exception("Invalid authorization header")
+        token = info.context.token
 
         db = get_db_session()
         try:
-            current = get_current_user_from_token(token, db)
-            ensure_admin(current, db)
 
-            from app.api.dependencies import get_company_id_from_token
             company_id = get_company_id_from_token(token)
             if not company_id:
                 raise Exception("Company context required")
 
-            from app.models.job import Job
             job = db.query(Job).filter(Job.id == id, Job.company_id == company_id).first()
             if not job:
                 return None
 
             # Get department
-            from app.models.department import Department
             dept = db.query(Department).filter(Department.id == job.department_id).first()
             dept_type = None
             if dept:
@@ -760,8 +576,6 @@ class Query:
                 )
 
             # Get analysis count
-            from app.models.application import Application, ApplicationStatus
-            from sqlalchemy import func
             analysis_count = db.query(func.count(Application.id)).filter(
                 Application.job_id == job.id,
                 Application.status != ApplicationStatus.PENDING
@@ -770,7 +584,6 @@ class Query:
             # Get interview template
             interview_template = None
             if job.interview_template_id:
-                from app.models.interview import InterviewTemplate
                 it = db.query(InterviewTemplate).filter(InterviewTemplate.id == job.interview_template_id).first()
                 if it:
                     interview_template = InterviewTemplateType(
@@ -790,7 +603,6 @@ class Query:
             # Get likert template
             likert_template = None
             if job.likert_template_id:
-                from app.modules.likert.models import LikertTemplate
                 lt = db.query(LikertTemplate).filter(LikertTemplate.id == job.likert_template_id).first()
                 if lt:
                     likert_template = LikertTemplateType(
@@ -851,7 +663,7 @@ class Query:
         finally:
             db.close()
 
-    @strawberry.field
+    @strawberry.field(permission_classes=[IsAdmin])
     def jobs(
         self,
         info: Info,
@@ -861,24 +673,12 @@ class Query:
         search_term: Optional[str] = None
     ) -> list[JobType]:
         """List all jobs with optional filters (admin only)"""
-        request = info.context["request"]
-        auth_header = request.headers.get("authorization")
-        if not auth_header:
-            raise Exception("Not authenticated")
-        try:
-            scheme, token = auth_header.split()
-            if scheme.lower() != "bearer":
-                raise Exception("Invalid authentication scheme")
-        except ValueError:
-            raise Exception("Invalid authorization header")
+        token = info.context.token
 
         db = get_db_session()
         try:
-            current = get_current_user_from_token(token, db)
-            ensure_admin(current, db)
 
             # Extract company_id from token for multi-tenancy filtering
-            from app.api.dependencies import get_company_id_from_token
             company_id = get_company_id_from_token(token)
             if not company_id:
                 raise Exception("Company context required")
@@ -893,9 +693,6 @@ class Query:
             )
 
             # Prefetch application counts per job
-            from app.models.application import Application, ApplicationStatus
-            from app.models.candidate import Candidate
-            from sqlalchemy import func
             counts = (
                 db.query(Application.job_id, func.count(Application.id))
                 .filter(Application.status != ApplicationStatus.PENDING)
@@ -906,7 +703,6 @@ class Query:
             count_map = {jid: cnt for jid, cnt in counts}
             
             # Prefetch recent applicants (first 2) for each job
-            from sqlalchemy.orm import aliased
             recent_applicants_map = {}
             for j in jobs:
                 recent_apps = (
@@ -968,7 +764,6 @@ class Query:
                 recent_applicants_map[j.id] = initials
 
             # Preload departments map
-            from app.models.department import Department
             deps = db.query(Department).filter(Department.company_id == company_id).all()
             dep_map = {d.id: d for d in deps}
 
@@ -1029,7 +824,7 @@ class Query:
         finally:
             db.close()
 
-    @strawberry.field
+    @strawberry.field(permission_classes=[IsAdmin])
     def candidates(
         self,
         info: Info,
@@ -1037,25 +832,11 @@ class Query:
         status: Optional[str] = None
     ) -> list[CandidateType]:
         """List all candidates (admin only)"""
-        request = info.context["request"]
-        auth_header = request.headers.get("authorization")
-        if not auth_header:
-            raise Exception("Not authenticated")
-        try:
-            scheme, token = auth_header.split()
-            if scheme.lower() != "bearer":
-                raise Exception("Invalid authentication scheme")
-        except ValueError:
-            raise Exception("Invalid authorization header")
+        token = info.context.token
 
         db = get_db_session()
         try:
-            from app.models import Candidate, Department
-            current = get_current_user_from_token(token, db)
-            ensure_admin(current, db)
-
             # Extract company_id from token for multi-tenancy filtering
-            from app.api.dependencies import get_company_id_from_token
             company_id = get_company_id_from_token(token)
             if not company_id:
                 raise Exception("Company context required")
@@ -1078,7 +859,6 @@ class Query:
             result = []
             
             # Get talent pool entries for all candidates in one query
-            from app.modules.talent_pool.models import TalentPoolEntry
             candidate_ids = [c.id for c in candidates]
             talent_pool_entries = db.query(TalentPoolEntry).filter(
                 TalentPoolEntry.candidate_id.in_(candidate_ids),
@@ -1146,23 +926,8 @@ class Query:
         status: Optional[str] = None,
     ) -> List[ApplicationType]:
         """Get applications (CV analysis results)"""
-        from app.models.application import Application
-        from app.models.job import Job
-        from app.models.candidate import Candidate
-        from app.models.department import Department
-
         # Get authorization header
-        request = info.context["request"]
-        auth_header = request.headers.get("authorization")
-
-        if not auth_header:
-            raise Exception("Not authenticated")
-
-        # Extract token
-        try:
-            scheme, token = auth_header.split()
-        except ValueError:
-            raise Exception("Invalid authorization header")
+        token = info.context.token
 
         db = get_db_session()
         try:
@@ -1170,7 +935,6 @@ class Query:
             current = get_current_user_from_token(token, db)
 
             # Extract company_id from token for multi-tenancy filtering
-            from app.api.dependencies import get_company_id_from_token
             company_id = get_company_id_from_token(token)
             if not company_id:
                 raise Exception("Company context required")
@@ -1185,7 +949,6 @@ class Query:
                 query = query.filter(Application.candidate_id == candidate_id)
 
             if status:
-                from app.models.application import ApplicationStatus
                 try:
                     status_enum = ApplicationStatus(status)
                     query = query.filter(Application.status == status_enum)
@@ -1262,7 +1025,6 @@ class Query:
                         )
 
                     # Check talent pool status for this candidate
-                    from app.modules.talent_pool.models import TalentPoolEntry, TalentPoolCandidateTag, TalentPoolTag
                     talent_pool_entry = db.query(TalentPoolEntry).filter(
                         TalentPoolEntry.candidate_id == candidate.id,
                         TalentPoolEntry.company_id == company_id
@@ -1309,9 +1071,6 @@ class Query:
                     )
 
                 # Check for interview and likert sessions
-                from app.models.interview import InterviewSession
-                from app.modules.likert.models import LikertSession
-                from app.modules.second_interview.models import SecondInterview
                 
                 interview_session = db.query(InterviewSession).filter(
                     InterviewSession.application_id == app.id
@@ -1320,7 +1079,6 @@ class Query:
                     LikertSession.application_id == app.id
                 ).first()
                 # Get the most recent active (invited) interview, or the latest one if none active
-                from app.modules.second_interview.models import SecondInterviewStatus
                 second_interview = db.query(SecondInterview).filter(
                     SecondInterview.application_id == app.id,
                     SecondInterview.status == SecondInterviewStatus.INVITED
@@ -1403,21 +1161,8 @@ class Query:
         language: Optional[str] = None,
     ) -> ComparisonResultType:
         """Compare two candidates (ephemeral, no persistence)."""
-        import httpx
-        from app.models.candidate import Candidate
-        from app.models.job import Job
-        from app.core.config import settings
-
         # Auth
-        request = info.context["request"]
-        auth_header = request.headers.get("authorization")
-        if not auth_header:
-            raise Exception("Not authenticated")
-        try:
-            scheme, token = auth_header.split()
-            _ = scheme
-        except ValueError:
-            raise Exception("Invalid authorization header")
+        info.context.current_user()
 
         db = get_db_session()
         try:
@@ -1455,7 +1200,7 @@ class Query:
             }
 
             # Call AI-Service synchronously to avoid event-loop issues
-            with httpx.Client(timeout=60.0) as client:
+            with httpx.Client(timeout=60.0, headers=trace_headers()) as client:
                 resp = client.post(f"{settings.AI_SERVICE_URL}/compare-cvs", json=payload)
 
             if resp.status_code != 200:
@@ -1465,17 +1210,6 @@ class Query:
                 raise Exception(body.get("error", "compare failed"))
             raw = body.get("data") or {}
 
-            # Import new types
-            from app.graphql.types import (
-                LanguageInfoType,
-                EducationInfoType,
-                SkillsCompareType,
-                CandidateCompareType,
-                AIEvaluationType,
-                AIEvaluationBothType,
-                ComparisonResultType,
-            )
-
             # Extract data directly from database instead of asking AI
             def _extract_from_db(candidate):
                 parsed = candidate.parsed_data or {}
@@ -1661,32 +1395,16 @@ class Query:
             period_start: ISO date string for period start (optional)
             period_end: ISO date string for period end (optional)
         """
-        request = info.context["request"]
-        auth_header = request.headers.get("authorization")
-        
-        if not auth_header:
-            raise Exception("Not authenticated")
-        
-        try:
-            scheme, token = auth_header.split()
-            if scheme.lower() != "bearer":
-                raise Exception("Invalid authentication scheme")
-        except ValueError:
-            raise Exception("Invalid authorization header")
+        token = info.context.token
         
         db = get_db_session()
         try:
             # Authenticate user and get company_id
             current = get_current_user_from_token(token, db)
-            from app.api.dependencies import get_company_id_from_token
             company_id = get_company_id_from_token(token)
             if not company_id:
                 raise Exception("Company context required")
             
-            from app.models.subscription import UsageTracking
-            from datetime import datetime
-            from sqlalchemy import and_
-            
             # Build query with company_id and resource_type (uses idx_usage_tracking_company_resource)
             query = db.query(UsageTracking).filter(
                 and_(
@@ -1742,34 +1460,16 @@ class Query:
         Args:
             batch_number: The batch number to fetch details for
         """
-        request = info.context["request"]
-        auth_header = request.headers.get("authorization")
-        
-        if not auth_header:
-            raise Exception("Not authenticated")
-        
-        try:
-            scheme, token = auth_header.split()
-            if scheme.lower() != "bearer":
-                raise Exception("Invalid authentication scheme")
-        except ValueError:
-            raise Exception("Invalid authorization header")
+        token = info.context.token
         
         db = get_db_session()
         try:
             # Authenticate user and get company_id
             current = get_current_user_from_token(token, db)
-            from app.api.dependencies import get_company_id_from_token
             company_id = get_company_id_from_token(token)
             if not company_id:
                 raise Exception("Company context required")
             
-            from app.models.subscription import UsageTracking
-            from app.models.candidate import Candidate
-            from app.models.application import Application
-            from app.models.job import Job
-            from sqlalchemy import and_
-            
             # Get usage tracking record for metadata
             usage_record = db.query(UsageTracking).filter(
                 and_(
@@ -1865,56 +1565,56 @@ class Query:
         Return only periods (months) that have usage for CV uploads or AI analyses,
         aggregated by month. Newest first. Limits to last N months if provided.
         """
-        request = info.context["request"]
-        auth_header = request.headers.get("authorization")
-        if not auth_header:
-            raise Exception("Not authenticated")
-        try:
-            scheme, token = auth_header.split()
-            _ = scheme
-        except ValueError:
-            raise Exception("Invalid authorization header")
+        token = info.context.token
 
         db = get_db_session()
         try:
             # Auth and company
             _ = get_current_user_from_token(token, db)
-            from app.api.dependencies import get_company_id_from_token
             company_id = get_company_id_from_token(token)
             if not company_id:
                 raise Exception("Company context required")
 
-            from sqlalchemy import func, case, and_
-            from app.models.subscription import UsageTracking
-            from datetime import date
-
-            # Aggregate by month (period_start/period_end already normalized per our writes)
-            q = (
-                db.query(
-                    UsageTracking.period_start.label("ps"),
-                    UsageTracking.period_end.label("pe"),
-                    func.sum(UsageTracking.count).label("total"),
-                    func.sum(case((UsageTracking.resource_type == "cv_upload", UsageTracking.count), else_=0)).label("cv_uploads"),
-                    func.sum(case((UsageTracking.resource_type == "ai_analysis", UsageTracking.count), else_=0)).label("ai_analyses"),
-                    func.sum(case((UsageTracking.resource_type == "interview_completed", UsageTracking.count), else_=0)).label("interview_completed"),
-                    func.sum(case((UsageTracking.resource_type == "interview_ai_analysis", UsageTracking.count), else_=0)).label("interview_ai_analysis"),
-                    func.sum(case((UsageTracking.resource_type == "ai_question_generation", UsageTracking.count), else_=0)).label("ai_question_generation"),
+            resource_types = ["cv_upload", "ai_analysis", "interview_completed", "interview_ai_analysis", "ai_question_generation"]
+
+            def monthly_totals(model, count_column):
+                # Aggregate by month (period_start/period_end already normalized per our writes)
+                q = (
+                    db.query(
+                        model.period_start.label("ps"),
+                        model.period_end.label("pe"),
+                        func.sum(count_column).label("total"),
+                        *[
+                            func.sum(case((model.resource_type == rt, count_column), else_=0)).label(rt)
+                            for rt in resource_types
+                        ],
+                    )
+                    .filter(model.company_id == company_id)
+                    .filter(model.resource_type.in_(resource_types))
+                    .group_by(model.period_start, model.period_end)
+                    .order_by(model.period_start.desc())
                 )
-                .filter(UsageTracking.company_id == company_id)
-                .filter(UsageTracking.resource_type.in_(["cv_upload", "ai_analysis", "interview_completed", "interview_ai_analysis", "ai_question_generation"]))
-                .group_by(UsageTracking.period_start, UsageTracking.period_end)
-                .order_by(UsageTracking.period_start.desc())
-            )
-
+                if months_limit and months_limit > 0:
+                    q = q.limit(months_limit)
+                return q.all()
+
+            # Recent months come from usage_tracking, months past retention from their rollups
+            periods = {}
+            for rows in (
+                monthly_totals(UsageTracking, UsageTracking.count),
+                monthly_totals(UsageTrackingMonthly, UsageTrackingMonthly.total_count),
+            ):
+                for ps, pe, *counts in rows:
+                    previous = periods.get((ps, pe))
+                    periods[(ps, pe)] = [a + (b or 0) for a, b in zip(previous, counts)] if previous else [c or 0 for c in counts]
+
+            rows = sorted(periods.items(), key=lambda item: item[0][0], reverse=True)
             if months_limit and months_limit > 0:
-                q = q.limit(months_limit)
-
-            rows = q.all()
+                rows = rows[:months_limit]
             result: List[UsagePeriodSummary] = []
-            for ps, pe, total, cvu, aia, int_comp, int_ai, ai_qg in rows:
+            for (ps, pe), (total, cvu, aia, int_comp, int_ai, ai_qg) in rows:
                 # Build localized label like "Kasım 2025"
                 try:
-                    import locale
                     locale.setlocale(locale.LC_TIME, "tr_TR.UTF-8")
                     label = ps.strftime("%B %Y")
                     # Capitalize first letter (locale-aware)
@@ -2000,20 +1700,15 @@ class Query:
         from app.modules.job_outro.resolvers import get_job_outro_templates
         return get_job_outro_templates(info, active_only)
 
-    @strawberry.field
+    @strawberry.field(permission_classes=[rate_limited("public_interview")])
     def interview_session(self, info: Info, token: str) -> Optional["InterviewSessionFullType"]:
         """Get interview session by token (public - for candidates)"""
         from app.modules.interview.resolvers import get_interview_session
         return get_interview_session(info, token)
 
-    @strawberry.field
+    @strawberry.field(permission_classes=[rate_limited("public_likert")])
     def likert_session(self, info: Info, token: str) -> Optional["LikertSessionFullType"]:
         """Get likert session by token (public - for candidates)"""
-        from app.modules.likert.models import LikertSession, LikertTemplate, LikertQuestion
-        from app.models.job import Job
-        from app.models.candidate import Candidate
-        from app.modules.agreement.models import AgreementTemplate
-        
         db = get_db_session()
         try:
             session = db.query(LikertSession).filter(LikertSession.token == token).first()
@@ -2106,10 +1801,6 @@ class Query:
     @strawberry.field
     def likert_session_by_application(self, info: Info, application_id: str) -> Optional["LikertSessionWithAnswersType"]:
         """Get likert session by application ID (for HR view with answers)"""
-        from app.modules.likert.models import LikertSession, LikertTemplate, LikertQuestion, LikertAnswer
-        from app.models.job import Job
-        from app.models.candidate import Candidate
-        
         db = get_db_session()
         try:
             session = db.query(LikertSession).filter(LikertSession.application_id == application_id).first()
@@ -2261,6 +1952,19 @@ class Query:
         from app.modules.talent_pool.resolvers import is_candidate_in_talent_pool
         return is_candidate_in_talent_pool(info, candidate_id)
 
+    # ============ Candidate Search Queries ============
+    @strawberry.field
+    async def similar_candidates(self, info: Info, job_id: str, limit: int = 20) -> List[SimilarCandidateType]:
+        """Top-N company candidates most similar to a job (embedding search, no AI analysis)"""
+        from app.modules.candidate_search.resolvers import get_similar_candidates
+        return await get_similar_candidates(info, job_id, limit)
+
+    @strawberry.field
+    def search_candidates(self, info: Info, query: str, page: int = 1, page_size: int = 20) -> CandidateSearchResultType:
+        """Ranked full-text + fuzzy search over candidates (name, email, skills, titles, education, CV text)"""
+        from app.modules.candidate_search.resolvers import search_candidates
+        return search_candidates(info, query, page, page_size)
+
     # ============ Second Interview Queries ============
     @strawberry.field
     def second_interview(self, info: Info, id: str) -> Optional[SecondInterviewGQLType]:
@@ -2308,19 +2012,6 @@ class Query:
         from app.modules.second_interview.resolvers import check_active_interview
         return check_active_interview(info, application_id)
 
-    # ============ Calendar Queries ============
-    @strawberry.field
-    def calendar_events(
-        self,
-        info: Info,
-        start_date: str = strawberry.argument(name="startDate"),
-        end_date: str = strawberry.argument(name="endDate"),
-        event_types: Optional[List[str]] = None,
-    ) -> "CalendarEventsResponse":
-        """Get calendar events within a date range"""
-        from app.modules.calendar.resolvers import get_calendar_events
-        return get_calendar_events(info, start_date, end_date, event_types)
-
     # ============================================
     # Second Interview Template Queries
     # ============================================
@@ -2347,43 +2038,6 @@ class Query:
         from app.modules.second_interview_template.resolvers import get_second_interview_template_variables
         return get_second_interview_template_variables(info)
 
-    # ============================================
-    # AI Interview Email Template Queries
-    # ============================================
-    
-    @strawberry.field
-    def ai_interview_email_templates(
-        self, 
-        info: Info, 
-        language: Optional[str] = None,
-        active_only: bool = False
-    ) -> AIInterviewEmailTemplateListResponse:
-        """Get all AI interview email templates for the company"""
-        from app.modules.ai_interview_template.resolvers import ai_interview_email_templates as get_templates
-        return get_templates(info, language, active_only)
-
-    # ============================================
-    # Likert Email Template Queries
-    # ============================================
-    
-    @strawberry.field
-    def likert_email_templates(self, info: Info) -> List[LikertEmailTemplateGQLType]:
-        """Get all Likert email templates for the company"""
-        from app.modules.likert_template.resolvers import get_likert_templates
-        return get_likert_templates(info)
-
-    @strawberry.field
-    def likert_email_template(self, info: Info, id: str) -> Optional[LikertEmailTemplateGQLType]:
-        """Get a single Likert email template by ID"""
-        from app.modules.likert_template.resolvers import get_likert_template
-        return get_likert_template(info, id)
-
-    @strawberry.field
-    def likert_email_template_variables(self, info: Info) -> LikertEmailTemplateVariablesResponse:
-        """Get available template variables for Likert email templates"""
-        from app.modules.likert_template.resolvers import get_likert_template_variables
-        return get_likert_template_variables(info)
-
     # ============================================
     # Company Address Queries
     # ============================================
@@ -2404,91 +2058,6 @@ class Query:
         from app.modules.company_address.resolvers import get_company_address
         return get_company_address(info, id)
 
-    # ============================================
-    # Benefits Queries (Yan Haklar)
-    # ============================================
-    
-    @strawberry.field
-    def benefits(
-        self, 
-        info: Info, 
-        category: Optional[str] = None,
-        is_active: Optional[bool] = None
-    ) -> List[BenefitType]:
-        """Get all benefits for the company"""
-        from app.modules.benefits.resolvers import get_benefits
-        from app.modules.benefits.types import BenefitType
-        return get_benefits(info, category, is_active)
-
-    @strawberry.field
-    def benefit(self, info: Info, id: str) -> Optional[BenefitType]:
-        """Get a single benefit by ID"""
-        from app.modules.benefits.resolvers import get_benefit
-        from app.modules.benefits.types import BenefitType
-        return get_benefit(info, id)
-
-    # ============================================
-    # Offer Template Queries (Teklif Şablonları)
-    # ============================================
-    
-    @strawberry.field
-    def offer_templates(
-        self, 
-        info: Info, 
-        is_active: Optional[bool] = None
-    ) -> List['OfferTemplateType']:
-        """Get all offer templates for the company"""
-        from app.modules.offer.resolvers import get_offer_templates
-        from app.modules.offer.types import OfferTemplateType
-        return get_offer_templates(info, is_active)
-
-    @strawberry.field
-    def offer_template(self, info: Info, id: str) -> Optional['OfferTemplateType']:
-        """Get a single offer template by ID"""
-        from app.modules.offer.resolvers import get_offer_template
-        from app.modules.offer.types import OfferTemplateType
-        return get_offer_template(info, id)
-
-    # ============================================
-    # Offer Queries (Teklifler)
-    # ============================================
-    
-    @strawberry.field
-    def offers(
-        self, 
-        info: Info, 
-        status: Optional[str] = None
-    ) -> List['OfferType']:
-        """Get all offers for the company"""
-        from app.modules.offer.resolvers import get_offers
-        from app.modules.offer.types import OfferType
-        return get_offers(info, status)
-
-    @strawberry.field
-    def offer(self, info: Info, id: str) -> Optional['OfferType']:
-        """Get a single offer by ID"""
-        from app.modules.offer.resolvers import get_offer
-        from app.modules.offer.types import OfferType
-        return get_offer(info, id)
-
-    @strawberry.field
-    def offer_by_application(
-        self, 
-        info: Info, 
-        application_id: str = strawberry.argument(name="applicationId")
-    ) -> Optional['OfferType']:
-        """Get offer for a specific application"""
-        from app.modules.offer.resolvers import get_offer_by_application
-        from app.modules.offer.types import OfferType
-        return get_offer_by_application(info, application_id)
-
-    @strawberry.field
-    def offer_by_token(self, token: str) -> Optional['PublicOfferType']:
-        """Get offer by token (public - for candidate portal)"""
-        from app.modules.offer.resolvers import get_offer_by_token
-        from app.modules.offer.types import PublicOfferType
-        return get_offer_by_token(token)
-
     # ==========================================
     # Shortlist Queries
     # ==========================================
@@ -2510,7 +2079,7 @@ class Query:
         from app.modules.shortlist.resolvers import get_shortlist_share
         return get_shortlist_share(info, id)
     
-    @strawberry.field
+    @strawberry.field(permission_classes=[rate_limited("public_shortlist")])
     def public_shortlist(self, token: str) -> Optional[PublicShortlistType]:
         """Get public shortlist by token (no auth required)"""
         from app.modules.shortlist.resolvers import get_public_shortlist
@@ -2527,11 +2096,6 @@ class Subscription:
         Stream application updates for a specific job.
         Emits an ApplicationType each time a candidate analysis for the job is saved.
         """
-        from app.models.application import Application
-        from app.models.job import Job
-        from app.models.candidate import Candidate
-        from app.models.department import Department
-
         topic = f"job:{job_id}:applications"
 
         async for event in pubsub.subscribe(topic):
@@ -2667,11 +2231,6 @@ class Subscription:
         async for _ in pubsub.subscribe(topic):
             db = get_db_session()
             try:
-                from app.models.candidate import Candidate
-                from app.models.job import Job
-                from app.models.application import Application
-                from app.models.department import Department
-
                 cand_count = db.query(Candidate).count()
                 job_count = db.query(Job).count()
                 app_count = db.query(Application).count()
@@ -2686,15 +2245,81 @@ class Subscription:
             finally:
                 db.close()
 
+    # ============ Streaming AI generation ============
+    # Relay AI-Service streaming endpoints: partial content ("delta"/"item"/
+    # "field" events) as the model writes, then "done" with the same data the
+    # matching mutation returns, or "error".
+
+    @strawberry.subscription
+    async def generate_job_with_ai_stream(
+        self,
+        info: Info,
+        input: GenerateJobWithAIInput
+    ) -> AsyncGenerator[AIStreamEventType, None]:
+        """Streaming generateJobWithAi: description text arrives as it is written"""
+        db = get_db_session()
+        try:
+            if not get_current_user_from_token(info.context.token, db):
+                raise Exception("User not found")
+        finally:
+            db.close()
+
+        payload = {
+            "position": input.position,
+            "department": input.department,
+            "location": input.location,
+            "employment_type": input.employment_type,
+            "experience_level": input.experience_level,
+            "required_skills": input.required_skills or [],
+            "required_languages": [
+                {"name": lang.name, "level": lang.level}
+                for lang in (input.required_languages or [])
+            ],
+            "additional_notes": input.additional_notes,
+            "language": input.language or "turkish"
+        }
+        try:
+            async for event in ai_service_client.stream_events("/generate-job-description/stream", payload):
+                yield ai_stream_event(event)
+        except Exception as e:
+            yield AIStreamEventType(event="error", error=f"Failed to generate job description: {str(e)}")
+
+    @strawberry.subscription
+    async def generate_likert_questions_stream(
+        self,
+        info: Info,
+        input: GenerateLikertQuestionsInput
+    ) -> AsyncGenerator[AIStreamEventType, None]:
+        """Streaming generateLikertQuestions: one "item" event per finished question"""
+        payload = {
+            "description": input.description,
+            "question_count": input.question_count,
+            "language": input.language,
+            "dimension": input.dimension,
+            "direction": input.direction,
+            "scale_type": input.scale_type
+        }
+        try:
+            async for event in ai_service_client.stream_events("/generate-likert-questions/stream", payload):
+                yield ai_stream_event(event)
+        except Exception as e:
+            yield AIStreamEventType(event="error", error=str(e))
+
+    @strawberry.subscription
+    async def analyze_interview_with_ai_stream(self, info: Info, session_id: str) -> AsyncGenerator[AIStreamEventType, None]:
+        """Streaming analyzeInterviewWithAi: categories arrive as they are scored"""
+        from app.modules.interview.resolvers import analyze_interview_with_ai_stream
+        async for event in analyze_interview_with_ai_stream(info, session_id):
+            yield event
+
 
 @strawberry.type
-class Mutation(CompanyMutation):
+class Mutation(CompanyMutation, LazyMutation):
     """GraphQL Mutation root"""
 
     @strawberry.mutation
     async def register(self, input: RegisterInput) -> TokenType:
         """Register a new user"""
-        from app.schemas.user import UserRegister
         db = get_db_session()
         try:
             # Create UserRegister schema object
@@ -2720,7 +2345,6 @@ class Mutation(CompanyMutation):
     @strawberry.mutation
     async def login(self, input: LoginInput) -> TokenType:
         """Login user with company_code"""
-        from app.schemas.user import UserLogin
         db = get_db_session()
         try:
             # Create UserLogin schema object
@@ -2804,19 +2428,7 @@ class Mutation(CompanyMutation):
     def change_password(self, input: ChangePasswordInput, info: Info) -> MessageType:
         """Change password for authenticated user"""
         # Get authorization header
-        request = info.context["request"]
-        auth_header = request.headers.get("authorization")
-        
-        if not auth_header:
-            raise Exception("Not authenticated")
-        
-        # Extract token
-        try:
-            scheme, token = auth_header.split()
-            if scheme.lower() != "bearer":
-                raise Exception("Invalid authentication scheme")
-        except ValueError:
-            raise Exception("Invalid authorization header")
+        token = info.context.token
         
         # Get user and change password
         db = get_db_session()
@@ -2837,32 +2449,13 @@ class Mutation(CompanyMutation):
         finally:
             db.close()
 
-    @strawberry.mutation
+    @strawberry.mutation(permission_classes=[IsAdmin])
     def create_user(self, input: CreateUserInput, info: Info) -> UserType:
         """Create a new user (admin action)"""
-        # Auth required (reuse token parsing)
-        request = info.context["request"]
-        auth_header = request.headers.get("authorization")
-        if not auth_header:
-            raise Exception("Not authenticated")
-        try:
-            scheme, token = auth_header.split()
-            if scheme.lower() != "bearer":
-                raise Exception("Invalid authentication scheme")
-        except ValueError:
-            raise Exception("Invalid authorization header")
+        token = info.context.token
 
         db = get_db_session()
         try:
-            # Ensure caller is a valid user and is admin
-            current = get_current_user_from_token(token, db)
-            role_name = None
-            if current.role_id:
-                r = db.query(Role).filter(Role.id == current.role_id).first()
-                role_name = r.name if r else None
-            if role_name != 'admin':
-                raise Exception("Bu işlem için yetkiniz yok")
-
             # Get company_id from token for multi-tenancy
             company_id = get_company_id_from_token(token)
 
@@ -2895,59 +2488,32 @@ class Mutation(CompanyMutation):
         finally:
             db.close()
 
-    @strawberry.mutation
+    @strawberry.mutation(permission_classes=[IsAdmin])
     def deactivate_user(self, user_id: int, info: Info) -> MessageType:
         """Soft delete: set is_active = false (admin only)"""
-        request = info.context["request"]
-        auth_header = request.headers.get("authorization")
-        if not auth_header:
-            raise Exception("Not authenticated")
-        try:
-            scheme, token = auth_header.split()
-            if scheme.lower() != "bearer":
-                raise Exception("Invalid authentication scheme")
-        except ValueError:
-            raise Exception("Invalid authorization header")
-
         db = get_db_session()
         try:
-            current = get_current_user_from_token(token, db)
-            ensure_admin(current, db)
             target = db.query(User).filter(User.id == user_id).first()
             if not target:
                 raise Exception("Kullanıcı bulunamadı")
-            target.is_active = False
-            db.commit()
+            AuthService.deactivate_user(db, target)
             return MessageType(message="Kullanıcı pasif hale getirildi", success=True)
         finally:
             db.close()
 
-    @strawberry.mutation
+    @strawberry.mutation(permission_classes=[IsAdmin])
     def create_department(self, input: DepartmentInput, info: Info) -> DepartmentType:
         """Create a new department (admin only)"""
-        request = info.context["request"]
-        auth_header = request.headers.get("authorization")
-        if not auth_header:
-            raise Exception("Not authenticated")
-        try:
-            scheme, token = auth_header.split()
-            if scheme.lower() != "bearer":
-                raise Exception("Invalid authentication scheme")
-        except ValueError:
-            raise Exception("Invalid authorization header")
+        token = info.context.token
 
         db = get_db_session()
         try:
-            current = get_current_user_from_token(token, db)
-            ensure_admin(current, db)
             
             # Extract company_id from token
-            from app.api.dependencies import get_company_id_from_token
             company_id = get_company_id_from_token(token)
             if not company_id:
                 raise Exception("Company context required")
             
-            from app.schemas.department import DepartmentCreate
             dept_data = DepartmentCreate(name=input.name, is_active=input.is_active, color=input.color, icon=input.icon)
             created = DepartmentService.create(db, dept_data, company_id=company_id)
             result = DepartmentType(
@@ -2961,12 +2527,11 @@ class Mutation(CompanyMutation):
             )
             # Publish stats update (department count may change if active)
             try:
-                import asyncio as _asyncio
                 try:
-                    loop = _asyncio.get_running_loop()
+                    loop = asyncio.get_running_loop()
                     loop.create_task(pubsub.publish(topic="stats", payload={"reason": "department_created"}))
                 except RuntimeError:
-                    _asyncio.run(pubsub.publish(topic="stats", payload={"reason": "department_created"}))
+                    asyncio.run(pubsub.publish(topic="stats", payload={"reason": "department_created"}))
             except Exception:
                 pass
             return result
@@ -2975,25 +2540,11 @@ class Mutation(CompanyMutation):
         finally:
             db.close()
 
-    @strawberry.mutation
+    @strawberry.mutation(permission_classes=[IsAdmin])
     def update_department(self, id: str, input: DepartmentUpdateInput, info: Info) -> DepartmentType:
         """Update a department (admin only)"""
-        request = info.context["request"]
-        auth_header = request.headers.get("authorization")
-        if not auth_header:
-            raise Exception("Not authenticated")
-        try:
-            scheme, token = auth_header.split()
-            if scheme.lower() != "bearer":
-                raise Exception("Invalid authentication scheme")
-        except ValueError:
-            raise Exception("Invalid authorization header")
-
         db = get_db_session()
         try:
-            current = get_current_user_from_token(token, db)
-            ensure_admin(current, db)
-            from app.schemas.department import DepartmentUpdate
             dept_data = DepartmentUpdate(name=input.name, is_active=input.is_active, color=input.color, icon=input.icon)
             updated = DepartmentService.update(db, id, dept_data)
             result = DepartmentType(
@@ -3007,12 +2558,11 @@ class Mutation(CompanyMutation):
             )
             # Active flag may have changed; publish stats
             try:
-                import asyncio as _asyncio
                 try:
-                    loop = _asyncio.get_running_loop()
+                    loop = asyncio.get_running_loop()
                     loop.create_task(pubsub.publish(topic="stats", payload={"reason": "department_updated"}))
                 except RuntimeError:
-                    _asyncio.run(pubsub.publish(topic="stats", payload={"reason": "department_updated"}))
+                    asyncio.run(pubsub.publish(topic="stats", payload={"reason": "department_updated"}))
             except Exception:
                 pass
             return result
@@ -3021,24 +2571,11 @@ class Mutation(CompanyMutation):
         finally:
             db.close()
 
-    @strawberry.mutation
+    @strawberry.mutation(permission_classes=[IsAdmin])
     def toggle_department_active(self, id: str, info: Info) -> DepartmentType:
         """Toggle department active status (admin only)"""
-        request = info.context["request"]
-        auth_header = request.headers.get("authorization")
-        if not auth_header:
-            raise Exception("Not authenticated")
-        try:
-            scheme, token = auth_header.split()
-            if scheme.lower() != "bearer":
-                raise Exception("Invalid authentication scheme")
-        except ValueError:
-            raise Exception("Invalid authorization header")
-
         db = get_db_session()
         try:
-            current = get_current_user_from_token(token, db)
-            ensure_admin(current, db)
             toggled = DepartmentService.toggle_active(db, id)
             result = DepartmentType(
                 id=toggled.id,
@@ -3050,12 +2587,11 @@ class Mutation(CompanyMutation):
             )
             # Active-only department count changed
             try:
-                import asyncio as _asyncio
                 try:
-                    loop = _asyncio.get_running_loop()
+                    loop = asyncio.get_running_loop()
                     loop.create_task(pubsub.publish(topic="stats", payload={"reason": "department_toggled"}))
                 except RuntimeError:
-                    _asyncio.run(pubsub.publish(topic="stats", payload={"reason": "department_toggled"}))
+                    asyncio.run(pubsub.publish(topic="stats", payload={"reason": "department_toggled"}))
             except Exception:
                 pass
             return result
@@ -3064,34 +2600,23 @@ class Mutation(CompanyMutation):
         finally:
             db.close()
 
-    @strawberry.mutation
+    @strawberry.mutation(permission_classes=[IsAdmin])
     def delete_department(self, id: str, info: Info) -> bool:
         """Delete department permanently (admin only) - only if no related records exist"""
-        request = info.context["request"]
-        auth_header = request.headers.get("authorization")
-        if not auth_header:
-            raise Exception("Not authenticated")
-        try:
-            scheme, token = auth_header.split()
-            if scheme.lower() != "bearer":
-                raise Exception("Invalid authentication scheme")
-        except ValueError:
-            raise Exception("Invalid authorization header")
+        token = info.context.token
 
         db = get_db_session()
         try:
             current = get_current_user_from_token(token, db)
-            ensure_admin(current, db)
             company_id = current.company_id if hasattr(current, 'company_id') else None
             DepartmentService.delete(db, id, company_id)
             # Department count changed
             try:
-                import asyncio as _asyncio
                 try:
-                    loop = _asyncio.get_running_loop()
+                    loop = asyncio.get_running_loop()
                     loop.create_task(pubsub.publish(topic="stats", payload={"reason": "department_deleted"}))
                 except RuntimeError:
-                    _asyncio.run(pubsub.publish(topic="stats", payload={"reason": "department_deleted"}))
+                    asyncio.run(pubsub.publish(topic="stats", payload={"reason": "department_deleted"}))
             except Exception:
                 pass
             return True
@@ -3100,34 +2625,19 @@ class Mutation(CompanyMutation):
         finally:
             db.close()
 
-    @strawberry.mutation
+    @strawberry.mutation(permission_classes=[IsAdmin])
     def create_job(self, input: JobInput, info: Info) -> JobType:
         """Create a new job (admin only)"""
-        request = info.context["request"]
-        auth_header = request.headers.get("authorization")
-        if not auth_header:
-            raise Exception("Not authenticated")
-        try:
-            scheme, token = auth_header.split()
-            if scheme.lower() != "bearer":
-                raise Exception("Invalid authentication scheme")
-        except ValueError:
-            raise Exception("Invalid authorization header")
+        token = info.context.token
 
         db = get_db_session()
         try:
-            current = get_current_user_from_token(token, db)
-            ensure_admin(current, db)
             
             # Extract company_id from token
-            from app.api.dependencies import get_company_id_from_token
             company_id = get_company_id_from_token(token)
             if not company_id:
                 raise Exception("Company context required")
             
-            from app.schemas.job import JobCreate
-            from datetime import date
-            
             # Convert ISO date string to date object
             deadline_date = None
             if input.deadline:
@@ -3203,12 +2713,11 @@ class Mutation(CompanyMutation):
             )
             # Publish stats update (job count)
             try:
-                import asyncio as _asyncio
                 try:
-                    loop = _asyncio.get_running_loop()
+                    loop = asyncio.get_running_loop()
                     loop.create_task(pubsub.publish(topic="stats", payload={"reason": "job_created"}))
                 except RuntimeError:
-                    _asyncio.run(pubsub.publish(topic="stats", payload={"reason": "job_created"}))
+                    asyncio.run(pubsub.publish(topic="stats", payload={"reason": "job_created"}))
             except Exception:
                 pass
             return result
@@ -3217,27 +2726,11 @@ class Mutation(CompanyMutation):
         finally:
             db.close()
 
-    @strawberry.mutation
+    @strawberry.mutation(permission_classes=[IsAdmin])
     def update_job(self, id: str, input: JobUpdateInput, info: Info) -> JobType:
         """Update a job (admin only)"""
-        request = info.context["request"]
-        auth_header = request.headers.get("authorization")
-        if not auth_header:
-            raise Exception("Not authenticated")
-        try:
-            scheme, token = auth_header.split()
-            if scheme.lower() != "bearer":
-                raise Exception("Invalid authentication scheme")
-        except ValueError:
-            raise Exception("Invalid authorization header")
-
         db = get_db_session()
         try:
-            current = get_current_user_from_token(token, db)
-            ensure_admin(current, db)
-            
-            from app.schemas.job import JobUpdate
-            from datetime import date
             
             # Convert ISO date string to date object
             deadline_date = None
@@ -3367,12 +2860,11 @@ class Mutation(CompanyMutation):
             )
             # Job visibility/active may affect counts in some views; publish for safety
             try:
-                import asyncio as _asyncio
                 try:
-                    loop = _asyncio.get_running_loop()
+                    loop = asyncio.get_running_loop()
                     loop.create_task(pubsub.publish(topic="stats", payload={"reason": "job_updated"}))
                 except RuntimeError:
-                    _asyncio.run(pubsub.publish(topic="stats", payload={"reason": "job_updated"}))
+                    asyncio.run(pubsub.publish(topic="stats", payload={"reason": "job_updated"}))
             except Exception:
                 pass
             return result
@@ -3381,24 +2873,11 @@ class Mutation(CompanyMutation):
         finally:
             db.close()
 
-    @strawberry.mutation
+    @strawberry.mutation(permission_classes=[IsAdmin])
     def toggle_job_active(self, id: str, info: Info) -> JobType:
         """Toggle job active status (admin only)"""
-        request = info.context["request"]
-        auth_header = request.headers.get("authorization")
-        if not auth_header:
-            raise Exception("Not authenticated")
-        try:
-            scheme, token = auth_header.split()
-            if scheme.lower() != "bearer":
-                raise Exception("Invalid authentication scheme")
-        except ValueError:
-            raise Exception("Invalid authorization header")
-
         db = get_db_session()
         try:
-            current = get_current_user_from_token(token, db)
-            ensure_admin(current, db)
             toggled = JobService.toggle_active(db, id)
             result = JobType(
                 id=toggled.id,
@@ -3426,12 +2905,11 @@ class Mutation(CompanyMutation):
                 updated_at=toggled.updated_at.isoformat(),
             )
             try:
-                import asyncio as _asyncio
                 try:
-                    loop = _asyncio.get_running_loop()
+                    loop = asyncio.get_running_loop()
                     loop.create_task(pubsub.publish(topic="stats", payload={"reason": "job_toggled"}))
                 except RuntimeError:
-                    _asyncio.run(pubsub.publish(topic="stats", payload={"reason": "job_toggled"}))
+                    asyncio.run(pubsub.publish(topic="stats", payload={"reason": "job_toggled"}))
             except Exception:
                 pass
             return result
@@ -3440,28 +2918,13 @@ class Mutation(CompanyMutation):
         finally:
             db.close()
 
-    @strawberry.mutation
+    @strawberry.mutation(permission_classes=[IsAdmin])
     def delete_job(self, id: str, info: Info) -> MessageType:
         """Delete a job (admin only) - only if no applications exist"""
-        request = info.context["request"]
-        auth_header = request.headers.get("authorization")
-        if not auth_header:
-            raise Exception("Not authenticated")
-        try:
-            scheme, token = auth_header.split()
-            if scheme.lower() != "bearer":
-                raise Exception("Invalid authentication scheme")
-        except ValueError:
-            raise Exception("Invalid authorization header")
-
         db = get_db_session()
         try:
-            current = get_current_user_from_token(token, db)
-            ensure_admin(current, db)
             
             # Find the job
-            from app.models.job import Job
-            from app.models.application import Application
             
             job = db.query(Job).filter(Job.id == id).first()
             if not job:
@@ -3475,15 +2938,15 @@ class Mutation(CompanyMutation):
             # Delete the job
             db.delete(job)
             db.commit()
+            public_job_cache.invalidate_job(id)
             
             # Publish stats update
             try:
-                import asyncio as _asyncio
                 try:
-                    loop = _asyncio.get_running_loop()
+                    loop = asyncio.get_running_loop()
                     loop.create_task(pubsub.publish(topic="stats", payload={"reason": "job_deleted"}))
                 except RuntimeError:
-                    _asyncio.run(pubsub.publish(topic="stats", payload={"reason": "job_deleted"}))
+                    asyncio.run(pubsub.publish(topic="stats", payload={"reason": "job_deleted"}))
             except Exception:
                 pass
             
@@ -3494,34 +2957,20 @@ class Mutation(CompanyMutation):
         finally:
             db.close()
 
-    @strawberry.mutation
+    @strawberry.mutation(permission_classes=[IsAdmin])
     def duplicate_job(self, id: str, info: Info) -> MessageType:
         """Duplicate a job as draft (admin only)"""
-        request = info.context["request"]
-        auth_header = request.headers.get("authorization")
-        if not auth_header:
-            raise Exception("Not authenticated")
-        try:
-            scheme, token = auth_header.split()
-            if scheme.lower() != "bearer":
-                raise Exception("Invalid authentication scheme")
-        except ValueError:
-            raise Exception("Invalid authorization header")
+        token = info.context.token
 
         db = get_db_session()
         try:
-            current = get_current_user_from_token(token, db)
-            ensure_admin(current, db)
             
             # Extract company_id from token
-            from app.api.dependencies import get_company_id_from_token
             company_id = get_company_id_from_token(token)
             if not company_id:
                 raise Exception("Company context required")
             
             # Find the job to duplicate
-            from app.models.job import Job
-            import re
             
             original_job = db.query(Job).filter(Job.id == id).first()
             if not original_job:
@@ -3556,7 +3005,6 @@ class Mutation(CompanyMutation):
                 new_title = f"Kopya {max_num + 1} {original_title}"
             
             # Create a new job with copied fields
-            import uuid
             new_job = Job(
                 id=str(uuid.uuid4()),
                 company_id=company_id,
@@ -3604,33 +3052,16 @@ class Mutation(CompanyMutation):
         finally:
             db.close()
 
-    @strawberry.mutation
+    @strawberry.mutation(permission_classes=[IsAdmin])
     def delete_candidate(self, id: str, info: Info) -> MessageType:
         """Delete a candidate/CV (admin only) - manually deletes all related records"""
-        request = info.context["request"]
-        auth_header = request.headers.get("authorization")
-        if not auth_header:
-            raise Exception("Not authenticated")
-        try:
-            scheme, token = auth_header.split()
-            if scheme.lower() != "bearer":
-                raise Exception("Invalid authentication scheme")
-        except ValueError:
-            raise Exception("Invalid authorization header")
+        token = info.context.token
 
         db = get_db_session()
         try:
-            current = get_current_user_from_token(token, db)
-            ensure_admin(current, db)
             
-            from app.api.dependencies import get_company_id_from_token
             company_id = get_company_id_from_token(token)
             
-            from app.models.candidate import Candidate
-            from app.models.application import Application
-            from sqlalchemy import text
-            import os
-            
             # Find the candidate
             candidate = db.query(Candidate).filter(
                 Candidate.id == id,
@@ -3681,12 +3112,11 @@ class Mutation(CompanyMutation):
             
             # Publish stats update
             try:
-                import asyncio as _asyncio
                 try:
-                    loop = _asyncio.get_running_loop()
+                    loop = asyncio.get_running_loop()
                     loop.create_task(pubsub.publish(topic="stats", payload={"reason": "candidate_deleted"}))
                 except RuntimeError:
-                    _asyncio.run(pubsub.publish(topic="stats", payload={"reason": "candidate_deleted"}))
+                    asyncio.run(pubsub.publish(topic="stats", payload={"reason": "candidate_deleted"}))
             except Exception:
                 pass
             
@@ -3697,7 +3127,7 @@ class Mutation(CompanyMutation):
         finally:
             db.close()
 
-    @strawberry.mutation
+    @strawberry.mutation(permission_classes=[IsAdmin])
     async def upload_cvs(
         self, 
         files: List[Upload], 
@@ -3709,30 +3139,18 @@ class Mutation(CompanyMutation):
         Supports PDF and DOCX formats
         Files will be associated with the specified department
         """
-        request = info.context["request"]
-        auth_header = request.headers.get("authorization")
-        if not auth_header:
-            raise Exception("Not authenticated")
-        try:
-            scheme, token = auth_header.split()
-            if scheme.lower() != "bearer":
-                raise Exception("Invalid authentication scheme")
-        except ValueError:
-            raise Exception("Invalid authorization header")
+        token = info.context.token
 
         db = get_db_session()
         try:
             current = get_current_user_from_token(token, db)
-            ensure_admin(current, db)
             
             # Get company_id from current user
-            from app.api.dependencies import get_company_id_from_token
             company_id = get_company_id_from_token(token)
             if not company_id:
                 raise Exception("Company context required")
             
             # Verify department exists
-            from app.models import Department, Candidate
             department = db.query(Department).filter(Department.id == department_id).first()
             if not department:
                 raise Exception(f"Department with ID {department_id} not found")
@@ -3741,11 +3159,24 @@ class Mutation(CompanyMutation):
             failed = []
             
             # Generate batch number for this upload session
-            import random
             batch_number = f"#{random.randint(100000, 999999)}"
             print(f"🔍 Generated batch_number for upload session: {batch_number}")
             
+            # Hold quota for the whole batch up front so concurrent uploads cannot overshoot the plan
+            reservation = await UsageService.reserve_usage(
+                db, company_id, ResourceType.CV_UPLOAD, len(files), allow_partial=True
+            )
+            
             for file in files:
+                if not await UsageService.refresh_reservation(db, reservation):
+                    # Hold expired mid-batch; its units may already belong to another batch
+                    reservation.granted = len(successful)
+                if len(successful) >= reservation.granted:
+                    failed.append(FailedFileType(
+                        file_name=file.filename,
+                        reason="Aylık CV yükleme limitinize ulaştınız."
+                    ))
+                    continue
                 try:
                     # Read file content
                     file_content = await file.read()
@@ -3793,7 +3224,6 @@ class Mutation(CompanyMutation):
                                 reason=error_msg
                             ))
                             # Delete the uploaded file since it's not a valid CV
-                            import os
                             if os.path.exists(file_path):
                                 os.remove(file_path)
                             continue
@@ -3819,8 +3249,7 @@ class Mutation(CompanyMutation):
                         exp_months = None
                         try:
                             # Birth year: try explicit birth_year, else parse from DOB strings or CV text
-                            from datetime import datetime as _dt
-                            current_year = _dt.utcnow().year
+                            current_year = datetime.utcnow().year
                             by = personal.get('birth_year') or personal.get('birthYear')
                             if isinstance(by, int) and 1900 <= by <= current_year:
                                 birth_year = by  # store birth year as-is
@@ -3830,20 +3259,19 @@ class Mutation(CompanyMutation):
                                     personal.get('dob'), personal.get('date_of_birth'), personal.get('birth_date'),
                                     personal.get('birthdate'), personal.get('dogum_tarihi'), personal.get('Doğum Tarihi')
                                 ]
-                                import re as _re
                                 year_found = None
                                 for val in dob_candidates:
                                     if isinstance(val, str):
-                                        m = _re.search(r"(19\d{2}|20\d{2})", val)
+                                        m = re.search(r"(19\d{2}|20\d{2})", val)
                                         if m:
                                             y = int(m.group(1))
                                             if 1900 <= y <= current_year:
                                                 year_found = y
                                                 break
                                 if year_found is None and isinstance(cv_text, str):
-                                    m = _re.search(r"Doğum\s*Tarihi[^\n\r]*(19\d{2}|20\d{2})", cv_text, _re.IGNORECASE)
+                                    m = re.search(r"Doğum\s*Tarihi[^\n\r]*(19\d{2}|20\d{2})", cv_text, re.IGNORECASE)
                                     if not m:
-                                        m = _re.search(r"(19\d{2}|20\d{2})", cv_text)
+                                        m = re.search(r"(19\d{2}|20\d{2})", cv_text)
                                     if m:
                                         y = int(m.group(1))
                                         if 1900 <= y <= current_year:
@@ -3871,14 +3299,13 @@ class Mutation(CompanyMutation):
                                             return None
                                     sm = _ym(start)
                                     em = _ym(end) if end and str(end).lower() not in ('present','now','günümüz','current') else None
-                                    from datetime import datetime as _d
                                     if sm:
                                         sy, smm = sm
                                         if em:
                                             ey, emm = em
                                             total += (ey - sy) * 12 + (emm - smm)
                                         else:
-                                            now = _d.utcnow()
+                                            now = datetime.utcnow()
                                             total += (now.year - sy) * 12 + (now.month - smm)
                                 exp_months = max(0, int(total))
                         except Exception:
@@ -3901,8 +3328,7 @@ class Mutation(CompanyMutation):
                     # Create candidate record in database
                     # Final sanity for birth_year bounds
                     try:
-                        from datetime import datetime as _dt2
-                        _cy = _dt2.utcnow().year
+                        _cy = datetime.utcnow().year
                         if birth_year is not None and not (1900 <= int(birth_year) <= _cy - 10):
                             birth_year = None
                     except Exception:
@@ -3952,23 +3378,18 @@ class Mutation(CompanyMutation):
                         reason=str(e)
                     ))
             
-            # Record a single session usage with total successful uploads
+            # Record a single session usage with total successful uploads and release unused quota
             try:
                 total_success = len(successful)
                 print(f"🔍 DEBUG: total_success={total_success}, successful files count={len(successful)}")
-                if total_success > 0 and hasattr(current, 'company_id') and current.company_id:
-                    from app.services.usage_service import UsageService
-                    from app.models.subscription import ResourceType
-                    print(f"🔍 DEBUG: Calling create_session_usage with count={total_success}, batch={batch_number}")
-                    # Usage recorded as CV_UPLOAD with batch_number, no metadata
-                    result = await UsageService.create_session_usage(
-                        db, current.company_id, ResourceType.CV_UPLOAD, 
-                        count=total_success, metadata={}, batch_number=batch_number
-                    )
+                # Usage recorded as CV_UPLOAD with batch_number, no metadata
+                result = await UsageService.commit_reservation(
+                    db, reservation, used=total_success, metadata={}, batch_number=batch_number
+                )
+                if total_success > 0:
                     print(f"✅ Recorded CV upload session {batch_number}: {total_success} files, result={result}")
             except Exception as _ue2:
                 print(f"❌ Usage session record (cv_upload) failed: {_ue2}")
-                import traceback
                 traceback.print_exc()
 
             return CVUploadResponse(
@@ -3984,15 +3405,14 @@ class Mutation(CompanyMutation):
             # Publish a stats event if any CV was uploaded successfully
             try:
                 if 'successful' in locals() and len(successful) > 0:
-                    import asyncio as _asyncio
                     # Fire-and-forget publish; ignore if event loop not running
                     try:
-                        loop = _asyncio.get_running_loop()
+                        loop = asyncio.get_running_loop()
                         loop.create_task(pubsub.publish(topic="stats", payload={"reason": "cv_upload"}))
                     except RuntimeError:
                         # No running loop; best-effort synchronous publish
                         try:
-                            _asyncio.run(pubsub.publish(topic="stats", payload={"reason": "cv_upload"}))
+                            asyncio.run(pubsub.publish(topic="stats", payload={"reason": "cv_upload"}))
                         except Exception:
                             pass
             except Exception:
@@ -4009,26 +3429,11 @@ class Mutation(CompanyMutation):
         """
         Analyze candidates against a job using AI.
         Sequential processing (one candidate at a time).
+        With topK / minPrefilterScore, candidates are first ranked locally and
+        only the selected ones are sent to the AI matcher.
         """
-        import httpx
-        from datetime import datetime
-        from app.models.job import Job
-        from app.models.candidate import Candidate
-        from app.models.application import Application, ApplicationStatus
-        from app.core.config import settings
-        
         # Get authorization header
-        request = info.context["request"]
-        auth_header = request.headers.get("authorization")
-        
-        if not auth_header:
-            raise Exception("Not authenticated")
-        
-        # Extract token
-        try:
-            scheme, token = auth_header.split()
-        except ValueError:
-            raise Exception("Invalid authorization header")
+        token = info.context.token
         
         db = get_db_session()
         try:
@@ -4039,7 +3444,6 @@ class Mutation(CompanyMutation):
             # ensure_admin(db, current)
             
             # Get company_id from current user
-            from app.api.dependencies import get_company_id_from_token
             company_id = get_company_id_from_token(token)
             if not company_id:
                 raise Exception("Company context required")
@@ -4074,21 +3478,77 @@ class Mutation(CompanyMutation):
             error_count = 0
 
             # Generate batch number for this analysis session
-            import random
             batch_number = f"#{random.randint(100000, 999999)}"
             print(f"🔍 Generated batch_number for analysis session: {batch_number}")
 
             # Quick health check for AI-Service to fail fast with a clear message
             try:
-                async with httpx.AsyncClient(timeout=5.0) as client:
+                async with httpx.AsyncClient(timeout=5.0, headers=trace_headers()) as client:
                     hc = await client.get(f"{settings.AI_SERVICE_URL}/")
                 if hc.status_code != 200:
                     return MessageType(success=False, message="AI-Service unreachable (health check failed)")
             except Exception:
                 return MessageType(success=False, message="AI-Service not running at AI_SERVICE_URL; please start AI-Service on port 8001")
             
+            # Optional local prefilter: rank not-yet-analyzed candidates without the LLM
+            # and send only the top-K / above-threshold ones to the matcher
+            prefiltered_out = set()
+            if input.top_k is not None or input.min_prefilter_score is not None:
+                analyzed_ids = {
+                    row.candidate_id for row in db.query(Application.candidate_id).filter(
+                        Application.job_id == input.job_id,
+                        Application.company_id == company_id,
+                        Application.candidate_id.in_(input.candidate_ids)
+                    )
+                }
+                pending = db.query(Candidate).filter(
+                    Candidate.id.in_(input.candidate_ids),
+                    Candidate.company_id == company_id
+                ).all()
+                prefilter_payload = [
+                    {
+                        "id": c.id,
+                        "name": c.name,
+                        "cv_language": c.cv_language,
+                        "parsed_data": c.parsed_data or {},
+                        "location": c.location,
+                        "experience_months": c.experience_months
+                    }
+                    for c in pending if c.id not in analyzed_ids
+                ]
+                try:
+                    ranked = await ai_service_client.prefilter_candidates(
+                        job_data,
+                        prefilter_payload,
+                        top_k=input.top_k,
+                        min_score=input.min_prefilter_score
+                    )
+                    prefiltered_out = {str(r.get("id")) for r in ranked if not r.get("selected")}
+                    print(f"🔎 Prefilter kept {len(ranked) - len(prefiltered_out)}/{len(ranked)} candidates")
+                except Exception as pf_err:
+                    # Fall back to analyzing everyone rather than failing the batch
+                    print(f"⚠️ Prefilter failed, analyzing all candidates: {pf_err}")
+            
+            # Hold AI analysis quota for the batch up front so concurrent runs cannot overshoot the plan
+            reservation = await UsageService.reserve_usage(
+                db,
+                company_id,
+                ResourceType.AI_ANALYSIS,
+                sum(1 for cid in input.candidate_ids if str(cid) not in prefiltered_out),
+                allow_partial=True
+            )
+            skipped_by_limit = 0
+            
             # Process each candidate sequentially
             for candidate_id in input.candidate_ids:
+                if str(candidate_id) in prefiltered_out:
+                    continue
+                if not await UsageService.refresh_reservation(db, reservation):
+                    # Hold expired mid-batch; its units may already belong to another batch
+                    reservation.granted = success_count
+                if success_count >= reservation.granted:
+                    skipped_by_limit += 1
+                    continue
                 try:
                     # Get candidate (with company filter)
                     candidate = db.query(Candidate).filter(
@@ -4134,7 +3594,7 @@ class Mutation(CompanyMutation):
                     # Call AI service
                     ai_service_url = f"{settings.AI_SERVICE_URL}/match-cv-to-job"
                     
-                    async with httpx.AsyncClient(timeout=60.0) as client:
+                    async with httpx.AsyncClient(timeout=60.0, headers=trace_headers()) as client:
                         response = await client.post(
                             ai_service_url,
                             json={
@@ -4220,26 +3680,29 @@ class Mutation(CompanyMutation):
             
             # Report success only if at least one analysis succeeded
             # Record a single AI_ANALYSIS usage session with the number of analyzed candidates
+            # and release the unused part of the reservation
             try:
-                if success_count > 0 and hasattr(current, 'company_id') and current.company_id:
-                    from app.services.usage_service import UsageService
-                    from app.models.subscription import ResourceType
-                    await UsageService.create_session_usage(
-                        db,
-                        current.company_id,
-                        ResourceType.AI_ANALYSIS,
-                        count=success_count,
-                        metadata={},
-                        batch_number=batch_number
-                    )
+                await UsageService.commit_reservation(
+                    db,
+                    reservation,
+                    used=success_count,
+                    metadata={},
+                    batch_number=batch_number
+                )
+                if success_count > 0:
                     print(f"✅ Recorded AI analysis session {batch_number}: {success_count} candidates")
             except Exception as _ue:
                 print(f"❌ Usage session record failed: {_ue}")
 
             overall_success = success_count > 0
+            message = f"Analysis complete. Success: {success_count}, Failed: {error_count}"
+            if prefiltered_out:
+                message += f", Skipped by prefilter: {len(prefiltered_out)}"
+            if skipped_by_limit:
+                message += f", Skipped by usage limit: {skipped_by_limit}"
             return MessageType(
                 success=overall_success,
-                message=f"Analysis complete. Success: {success_count}, Failed: {error_count}"
+                message=message
             )
             
         except Exception as e:
@@ -4257,22 +3720,8 @@ class Mutation(CompanyMutation):
         Generate a job description using AI.
         Does NOT save to database - returns generated data for preview/edit.
         """
-        import httpx
-        import json
-        from app.core.config import settings
-        
         # Get authorization header
-        request = info.context["request"]
-        auth_header = request.headers.get("authorization")
-        
-        if not auth_header:
-            raise Exception("Not authenticated")
-        
-        # Extract token
-        try:
-            scheme, token = auth_header.split()
-        except ValueError:
-            raise Exception("Invalid authorization header")
+        token = info.context.token
         
         db = get_db_session()
         try:
@@ -4300,7 +3749,7 @@ class Mutation(CompanyMutation):
             # Call AI Service
             ai_service_url = f"{settings.AI_SERVICE_URL}/generate-job-description"
             
-            async with httpx.AsyncClient(timeout=60.0) as client:
+            async with httpx.AsyncClient(timeout=60.0, headers=trace_headers()) as client:
                 response = await client.post(
                     ai_service_url,
                     json=payload
@@ -4510,19 +3959,19 @@ class Mutation(CompanyMutation):
         from app.modules.likert.resolvers import create_likert_session
         return await create_likert_session(info, input)
 
-    @strawberry.mutation
+    @strawberry.mutation(permission_classes=[rate_limited("public_likert")])
     async def start_likert_session(self, token: str) -> "GenericResponse":
         """Start a likert session (mark as in_progress)"""
         from app.modules.likert.resolvers import start_likert_session
         return await start_likert_session(token)
 
-    @strawberry.mutation
+    @strawberry.mutation(permission_classes=[rate_limited("public_likert")])
     async def save_likert_answer(self, session_token: str, question_id: str, score: int) -> "GenericResponse":
         """Save a likert answer"""
         from app.modules.likert.resolvers import save_likert_answer
         return await save_likert_answer(session_token, question_id, score)
 
-    @strawberry.mutation
+    @strawberry.mutation(permission_classes=[rate_limited("public_likert")])
     async def complete_likert_session(self, token: str) -> "GenericResponse":
         """Complete a likert session"""
         from app.modules.likert.resolvers import complete_likert_session
@@ -4534,25 +3983,25 @@ class Mutation(CompanyMutation):
         from app.modules.interview.resolvers import create_interview_session
         return await create_interview_session(info, input)
 
-    @strawberry.mutation
+    @strawberry.mutation(permission_classes=[rate_limited("public_interview")])
     async def start_interview_session(self, info: Info, token: str) -> InterviewSessionResponse:
         """Start an interview session (called when candidate begins)"""
         from app.modules.interview.resolvers import start_interview_session
         return await start_interview_session(info, token)
 
-    @strawberry.mutation
+    @strawberry.mutation(permission_classes=[rate_limited("public_interview")])
     async def save_interview_answer(self, info: Info, input: SaveInterviewAnswerInput) -> InterviewAnswerResponse:
         """Save an interview answer"""
         from app.modules.interview.resolvers import save_interview_answer
         return await save_interview_answer(info, input)
 
-    @strawberry.mutation
+    @strawberry.mutation(permission_classes=[rate_limited("public_interview")])
     async def complete_interview_session(self, info: Info, token: str) -> InterviewSessionResponse:
         """Complete an interview session"""
         from app.modules.interview.resolvers import complete_interview_session
         return await complete_interview_session(info, token)
 
-    @strawberry.mutation
+    @strawberry.mutation(permission_classes=[rate_limited("public_interview")])
     async def accept_interview_agreement(self, info: Info, token: str) -> InterviewSessionResponse:
         """Accept interview agreement"""
         from app.modules.interview.resolvers import accept_interview_agreement
@@ -4564,17 +4013,15 @@ class Mutation(CompanyMutation):
         from app.modules.interview.resolvers import analyze_interview_with_ai
         return await analyze_interview_with_ai(info, session_id)
 
-    @strawberry.mutation
+    @strawberry.mutation(permission_classes=[rate_limited("public_interview")])
     async def update_browser_stt_support(self, info: Info, token: str, supported: bool) -> InterviewSessionResponse:
         """Update browser STT support status for a session"""
         from app.modules.interview.resolvers import update_browser_stt_support
         return await update_browser_stt_support(info, token, supported)
 
-    @strawberry.mutation
+    @strawberry.mutation(permission_classes=[rate_limited("public_likert")])
     async def submit_likert_session(self, info: Info, token: str, answers: List[LikertAnswerInput]) -> LikertSessionResponse:
         """Submit likert test answers"""
-        from app.modules.likert.models import LikertSession, LikertAnswer
-        
         db = get_db_session()
         try:
             session = db.query(LikertSession).filter(LikertSession.token == token).first()
@@ -4751,76 +4198,6 @@ class Mutation(CompanyMutation):
         from app.modules.second_interview_template.resolvers import delete_second_interview_template
         return await delete_second_interview_template(info, id)
 
-    # ============================================
-    # AI Interview Email Template Mutations
-    # ============================================
-
-    @strawberry.mutation
-    def create_ai_interview_email_template(
-        self, 
-        info: Info, 
-        input: AIInterviewEmailTemplateInput
-    ) -> AIInterviewEmailTemplateResponse:
-        """Create a new AI interview email template"""
-        from app.modules.ai_interview_template.resolvers import create_ai_interview_email_template
-        return create_ai_interview_email_template(info, input)
-
-    @strawberry.mutation
-    def update_ai_interview_email_template(
-        self, 
-        info: Info, 
-        id: str,
-        input: AIInterviewEmailTemplateUpdateInput
-    ) -> AIInterviewEmailTemplateResponse:
-        """Update an AI interview email template"""
-        from app.modules.ai_interview_template.resolvers import update_ai_interview_email_template
-        return update_ai_interview_email_template(info, id, input)
-
-    @strawberry.mutation
-    def delete_ai_interview_email_template(
-        self, 
-        info: Info, 
-        id: str
-    ) -> AIInterviewEmailTemplateResponse:
-        """Delete an AI interview email template"""
-        from app.modules.ai_interview_template.resolvers import delete_ai_interview_email_template
-        return delete_ai_interview_email_template(info, id)
-
-    # ============================================
-    # Likert Email Template Mutations
-    # ============================================
-
-    @strawberry.mutation
-    async def create_likert_email_template(
-        self, 
-        info: Info, 
-        input: LikertEmailTemplateInput
-    ) -> LikertEmailTemplateResponse:
-        """Create a new Likert test email template"""
-        from app.modules.likert_template.resolvers import create_likert_template
-        return await create_likert_template(info, input)
-
-    @strawberry.mutation
-    async def update_likert_email_template(
-        self, 
-        info: Info, 
-        id: str,
-        input: LikertEmailTemplateUpdateInput
-    ) -> LikertEmailTemplateResponse:
-        """Update a Likert test email template"""
-        from app.modules.likert_template.resolvers import update_likert_template
-        return await update_likert_template(info, id, input)
-
-    @strawberry.mutation
-    async def delete_likert_email_template(
-        self, 
-        info: Info, 
-        id: str
-    ) -> MessageType:
-        """Delete a Likert test email template"""
-        from app.modules.likert_template.resolvers import delete_likert_template
-        return await delete_likert_template(info, id)
-
     # ============================================
     # Company Address Mutations
     # ============================================
@@ -4855,376 +4232,6 @@ class Mutation(CompanyMutation):
         from app.modules.company_address.resolvers import delete_company_address
         return await delete_company_address(info, id)
 
-    @strawberry.mutation
-    async def generate_interview_questions(
-        self, 
-        info: Info, 
-        input: GenerateInterviewQuestionsInput
-    ) -> GenerateInterviewQuestionsResultType:
-        """Generate interview questions using AI based on description"""
-        import httpx
-        from app.core.config import settings
-        from app.graphql.types import GeneratedQuestionType
-        
-        try:
-            # Call AI Service with new parameters
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    f"{settings.AI_SERVICE_URL}/generate-interview-questions",
-                    json={
-                        "description": input.description,
-                        "question_count": input.question_count,
-                        "language": input.language,
-                        "question_type": input.question_type,
-                        "difficulty": input.difficulty
-                    }
-                )
-                
-                if response.status_code != 200:
-                    return GenerateInterviewQuestionsResultType(
-                        success=False,
-                        error=f"AI Service error: {response.status_code}"
-                    )
-                
-                data = response.json()
-                
-                if data.get("success"):
-                    # Convert to GeneratedQuestionType objects
-                    questions = []
-                    for q in data.get("questions", []):
-                        if isinstance(q, dict):
-                            questions.append(GeneratedQuestionType(
-                                text=q.get("text", ""),
-                                question_type=q.get("type", "behavioral")
-                            ))
-                        elif isinstance(q, str):
-                            questions.append(GeneratedQuestionType(
-                                text=q,
-                                question_type="behavioral"
-                            ))
-                    
-                    return GenerateInterviewQuestionsResultType(
-                        success=True,
-                        questions=questions
-                    )
-                else:
-                    return GenerateInterviewQuestionsResultType(
-                        success=False,
-                        error=data.get("error", "Unknown error")
-                    )
-                    
-        except httpx.TimeoutException:
-            return GenerateInterviewQuestionsResultType(
-                success=False,
-                error="AI Service timeout - please try again"
-            )
-        except Exception as e:
-            return GenerateInterviewQuestionsResultType(
-                success=False,
-                error=str(e)
-            )
-
-    @strawberry.mutation
-    async def regenerate_single_question(
-        self, 
-        info: Info, 
-        input: "RegenerateSingleQuestionInput"
-    ) -> "RegenerateSingleQuestionResultType":
-        """Regenerate a single interview question"""
-        import httpx
-        from app.core.config import settings
-        from app.graphql.types import GeneratedQuestionType, RegenerateSingleQuestionResultType
-        
-        try:
-            # Call AI Service
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    f"{settings.AI_SERVICE_URL}/regenerate-single-question",
-                    json={
-                        "description": input.description,
-                        "question_type": input.question_type,
-                        "difficulty": input.difficulty,
-                        "language": input.language,
-                        "existing_questions": input.existing_questions or []
-                    }
-                )
-                
-                if response.status_code != 200:
-                    return RegenerateSingleQuestionResultType(
-                        success=False,
-                        error=f"AI Service error: {response.status_code}"
-                    )
-                
-                data = response.json()
-                
-                if data.get("success"):
-                    q_data = data.get("question", {})
-                    question = GeneratedQuestionType(
-                        text=q_data.get("text", ""),
-                        question_type=q_data.get("type", input.question_type)
-                    )
-                    return RegenerateSingleQuestionResultType(
-                        success=True,
-                        question=question
-                    )
-                else:
-                    return RegenerateSingleQuestionResultType(
-                        success=False,
-                        error=data.get("error", "Unknown error")
-                    )
-                    
-        except httpx.TimeoutException:
-            return RegenerateSingleQuestionResultType(
-                success=False,
-                error="AI Service timeout - please try again"
-            )
-        except Exception as e:
-            return RegenerateSingleQuestionResultType(
-                success=False,
-                error=str(e)
-            )
-
-    @strawberry.mutation
-    async def generate_likert_questions(
-        self, 
-        info: Info, 
-        input: GenerateLikertQuestionsInput
-    ) -> GenerateLikertQuestionsResultType:
-        """Generate Likert questions using AI based on dimension and settings"""
-        import httpx
-        from app.core.config import settings
-        
-        try:
-            # Call AI Service
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    f"{settings.AI_SERVICE_URL}/generate-likert-questions",
-                    json={
-                        "description": input.description,
-                        "question_count": input.question_count,
-                        "language": input.language,
-                        "dimension": input.dimension,
-                        "direction": input.direction,
-                        "scale_type": input.scale_type
-                    }
-                )
-                
-                if response.status_code != 200:
-                    return GenerateLikertQuestionsResultType(
-                        success=False,
-                        error=f"AI Service error: {response.status_code}"
-                    )
-                
-                data = response.json()
-                
-                if data.get("success"):
-                    # Convert to GeneratedLikertQuestionType objects
-                    questions = []
-                    for q in data.get("questions", []):
-                        if isinstance(q, dict):
-                            questions.append(GeneratedLikertQuestionType(
-                                text=q.get("text", ""),
-                                dimension=q.get("dimension", "leadership"),
-                                direction=q.get("direction", "positive")
-                            ))
-                    
-                    return GenerateLikertQuestionsResultType(
-                        success=True,
-                        questions=questions
-                    )
-                else:
-                    return GenerateLikertQuestionsResultType(
-                        success=False,
-                        error=data.get("error", "Unknown error")
-                    )
-                    
-        except httpx.TimeoutException:
-            return GenerateLikertQuestionsResultType(
-                success=False,
-                error="AI Service timeout - please try again"
-            )
-        except Exception as e:
-            return GenerateLikertQuestionsResultType(
-                success=False,
-                error=str(e)
-            )
-
-    @strawberry.mutation
-    async def regenerate_single_likert_question(
-        self, 
-        info: Info, 
-        input: RegenerateSingleLikertQuestionInput
-    ) -> RegenerateSingleLikertQuestionResultType:
-        """Regenerate a single Likert question"""
-        import httpx
-        from app.core.config import settings
-        
-        try:
-            # Call AI Service
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    f"{settings.AI_SERVICE_URL}/regenerate-single-likert-question",
-                    json={
-                        "description": input.description,
-                        "dimension": input.dimension,
-                        "direction": input.direction,
-                        "language": input.language,
-                        "existing_questions": input.existing_questions or []
-                    }
-                )
-                
-                if response.status_code != 200:
-                    return RegenerateSingleLikertQuestionResultType(
-                        success=False,
-                        error=f"AI Service error: {response.status_code}"
-                    )
-                
-                data = response.json()
-                
-                if data.get("success"):
-                    q_data = data.get("question", {})
-                    question = GeneratedLikertQuestionType(
-                        text=q_data.get("text", ""),
-                        dimension=q_data.get("dimension", input.dimension),
-                        direction=q_data.get("direction", input.direction)
-                    )
-                    return RegenerateSingleLikertQuestionResultType(
-                        success=True,
-                        question=question
-                    )
-                else:
-                    return RegenerateSingleLikertQuestionResultType(
-                        success=False,
-                        error=data.get("error", "Unknown error")
-                    )
-                    
-        except httpx.TimeoutException:
-            return RegenerateSingleLikertQuestionResultType(
-                success=False,
-                error="AI Service timeout - please try again"
-            )
-        except Exception as e:
-            return RegenerateSingleLikertQuestionResultType(
-                success=False,
-                error=str(e)
-            )
-
-    # ============================================
-    # Benefits Mutations (Yan Haklar)
-    # ============================================
-    
-    @strawberry.mutation
-    def create_benefit(self, info: Info, input: BenefitInput) -> BenefitResponseType:
-        """Create a new benefit"""
-        from app.modules.benefits.resolvers import create_benefit
-        from app.modules.benefits.types import BenefitInput, BenefitResponseType
-        return create_benefit(info, input)
-
-    @strawberry.mutation
-    def update_benefit(self, info: Info, id: str, input: BenefitInput) -> BenefitResponseType:
-        """Update an existing benefit"""
-        from app.modules.benefits.resolvers import update_benefit
-        from app.modules.benefits.types import BenefitInput, BenefitResponseType
-        return update_benefit(info, id, input)
-
-    @strawberry.mutation
-    def delete_benefit(self, info: Info, id: str) -> BenefitResponseType:
-        """Delete a benefit"""
-        from app.modules.benefits.resolvers import delete_benefit
-        from app.modules.benefits.types import BenefitResponseType
-        return delete_benefit(info, id)
-
-    # ============================================
-    # Offer Template Mutations (Teklif Şablonları)
-    # ============================================
-    
-    @strawberry.mutation
-    def create_offer_template(self, info: Info, input: 'OfferTemplateInput') -> 'OfferTemplateResponseType':
-        """Create a new offer template"""
-        from app.modules.offer.resolvers import create_offer_template
-        from app.modules.offer.types import OfferTemplateInput, OfferTemplateResponseType
-        return create_offer_template(info, input)
-
-    @strawberry.mutation
-    def update_offer_template(self, info: Info, id: str, input: 'OfferTemplateInput') -> 'OfferTemplateResponseType':
-        """Update an existing offer template"""
-        from app.modules.offer.resolvers import update_offer_template
-        from app.modules.offer.types import OfferTemplateInput, OfferTemplateResponseType
-        return update_offer_template(info, id, input)
-
-    @strawberry.mutation
-    def delete_offer_template(self, info: Info, id: str) -> 'OfferTemplateResponseType':
-        """Delete an offer template"""
-        from app.modules.offer.resolvers import delete_offer_template
-        from app.modules.offer.types import OfferTemplateResponseType
-        return delete_offer_template(info, id)
-
-    @strawberry.mutation
-    def toggle_offer_template(self, info: Info, id: str) -> 'OfferTemplateResponseType':
-        """Toggle offer template active status"""
-        from app.modules.offer.resolvers import toggle_offer_template
-        from app.modules.offer.types import OfferTemplateResponseType
-        return toggle_offer_template(info, id)
-
-    # ============================================
-    # Offer Mutations (Teklifler)
-    # ============================================
-    
-    @strawberry.mutation
-    def create_offer(self, info: Info, input: 'OfferInput') -> 'OfferResponseType':
-        """Create a new offer"""
-        from app.modules.offer.resolvers import create_offer
-        from app.modules.offer.types import OfferInput, OfferResponseType
-        return create_offer(info, input)
-
-    @strawberry.mutation
-    def update_offer(self, info: Info, id: str, input: 'OfferInput') -> 'OfferResponseType':
-        """Update an existing offer"""
-        from app.modules.offer.resolvers import update_offer
-        from app.modules.offer.types import OfferInput, OfferResponseType
-        return update_offer(info, id, input)
-
-    @strawberry.mutation
-    def delete_offer(self, info: Info, id: str) -> 'OfferResponseType':
-        """Delete an offer"""
-        from app.modules.offer.resolvers import delete_offer
-        from app.modules.offer.types import OfferResponseType
-        return delete_offer(info, id)
-
-    @strawberry.mutation
-    def send_offer(self, info: Info, id: str) -> 'OfferResponseType':
-        """Send an offer to the candidate"""
-        from app.modules.offer.resolvers import send_offer
-        from app.modules.offer.types import OfferResponseType
-        return send_offer(info, id)
-
-    @strawberry.mutation
-    def withdraw_offer(self, info: Info, id: str) -> 'OfferResponseType':
-        """Withdraw an offer"""
-        from app.modules.offer.resolvers import withdraw_offer
-        from app.modules.offer.types import OfferResponseType
-        return withdraw_offer(info, id)
-
-    @strawberry.mutation
-    def update_offer_status(
-        self, 
-        info: Info, 
-        offer_id: str = strawberry.argument(name="offerId"),
-        status: str = strawberry.argument(name="status"),
-        note: Optional[str] = None
-    ) -> 'OfferResponseType':
-        """HR updates offer status (accept/reject)"""
-        from app.modules.offer.resolvers import update_offer_status
-        from app.modules.offer.types import OfferResponseType
-        return update_offer_status(info, offer_id, status, note)
-
-    @strawberry.mutation
-    def respond_to_offer(self, input: 'OfferResponseInput') -> 'OfferResponseType':
-        """Candidate response to an offer (public)"""
-        from app.modules.offer.resolvers import respond_to_offer
-        from app.modules.offer.types import OfferResponseInput, OfferResponseType
-        return respond_to_offer(input)
-
     # ==========================================
     # Shortlist Mutations
     # ==========================================
@@ -5269,4 +4276,9 @@ class Mutation(CompanyMutation):
 
 
 # Create schema
-schema = strawberry.Schema(query=Query, mutation=Mutation, subscription=Subscription)
+schema = strawberry.Schema(
+    query=Query,
+    mutation=Mutation,
+    subscription=Subscription,
+    extensions=[OperationMetrics, QueryProfiler, RequestTransaction],
+)
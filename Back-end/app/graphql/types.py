@@ -438,6 +438,9 @@ class AnalyzeJobCandidatesInput:
     """Input for analyzing candidates for a job"""
     job_id: str = strawberry.field(name="jobId")
     candidate_ids: List[str] = strawberry.field(name="candidateIds")
+    # Optional local prefilter: only the best candidates go to the AI matcher
+    top_k: Optional[int] = strawberry.field(name="topK", default=None)
+    min_prefilter_score: Optional[float] = strawberry.field(name="minPrefilterScore", default=None)
 
 
 @strawberry.input
@@ -1350,3 +1353,12 @@ from app.modules.calendar.types import (
     CalendarEventType,
     CalendarEventsResponse,
 )
+
+# ============================================
+# Candidate Search Module Types
+# ============================================
+from app.modules.candidate_search.types import (
+    SimilarCandidateType,
+    CandidateSearchHitType,
+    CandidateSearchResultType,
+)
@@ -8,7 +8,7 @@ from app.models.job import Job
 from app.models.candidate import Candidate
 from app.models.application import Application, ApplicationStatus
 from app.models.company import Company
-from app.models.subscription import SubscriptionPlan, CompanySubscription, UsageTracking, SubscriptionStatus, ResourceType
+from app.models.subscription import SubscriptionPlan, CompanySubscription, UsageTracking, UsageTrackingMonthly, UsageQuota, QuotaReservation, SubscriptionStatus, ResourceType
 from app.models.transaction import Transaction, TransactionStatus, PaymentMethod
 # InterviewTemplate is now in the modules folder
 from app.modules.interview.models import InterviewTemplate, InterviewQuestion, InterviewSession, InterviewAnswer, InterviewSessionStatus
@@ -34,6 +34,9 @@ __all__ = [
     'SubscriptionPlan',
     'CompanySubscription',
     'UsageTracking',
+    'UsageTrackingMonthly',
+    'UsageQuota',
+    'QuotaReservation',
     'SubscriptionStatus',
     'ResourceType',
     'Transaction',
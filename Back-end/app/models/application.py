@@ -31,6 +31,14 @@ class ApplicationStatus(enum.Enum):
     OFFER_REJECTED = "OFFER_REJECTED"
 
 
+class ProcessingStatus(str, enum.Enum):
+    """Background CV parse/match state for public applications."""
+    QUEUED = "queued"
+    PROCESSING = "processing"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
 class Application(Base):
     """
     Application model - stores AI analysis results for job-candidate pairs.
@@ -84,6 +92,16 @@ class Application(Base):
     )
     applicant_email = Column(String(255), nullable=True, comment="Applicant email (backup)")
     applicant_phone = Column(String(50), nullable=True, comment="Applicant phone (backup)")
+    processing_status = Column(
+        String(20),
+        nullable=True,
+        comment="Background parse/match state for public applications: queued, processing, completed, failed"
+    )
+    processing_error = Column(Text, nullable=True, comment="Why background processing failed")
+    processing_started_at = Column(DateTime, nullable=True, comment="When a worker claimed the application")
+    cv_file_name = Column(String(500), nullable=True, comment="CV submitted with a public application")
+    cv_file_path = Column(String(1000), nullable=True, comment="Stored CV; copied to the candidate once it parses")
+    cv_file_size = Column(Integer, nullable=True)
     
     # Status
     status = Column(
@@ -2,15 +2,22 @@
 Candidate Model - CV Management
 Stores uploaded candidate information
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum as SQLEnum, event
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 from datetime import datetime
 import enum
 import uuid
 from app.core.database import Base
 
+# pgvector import (if available)
+try:
+    from pgvector.sqlalchemy import Vector
+    VECTOR_AVAILABLE = True
+except ImportError:
+    VECTOR_AVAILABLE = False
+
 
 class CandidateStatus(str, enum.Enum):
     """Candidate application status"""
@@ -71,6 +78,16 @@ class Candidate(Base):
     # Batch tracking
     batch_number = Column(String(20), nullable=True, index=True)
     
+    # Full-text search document (name, email, skills, titles, companies, education, cv_text).
+    # Maintained by a DB trigger (migration 056); deferred so normal loads never fetch it
+    search_vector = deferred(Column(TSVECTOR, nullable=True))
+    
+    # AI Embedding of parsed CV content (pgvector) - for semantic job matching
+    if VECTOR_AVAILABLE:
+        cv_embedding = Column(Vector(1536), nullable=True)
+        # AI-Service model id of cv_embedding; only vectors of the current model are compared
+        cv_embedding_model = Column(String(200), nullable=True)
+    
     # Timestamps
     uploaded_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -84,3 +101,10 @@ class Candidate(Base):
     def __repr__(self):
         return f"<Candidate(id={self.id}, name={self.name}, department_id={self.department_id})>"
 
+
+if VECTOR_AVAILABLE:
+    @event.listens_for(Candidate.parsed_data, "set")
+    def _reset_cv_embedding(target, value, oldvalue, initiator):
+        """CV content changed: drop the stale embedding so the next search re-embeds it"""
+        target.cv_embedding = None
+        target.cv_embedding_model = None
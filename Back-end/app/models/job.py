@@ -3,7 +3,7 @@ Job Model
 Represents job postings in the system
 Completely separate from User/Role/Department (only FK to department)
 """
-from sqlalchemy import Column, String, Text, Integer, Boolean, DateTime, Date, ForeignKey, ARRAY
+from sqlalchemy import Column, String, Text, Integer, Boolean, DateTime, Date, ForeignKey, ARRAY, event
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -89,8 +89,10 @@ class Job(Base):
 
     # AI Embeddings (pgvector) - optional, for semantic search
     if VECTOR_AVAILABLE:
-        description_embedding = Column(Vector(1536), nullable=True)  # OpenAI ada-002 dimension
+        description_embedding = Column(Vector(1536), nullable=True)  # 1536 dims (see AI-Service EMBEDDING_DIMENSIONS)
         requirements_embedding = Column(Vector(1536), nullable=True)
+        # AI-Service model id of both embeddings; re-embedded when the model changes
+        embedding_model = Column(String(200), nullable=True)
 
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -108,3 +110,14 @@ class Job(Base):
 
     def __repr__(self):
         return f"<Job {self.title} ({self.status})>"
+
+
+if VECTOR_AVAILABLE:
+    def _reset_job_embeddings(target, value, oldvalue, initiator):
+        """Job text changed: drop stale embeddings so the next search re-embeds them"""
+        target.description_embedding = None
+        target.requirements_embedding = None
+        target.embedding_model = None
+
+    for _attr in (Job.title, Job.description_plain, Job.requirements_plain, Job.keywords):
+        event.listen(_attr, "set", _reset_job_embeddings)
@@ -100,3 +100,57 @@ class UsageTracking(Base):
     
     def __repr__(self):
         return f"<UsageTracking {self.company_id}: {self.resource_type} = {self.count}>"
+
+
+class UsageTrackingMonthly(Base):
+    """Monthly usage totals rolled up from usage_tracking partitions past retention"""
+    __tablename__ = "usage_tracking_monthly"
+    
+    company_id = Column(UUID(as_uuid=True), ForeignKey('companies.id', ondelete='CASCADE'), primary_key=True)
+    resource_type = Column(String(50), primary_key=True)
+    period_start = Column(Date, primary_key=True)
+    period_end = Column(Date, primary_key=True)
+    total_count = Column(Integer, default=0, nullable=False)
+    sessions = Column(Integer, default=0, nullable=False)  # usage_tracking rows rolled into the total
+    archived_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    
+    def __repr__(self):
+        return f"<UsageTrackingMonthly {self.company_id}: {self.resource_type} {self.period_start} = {self.total_count}>"
+
+
+class UsageQuota(Base):
+    """Monthly quota counter - committed usage; running batches hold units in usage_reservations"""
+    __tablename__ = "usage_quotas"
+    
+    company_id = Column(UUID(as_uuid=True), ForeignKey('companies.id', ondelete='CASCADE'), primary_key=True)
+    resource_type = Column(String(50), primary_key=True)
+    period_start = Column(Date, primary_key=True)
+    used = Column(Integer, default=0, nullable=False)
+    
+    __table_args__ = (
+        CheckConstraint('used >= 0', name='check_usage_quota_non_negative'),
+    )
+    
+    def __repr__(self):
+        return f"<UsageQuota {self.company_id}: {self.resource_type} = {self.used}>"
+
+
+class QuotaReservation(Base):
+    """Units one running batch holds against a monthly quota counter"""
+    __tablename__ = "usage_reservations"
+    
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    company_id = Column(UUID(as_uuid=True), ForeignKey('companies.id', ondelete='CASCADE'), nullable=False)
+    resource_type = Column(String(50), nullable=False)
+    period_start = Column(Date, nullable=False)
+    units = Column(Integer, nullable=False)
+    # Refreshed while the batch runs; an expired hold no longer counts
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    
+    __table_args__ = (
+        CheckConstraint('units > 0', name='check_usage_reservation_units_positive'),
+    )
+    
+    def __repr__(self):
+        return f"<QuotaReservation {self.id}: {self.resource_type} {self.units} until {self.expires_at}>"
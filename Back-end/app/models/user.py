@@ -16,6 +16,8 @@ class User(Base):
     is_verified = Column(Boolean, default=False)
     role_id = Column(String(36), ForeignKey('roles.id'), nullable=True, index=True)
     role = relationship('Role')
+    # Bumped to revoke previously issued access tokens (e.g. after password reset)
+    token_version = Column(Integer, nullable=False, default=0, server_default='0')
     
     # Multi-tenancy support
     company_id = Column(UUID(as_uuid=True), ForeignKey('companies.id'), nullable=True, index=True)
@@ -18,14 +18,7 @@ from app.modules.agreement.types import (
 
 def get_agreement_templates(info: Info) -> List[AgreementTemplateType]:
     """Get all agreement templates for the current company"""
-    request = info.context["request"]
-    auth_header = request.headers.get("authorization")
-    if not auth_header:
-        raise Exception("Not authenticated")
-    try:
-        _, token = auth_header.split()
-    except ValueError:
-        raise Exception("Invalid authorization header")
+    token = info.context.token
     
     db = get_db_session()
     try:
@@ -53,14 +46,7 @@ def get_agreement_templates(info: Info) -> List[AgreementTemplateType]:
 
 async def create_agreement_template(info: Info, input: AgreementTemplateInput) -> AgreementTemplateResponse:
     """Create a new agreement template"""
-    request = info.context["request"]
-    auth_header = request.headers.get("authorization")
-    if not auth_header:
-        raise Exception("Not authenticated")
-    try:
-        _, token = auth_header.split()
-    except ValueError:
-        raise Exception("Invalid authorization header")
+    token = info.context.token
     
     db = get_db_session()
     try:
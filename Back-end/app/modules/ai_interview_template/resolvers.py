@@ -41,14 +41,7 @@ def ai_interview_email_templates(
     active_only: bool = False,
 ) -> AIInterviewEmailTemplateListResponse:
     """Get all AI interview email templates for the company"""
-    request = info.context["request"]
-    auth_header = request.headers.get("authorization")
-    if not auth_header:
-        raise Exception("Not authenticated")
-    try:
-        _, token = auth_header.split()
-    except ValueError:
-        raise Exception("Invalid authorization header")
+    token = info.context.token
     
     db = get_db_session()
     try:
@@ -92,14 +85,7 @@ def create_ai_interview_email_template(
     input: AIInterviewEmailTemplateInput,
 ) -> AIInterviewEmailTemplateResponse:
     """Create a new AI interview email template"""
-    request = info.context["request"]
-    auth_header = request.headers.get("authorization")
-    if not auth_header:
-        raise Exception("Not authenticated")
-    try:
-        _, token = auth_header.split()
-    except ValueError:
-        raise Exception("Invalid authorization header")
+    token = info.context.token
     
     db = get_db_session()
     try:
@@ -151,14 +137,7 @@ def update_ai_interview_email_template(
     input: AIInterviewEmailTemplateUpdateInput,
 ) -> AIInterviewEmailTemplateResponse:
     """Update an existing AI interview email template"""
-    request = info.context["request"]
-    auth_header = request.headers.get("authorization")
-    if not auth_header:
-        raise Exception("Not authenticated")
-    try:
-        _, token = auth_header.split()
-    except ValueError:
-        raise Exception("Invalid authorization header")
+    token = info.context.token
     
     db = get_db_session()
     try:
@@ -222,14 +201,7 @@ def delete_ai_interview_email_template(
     id: str,
 ) -> AIInterviewEmailTemplateResponse:
     """Delete an AI interview email template"""
-    request = info.context["request"]
-    auth_header = request.headers.get("authorization")
-    if not auth_header:
-        raise Exception("Not authenticated")
-    try:
-        _, token = auth_header.split()
-    except ValueError:
-        raise Exception("Invalid authorization header")
+    token = info.context.token
     
     db = get_db_session()
     try:
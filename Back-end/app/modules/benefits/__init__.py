@@ -5,13 +5,24 @@ Benefits Module - Yan Haklar Yönetimi
 from .models import Benefit
 from .enums import BenefitCategory, ValuePeriod
 from .types import BenefitType, BenefitInput
-from .resolvers import (
-    get_benefits,
-    get_benefit,
-    create_benefit,
-    update_benefit,
-    delete_benefit
-)
+
+# Resolvers load on first access (the GraphQL schema imports this package for
+# its types at startup; see app/graphql/lazy_resolvers.py)
+_RESOLVERS = {
+    'get_benefits',
+    'get_benefit',
+    'create_benefit',
+    'update_benefit',
+    'delete_benefit',
+}
+
+
+def __getattr__(name):
+    if name in _RESOLVERS:
+        from . import resolvers
+        return getattr(resolvers, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'Benefit',
@@ -6,29 +6,13 @@ from typing import List, Optional
 from uuid import UUID
 from strawberry.types import Info
 
-from app.modules.common import get_db_session
+from app.modules.common import get_auth_token, get_db_session
 from app.api.dependencies import get_current_user_from_token, get_company_id_from_token
 from .models import Benefit
 from .types import BenefitType, BenefitInput, BenefitResponseType
 from .enums import BenefitCategory, ValuePeriod
 
 
-def _get_auth_info(info: Info):
-    """Helper to get authentication info from request"""
-    request = info.context["request"]
-    auth_header = request.headers.get("authorization")
-    
-    if not auth_header:
-        raise Exception("Not authenticated")
-    
-    try:
-        scheme, token = auth_header.split()
-    except ValueError:
-        raise Exception("Invalid authorization header")
-    
-    return token
-
-
 def _benefit_to_type(benefit: Benefit) -> BenefitType:
     """Convert Benefit model to BenefitType"""
     return BenefitType(
@@ -48,7 +32,7 @@ def _benefit_to_type(benefit: Benefit) -> BenefitType:
 
 def get_benefits(info: Info, category: Optional[str] = None, is_active: Optional[bool] = None) -> List[BenefitType]:
     """Get all benefits for the company"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -81,7 +65,7 @@ def get_benefits(info: Info, category: Optional[str] = None, is_active: Optional
 
 def get_benefit(info: Info, id: str) -> Optional[BenefitType]:
     """Get a single benefit by ID"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -104,7 +88,7 @@ def get_benefit(info: Info, id: str) -> Optional[BenefitType]:
 
 def create_benefit(info: Info, input: BenefitInput) -> BenefitResponseType:
     """Create a new benefit"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -165,7 +149,7 @@ def create_benefit(info: Info, input: BenefitInput) -> BenefitResponseType:
 
 def update_benefit(info: Info, id: str, input: BenefitInput) -> BenefitResponseType:
     """Update an existing benefit"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -234,7 +218,7 @@ def update_benefit(info: Info, id: str, input: BenefitInput) -> BenefitResponseT
 
 def delete_benefit(info: Info, id: str) -> BenefitResponseType:
     """Delete a benefit"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
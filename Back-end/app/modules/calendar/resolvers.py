@@ -5,24 +5,11 @@ from datetime import datetime, date, timedelta
 from typing import Optional, List
 from strawberry.types import Info
 
-from app.modules.common import get_db_session
+from app.modules.common import get_auth_token, get_db_session
 from app.api.dependencies import get_company_id_from_token
 from app.modules.calendar.types import CalendarEventType, CalendarEventsResponse
 
 
-def _get_auth_info(info: Info):
-    """Helper to extract auth token from request"""
-    request = info.context["request"]
-    auth_header = request.headers.get("authorization")
-    if not auth_header:
-        raise Exception("Not authenticated")
-    try:
-        _, token = auth_header.split()
-    except ValueError:
-        raise Exception("Invalid authorization header")
-    return token
-
-
 def get_calendar_events(
     info: Info,
     start_date: str,
@@ -42,7 +29,7 @@ def get_calendar_events(
     from app.models.application import Application
     
     # Auth
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     company_id = get_company_id_from_token(token)
     if not company_id:
         return CalendarEventsResponse(events=[], total_count=0)
@@ -0,0 +1,6 @@
+"""
+Candidate Search Module - Semantic (pgvector) and full-text candidate search
+
+Import types directly from app.modules.candidate_search.types
+Import resolvers directly from app.modules.candidate_search.resolvers
+"""
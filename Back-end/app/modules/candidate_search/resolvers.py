@@ -0,0 +1,91 @@
+"""
+GraphQL Resolvers for Candidate Search Module
+"""
+
+from typing import List
+from strawberry.types import Info
+
+from app.api.dependencies import get_company_id_from_token
+from app.models.application import Application
+from app.models.job import Job
+from app.modules.common import get_auth_token, get_db_session
+from app.services.candidate_search_service import CandidateSearchService
+from app.services.embedding_service import EmbeddingService
+from .types import CandidateSearchHitType, CandidateSearchResultType, SimilarCandidateType
+
+
+async def get_similar_candidates(info: Info, job_id: str, limit: int = 20) -> List[SimilarCandidateType]:
+    """Top-N company candidates closest to the job by CV embedding (no LLM call)"""
+    token = get_auth_token(info)
+    
+    db = get_db_session()
+    try:
+        company_id = get_company_id_from_token(token)
+        if not company_id:
+            raise Exception("Company context required")
+        
+        job = db.query(Job).filter(Job.id == job_id, Job.company_id == company_id).first()
+        if not job:
+            raise Exception("İş ilanı bulunamadı")
+        
+        limit = max(1, min(limit, 100))
+        ranked = await EmbeddingService.similar_candidates(db, job, company_id, limit=limit)
+        
+        candidate_ids = [candidate.id for candidate, _ in ranked]
+        applied_ids = {
+            row.candidate_id for row in db.query(Application.candidate_id).filter(
+                Application.job_id == job_id,
+                Application.candidate_id.in_(candidate_ids)
+            )
+        } if candidate_ids else set()
+        
+        return [
+            SimilarCandidateType(
+                id=str(candidate.id),
+                name=candidate.name or "",
+                email=candidate.email,
+                location=candidate.location,
+                experience_months=candidate.experience_months,
+                similarity=round(similarity, 4),
+                has_applied=candidate.id in applied_ids,
+            )
+            for candidate, similarity in ranked
+        ]
+    finally:
+        db.close()
+
+
+def search_candidates(info: Info, query: str, page: int = 1, page_size: int = 20) -> CandidateSearchResultType:
+    """Ranked full-text (Turkish/English) + fuzzy name search over the company's candidates"""
+    token = get_auth_token(info)
+    
+    db = get_db_session()
+    try:
+        company_id = get_company_id_from_token(token)
+        if not company_id:
+            raise Exception("Company context required")
+        
+        page = max(1, page)
+        page_size = max(1, min(page_size, 100))
+        hits, total = CandidateSearchService.search(db, company_id, query, page=page, page_size=page_size)
+        
+        return CandidateSearchResultType(
+            items=[
+                CandidateSearchHitType(
+                    id=str(candidate.id),
+                    name=candidate.name or "",
+                    email=candidate.email,
+                    phone=candidate.phone,
+                    location=candidate.location,
+                    experience_months=candidate.experience_months,
+                    cv_file_name=candidate.cv_file_name,
+                    rank=round(rank, 4),
+                )
+                for candidate, rank in hits
+            ],
+            total=total,
+            page=page,
+            page_size=page_size,
+        )
+    finally:
+        db.close()
@@ -0,0 +1,40 @@
+"""
+GraphQL Types for Candidate Search Module
+"""
+
+import strawberry
+from typing import List, Optional
+
+
+@strawberry.type
+class SimilarCandidateType:
+    """Candidate ranked by embedding similarity to a job"""
+    id: str
+    name: str
+    email: Optional[str] = None
+    location: Optional[str] = None
+    experience_months: Optional[int] = strawberry.field(name="experienceMonths", default=None)
+    similarity: float = 0.0  # cosine similarity, higher is closer
+    has_applied: bool = strawberry.field(name="hasApplied", default=False)
+
+
+@strawberry.type
+class CandidateSearchHitType:
+    """Candidate matched by full-text / fuzzy search"""
+    id: str
+    name: str
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    location: Optional[str] = None
+    experience_months: Optional[int] = strawberry.field(name="experienceMonths", default=None)
+    cv_file_name: Optional[str] = strawberry.field(name="cvFileName", default=None)
+    rank: float = 0.0
+
+
+@strawberry.type
+class CandidateSearchResultType:
+    """One page of ranked candidate search results"""
+    items: List[CandidateSearchHitType]
+    total: int
+    page: int
+    page_size: int = strawberry.field(name="pageSize")
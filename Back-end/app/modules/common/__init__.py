@@ -2,12 +2,19 @@
 Common types and utilities shared across all modules.
 """
 
+import json
 import strawberry
-from typing import Optional
+from strawberry.types import Info
+from typing import Any, Dict, Optional
 
 from app.modules.common.database import get_db_session
 
 
+def get_auth_token(info: Info) -> str:
+    """Bearer token for the current operation, parsed once by the GraphQL context"""
+    return info.context.token
+
+
 @strawberry.type
 class MessageType:
     """GraphQL Message type for simple responses"""
@@ -23,9 +30,41 @@ class GenericResponse:
     data: Optional[str] = None
 
 
+@strawberry.type
+class AIStreamEventType:
+    """One partial result relayed from a streaming AI-Service generation.
+
+    event: "delta" (``text`` appended to field ``key``), "item" (finished
+    element ``index`` of array ``key``), "field" (finished value of ``key``),
+    "done" (final result) or "error". ``value`` is a JSON string.
+    """
+    event: str
+    key: Optional[str] = None
+    index: Optional[int] = None
+    text: Optional[str] = None
+    value: Optional[str] = None
+    error: Optional[str] = None
+
+
+def ai_stream_event(event: Dict[str, Any]) -> AIStreamEventType:
+    """GraphQL event from an AI-Service stream event (``done`` carries ``data``)"""
+    value = event.get("data") if event.get("event") == "done" else event.get("value")
+    return AIStreamEventType(
+        event=event.get("event", ""),
+        key=event.get("key"),
+        index=event.get("index"),
+        text=event.get("text"),
+        value=json.dumps(value, ensure_ascii=False) if value is not None else None,
+        error=event.get("error"),
+    )
+
+
 __all__ = [
     "MessageType",
     "GenericResponse",
+    "AIStreamEventType",
+    "ai_stream_event",
     "get_db_session",
+    "get_auth_token",
 ]
 
@@ -6,7 +6,16 @@ from app.core.database import get_db
 
 
 def get_db_session() -> Session:
-    """Get a new database session"""
-    return next(get_db())
+    """Get a database session.
 
+    Inside a GraphQL HTTP operation this is the operation's shared session
+    (one pooled connection for every field); elsewhere a new session.
+    Callers still commit and close it; outside mutations the shared session
+    defers both to the end of the operation (see app.graphql.context.RequestSession).
+    """
+    from app.graphql.context import get_request_scoped_session
 
+    session = get_request_scoped_session()
+    if session is not None:
+        return session
+    return next(get_db())
@@ -6,7 +6,7 @@ from typing import List, Optional
 from strawberry.types import Info
 
 from app.api.dependencies import get_company_id_from_token
-from app.modules.common import get_db_session
+from app.modules.common import get_auth_token, get_db_session
 from app.modules.company_address.models import CompanyAddress
 from app.modules.company_address.types import (
     CompanyAddressType,
@@ -16,19 +16,6 @@ from app.modules.company_address.types import (
 )
 
 
-def _get_auth_info(info: Info):
-    """Helper to extract auth info from request"""
-    request = info.context["request"]
-    auth_header = request.headers.get("authorization")
-    if not auth_header:
-        raise Exception("Not authenticated")
-    try:
-        _, token = auth_header.split()
-    except ValueError:
-        raise Exception("Invalid authorization header")
-    return token
-
-
 def _build_address_type(address: CompanyAddress) -> CompanyAddressType:
     """Helper to build CompanyAddressType from model"""
     return CompanyAddressType(
@@ -52,7 +39,7 @@ def _build_address_type(address: CompanyAddress) -> CompanyAddressType:
 
 def get_company_addresses(info: Info, include_inactive: bool = False) -> List[CompanyAddressType]:
     """Get all addresses for the company"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -77,7 +64,7 @@ def get_company_addresses(info: Info, include_inactive: bool = False) -> List[Co
 
 def get_company_address(info: Info, id: str) -> Optional[CompanyAddressType]:
     """Get a single address by ID"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -102,7 +89,7 @@ def get_company_address(info: Info, id: str) -> Optional[CompanyAddressType]:
 
 async def create_company_address(info: Info, input: CompanyAddressInput) -> CompanyAddressResponse:
     """Create a new company address"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -149,7 +136,7 @@ async def create_company_address(info: Info, input: CompanyAddressInput) -> Comp
 
 async def update_company_address(info: Info, input: CompanyAddressUpdateInput) -> CompanyAddressResponse:
     """Update an existing company address"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -213,7 +200,7 @@ async def update_company_address(info: Info, input: CompanyAddressUpdateInput) -
 
 async def delete_company_address(info: Info, id: str) -> CompanyAddressResponse:
     """Delete a company address (soft delete - sets is_active to False)"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -8,6 +8,7 @@ Provides single source of truth for application status and timeline.
 from app.modules.history.models import (
     ActionType,
     ApplicationHistory,
+    ApplicationHistoryMonthly,
     DEFAULT_ACTION_TYPES,
 )
 
@@ -29,6 +30,7 @@ __all__ = [
     # Models
     "ActionType",
     "ApplicationHistory",
+    "ApplicationHistoryMonthly",
     "DEFAULT_ACTION_TYPES",
     # Types
     "ActionTypeType",
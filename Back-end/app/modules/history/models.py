@@ -2,7 +2,7 @@
 History Models - Application Event Tracking System
 Tracks all actions/events for candidates throughout the recruitment process.
 """
-from sqlalchemy import Column, String, Integer, Text, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, String, Integer, Text, Date, DateTime, ForeignKey, Boolean
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -86,6 +86,23 @@ class ApplicationHistory(Base):
         return f"<ApplicationHistory(application_id={self.application_id}, action={self.action_type_id}, created_at={self.created_at})>"
 
 
+class ApplicationHistoryMonthly(Base):
+    """
+    Monthly action counts per job, rolled up from application_history partitions
+    past APPLICATION_HISTORY_RETENTION_MONTHS before they are dropped.
+    """
+    __tablename__ = "application_history_monthly"
+
+    company_id = Column(UUID(as_uuid=True), ForeignKey("companies.id", ondelete="CASCADE"), primary_key=True)
+    month = Column(Date, primary_key=True)
+    action_type_id = Column(UUID(as_uuid=True), ForeignKey("action_types.id", ondelete="RESTRICT"), primary_key=True)
+    job_id = Column(String(36), primary_key=True)  # No FK: the job may be deleted after archival
+    entries = Column(Integer, default=0, nullable=False)
+
+    def __repr__(self):
+        return f"<ApplicationHistoryMonthly(month={self.month}, action={self.action_type_id}, entries={self.entries})>"
+
+
 # Default system action types (will be seeded)
 DEFAULT_ACTION_TYPES = [
     {
@@ -120,14 +120,7 @@ def get_action_types(info: Info) -> List[ActionTypeType]:
 
 def get_application_history(info: Info, application_id: str) -> HistoryListResponse:
     """Get full history for an application"""
-    request = info.context["request"]
-    auth_header = request.headers.get("authorization")
-    if not auth_header:
-        raise Exception("Not authenticated")
-    try:
-        _, token = auth_header.split()
-    except ValueError:
-        raise Exception("Invalid authorization header")
+    token = info.context.token
     
     db = get_db_session()
     try:
@@ -182,14 +175,7 @@ def get_application_history(info: Info, application_id: str) -> HistoryListRespo
 
 def get_last_status(info: Info, application_id: str) -> Optional[LastStatusType]:
     """Get last status for an application (most recent history entry)"""
-    request = info.context["request"]
-    auth_header = request.headers.get("authorization")
-    if not auth_header:
-        raise Exception("Not authenticated")
-    try:
-        _, token = auth_header.split()
-    except ValueError:
-        raise Exception("Invalid authorization header")
+    token = info.context.token
     
     db = get_db_session()
     try:
@@ -223,14 +209,7 @@ def get_last_status(info: Info, application_id: str) -> Optional[LastStatusType]
 
 async def add_history_entry(info: Info, input: CreateHistoryEntryInput) -> HistoryResponse:
     """Add a new history entry"""
-    request = info.context["request"]
-    auth_header = request.headers.get("authorization")
-    if not auth_header:
-        raise Exception("Not authenticated")
-    try:
-        _, token = auth_header.split()
-    except ValueError:
-        raise Exception("Invalid authorization header")
+    token = info.context.token
     
     db = get_db_session()
     try:
@@ -310,14 +289,7 @@ def get_recent_activities(info: Info, limit: int = 10) -> RecentActivitiesRespon
     from app.models.candidate import Candidate
     from app.models.job import Job
     
-    request = info.context["request"]
-    auth_header = request.headers.get("authorization")
-    if not auth_header:
-        raise Exception("Not authenticated")
-    try:
-        _, token = auth_header.split()
-    except ValueError:
-        raise Exception("Invalid authorization header")
+    token = info.context.token
     
     db = get_db_session()
     try:
@@ -3,12 +3,13 @@ GraphQL Resolvers for Interview Module
 """
 import secrets
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import AsyncGenerator, List, Optional
 
 from strawberry.types import Info
 
 from app.api.dependencies import get_company_id_from_token, get_current_user_from_token
-from app.modules.common import get_db_session, MessageType
+from app.core.telemetry import trace_headers
+from app.modules.common import get_db_session, get_auth_token, MessageType, AIStreamEventType, ai_stream_event
 from app.modules.agreement.types import AgreementTemplateType
 from app.modules.interview.models import (
     InterviewTemplate,
@@ -43,14 +44,7 @@ from app.modules.interview.types import (
 
 def get_interview_templates(info: Info) -> List[InterviewTemplateType]:
     """Get all interview templates for the current company"""
-    request = info.context["request"]
-    auth_header = request.headers.get("authorization")
-    if not auth_header:
-        raise Exception("Not authenticated")
-    try:
-        _, token = auth_header.split()
-    except ValueError:
-        raise Exception("Invalid authorization header")
+    token = info.context.token
     
     db = get_db_session()
     try:
@@ -393,14 +387,7 @@ def get_interview_session_by_application(info: Info, application_id: str) -> Opt
 
 async def create_interview_template(info: Info, input: InterviewTemplateInput) -> InterviewTemplateResponse:
     """Create a new interview template"""
-    request = info.context["request"]
-    auth_header = request.headers.get("authorization")
-    if not auth_header:
-        raise Exception("Not authenticated")
-    try:
-        _, token = auth_header.split()
-    except ValueError:
-        raise Exception("Invalid authorization header")
+    token = info.context.token
     
     db = get_db_session()
     try:
@@ -666,13 +653,7 @@ async def create_interview_session(info: Info, input: CreateInterviewSessionInpu
     from app.modules.history.resolvers import create_history_entry
     
     request = info.context["request"]
-    auth_header = request.headers.get("authorization")
-    if not auth_header:
-        raise Exception("Not authenticated")
-    try:
-        _, token = auth_header.split()
-    except ValueError:
-        raise Exception("Invalid authorization header")
+    token = info.context.token
     
     db = get_db_session()
     try:
@@ -1061,11 +1042,120 @@ async def accept_interview_agreement(info: Info, token: str) -> InterviewSession
 
 # ============ AI Analysis Resolvers ============
 
+def _ai_analysis_type(ai_result: dict, overall_score: Optional[float] = None) -> AIInterviewAnalysisType:
+    """GraphQL type for a stored or fresh AI analysis"""
+    return AIInterviewAnalysisType(
+        overall_score=overall_score if overall_score is not None else ai_result.get("overall_score", 0),
+        categories=[
+            AIAnalysisCategoryType(
+                category=cat.get("category", ""),
+                category_en=cat.get("category_en", ""),
+                score=cat.get("score", 0),
+                feedback=cat.get("feedback", []),
+            ) for cat in ai_result.get("categories", [])
+        ],
+        summary=ai_result.get("summary"),
+        analyzed_at=ai_result.get("analyzed_at", datetime.utcnow().isoformat()),
+    )
+
+
+def _interview_analysis_payload(db, session: InterviewSession) -> dict:
+    """AI-Service /analyze-interview request body for a session"""
+    from app.models.job import Job
+    
+    # Get job details
+    job = db.query(Job).filter(Job.id == session.job_id).first()
+    if not job:
+        raise Exception("Job not found")
+    
+    # Get template for AI analysis check
+    template = None
+    if job.interview_template_id:
+        template = db.query(InterviewTemplate).filter(InterviewTemplate.id == job.interview_template_id).first()
+    
+    # Get answers with questions
+    answers = db.query(InterviewAnswer).filter(InterviewAnswer.session_id == session.id).all()
+    questions_list = []
+    if template:
+        questions_list = db.query(InterviewQuestion).filter(
+            InterviewQuestion.template_id == template.id
+        ).order_by(InterviewQuestion.question_order).all()
+    
+    # Build Q&A list for AI
+    qa_list = []
+    for a in sorted(answers, key=lambda x: x.created_at):
+        q = next((q for q in questions_list if str(q.id) == str(a.question_id)), None)
+        if q:
+            qa_list.append({
+                "question": q.question_text,
+                "answer": a.answer_text or "",
+                "order": q.question_order,
+            })
+    
+    # Prepare job context
+    job_context = {
+        "title": job.title,
+        "description": job.description_plain or job.description or "",
+        "requirements": job.requirements_plain or job.requirements or "",
+    }
+    
+    return {
+        "job_context": job_context,
+        "questions_answers": qa_list,
+        "language": template.language if template else "tr",
+    }
+
+
+def _save_interview_analysis(db, session: InterviewSession, ai_result: dict) -> None:
+    """Store the analysis on the session and record interview_ai_analysis usage"""
+    # Save to database
+    session.ai_analysis = ai_result
+    session.ai_overall_score = ai_result.get("overall_score", 0)
+    db.commit()
+    db.refresh(session)
+    
+    # Record usage for interview_ai_analysis
+    try:
+        from app.models.subscription import UsageTracking
+        from app.models.candidate import Candidate
+        from datetime import date
+        from calendar import monthrange
+        
+        today = date.today()
+        month_start = date(today.year, today.month, 1)
+        last_day = monthrange(today.year, today.month)[1]
+        month_end = date(today.year, today.month, last_day)
+        batch_number = f"##AIA{secrets.token_hex(3).upper()}"
+        
+        # Get candidate name for metadata
+        candidate = db.query(Candidate).filter(Candidate.id == session.candidate_id).first()
+        candidate_name = candidate.name if candidate else "Unknown"
+        
+        usage_entry = UsageTracking(
+            company_id=session.company_id,
+            resource_type="interview_ai_analysis",
+            count=1,
+            period_start=month_start,
+            period_end=month_end,
+            usage_metadata={
+                "session_id": str(session.id), 
+                "candidate_id": str(session.candidate_id),
+                "candidate_name": candidate_name,
+                "application_id": str(session.application_id) if session.application_id else None
+            },
+            batch_number=batch_number
+        )
+        db.add(usage_entry)
+        db.commit()
+        print(f"✅ Recorded interview_ai_analysis usage: {batch_number}")
+    except Exception as ue:
+        print(f"❌ Usage record failed for interview_ai_analysis: {ue}")
+
+
 async def analyze_interview_with_ai(info: Info, session_id: str) -> AIAnalysisResponse:
     """Trigger AI analysis for a completed interview session"""
     import httpx
     import os
-    from app.models.job import Job
     
     request = info.context["request"]
     auth_header = request.headers.get("authorization")
@@ -1084,69 +1174,21 @@ async def analyze_interview_with_ai(info: Info, session_id: str) -> AIAnalysisRe
             return AIAnalysisResponse(
                 success=True,
                 message="Analysis already exists",
-                analysis=AIInterviewAnalysisType(
-                    overall_score=float(session.ai_overall_score) if session.ai_overall_score else 0,
-                    categories=[
-                        AIAnalysisCategoryType(
-                            category=cat.get("category", ""),
-                            category_en=cat.get("category_en", ""),
-                            score=cat.get("score", 0),
-                            feedback=cat.get("feedback", []),
-                        ) for cat in session.ai_analysis.get("categories", [])
-                    ],
-                    summary=session.ai_analysis.get("summary"),
-                    analyzed_at=session.ai_analysis.get("analyzed_at"),
+                analysis=_ai_analysis_type(
+                    session.ai_analysis,
+                    float(session.ai_overall_score) if session.ai_overall_score else 0,
                 )
             )
         
-        # Get job details
-        job = db.query(Job).filter(Job.id == session.job_id).first()
-        if not job:
-            return AIAnalysisResponse(success=False, message="Job not found", analysis=None)
-        
-        # Get template for AI analysis check
-        template = None
-        if job.interview_template_id:
-            template = db.query(InterviewTemplate).filter(InterviewTemplate.id == job.interview_template_id).first()
-        
-        # Get answers with questions
-        answers = db.query(InterviewAnswer).filter(InterviewAnswer.session_id == session.id).all()
-        questions_list = []
-        if template:
-            questions_list = db.query(InterviewQuestion).filter(
-                InterviewQuestion.template_id == template.id
-            ).order_by(InterviewQuestion.question_order).all()
-        
-        # Build Q&A list for AI
-        qa_list = []
-        for a in sorted(answers, key=lambda x: x.created_at):
-            q = next((q for q in questions_list if str(q.id) == str(a.question_id)), None)
-            if q:
-                qa_list.append({
-                    "question": q.question_text,
-                    "answer": a.answer_text or "",
-                    "order": q.question_order,
-                })
-        
-        # Prepare job context
-        job_context = {
-            "title": job.title,
-            "description": job.description_plain or job.description or "",
-            "requirements": job.requirements_plain or job.requirements or "",
-        }
+        payload = _interview_analysis_payload(db, session)
         
         # Call AI-Service
         ai_service_url = os.getenv("AI_SERVICE_URL", "http://localhost:8001")
-        interview_language = template.language if template else "tr"
         
-        async with httpx.AsyncClient(timeout=120.0) as client:
+        async with httpx.AsyncClient(timeout=120.0, headers=trace_headers()) as client:
             response = await client.post(
                 f"{ai_service_url}/analyze-interview",
-                json={
-                    "job_context": job_context,
-                    "questions_answers": qa_list,
-                    "language": interview_language,
-                }
+                json=payload
             )
             
             if response.status_code != 200:
@@ -1168,66 +1210,12 @@ async def analyze_interview_with_ai(info: Info, session_id: str) -> AIAnalysisRe
             
             ai_result = ai_response.get("data", {})
         
-        # Save to database
-        session.ai_analysis = ai_result
-        session.ai_overall_score = ai_result.get("overall_score", 0)
-        db.commit()
-        db.refresh(session)
-        
-        # Record usage for interview_ai_analysis
-        try:
-            from app.models.subscription import UsageTracking
-            from app.models.candidate import Candidate
-            from datetime import date
-            from calendar import monthrange
-            import secrets
-            
-            today = date.today()
-            month_start = date(today.year, today.month, 1)
-            last_day = monthrange(today.year, today.month)[1]
-            month_end = date(today.year, today.month, last_day)
-            batch_number = f"##AIA{secrets.token_hex(3).upper()}"
-            
-            # Get candidate name for metadata
-            candidate = db.query(Candidate).filter(Candidate.id == session.candidate_id).first()
-            candidate_name = candidate.name if candidate else "Unknown"
-            
-            usage_entry = UsageTracking(
-                company_id=session.company_id,
-                resource_type="interview_ai_analysis",
-                count=1,
-                period_start=month_start,
-                period_end=month_end,
-                usage_metadata={
-                    "session_id": str(session.id), 
-                    "candidate_id": str(session.candidate_id),
-                    "candidate_name": candidate_name,
-                    "application_id": str(session.application_id) if session.application_id else None
-                },
-                batch_number=batch_number
-            )
-            db.add(usage_entry)
-            db.commit()
-            print(f"✅ Recorded interview_ai_analysis usage: {batch_number}")
-        except Exception as ue:
-            print(f"❌ Usage record failed for interview_ai_analysis: {ue}")
+        _save_interview_analysis(db, session, ai_result)
         
         return AIAnalysisResponse(
             success=True,
             message="Analysis completed successfully",
-            analysis=AIInterviewAnalysisType(
-                overall_score=ai_result.get("overall_score", 0),
-                categories=[
-                    AIAnalysisCategoryType(
-                        category=cat.get("category", ""),
-                        category_en=cat.get("category_en", ""),
-                        score=cat.get("score", 0),
-                        feedback=cat.get("feedback", []),
-                    ) for cat in ai_result.get("categories", [])
-                ],
-                summary=ai_result.get("summary"),
-                analyzed_at=ai_result.get("analyzed_at", datetime.utcnow().isoformat()),
-            )
+            analysis=_ai_analysis_type(ai_result)
         )
     except Exception as e:
         db.rollback()
@@ -1236,6 +1224,41 @@ async def analyze_interview_with_ai(info: Info, session_id: str) -> AIAnalysisRe
         db.close()
 
 
+async def analyze_interview_with_ai_stream(info: Info, session_id: str) -> AsyncGenerator[AIStreamEventType, None]:
+    """Streaming analyzeInterviewWithAi: categories arrive as the model scores them.
+
+    The final "done" event carries the stored analysis (saved and usage
+    recorded exactly like the mutation); an existing analysis is replayed as
+    a single "done" event.
+    """
+    from app.services.ai_service_client import ai_service_client
+    
+    get_auth_token(info)  # raises when not authenticated
+    
+    db = get_db_session()
+    try:
+        session = db.query(InterviewSession).filter(InterviewSession.id == session_id).first()
+        if not session:
+            yield AIStreamEventType(event="error", error="Session not found")
+            return
+        if session.ai_analysis:
+            yield ai_stream_event({"event": "done", "data": session.ai_analysis})
+            return
+        payload = _interview_analysis_payload(db, session)
+        # Do not hold a connection while the model writes
+        db.commit()
+        
+        async for event in ai_service_client.stream_events("/analyze-interview/stream", payload):
+            if event.get("event") == "done":
+                _save_interview_analysis(db, session, event.get("data") or {})
+            yield ai_stream_event(event)
+    except Exception as e:
+        db.rollback()
+        yield AIStreamEventType(event="error", error=str(e))
+    finally:
+        db.close()
+
+
 async def update_browser_stt_support(info: Info, token: str, supported: bool) -> InterviewSessionResponse:
     """Update browser STT support status for a session"""
     db = get_db_session()
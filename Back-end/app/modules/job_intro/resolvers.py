@@ -6,6 +6,7 @@ from strawberry.types import Info
 
 from app.api.dependencies import get_company_id_from_token, get_current_user_from_token
 from app.modules.common import get_db_session, MessageType
+from app.services.public_job_cache import public_job_cache
 from app.modules.job_intro.models import JobIntroTemplate
 from app.modules.job_intro.types import (
     JobIntroTemplateType,
@@ -18,14 +19,7 @@ from app.modules.job_intro.types import (
 
 def get_job_intro_templates(info: Info, active_only: bool = False) -> List[JobIntroTemplateType]:
     """Get all job intro templates for the current company"""
-    request = info.context["request"]
-    auth_header = request.headers.get("authorization")
-    if not auth_header:
-        raise Exception("Not authenticated")
-    try:
-        _, token = auth_header.split()
-    except ValueError:
-        raise Exception("Invalid authorization header")
+    token = info.context.token
     
     db = get_db_session()
     try:
@@ -58,14 +52,7 @@ def get_job_intro_templates(info: Info, active_only: bool = False) -> List[JobIn
 
 async def create_job_intro_template(info: Info, input: JobIntroTemplateInput) -> JobIntroTemplateResponse:
     """Create a new job intro template"""
-    request = info.context["request"]
-    auth_header = request.headers.get("authorization")
-    if not auth_header:
-        raise Exception("Not authenticated")
-    try:
-        _, token = auth_header.split()
-    except ValueError:
-        raise Exception("Invalid authorization header")
+    token = info.context.token
     
     db = get_db_session()
     try:
@@ -82,6 +69,7 @@ async def create_job_intro_template(info: Info, input: JobIntroTemplateInput) ->
         db.add(template)
         db.commit()
         db.refresh(template)
+        public_job_cache.invalidate_company(template.company_id)
         
         return JobIntroTemplateResponse(
             success=True,
@@ -121,6 +109,7 @@ async def update_job_intro_template(info: Info, id: str, input: JobIntroTemplate
         template.is_active = input.is_active
         db.commit()
         db.refresh(template)
+        public_job_cache.invalidate_company(template.company_id)
         
         return JobIntroTemplateResponse(
             success=True,
@@ -155,8 +144,10 @@ async def delete_job_intro_template(info: Info, id: str) -> MessageType:
         if not template:
             return MessageType(success=False, message="Template not found")
         
+        company_id = template.company_id
         db.delete(template)
         db.commit()
+        public_job_cache.invalidate_company(company_id)
         return MessageType(success=True, message="Template deleted")
     except Exception as e:
         db.rollback()
@@ -181,6 +172,7 @@ async def toggle_job_intro_template(info: Info, id: str) -> JobIntroTemplateResp
         template.is_active = not template.is_active
         db.commit()
         db.refresh(template)
+        public_job_cache.invalidate_company(template.company_id)
         
         return JobIntroTemplateResponse(
             success=True,
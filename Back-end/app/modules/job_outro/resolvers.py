@@ -6,6 +6,7 @@ from strawberry.types import Info
 
 from app.api.dependencies import get_company_id_from_token, get_current_user_from_token
 from app.modules.common import get_db_session, MessageType
+from app.services.public_job_cache import public_job_cache
 from app.modules.job_outro.models import JobOutroTemplate
 from app.modules.job_outro.types import (
     JobOutroTemplateType,
@@ -18,14 +19,7 @@ from app.modules.job_outro.types import (
 
 def get_job_outro_templates(info: Info, active_only: bool = False) -> List[JobOutroTemplateType]:
     """Get all job outro templates for the current company"""
-    request = info.context["request"]
-    auth_header = request.headers.get("authorization")
-    if not auth_header:
-        raise Exception("Not authenticated")
-    try:
-        _, token = auth_header.split()
-    except ValueError:
-        raise Exception("Invalid authorization header")
+    token = info.context.token
     
     db = get_db_session()
     try:
@@ -58,14 +52,7 @@ def get_job_outro_templates(info: Info, active_only: bool = False) -> List[JobOu
 
 async def create_job_outro_template(info: Info, input: JobOutroTemplateInput) -> JobOutroTemplateResponse:
     """Create a new job outro template"""
-    request = info.context["request"]
-    auth_header = request.headers.get("authorization")
-    if not auth_header:
-        raise Exception("Not authenticated")
-    try:
-        _, token = auth_header.split()
-    except ValueError:
-        raise Exception("Invalid authorization header")
+    token = info.context.token
     
     db = get_db_session()
     try:
@@ -82,6 +69,7 @@ async def create_job_outro_template(info: Info, input: JobOutroTemplateInput) ->
         db.add(template)
         db.commit()
         db.refresh(template)
+        public_job_cache.invalidate_company(template.company_id)
         
         return JobOutroTemplateResponse(
             success=True,
@@ -121,6 +109,7 @@ async def update_job_outro_template(info: Info, id: str, input: JobOutroTemplate
         template.is_active = input.is_active
         db.commit()
         db.refresh(template)
+        public_job_cache.invalidate_company(template.company_id)
         
         return JobOutroTemplateResponse(
             success=True,
@@ -155,8 +144,10 @@ async def delete_job_outro_template(info: Info, id: str) -> MessageType:
         if not template:
             return MessageType(success=False, message="Template not found")
         
+        company_id = template.company_id
         db.delete(template)
         db.commit()
+        public_job_cache.invalidate_company(company_id)
         return MessageType(success=True, message="Template deleted")
     except Exception as e:
         db.rollback()
@@ -181,6 +172,7 @@ async def toggle_job_outro_template(info: Info, id: str) -> JobOutroTemplateResp
         template.is_active = not template.is_active
         db.commit()
         db.refresh(template)
+        public_job_cache.invalidate_company(template.company_id)
         
         return JobOutroTemplateResponse(
             success=True,
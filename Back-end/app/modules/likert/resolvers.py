@@ -25,14 +25,7 @@ from app.modules.likert.types import (
 
 def get_likert_templates(info: Info) -> List[LikertTemplateType]:
     """Get all likert templates for the current company"""
-    request = info.context["request"]
-    auth_header = request.headers.get("authorization")
-    if not auth_header:
-        raise Exception("Not authenticated")
-    try:
-        _, token = auth_header.split()
-    except ValueError:
-        raise Exception("Invalid authorization header")
+    token = info.context.token
     
     db = get_db_session()
     try:
@@ -105,14 +98,7 @@ def get_likert_template(info: Info, id: str) -> Optional[LikertTemplateType]:
 
 async def create_likert_template(info: Info, input: LikertTemplateInput) -> LikertTemplateResponse:
     """Create a new likert template"""
-    request = info.context["request"]
-    auth_header = request.headers.get("authorization")
-    if not auth_header:
-        raise Exception("Not authenticated")
-    try:
-        _, token = auth_header.split()
-    except ValueError:
-        raise Exception("Invalid authorization header")
+    token = info.context.token
     
     db = get_db_session()
     try:
@@ -212,14 +198,7 @@ async def create_likert_template(info: Info, input: LikertTemplateInput) -> Like
 
 async def update_likert_template(info: Info, id: str, input: LikertTemplateInput) -> LikertTemplateResponse:
     """Update a likert template"""
-    request = info.context["request"]
-    auth_header = request.headers.get("authorization")
-    if not auth_header:
-        raise Exception("Not authenticated")
-    try:
-        _, token = auth_header.split()
-    except ValueError:
-        raise Exception("Invalid authorization header")
+    token = info.context.token
     
     db = get_db_session()
     try:
@@ -394,13 +373,7 @@ async def create_likert_session(info: Info, input: CreateLikertSessionInput) ->
     from app.modules.history.resolvers import create_history_entry
     
     request = info.context["request"]
-    auth_header = request.headers.get("authorization")
-    if not auth_header:
-        raise Exception("Not authenticated")
-    try:
-        _, token = auth_header.split()
-    except ValueError:
-        raise Exception("Invalid authorization header")
+    token = info.context.token
     
     db = get_db_session()
     try:
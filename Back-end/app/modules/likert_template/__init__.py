@@ -11,14 +11,25 @@ from app.modules.likert_template.types import (
     LikertEmailTemplateVariableType,
     LikertEmailTemplateVariablesResponse,
 )
-from app.modules.likert_template.resolvers import (
-    get_likert_templates,
-    get_likert_template,
-    get_likert_template_variables,
-    create_likert_template,
-    update_likert_template,
-    delete_likert_template,
-)
+
+# Resolvers load on first access (the GraphQL schema imports this package for
+# its types at startup; see app/graphql/lazy_resolvers.py)
+_RESOLVERS = {
+    "get_likert_templates",
+    "get_likert_template",
+    "get_likert_template_variables",
+    "create_likert_template",
+    "update_likert_template",
+    "delete_likert_template",
+}
+
+
+def __getattr__(name):
+    if name in _RESOLVERS:
+        from . import resolvers
+        return getattr(resolvers, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     # Models
@@ -5,7 +5,7 @@ from typing import List, Optional
 from strawberry.types import Info
 
 from app.api.dependencies import get_company_id_from_token, get_current_user_from_token
-from app.modules.common import get_db_session, MessageType
+from app.modules.common import get_auth_token, get_db_session, MessageType
 from app.modules.likert_template.models import (
     LikertEmailTemplate,
     LIKERT_TEMPLATE_VARIABLES,
@@ -20,24 +20,11 @@ from app.modules.likert_template.types import (
 )
 
 
-def _get_auth_info(info: Info):
-    """Helper to extract auth info from request"""
-    request = info.context["request"]
-    auth_header = request.headers.get("authorization")
-    if not auth_header:
-        raise Exception("Not authenticated")
-    try:
-        _, token = auth_header.split()
-    except ValueError:
-        raise Exception("Invalid authorization header")
-    return token
-
-
 # ============ Query Resolvers ============
 
 def get_likert_templates(info: Info) -> List[LikertEmailTemplateType]:
     """Get all Likert test templates for the current company"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -65,7 +52,7 @@ def get_likert_templates(info: Info) -> List[LikertEmailTemplateType]:
 
 def get_likert_template(info: Info, id: str) -> Optional[LikertEmailTemplateType]:
     """Get a single Likert test template by ID"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -113,7 +100,7 @@ async def create_likert_template(
     input: LikertEmailTemplateInput
 ) -> LikertEmailTemplateResponse:
     """Create a new Likert test email template"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -169,7 +156,7 @@ async def update_likert_template(
     input: LikertEmailTemplateUpdateInput
 ) -> LikertEmailTemplateResponse:
     """Update a Likert test email template"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -230,7 +217,7 @@ async def update_likert_template(
 
 async def delete_likert_template(info: Info, id: str) -> MessageType:
     """Delete a Likert test template"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -16,27 +16,38 @@ from .types import (
     PublicOfferType,
     OfferResponseInput
 )
-from .resolvers import (
+
+# Resolvers load on first access (the GraphQL schema imports this package for
+# its types at startup; see app/graphql/lazy_resolvers.py)
+_RESOLVERS = {
     # Template resolvers
-    get_offer_templates,
-    get_offer_template,
-    create_offer_template,
-    update_offer_template,
-    delete_offer_template,
-    toggle_offer_template,
+    'get_offer_templates',
+    'get_offer_template',
+    'create_offer_template',
+    'update_offer_template',
+    'delete_offer_template',
+    'toggle_offer_template',
     # Offer resolvers
-    get_offers,
-    get_offer,
-    get_offer_by_application,
-    create_offer,
-    update_offer,
-    delete_offer,
-    send_offer,
-    withdraw_offer,
+    'get_offers',
+    'get_offer',
+    'get_offer_by_application',
+    'create_offer',
+    'update_offer',
+    'delete_offer',
+    'send_offer',
+    'withdraw_offer',
     # Public resolvers
-    get_offer_by_token,
-    respond_to_offer
-)
+    'get_offer_by_token',
+    'respond_to_offer',
+}
+
+
+def __getattr__(name):
+    if name in _RESOLVERS:
+        from . import resolvers
+        return getattr(resolvers, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     # Models
@@ -7,7 +7,7 @@ from datetime import datetime, date
 from uuid import UUID
 from strawberry.types import Info
 
-from app.modules.common import get_db_session
+from app.modules.common import get_auth_token, get_db_session
 from app.api.dependencies import get_current_user_from_token, get_company_id_from_token
 from .models import OfferTemplate, Offer
 from .types import (
@@ -18,22 +18,6 @@ from .types import (
 from .enums import OfferStatus, Currency
 
 
-def _get_auth_info(info: Info):
-    """Helper to get authentication info from request"""
-    request = info.context["request"]
-    auth_header = request.headers.get("authorization")
-    
-    if not auth_header:
-        raise Exception("Not authenticated")
-    
-    try:
-        scheme, token = auth_header.split()
-    except ValueError:
-        raise Exception("Invalid authorization header")
-    
-    return token
-
-
 # ============================================
 # Helper Functions
 # ============================================
@@ -82,7 +66,7 @@ def _template_to_type(template: OfferTemplate) -> OfferTemplateType:
 
 def get_offer_templates(info: Info, is_active: Optional[bool] = None) -> List[OfferTemplateType]:
     """Get all offer templates for the company"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -105,7 +89,7 @@ def get_offer_templates(info: Info, is_active: Optional[bool] = None) -> List[Of
 
 def get_offer_template(info: Info, id: str) -> Optional[OfferTemplateType]:
     """Get a single offer template by ID"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -128,7 +112,7 @@ def get_offer_template(info: Info, id: str) -> Optional[OfferTemplateType]:
 
 def create_offer_template(info: Info, input: OfferTemplateInput) -> OfferTemplateResponseType:
     """Create a new offer template"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -184,7 +168,7 @@ def create_offer_template(info: Info, input: OfferTemplateInput) -> OfferTemplat
 
 def update_offer_template(info: Info, id: str, input: OfferTemplateInput) -> OfferTemplateResponseType:
     """Update an existing offer template"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -248,7 +232,7 @@ def update_offer_template(info: Info, id: str, input: OfferTemplateInput) -> Off
 
 def delete_offer_template(info: Info, id: str) -> OfferTemplateResponseType:
     """Delete an offer template"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -289,7 +273,7 @@ def delete_offer_template(info: Info, id: str) -> OfferTemplateResponseType:
 
 def toggle_offer_template(info: Info, id: str) -> OfferTemplateResponseType:
     """Toggle offer template active status"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -390,7 +374,7 @@ def _offer_to_type(offer: Offer, db) -> OfferType:
 
 def get_offers(info: Info, status: Optional[str] = None) -> List[OfferType]:
     """Get all offers for the company"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -417,7 +401,7 @@ def get_offers(info: Info, status: Optional[str] = None) -> List[OfferType]:
 
 def get_offer(info: Info, id: str) -> Optional[OfferType]:
     """Get a single offer by ID"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -440,7 +424,7 @@ def get_offer(info: Info, id: str) -> Optional[OfferType]:
 
 def get_offer_by_application(info: Info, application_id: str) -> Optional[OfferType]:
     """Get offer for a specific application"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -463,7 +447,7 @@ def get_offer_by_application(info: Info, application_id: str) -> Optional[OfferT
 
 def create_offer(info: Info, input: OfferInput) -> OfferResponseType:
     """Create a new offer"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -567,7 +551,7 @@ def create_offer(info: Info, input: OfferInput) -> OfferResponseType:
 
 def update_offer(info: Info, id: str, input: OfferInput) -> OfferResponseType:
     """Update an existing offer"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -651,7 +635,7 @@ def update_offer(info: Info, id: str, input: OfferInput) -> OfferResponseType:
 
 def delete_offer(info: Info, id: str) -> OfferResponseType:
     """Delete an offer"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -692,7 +676,7 @@ def delete_offer(info: Info, id: str) -> OfferResponseType:
 
 def send_offer(info: Info, id: str) -> OfferResponseType:
     """Send an offer to the candidate"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -787,7 +771,7 @@ def send_offer(info: Info, id: str) -> OfferResponseType:
 
 def withdraw_offer(info: Info, id: str) -> OfferResponseType:
     """Withdraw an offer"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -911,7 +895,7 @@ def update_offer_status(
     note: Optional[str] = None
 ) -> OfferResponseType:
     """HR updates offer status (accept/reject on behalf of candidate or mark as accepted after verbal confirmation)"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -20,14 +20,7 @@ from app.modules.rejection.types import (
 
 def get_rejection_templates(info: Info) -> List[RejectionTemplateType]:
     """Get all rejection templates for the current company"""
-    request = info.context["request"]
-    auth_header = request.headers.get("authorization")
-    if not auth_header:
-        raise Exception("Not authenticated")
-    try:
-        _, token = auth_header.split()
-    except ValueError:
-        raise Exception("Invalid authorization header")
+    token = info.context.token
     
     db = get_db_session()
     try:
@@ -85,14 +78,7 @@ def get_rejection_template(info: Info, id: str) -> Optional[RejectionTemplateTyp
 
 async def create_rejection_template(info: Info, input: RejectionTemplateInput) -> RejectionTemplateResponse:
     """Create a new rejection email template"""
-    request = info.context["request"]
-    auth_header = request.headers.get("authorization")
-    if not auth_header:
-        raise Exception("Not authenticated")
-    try:
-        _, token = auth_header.split()
-    except ValueError:
-        raise Exception("Invalid authorization header")
+    token = info.context.token
     
     db = get_db_session()
     try:
@@ -220,14 +206,7 @@ async def reject_application(
     from app.models.application import Application, ApplicationStatus
     from app.modules.history.resolvers import create_history_entry
     
-    request = info.context["request"]
-    auth_header = request.headers.get("authorization")
-    if not auth_header:
-        raise Exception("Not authenticated")
-    try:
-        _, token = auth_header.split()
-    except ValueError:
-        raise Exception("Invalid authorization header")
+    token = info.context.token
     
     db = get_db_session()
     try:
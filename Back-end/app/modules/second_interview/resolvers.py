@@ -8,7 +8,7 @@ from datetime import datetime, date
 from strawberry.types import Info
 
 from app.api.dependencies import get_company_id_from_token, get_current_user_from_token
-from app.modules.common import get_db_session, MessageType
+from app.modules.common import get_auth_token, get_db_session, MessageType
 from app.modules.second_interview.models import (
     SecondInterview,
     SecondInterviewType as InterviewTypeEnum,
@@ -30,19 +30,6 @@ from app.models.application import Application, ApplicationStatus
 from app.modules.history.models import ApplicationHistory, ActionType
 
 
-def _get_auth_info(info: Info):
-    """Helper to extract auth info from request"""
-    request = info.context["request"]
-    auth_header = request.headers.get("authorization")
-    if not auth_header:
-        raise Exception("Not authenticated")
-    try:
-        _, token = auth_header.split()
-    except ValueError:
-        raise Exception("Invalid authorization header")
-    return token
-
-
 def _build_second_interview_type(interview: SecondInterview) -> SecondInterviewType:
     """Helper to build SecondInterviewType from model"""
     
@@ -110,7 +97,7 @@ def _build_second_interview_type(interview: SecondInterview) -> SecondInterviewT
 
 def get_second_interview(info: Info, id: str) -> Optional[SecondInterviewType]:
     """Get a single second interview by ID"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -131,7 +118,7 @@ def get_second_interview(info: Info, id: str) -> Optional[SecondInterviewType]:
 
 def get_second_interview_by_application(info: Info, application_id: str) -> Optional[SecondInterviewType]:
     """Get the most recent/active second interview for a specific application"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -161,7 +148,7 @@ def get_second_interview_by_application(info: Info, application_id: str) -> Opti
 
 def get_all_interviews_by_application(info: Info, application_id: str) -> List[SecondInterviewType]:
     """Get all interviews for a specific application"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -179,7 +166,7 @@ def get_all_interviews_by_application(info: Info, application_id: str) -> List[S
 
 def check_active_interview(info: Info, application_id: str) -> Optional[SecondInterviewType]:
     """Check if there's an active interview (not completed/cancelled and date not passed)"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -206,7 +193,7 @@ def check_active_interview(info: Info, application_id: str) -> Optional[SecondIn
 
 def get_second_interviews_by_job(info: Info, job_id: str) -> List[SecondInterviewType]:
     """Get all second interviews for a specific job"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -234,7 +221,7 @@ async def send_second_interview_invite(
     input: SecondInterviewInviteInput
 ) -> SecondInterviewResponse:
     """Send second interview invitation to a candidate"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -368,7 +355,7 @@ async def submit_second_interview_feedback(
     input: SecondInterviewFeedbackInput
 ) -> SecondInterviewResponse:
     """Submit feedback for a completed second interview"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -504,7 +491,7 @@ async def submit_second_interview_feedback(
 
 async def cancel_second_interview(info: Info, id: str) -> SecondInterviewResponse:
     """Cancel a second interview"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
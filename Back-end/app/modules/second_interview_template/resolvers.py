@@ -30,14 +30,7 @@ def get_second_interview_templates(
     template_type: Optional[SecondInterviewTemplateTypeEnum] = None
 ) -> List[SecondInterviewTemplateType]:
     """Get all second interview templates for the current company, optionally filtered by type"""
-    request = info.context["request"]
-    auth_header = request.headers.get("authorization")
-    if not auth_header:
-        raise Exception("Not authenticated")
-    try:
-        _, token = auth_header.split()
-    except ValueError:
-        raise Exception("Invalid authorization header")
+    token = info.context.token
     
     db = get_db_session()
     try:
@@ -129,14 +122,7 @@ async def create_second_interview_template(
     input: SecondInterviewTemplateInput
 ) -> SecondInterviewTemplateResponse:
     """Create a new second interview email template"""
-    request = info.context["request"]
-    auth_header = request.headers.get("authorization")
-    if not auth_header:
-        raise Exception("Not authenticated")
-    try:
-        _, token = auth_header.split()
-    except ValueError:
-        raise Exception("Invalid authorization header")
+    token = info.context.token
     
     db = get_db_session()
     try:
@@ -195,14 +181,7 @@ async def update_second_interview_template(
     input: SecondInterviewTemplateUpdateInput
 ) -> SecondInterviewTemplateResponse:
     """Update a second interview email template"""
-    request = info.context["request"]
-    auth_header = request.headers.get("authorization")
-    if not auth_header:
-        raise Exception("Not authenticated")
-    try:
-        _, token = auth_header.split()
-    except ValueError:
-        raise Exception("Invalid authorization header")
+    token = info.context.token
     
     db = get_db_session()
     try:
@@ -267,14 +246,7 @@ async def update_second_interview_template(
 
 async def delete_second_interview_template(info: Info, id: str) -> MessageType:
     """Delete a second interview template"""
-    request = info.context["request"]
-    auth_header = request.headers.get("authorization")
-    if not auth_header:
-        raise Exception("Not authenticated")
-    try:
-        _, token = auth_header.split()
-    except ValueError:
-        raise Exception("Invalid authorization header")
+    token = info.context.token
     
     db = get_db_session()
     try:
@@ -13,7 +13,7 @@ from datetime import datetime, timedelta
 from strawberry.types import Info
 import os
 
-from app.modules.common import get_db_session
+from app.modules.common import get_auth_token, get_db_session
 from app.api.dependencies import get_current_user_from_token, get_company_id_from_token
 from .models import ShortlistShare
 from .types import (
@@ -34,22 +34,6 @@ from .types import (
 )
 
 
-def _get_auth_info(info: Info):
-    """Helper to get authentication info from request"""
-    request = info.context["request"]
-    auth_header = request.headers.get("authorization")
-    
-    if not auth_header:
-        raise Exception("Not authenticated")
-    
-    try:
-        scheme, token = auth_header.split()
-    except ValueError:
-        raise Exception("Invalid authorization header")
-    
-    return token
-
-
 def _get_share_url(token: str) -> str:
     """Generate the public share URL"""
     base_url = os.getenv("FRONTEND_URL", "https://app.hrsmart.co")
@@ -115,7 +99,7 @@ def _share_to_type(share: ShortlistShare, db) -> ShortlistShareType:
 
 def toggle_longlist(info: Info, input: LonglistToggleInput) -> LonglistToggleResponseType:
     """Toggle longlist status for a single application (add to longlist from pool)"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -201,7 +185,7 @@ def toggle_longlist(info: Info, input: LonglistToggleInput) -> LonglistToggleRes
 
 def bulk_toggle_longlist(info: Info, input: BulkLonglistInput) -> BulkLonglistResponseType:
     """Bulk add/remove applications from longlist"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -294,7 +278,7 @@ def bulk_toggle_longlist(info: Info, input: BulkLonglistInput) -> BulkLonglistRe
 
 def toggle_shortlist(info: Info, input: ShortlistToggleInput) -> ShortlistToggleResponseType:
     """Toggle shortlist status for a single application (from longlist to shortlist or remove from shortlist)"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -386,7 +370,7 @@ def toggle_shortlist(info: Info, input: ShortlistToggleInput) -> ShortlistToggle
 
 def bulk_toggle_shortlist(info: Info, input: BulkShortlistInput) -> BulkShortlistResponseType:
     """Bulk add/remove applications from shortlist"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -486,7 +470,7 @@ def bulk_toggle_shortlist(info: Info, input: BulkShortlistInput) -> BulkShortlis
 
 def get_shortlist_shares(info: Info, job_id: Optional[str] = None, list_type: Optional[str] = None) -> List[ShortlistShareType]:
     """Get all shortlist/longlist shares for the company"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -513,7 +497,7 @@ def get_shortlist_shares(info: Info, job_id: Optional[str] = None, list_type: Op
 
 def get_shortlist_share(info: Info, id: str) -> Optional[ShortlistShareType]:
     """Get a single shortlist share by ID"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -536,7 +520,7 @@ def get_shortlist_share(info: Info, id: str) -> Optional[ShortlistShareType]:
 
 def create_shortlist_share(info: Info, input: ShortlistShareInput) -> ShortlistShareResponseType:
     """Create a new shortlist share link"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -600,7 +584,7 @@ def create_shortlist_share(info: Info, input: ShortlistShareInput) -> ShortlistS
 
 def delete_shortlist_share(info: Info, id: str) -> ShortlistShareResponseType:
     """Delete (deactivate) a shortlist share"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
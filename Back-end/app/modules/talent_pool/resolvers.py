@@ -7,7 +7,7 @@ from datetime import datetime
 from strawberry.types import Info
 
 from app.api.dependencies import get_company_id_from_token, get_current_user_from_token
-from app.modules.common import get_db_session, MessageType
+from app.modules.common import get_auth_token, get_db_session, MessageType
 from app.modules.talent_pool.models import TalentPoolEntry, TalentPoolTag, TalentPoolCandidateTag
 from app.modules.talent_pool.types import (
     TalentPoolTagType,
@@ -29,19 +29,6 @@ from app.modules.talent_pool.types import (
 )
 
 
-def _get_auth_info(info: Info):
-    """Helper to extract auth info from request"""
-    request = info.context["request"]
-    auth_header = request.headers.get("authorization")
-    if not auth_header:
-        raise Exception("Not authenticated")
-    try:
-        _, token = auth_header.split()
-    except ValueError:
-        raise Exception("Invalid authorization header")
-    return token
-
-
 def _build_entry_type(entry: TalentPoolEntry, db) -> TalentPoolEntryType:
     """Helper to build TalentPoolEntryType from model"""
     # Get candidate info
@@ -105,7 +92,7 @@ def _build_entry_type(entry: TalentPoolEntry, db) -> TalentPoolEntryType:
 
 def get_talent_pool_tags(info: Info) -> List[TalentPoolTagType]:
     """Get all talent pool tags for the current company (including system tags)"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -142,7 +129,7 @@ def get_talent_pool_tags(info: Info) -> List[TalentPoolTagType]:
 
 async def create_talent_pool_tag(info: Info, input: TalentPoolTagInput) -> TalentPoolTagResponse:
     """Create a new talent pool tag"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -194,7 +181,7 @@ async def create_talent_pool_tag(info: Info, input: TalentPoolTagInput) -> Talen
 
 async def update_talent_pool_tag(info: Info, id: str, input: TalentPoolTagUpdateInput) -> TalentPoolTagResponse:
     """Update a talent pool tag"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -247,7 +234,7 @@ async def update_talent_pool_tag(info: Info, id: str, input: TalentPoolTagUpdate
 
 async def delete_talent_pool_tag(info: Info, id: str) -> MessageType:
     """Delete a talent pool tag"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -279,7 +266,7 @@ async def delete_talent_pool_tag(info: Info, id: str) -> MessageType:
 
 def get_talent_pool_entries(info: Info, filter: Optional[TalentPoolFilterInput] = None) -> List[TalentPoolEntryType]:
     """Get all talent pool entries with optional filtering"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -303,9 +290,9 @@ def get_talent_pool_entries(info: Info, filter: Optional[TalentPoolFilterInput]
                 query = query.filter(TalentPoolEntry.status == filter.status)
             
             if filter.search:
+                from app.services.candidate_search_service import CandidateSearchService
                 query = query.join(Candidate).filter(
-                    (Candidate.name.ilike(f"%{filter.search}%")) |
-                    (Candidate.email.ilike(f"%{filter.search}%"))
+                    CandidateSearchService.match_condition(filter.search)
                 )
             
             if filter.tag_ids:
@@ -348,7 +335,7 @@ def get_talent_pool_entries(info: Info, filter: Optional[TalentPoolFilterInput]
 
 def get_talent_pool_entry(info: Info, id: str) -> Optional[TalentPoolEntryType]:
     """Get a single talent pool entry by ID"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -369,7 +356,7 @@ def get_talent_pool_entry(info: Info, id: str) -> Optional[TalentPoolEntryType]:
 
 def get_talent_pool_stats(info: Info) -> TalentPoolStatsType:
     """Get talent pool statistics"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -407,7 +394,7 @@ def get_talent_pool_stats(info: Info) -> TalentPoolStatsType:
 
 async def add_to_talent_pool(info: Info, input: TalentPoolEntryInput) -> TalentPoolEntryResponse:
     """Add a candidate to the talent pool"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -464,7 +451,7 @@ async def add_to_talent_pool(info: Info, input: TalentPoolEntryInput) -> TalentP
 
 async def bulk_add_to_talent_pool(info: Info, input: TalentPoolBulkAddInput) -> TalentPoolBulkResponse:
     """Bulk add candidates to the talent pool"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -524,7 +511,7 @@ async def bulk_add_to_talent_pool(info: Info, input: TalentPoolBulkAddInput) ->
 
 async def update_talent_pool_entry(info: Info, id: str, input: TalentPoolEntryUpdateInput) -> TalentPoolEntryResponse:
     """Update a talent pool entry (notes, tags)"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -573,7 +560,7 @@ async def update_talent_pool_entry(info: Info, id: str, input: TalentPoolEntryUp
 
 async def archive_talent_pool_entry(info: Info, id: str) -> TalentPoolEntryResponse:
     """Archive a talent pool entry"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -605,7 +592,7 @@ async def archive_talent_pool_entry(info: Info, id: str) -> TalentPoolEntryRespo
 
 async def restore_talent_pool_entry(info: Info, id: str) -> TalentPoolEntryResponse:
     """Restore an archived talent pool entry"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -637,7 +624,7 @@ async def restore_talent_pool_entry(info: Info, id: str) -> TalentPoolEntryRespo
 
 async def remove_from_talent_pool(info: Info, id: str) -> MessageType:
     """Permanently remove a candidate from the talent pool"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -664,7 +651,7 @@ async def remove_from_talent_pool(info: Info, id: str) -> MessageType:
 
 async def assign_to_job_from_pool(info: Info, input: TalentPoolAssignToJobInput) -> TalentPoolEntryResponse:
     """Assign a candidate from talent pool to a job/department"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
@@ -712,7 +699,7 @@ async def assign_to_job_from_pool(info: Info, input: TalentPoolAssignToJobInput)
 # Check if candidate is in talent pool (helper for UI)
 def is_candidate_in_talent_pool(info: Info, candidate_id: str) -> bool:
     """Check if a candidate is already in the talent pool"""
-    token = _get_auth_info(info)
+    token = get_auth_token(info)
     
     db = get_db_session()
     try:
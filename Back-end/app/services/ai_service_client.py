@@ -3,8 +3,13 @@ AI Service Client
 HTTP client for communicating with AI-Service
 """
 import httpx
-from typing import Dict, Any, Optional
+import json
+import time
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple
+from opentelemetry.trace import SpanKind
+
 from app.core.config import settings
+from app.core.telemetry import trace_headers, traced
 
 
 class AIServiceClient:
@@ -14,7 +19,10 @@ class AIServiceClient:
         # AI-Service runs on port 8001 - use 127.0.0.1 instead of localhost for IPv4
         self.base_url = settings.AI_SERVICE_URL or "http://127.0.0.1:8001"
         self.timeout = 60.0  # 60 seconds for AI processing
+        # (model id, fetched at) of the AI-Service embedding model
+        self._embedding_model: Optional[Tuple[str, float]] = None
     
+    @traced("ai_service.parse_cv_file", SpanKind.CLIENT)
     async def parse_cv_file(self, file_content: bytes, filename: str) -> Dict[str, Any]:
         """
         Parse CV file using AI-Service
@@ -30,7 +38,7 @@ class AIServiceClient:
             Exception: If API call fails
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with httpx.AsyncClient(timeout=self.timeout, headers=trace_headers()) as client:
                 # Create multipart form data
                 files = {
                     'file': (filename, file_content, 'application/octet-stream')
@@ -57,6 +65,7 @@ class AIServiceClient:
         except Exception as e:
             raise Exception(f"AI-Service call failed: {str(e)}")
     
+    @traced("ai_service.parse_cv_text", SpanKind.CLIENT)
     async def parse_cv_text(self, cv_text: str) -> Dict[str, Any]:
         """
         Parse CV from text using AI-Service
@@ -68,7 +77,7 @@ class AIServiceClient:
             Parsed CV data as JSON
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with httpx.AsyncClient(timeout=self.timeout, headers=trace_headers()) as client:
                 response = await client.post(
                     f"{self.base_url}/parse-cv-text",
                     json={"cv_text": cv_text}
@@ -90,6 +99,7 @@ class AIServiceClient:
         except Exception as e:
             raise Exception(f"AI-Service call failed: {str(e)}")
     
+    @traced("ai_service.match_cv_to_job", SpanKind.CLIENT)
     async def match_cv_to_job(self, job_data: Dict[str, Any], candidate_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Match candidate CV to job requirements using AI-Service
@@ -102,7 +112,7 @@ class AIServiceClient:
             Matching analysis with score and details
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with httpx.AsyncClient(timeout=self.timeout, headers=trace_headers()) as client:
                 response = await client.post(
                     f"{self.base_url}/match-cv-to-job",
                     json={
@@ -127,6 +137,134 @@ class AIServiceClient:
         except Exception as e:
             raise Exception(f"AI-Service call failed: {str(e)}")
 
+    
+    @traced("ai_service.prefilter_candidates", SpanKind.CLIENT)
+    async def prefilter_candidates(
+        self,
+        job_data: Dict[str, Any],
+        candidates: List[Dict[str, Any]],
+        top_k: Optional[int] = None,
+        min_score: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Rank candidates locally in AI-Service (no LLM call)
+        
+        Args:
+            job_data: Job information (same shape as match_cv_to_job)
+            candidates: Candidate payloads, each with an "id"
+            top_k: Keep at most this many candidates
+            min_score: Keep only candidates scoring at least this (0-100)
+            
+        Returns:
+            Ranked entries with id, score, breakdown and "selected" flag
+        """
+        try:
+            async with httpx.AsyncClient(timeout=self.timeout, headers=trace_headers()) as client:
+                response = await client.post(
+                    f"{self.base_url}/prefilter-candidates",
+                    json={
+                        "job_data": job_data,
+                        "candidates": candidates,
+                        "top_k": top_k,
+                        "min_score": min_score
+                    }
+                )
+                
+                response.raise_for_status()
+                result = response.json()
+                
+                if not result.get('success'):
+                    error = result.get('error', 'Unknown error')
+                    raise Exception(f"AI prefilter failed: {error}")
+                
+                return result.get('data') or []
+                
+        except httpx.TimeoutException:
+            raise Exception("AI-Service timeout - prefilter took too long")
+        except httpx.HTTPError as e:
+            raise Exception(f"AI-Service HTTP error: {str(e)}")
+        except Exception as e:
+            raise Exception(f"AI-Service call failed: {str(e)}")
+
+    
+    @traced("ai_service.embed_texts", SpanKind.CLIENT)
+    async def embed_texts(self, texts: List[str]) -> Tuple[List[List[float]], str]:
+        """
+        Embed texts using AI-Service (semantic search vectors)
+        
+        Args:
+            texts: Texts to embed (job descriptions, CV summaries)
+            
+        Returns:
+            One 1536-dim normalized vector per text, and the id of the model
+            that produced them (store it with the vectors)
+        """
+        try:
+            async with httpx.AsyncClient(timeout=self.timeout, headers=trace_headers()) as client:
+                response = await client.post(
+                    f"{self.base_url}/embed",
+                    json={"texts": texts}
+                )
+                
+                response.raise_for_status()
+                result = response.json()
+                
+                if not result.get('success'):
+                    error = result.get('error', 'Unknown error')
+                    raise Exception(f"AI embedding failed: {error}")
+                
+                model = result.get('model') or result.get('backend') or "unknown"
+                self._embedding_model = (model, time.monotonic())
+                return result.get('embeddings') or [], model
+                
+        except httpx.TimeoutException:
+            raise Exception("AI-Service timeout - embedding took too long")
+        except httpx.HTTPError as e:
+            raise Exception(f"AI-Service HTTP error: {str(e)}")
+        except Exception as e:
+            raise Exception(f"AI-Service call failed: {str(e)}")
+
+    async def embedding_model(self) -> str:
+        """Id of the AI-Service's current embedding model (cached for EMBEDDING_MODEL_CACHE_SECONDS)"""
+        cached = self._embedding_model
+        if cached is not None and time.monotonic() - cached[1] < settings.EMBEDDING_MODEL_CACHE_SECONDS:
+            return cached[0]
+        _, model = await self.embed_texts([])
+        return model
+
+
+    async def stream_events(
+        self,
+        path: str,
+        payload: Dict[str, Any],
+        timeout: float = 120.0
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Relay a streaming AI-Service endpoint (NDJSON), one event dict per line
+        
+        Args:
+            path: Streaming endpoint, e.g. "/generate-likert-questions/stream"
+            payload: Same JSON body as the non-streaming endpoint
+            timeout: Read timeout between events
+            
+        Yields:
+            Events ("delta", "item", "field", then "done" or "error")
+        """
+        try:
+            async with httpx.AsyncClient(timeout=timeout) as client:
+                # Headers only: a span held open across yields would leak into the consumer's context
+                async with client.stream("POST", f"{self.base_url}{path}", json=payload, headers=trace_headers()) as response:
+                    if response.status_code != 200:
+                        await response.aread()
+                        raise Exception(f"AI Service error: {response.status_code} {response.text}")
+                    async for line in response.aiter_lines():
+                        if line.strip():
+                            yield json.loads(line)
+        except httpx.TimeoutException:
+            raise Exception("AI-Service timeout")
+        except httpx.HTTPError as e:
+            raise Exception(f"AI-Service HTTP error: {str(e)}")
+
 
 # Global client instance
 ai_service_client = AIServiceClient()
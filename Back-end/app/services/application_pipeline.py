@@ -0,0 +1,204 @@
+"""
+Public Application Pipeline
+Background workers that parse, score and notify for queued public applications.
+
+``POST /api/public/apply`` only stores the CV and a ``queued`` application row,
+so the request returns in milliseconds. Workers claim rows atomically
+(``queued`` -> ``processing``) and run the AI calls. A parsed CV marks the row
+``completed``; a file that is not a usable CV (``ValueError``) is discarded
+(see ``ApplicationService.discard_failed_application``) so HR never sees it and
+the applicant can apply again. Any other error (AI-Service down, timeouts,
+database errors) keeps the application and marks it ``failed`` with the error,
+so HR can see and follow up on it.
+
+Rows survive restarts and dead workers: on startup every queued row is
+scheduled, and every ``PUBLIC_APPLICATION_RECOVER_INTERVAL_SECONDS`` rows stuck
+in ``processing`` (or left ``queued``) longer than
+``PUBLIC_APPLICATION_STALE_MINUTES`` are queued again.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.application import Application, ProcessingStatus
+
+logger = logging.getLogger(__name__)
+
+
+class PublicApplicationProcessor:
+    """asyncio queue + fixed worker pool bound to the app's event loop"""
+
+    _CLAIM_SQL = text(
+        """
+        UPDATE applications
+        SET processing_status = :processing, processing_started_at = :now
+        WHERE id = :application_id AND processing_status = :queued
+        RETURNING id
+        """
+    )
+
+    def __init__(self, workers: int = 2, stale_minutes: int = 10, recover_interval: int = 60) -> None:
+        self.workers = workers
+        self.stale_minutes = stale_minutes
+        self.recover_interval = recover_interval
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._queue = asyncio.Queue()
+        self._tasks = [
+            asyncio.create_task(self._worker(i), name=f"public-application-worker-{i}")
+            for i in range(self.workers)
+        ]
+        recovered = await asyncio.to_thread(self.recover, True)
+        if recovered:
+            logger.info(f"Re-queued {recovered} public applications")
+        self._tasks.append(asyncio.create_task(self._recover_loop(), name="public-application-recover"))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+
+    def enqueue(self, application_id: str) -> None:
+        """Schedule an application; a no-op when the workers are not running
+        (the row stays ``queued`` and is picked up by ``recover``)."""
+        if self._queue is None:
+            logger.warning(f"Application processor not running; {application_id} left queued")
+            return
+        self._queue.put_nowait(str(application_id))
+
+    def recover(self, startup: bool = False) -> int:
+        """Reset rows abandoned mid-processing and queue pending rows.
+
+        On startup every queued row is scheduled; periodic runs only pick up
+        rows queued longer than ``stale_minutes`` (the rest are already in the
+        in-memory queue). Scheduling a row twice is harmless, the claim is atomic.
+        """
+        db = SessionLocal()
+        try:
+            stale_before = datetime.utcnow() - timedelta(minutes=self.stale_minutes)
+            db.query(Application).filter(
+                Application.processing_status == ProcessingStatus.PROCESSING.value,
+                Application.processing_started_at < stale_before,
+            ).update(
+                {Application.processing_status: ProcessingStatus.QUEUED.value},
+                synchronize_session=False,
+            )
+            db.commit()
+            pending = db.query(Application.id).filter(
+                Application.processing_status == ProcessingStatus.QUEUED.value
+            )
+            if not startup:
+                pending = pending.filter(Application.created_at < stale_before)
+            ids = [row.id for row in pending.order_by(Application.created_at)]
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Failed to recover queued applications: {str(e)}")
+            return 0
+        finally:
+            db.close()
+
+        for application_id in ids:
+            self.enqueue(application_id)
+        return len(ids)
+
+    async def _recover_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.recover_interval)
+            recovered = await asyncio.to_thread(self.recover)
+            if recovered:
+                logger.info(f"Re-queued {recovered} stale public applications")
+
+    async def _worker(self, index: int) -> None:
+        while True:
+            application_id = await self._queue.get()
+            try:
+                await self.process(application_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Worker {index} failed on application {application_id}: {str(e)}")
+            finally:
+                self._queue.task_done()
+
+    def _claim(self, db, application_id: str) -> bool:
+        claimed = db.execute(
+            self._CLAIM_SQL,
+            {
+                "application_id": application_id,
+                "processing": ProcessingStatus.PROCESSING.value,
+                "queued": ProcessingStatus.QUEUED.value,
+                "now": datetime.utcnow(),
+            },
+        ).first()
+        db.commit()
+        return claimed is not None
+
+    @staticmethod
+    def _mark_failed(db, application: Application, error: str) -> None:
+        application.processing_status = ProcessingStatus.FAILED.value
+        application.processing_error = error
+        db.commit()
+
+    async def process(self, application_id: str) -> None:
+        """Parse, score and notify for one application if it is still queued"""
+        from app.services.application_service import ApplicationService
+
+        db = SessionLocal()
+        try:
+            if not self._claim(db, application_id):
+                return  # already taken by another worker or process
+
+            application = db.query(Application).filter(Application.id == application_id).first()
+            service = ApplicationService(db)
+            try:
+                notification = await service.score_public_application(application)
+            except ValueError as e:
+                # The file is not a usable CV: nothing worth keeping
+                db.rollback()
+                logger.warning(f"Application {application_id} has no usable CV, discarding it: {str(e)}")
+                try:
+                    service.discard_failed_application(application)
+                except Exception as discard_error:
+                    db.rollback()
+                    logger.error(f"Discarding application {application_id} failed: {str(discard_error)}")
+                    self._mark_failed(db, application, str(e))
+                return
+            except Exception as e:
+                # Transient or internal error: keep the application for HR
+                db.rollback()
+                logger.error(f"Processing application {application_id} failed: {str(e)}")
+                self._mark_failed(db, application, f"Failed to process CV: {str(e)}")
+                return
+
+            await asyncio.to_thread(service._send_notification_emails, **notification)
+        finally:
+            db.close()
+
+
+# global singleton
+public_application_processor = PublicApplicationProcessor(
+    workers=settings.PUBLIC_APPLICATION_WORKERS,
+    stale_minutes=settings.PUBLIC_APPLICATION_STALE_MINUTES,
+    recover_interval=settings.PUBLIC_APPLICATION_RECOVER_INTERVAL_SECONDS,
+)
@@ -2,23 +2,31 @@
 Application Service
 Handles public and internal job applications, including CV processing and AI matching.
 """
+import asyncio
 import logging
+import os
 import uuid
 from datetime import datetime
 from typing import Dict, Any, Optional
 from fastapi import HTTPException, UploadFile, BackgroundTasks
 from sqlalchemy.orm import Session
 
-from app.models.application import Application, ApplicationStatus
+from app.models.application import Application, ApplicationStatus, ProcessingStatus
 from app.models.candidate import Candidate
 from app.models.job import Job
 from app.services.file_upload import FileUploadService
 from app.services.ai_service_client import ai_service_client
+from app.services.embedding_service import EmbeddingService
 from app.services.email import send_application_notification_email, send_application_confirmation_email
 
 logger = logging.getLogger(__name__)
 
 
+def _read_file(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
 class ApplicationService:
     """Service for managing job applications."""
     
@@ -36,16 +44,17 @@ class ApplicationService:
         background_tasks: Optional[BackgroundTasks] = None
     ) -> Dict[str, Any]:
         """
-        Process a public job application end-to-end.
+        Accept a public job application and queue it for AI processing.
         
         Steps:
         1. Validate job exists and is active
         2. Validate and upload CV file
-        3. Parse CV with AI
-        4. Create/update candidate record
-        5. Perform AI job matching
-        6. Create application record with match score
-        7. Schedule notification emails
+        3. Create/update candidate record (an existing candidate keeps its CV
+           until the new one parses)
+        4. Create a PENDING application record (processing_status=queued)
+           holding the uploaded CV
+        5. Hand CV parsing, AI matching and notification emails to the
+           background processor (see application_pipeline)
         
         Args:
             job_id: Job UUID
@@ -53,10 +62,10 @@ class ApplicationService:
             email: Applicant's email
             phone: Applicant's phone
             cv_file: Uploaded CV file
-            background_tasks: FastAPI background tasks for async operations
+            background_tasks: Unused; kept for call-site compatibility
         
         Returns:
-            Dict with application_id, match_score, and success message
+            Dict with application_id, processing status and success message
         
         Raises:
             HTTPException: If validation fails or processing errors occur
@@ -89,59 +98,40 @@ class ApplicationService:
                 )
             await cv_file.seek(0)  # Reset file pointer
             
-            # Step 3: Upload CV file
-            logger.info(f"Uploading CV for {full_name} to job {job_id}")
-            file_path, file_url = await self.file_service.upload_cv_to_storage(cv_file)
-            
-            # Step 4: Parse CV with AI
-            logger.info(f"Parsing CV for {full_name}")
-            parsed_cv = await ai_service_client.parse_cv_file(cv_content, cv_file.filename)
-            
-            if not parsed_cv or "error" in parsed_cv:
-                raise HTTPException(
-                    status_code=500,
-                    detail="Failed to process CV. Please ensure it's a valid document."
-                )
-            
-            # Check if this is a valid CV
-            is_valid_cv = parsed_cv.get('is_valid_cv', {})
-            if isinstance(is_valid_cv, dict) and is_valid_cv.get('valid') == False:
-                reason = is_valid_cv.get('reason', 'not_a_cv')
-                if reason == 'not_a_cv':
-                    error_msg = "The uploaded file does not appear to be a CV/Resume."
-                elif reason == 'empty_content':
-                    error_msg = "The file is empty or unreadable."
-                elif reason == 'insufficient_info':
-                    error_msg = "The file doesn't contain enough personal/professional information to be considered a CV."
-                else:
-                    error_msg = "The uploaded file is not a valid CV."
-                raise HTTPException(status_code=400, detail=error_msg)
-            
-            # Extract LinkedIn and GitHub from parsed CV
-            personal = parsed_cv.get('personal', {})
-            linkedin_url = personal.get('linkedin')
-            github_url = personal.get('github')
-            
-            # Step 5: Create or update candidate
             # Multi-tenancy: existing candidate must belong to same company as job
             candidate = self.db.query(Candidate).filter(
                 Candidate.email == email,
                 Candidate.company_id == job.company_id
             ).first()
             
+            # Reject duplicates before storing anything (failed applications are
+            # discarded by the processor, so the applicant can submit again)
+            if candidate:
+                existing_app = self.db.query(Application).filter(
+                    Application.job_id == job_id,
+                    Application.candidate_id == candidate.id,
+                    Application.company_id == job.company_id,
+                    Application.processing_status.is_distinct_from(ProcessingStatus.FAILED.value)
+                ).first()
+                if existing_app:
+                    raise HTTPException(
+                        status_code=400,
+                        detail="You have already applied to this position"
+                    )
+            
+            # Step 3: Upload CV file
+            logger.info(f"Uploading CV for {full_name} to job {job_id}")
+            file_path, file_url = await self.file_service.upload_cv_to_storage(cv_file)
+            
+            # Step 4: Create or update candidate (CV and parsed data are filled in
+            # by the processor once the CV parses)
             if candidate:
-                # Update existing candidate
                 logger.info(f"Updating existing candidate: {email}")
                 candidate.name = full_name
                 candidate.phone = phone
-                candidate.cv_file_path = file_path
-                candidate.parsed_data = parsed_cv
-                candidate.linkedin = linkedin_url
-                candidate.github = github_url
                 candidate.department_id = job.department_id  # Update to job's department
                 candidate.updated_at = datetime.utcnow()
             else:
-                # Create new candidate
                 logger.info(f"Creating new candidate: {email}")
                 
                 # Use the job's department (candidates are associated with the job they're applying to)
@@ -150,13 +140,10 @@ class ApplicationService:
                     name=full_name,
                     email=email,
                     phone=phone,
-                    linkedin=linkedin_url,
-                    github=github_url,
                     cv_file_name=cv_file.filename,
                     cv_file_path=file_path,
                     cv_file_size=len(cv_content),
-                    parsed_data=parsed_cv,
-                    cv_language=parsed_cv.get("language", "unknown") if parsed_cv else "unknown",
+                    cv_language="unknown",
                     department_id=job.department_id,  # Use job's department
                     company_id=job.company_id,
                     status="new"
@@ -165,119 +152,35 @@ class ApplicationService:
             
             self.db.flush()  # Get candidate ID
             
-            # Step 6: Check if application already exists
-            existing_app = self.db.query(Application).filter(
-                Application.job_id == job_id,
-                Application.candidate_id == candidate.id,
-                Application.company_id == job.company_id
-            ).first()
-            
-            if existing_app:
-                raise HTTPException(
-                    status_code=400,
-                    detail="You have already applied to this position"
-                )
-            
-            # Step 7: Perform AI matching
-            logger.info(f"Performing AI matching for candidate {candidate.id} and job {job_id}")
-            
-            # Prepare job data for AI
-            job_data = {
-                "title": job.title,
-                "description": job.description_plain or job.description,
-                "requirements": job.requirements_plain or job.requirements,
-                "keywords": job.keywords or [],
-                "location": job.location,
-                "employment_type": job.employment_type,
-                "experience_level": job.experience_level,
-                "required_education": job.required_education,
-                "preferred_majors": job.preferred_majors,
-                "required_languages": job.required_languages or {},
-                "is_disabled_friendly": job.is_disabled_friendly or False
-            }
-
-            # Prepare candidate data for AI (IMPORTANT: wrap parsed_cv under 'parsed_data')
-            candidate_payload = {
-                "name": full_name,
-                "email": email,
-                "phone": phone,
-                "cv_language": (parsed_cv.get("language") if isinstance(parsed_cv, dict) else None) or getattr(candidate, "cv_language", None) or "unknown",
-                "parsed_data": parsed_cv or {}
-            }
-            
-            # Call AI service for matching
-            logger.info(
-                f"Calling AI matching with job: {job.title} and candidate payload keys: {list(candidate_payload.keys())}"
-            )
-            matching_result = await ai_service_client.match_cv_to_job(
-                job_data=job_data,
-                candidate_data=candidate_payload
-            )
-            
-            logger.info(f"AI matching result: {matching_result}")
-            
-            if not matching_result or "error" in matching_result:
-                # Fallback: create application without match score
-                logger.warning(f"AI matching failed, creating application without score")
-                match_score = None
-                overall_score = None
-                match_details = {"error": "AI matching unavailable"}
-                app_status = ApplicationStatus.PENDING
-            else:
-                # Extract match score - AI returns "overall_score" field (0-100)
-                raw_score = matching_result.get("overall_score", 0)
-                
-                # Ensure score is an integer between 0-100
-                if isinstance(raw_score, (int, float)):
-                    match_score = max(0, min(100, int(raw_score)))
-                else:
-                    match_score = 0
-                
-                overall_score = match_score  # Set both fields
-                match_details = matching_result  # Store complete AI analysis
-                app_status = ApplicationStatus.ANALYZED  # Mark as analyzed since AI completed
-                
-                logger.info(f"AI matching completed with score: {match_score}%")
-                logger.info(f"Matched skills: {matching_result.get('matched_skills', [])}")
-                logger.info(f"Missing skills: {matching_result.get('missing_skills', [])}")
-            
-            # Step 8: Create application record
-            logger.info(f"Creating application record with match score: {match_score}")
+            # Step 5: Create application record; scoring happens in the background
             application = Application(
                 id=str(uuid.uuid4()),
                 job_id=job_id,
                 candidate_id=candidate.id,
                 company_id=job.company_id,
                 source="public_application",
-                analysis_data=match_details if app_status == ApplicationStatus.ANALYZED else None,
-                match_score=match_score,
-                overall_score=overall_score,
-                match_details=match_details,
                 applicant_email=email,
                 applicant_phone=phone,
-                status=app_status,
-                analyzed_at=datetime.utcnow() if match_score is not None else None
+                status=ApplicationStatus.PENDING,
+                processing_status=ProcessingStatus.QUEUED.value,
+                cv_file_name=cv_file.filename,
+                cv_file_path=file_path,
+                cv_file_size=len(cv_content),
             )
             self.db.add(application)
             self.db.commit()
             
-            logger.info(f"Application created successfully: {application.id}")
+            logger.info(f"Application {application.id} accepted, queued for processing")
             
-            # Step 9: Schedule notification emails (background)
-            if background_tasks:
-                background_tasks.add_task(
-                    self._send_notification_emails,
-                    application_id=application.id,
-                    candidate_name=full_name,
-                    candidate_email=email,
-                    job_title=job.title,
-                    match_score=match_score
-                )
+            from app.services.application_pipeline import public_application_processor
+            public_application_processor.enqueue(application.id)
             
             return {
                 "success": True,
                 "application_id": application.id,
-                "match_score": match_score,
+                "status": ProcessingStatus.QUEUED.value,
+                "status_url": f"/api/public/applications/{application.id}/status",
+                "match_score": None,
                 "message": "Application submitted successfully. You will receive a confirmation email shortly."
             }
         
@@ -292,6 +195,170 @@ class ApplicationService:
                 detail="An error occurred while processing your application. Please try again."
             )
     
+    async def score_public_application(self, application: Application) -> Dict[str, Any]:
+        """
+        Parse the stored CV, run AI matching and persist the results.
+        
+        Called by the background processor once it has claimed the application.
+        
+        Returns:
+            Dict with email notification arguments for the completed application
+        
+        Raises:
+            ValueError: If the uploaded file is not a usable CV
+            Exception: If the AI-Service parse call fails
+        """
+        candidate = application.candidate
+        job = application.job
+        # Rows queued before migration 060 have their CV on the candidate
+        cv_file_path = application.cv_file_path or candidate.cv_file_path
+        
+        # Step 1: Parse CV with AI
+        logger.info(f"Parsing CV for application {application.id}")
+        cv_content = await asyncio.to_thread(_read_file, cv_file_path)
+        parsed_cv = await ai_service_client.parse_cv_file(cv_content, os.path.basename(cv_file_path))
+        
+        if not parsed_cv or "error" in parsed_cv:
+            raise ValueError("Failed to process CV. Please ensure it's a valid document.")
+        
+        # Check if this is a valid CV
+        is_valid_cv = parsed_cv.get('is_valid_cv', {})
+        if isinstance(is_valid_cv, dict) and is_valid_cv.get('valid') == False:
+            reason = is_valid_cv.get('reason', 'not_a_cv')
+            if reason == 'not_a_cv':
+                error_msg = "The uploaded file does not appear to be a CV/Resume."
+            elif reason == 'empty_content':
+                error_msg = "The file is empty or unreadable."
+            elif reason == 'insufficient_info':
+                error_msg = "The file doesn't contain enough personal/professional information to be considered a CV."
+            else:
+                error_msg = "The uploaded file is not a valid CV."
+            raise ValueError(error_msg)
+        
+        # Step 2: The CV is usable; make it the candidate's CV and store parsed data
+        if application.cv_file_path:
+            candidate.cv_file_name = application.cv_file_name
+            candidate.cv_file_path = application.cv_file_path
+            candidate.cv_file_size = application.cv_file_size
+        personal = parsed_cv.get('personal', {})
+        candidate.parsed_data = parsed_cv
+        candidate.linkedin = personal.get('linkedin')
+        candidate.github = personal.get('github')
+        candidate.cv_language = parsed_cv.get("language", "unknown")
+        self.db.flush()
+        
+        # Step 3: Perform AI matching
+        logger.info(f"Performing AI matching for candidate {candidate.id} and job {job.id}")
+        
+        # Prepare job data for AI
+        job_data = {
+            "title": job.title,
+            "description": job.description_plain or job.description,
+            "requirements": job.requirements_plain or job.requirements,
+            "keywords": job.keywords or [],
+            "location": job.location,
+            "employment_type": job.employment_type,
+            "experience_level": job.experience_level,
+            "required_education": job.required_education,
+            "preferred_majors": job.preferred_majors,
+            "required_languages": job.required_languages or {},
+            "is_disabled_friendly": job.is_disabled_friendly or False
+        }
+
+        # Prepare candidate data for AI (IMPORTANT: wrap parsed_cv under 'parsed_data')
+        candidate_payload = {
+            "name": candidate.name,
+            "email": candidate.email,
+            "phone": candidate.phone,
+            "cv_language": parsed_cv.get("language") or "unknown",
+            "parsed_data": parsed_cv
+        }
+        
+        try:
+            matching_result = await ai_service_client.match_cv_to_job(
+                job_data=job_data,
+                candidate_data=candidate_payload
+            )
+        except Exception as e:
+            logger.warning(f"AI matching call failed for application {application.id}: {str(e)}")
+            matching_result = None
+        
+        if not matching_result or "error" in matching_result:
+            # Fallback: keep application without match score
+            logger.warning(f"AI matching failed, keeping application without score")
+            match_score = None
+            match_details = {"error": "AI matching unavailable"}
+            app_status = ApplicationStatus.PENDING
+        else:
+            # Extract match score - AI returns "overall_score" field (0-100)
+            raw_score = matching_result.get("overall_score", 0)
+            
+            # Ensure score is an integer between 0-100
+            if isinstance(raw_score, (int, float)):
+                match_score = max(0, min(100, int(raw_score)))
+            else:
+                match_score = 0
+            
+            match_details = matching_result  # Store complete AI analysis
+            app_status = ApplicationStatus.ANALYZED  # Mark as analyzed since AI completed
+            
+            logger.info(f"AI matching completed with score: {match_score}%")
+        
+        # Step 4: Update application record
+        application.analysis_data = match_details if app_status == ApplicationStatus.ANALYZED else None
+        application.match_score = match_score
+        application.overall_score = match_score
+        application.match_details = match_details
+        application.status = app_status
+        application.analyzed_at = datetime.utcnow() if match_score is not None else None
+        application.processing_status = ProcessingStatus.COMPLETED.value
+        application.processing_error = None
+        self.db.commit()
+        
+        logger.info(f"Application {application.id} scored: {match_score}")
+        
+        # Best-effort: embed the CV now so semantic search does not have to later
+        try:
+            await EmbeddingService.embed_candidates(self.db, [candidate])
+        except Exception as e:
+            self.db.rollback()
+            logger.warning(f"CV embedding failed for candidate {candidate.id}: {str(e)}")
+        
+        return {
+            "application_id": application.id,
+            "candidate_name": candidate.name,
+            "candidate_email": candidate.email,
+            "job_title": job.title,
+            "match_score": match_score,
+        }
+    
+    def discard_failed_application(self, application: Application) -> None:
+        """
+        Remove a public application whose CV could not be used.
+        
+        HR never sees it, and the applicant can apply again. A candidate
+        created by this application (no other applications, CV never accepted)
+        is removed with it; an existing candidate keeps its previous CV. The
+        rejected file is deleted unless the candidate still points at it.
+        """
+        candidate = application.candidate
+        cv_file_path = application.cv_file_path
+        has_other_applications = self.db.query(Application.id).filter(
+            Application.candidate_id == candidate.id,
+            Application.id != application.id
+        ).first() is not None
+        
+        if not has_other_applications and candidate.parsed_data is None:
+            kept_cv_file_path = None
+            self.db.delete(candidate)  # cascades to the application
+        else:
+            kept_cv_file_path = candidate.cv_file_path
+            self.db.delete(application)
+        self.db.commit()
+        
+        if cv_file_path and cv_file_path != kept_cv_file_path:
+            self.file_service.delete_file(cv_file_path)
+    
     def _send_notification_emails(
         self,
         application_id: str,
@@ -303,7 +370,7 @@ class ApplicationService:
         """
         Send notification emails (HR notification + applicant confirmation).
         
-        This runs in the background after application is created.
+        This runs in the background once the application has been scored.
         """
         try:
             # Send to HR
@@ -6,6 +6,7 @@ from app.schemas.user import UserRegister, UserLogin
 from app.utils.security import hash_password, verify_password, create_access_token, create_refresh_token
 from app.utils.token import generate_reset_token, get_reset_token_expiry, is_token_expired
 from app.services.email import send_reset_password_email, send_welcome_email
+from app.services.principal_cache import user_principal_cache
 from typing import Optional
 
 
@@ -46,8 +47,13 @@ class AuthService:
         # Send welcome email
         await send_welcome_email(new_user.email, new_user.full_name)
         # Generate tokens
-        access_token = create_access_token(data={"sub": str(new_user.id), "email": new_user.email, "role": "user"})
-        refresh_token = create_refresh_token(data={"sub": str(new_user.id)})
+        access_token = create_access_token(data={
+            "sub": str(new_user.id),
+            "email": new_user.email,
+            "role": "user",
+            "tv": new_user.token_version or 0,
+        })
+        refresh_token = create_refresh_token(data={"sub": str(new_user.id), "tv": new_user.token_version or 0})
         return {
             "access_token": access_token,
             "refresh_token": refresh_token,
@@ -132,7 +138,8 @@ class AuthService:
         token_data = {
             "sub": str(user.id), 
             "email": user.email, 
-            "role": role_name or "user"
+            "role": role_name or "user",
+            "tv": user.token_version or 0,
         }
         
         # Add company_id to token if available
@@ -140,7 +147,7 @@ class AuthService:
             token_data["company_id"] = company_id
 
         access_token = create_access_token(data=token_data)
-        refresh_token = create_refresh_token(data={"sub": str(user.id)})
+        refresh_token = create_refresh_token(data={"sub": str(user.id), "tv": user.token_version or 0})
         
         return {
             "access_token": access_token,
@@ -213,11 +220,13 @@ class AuthService:
         # Get user
         user = AuthService.get_user_by_email(db, email)
         
-        # Update password
+        # Update password and revoke previously issued access tokens
         user.password_hash = hash_password(new_password)
         user.reset_token = None
         user.reset_token_expires_at = None
+        user.token_version = (user.token_version or 0) + 1
         db.commit()
+        user_principal_cache.invalidate(user.id)
         
         return {"message": "Şifreniz başarıyla güncellendi"}
     
@@ -243,6 +252,7 @@ class AuthService:
         # Update password
         user.password_hash = hash_password(new_password)
         db.commit()
+        user_principal_cache.invalidate(user.id)
         
         return {"message": "Şifreniz başarıyla değiştirildi"}
 
@@ -273,3 +283,10 @@ class AuthService:
         db.commit()
         db.refresh(new_user)
         return new_user
+
+    @staticmethod
+    def deactivate_user(db: Session, user: User) -> None:
+        """Soft delete a user and evict them from the principal cache"""
+        user.is_active = False
+        db.commit()
+        user_principal_cache.invalidate(user.id)
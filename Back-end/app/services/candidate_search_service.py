@@ -0,0 +1,77 @@
+"""
+Candidate Search Service
+Ranked full-text + fuzzy candidate search backed by candidates.search_vector
+(GIN) and trigram indexes on name/email (migration 056).
+"""
+from typing import List, Tuple
+from uuid import UUID
+
+from sqlalchemy import func, or_
+from sqlalchemy.orm import Session
+
+from app.models.candidate import Candidate
+
+# Weight of trigram name similarity (0-1) added to ts_rank_cd, so exact and
+# near-miss name searches rank above incidental CV-text hits
+_NAME_SIMILARITY_WEIGHT = 0.5
+
+
+class CandidateSearchService:
+    """Service for searching a company's candidates"""
+
+    @staticmethod
+    def tsquery(search: str):
+        """websearch-style query matched with Turkish, English and unstemmed terms"""
+        return (
+            func.websearch_to_tsquery('turkish', search)
+            .op('||')(func.websearch_to_tsquery('english', search))
+            .op('||')(func.websearch_to_tsquery('simple', search))
+        )
+
+    @staticmethod
+    def match_condition(search: str):
+        """Full-text hit on the CV document, fuzzy name match or email substring"""
+        return or_(
+            Candidate.search_vector.op('@@')(CandidateSearchService.tsquery(search)),
+            Candidate.name.op('%')(search),
+            Candidate.name.ilike(f"%{search}%"),
+            Candidate.email.ilike(f"%{search}%"),
+        )
+
+    @staticmethod
+    def rank_expression(search: str):
+        return (
+            func.coalesce(func.ts_rank_cd(Candidate.search_vector, CandidateSearchService.tsquery(search)), 0)
+            + _NAME_SIMILARITY_WEIGHT * func.similarity(func.coalesce(Candidate.name, ''), search)
+        )
+
+    @staticmethod
+    def search(
+        db: Session,
+        company_id: UUID,
+        search: str,
+        page: int = 1,
+        page_size: int = 20
+    ) -> Tuple[List[Tuple[Candidate, float]], int]:
+        """
+        Search a company's candidates.
+
+        Returns:
+            ((candidate, rank) pairs for the page, best first; total match count)
+        """
+        search = (search or "").strip()
+        if not search:
+            return [], 0
+
+        base = db.query(Candidate).filter(
+            Candidate.company_id == company_id,
+            CandidateSearchService.match_condition(search)
+        )
+        total = base.count()
+
+        rank = CandidateSearchService.rank_expression(search).label("rank")
+        rows = base.with_entities(Candidate, rank).order_by(
+            rank.desc(), Candidate.uploaded_at.desc()
+        ).offset((page - 1) * page_size).limit(page_size).all()
+
+        return [(candidate, float(score or 0)) for candidate, score in rows], total
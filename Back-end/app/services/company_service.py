@@ -11,6 +11,7 @@ from sqlalchemy import select, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.company import Company
 from app.core.database import get_db
+from app.services.public_job_cache import public_job_cache
 
 
 class CompanyService:
@@ -203,6 +204,7 @@ class CompanyService:
         
         await db.commit()
         await db.refresh(company)
+        public_job_cache.invalidate_company(company_id)
         
         return company
     
@@ -228,5 +230,6 @@ class CompanyService:
         
         await db.delete(company)
         await db.commit()
+        public_job_cache.invalidate_company(company_id)
         
         return True
@@ -3,6 +3,8 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from jinja2 import Template
 from app.core.config import settings
+from app.core.metrics import EMAILS_SENT
+from app.core.telemetry import traced
 from typing import Optional
 import time
 from collections import deque
@@ -23,6 +25,7 @@ except Exception:
     Address = None
 
 
+@traced("email.send")
 async def send_email(
     to_email: str,
     subject: str,
@@ -49,8 +52,10 @@ async def send_email(
                 category="Transactional",
             )
             client.send(mail)
+            EMAILS_SENT.labels("mailtrap", "sent").inc()
             return True
         except Exception as e:
+            EMAILS_SENT.labels("mailtrap", "error").inc()
             print(f"Mailtrap API send error: {e}. Falling back to SMTP...")
 
     # SMTP fallback
@@ -91,12 +96,14 @@ async def send_email(
                     start_tls=True,
                 )
                 _EMAIL_SEND_TIMES.append(time.time())
+                EMAILS_SENT.labels("smtp", "sent").inc()
                 return True
             except aiosmtplib.SMTPResponseException as smtp_err:
                 # 550 too many emails per second
                 code = getattr(smtp_err, 'code', None)
                 msg = getattr(smtp_err, 'message', '')
                 if code == 550 and 'Too many emails per second' in str(msg):
+                    EMAILS_SENT.labels("smtp", "rate_limited").inc()
                     print("SMTP rate limit (550) encountered.")
                     if settings.EMAIL_DISABLE_RETRY_ON_550:
                         print("Retry disabled by configuration; aborting further attempts.")
@@ -106,9 +113,11 @@ async def send_email(
                         print(f"Rate limit hit (attempt {attempt}/{attempts}). Backing off {delay:.2f}s...")
                         await asyncio.sleep(delay)
                         continue
+                EMAILS_SENT.labels("smtp", "error").inc()
                 print(f"Email send error (SMTP attempt {attempt}): {smtp_err}")
                 break
             except Exception as e:
+                EMAILS_SENT.labels("smtp", "error").inc()
                 print(f"Email send error (SMTP attempt {attempt}): {e}")
                 if attempt < attempts:
                     delay = base_delay * (2 ** (attempt - 1))
@@ -129,10 +138,13 @@ async def send_email(
                 category="Transactional",
             )
             client.send(mail)
+            EMAILS_SENT.labels("mailtrap", "sent").inc()
             return True
         except Exception as e:
+            EMAILS_SENT.labels("mailtrap", "error").inc()
             print(f"Mailtrap API send error (retry): {e}")
 
+    EMAILS_SENT.labels("any", "undelivered").inc()
     return False
 
 
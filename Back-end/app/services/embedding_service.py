@@ -0,0 +1,204 @@
+"""
+Embedding Service
+Keeps job and candidate pgvector embeddings filled and runs similarity search.
+
+Embeddings are computed by AI-Service (/embed) and stored with the id of the
+model that produced them (``Job.embedding_model``, ``Candidate.cv_embedding_model``).
+A column is NULL until it is embedded, and model events reset it to NULL
+whenever the source text changes (Job title/description/requirements/keywords,
+Candidate.parsed_data), so "needs embedding" is ``IS NULL`` or a model id other
+than the AI-Service's current one. Search only compares vectors of one model.
+"""
+import logging
+from typing import Any, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import or_, text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.candidate import Candidate, VECTOR_AVAILABLE
+from app.models.job import Job
+from app.services.ai_service_client import ai_service_client
+
+logger = logging.getLogger(__name__)
+
+# Per-field cap so one long description does not drown the rest of the CV
+_MAX_FIELD_CHARS = 1000
+
+
+def _clip(value: Any) -> str:
+    return str(value)[:_MAX_FIELD_CHARS] if value else ""
+
+
+def _join(parts: List[Any]) -> str:
+    return "\n".join(p for p in (_clip(x) for x in parts) if p)
+
+
+class EmbeddingService:
+    """Service for semantic (vector) job/candidate matching"""
+
+    @staticmethod
+    def job_description_text(job: Job) -> str:
+        keywords = job.keywords if isinstance(job.keywords, list) else []
+        return _join([
+            job.title,
+            ", ".join(str(k) for k in keywords),
+            job.description_plain or job.description,
+            job.requirements_plain or job.requirements,
+        ])
+
+    @staticmethod
+    def job_requirements_text(job: Job) -> str:
+        keywords = job.keywords if isinstance(job.keywords, list) else []
+        majors = job.preferred_majors if isinstance(job.preferred_majors, list) else []
+        return _join([
+            job.title,
+            ", ".join(str(k) for k in keywords),
+            job.requirements_plain or job.requirements,
+            job.required_education,
+            ", ".join(str(m) for m in majors),
+        ])
+
+    @staticmethod
+    def candidate_text(candidate: Candidate) -> str:
+        """Skills, titles, companies, education and summary from parsed_data"""
+        parsed = candidate.parsed_data if isinstance(candidate.parsed_data, dict) else {}
+        parts: List[Any] = [parsed.get("summary")]
+
+        skills = parsed.get("skills") or {}
+        if isinstance(skills, dict):
+            for key in ("technical", "tools", "soft"):
+                values = skills.get(key)
+                if isinstance(values, list):
+                    parts.append(", ".join(str(v) for v in values if v))
+        elif isinstance(skills, list):
+            parts.append(", ".join(str(v) for v in skills if v))
+
+        for exp in parsed.get("experience") or []:
+            if isinstance(exp, dict):
+                parts.append(" - ".join(str(exp[k]) for k in ("title", "company") if exp.get(k)))
+                parts.append(exp.get("description"))
+
+        for edu in parsed.get("education") or []:
+            if isinstance(edu, dict):
+                parts.append(" ".join(str(edu[k]) for k in ("degree", "field", "institution") if edu.get(k)))
+
+        for cert in parsed.get("certifications") or []:
+            if isinstance(cert, dict) and cert.get("name"):
+                parts.append(cert["name"])
+
+        for project in parsed.get("projects") or []:
+            if isinstance(project, dict):
+                technologies = project.get("technologies") or []
+                parts.append(" ".join([str(project.get("name") or "")] + [str(t) for t in technologies]))
+
+        return _join(parts)
+
+    @staticmethod
+    async def embed_job(db: Session, job: Job, model: Optional[str] = None) -> None:
+        """Fill the job's description/requirements embeddings if missing or made by another model"""
+        if not VECTOR_AVAILABLE:
+            raise Exception("pgvector is not available")
+        if (
+            job.description_embedding is not None
+            and job.requirements_embedding is not None
+            and (model is None or job.embedding_model == model)
+        ):
+            return
+        (description_vec, requirements_vec), embedding_model = await ai_service_client.embed_texts([
+            EmbeddingService.job_description_text(job),
+            EmbeddingService.job_requirements_text(job),
+        ])
+        job.description_embedding = description_vec
+        job.requirements_embedding = requirements_vec
+        job.embedding_model = embedding_model
+        db.commit()
+
+    @staticmethod
+    async def embed_candidates(db: Session, candidates: List[Candidate]) -> int:
+        """Embed the given candidates in batches; returns how many were embedded"""
+        if not VECTOR_AVAILABLE:
+            return 0
+        candidates = [c for c in candidates if c.parsed_data]
+        # Build all texts up front: each commit below expires the instances
+        texts = [EmbeddingService.candidate_text(c) for c in candidates]
+        batch_size = settings.EMBEDDING_BATCH_SIZE
+        for start in range(0, len(candidates), batch_size):
+            batch = candidates[start:start + batch_size]
+            vectors, embedding_model = await ai_service_client.embed_texts(texts[start:start + batch_size])
+            for candidate, vector in zip(batch, vectors):
+                candidate.cv_embedding = vector
+                candidate.cv_embedding_model = embedding_model
+            db.commit()
+        return len(candidates)
+
+    @staticmethod
+    async def backfill_candidates(
+        db: Session,
+        company_id: UUID,
+        limit: Optional[int] = None,
+        model: Optional[str] = None
+    ) -> int:
+        """Embed up to ``limit`` parsed candidates of a company that have no embedding yet
+        (or, given ``model``, one made by another model)"""
+        if not VECTOR_AVAILABLE:
+            return 0
+        stale = Candidate.cv_embedding.is_(None)
+        if model is not None:
+            stale = or_(stale, Candidate.cv_embedding_model.is_distinct_from(model))
+        missing = db.query(Candidate).filter(
+            Candidate.company_id == company_id,
+            stale,
+            Candidate.parsed_data.isnot(None)
+        ).order_by(Candidate.uploaded_at.desc()).limit(limit or settings.EMBEDDING_BACKFILL_LIMIT).all()
+        if not missing:
+            return 0
+        count = await EmbeddingService.embed_candidates(db, missing)
+        logger.info(f"Embedded {count} candidates for company {company_id}")
+        return count
+
+    @staticmethod
+    async def similar_candidates(
+        db: Session,
+        job: Job,
+        company_id: UUID,
+        limit: int = 20
+    ) -> List[Tuple[Candidate, float]]:
+        """
+        Top-N candidates of the company closest to the job by cosine similarity.
+
+        The job side is its description and requirements embeddings blended by
+        EMBEDDING_REQUIREMENTS_WEIGHT. Missing embeddings and those of another
+        model are (re)computed first (candidates capped by
+        EMBEDDING_BACKFILL_LIMIT per call); candidates not yet on the job's
+        model are left out rather than compared across models.
+
+        Returns:
+            (candidate, similarity in [-1, 1]) pairs, most similar first
+        """
+        await EmbeddingService.embed_job(db, job, await ai_service_client.embedding_model())
+        await EmbeddingService.backfill_candidates(db, company_id, model=job.embedding_model)
+
+        # HNSW filters after the index scan; widen the candidate list so the
+        # company filter still leaves ``limit`` rows (ignored for IVFFlat)
+        try:
+            db.execute(text(f"SET LOCAL hnsw.ef_search = {min(1000, max(40, int(limit) * 4))}"))
+        except Exception:
+            db.rollback()
+
+        # Both vectors are normalized, so the weighted sum points between them
+        weight = settings.EMBEDDING_REQUIREMENTS_WEIGHT
+        query_vec = [
+            (1.0 - weight) * float(d) + weight * float(r)
+            for d, r in zip(job.description_embedding, job.requirements_embedding)
+        ]
+        distance = Candidate.cv_embedding.cosine_distance(query_vec)
+        rows = db.query(Candidate, distance.label("distance")).filter(
+            Candidate.company_id == company_id,
+            Candidate.cv_embedding.isnot(None),
+            Candidate.cv_embedding_model == job.embedding_model
+        ).order_by(distance).limit(limit).all()
+
+        return [(candidate, 1.0 - float(dist)) for candidate, dist in rows]
+
@@ -0,0 +1,218 @@
+"""
+Entitlement Cache
+Per-company plan limits and current-month usage counters, so usage limit
+checks are an in-memory comparison instead of three queries each.
+
+Committed ``usage_tracking`` inserts are added to the cached counters by the
+session events below, whichever code path wrote them; changes to
+subscriptions, plans or existing usage rows drop the affected entries. The
+TTL bounds staleness across workers, which do not see each other's writes.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import cache_outcome
+from app.models.subscription import CompanySubscription, ResourceType, SubscriptionPlan, UsageTracking
+
+_HITS, _MISSES = cache_outcome("entitlements")
+
+
+def current_period_start() -> date:
+    today = date.today()
+    return date(today.year, today.month, 1)
+
+
+@dataclass
+class Entitlements:
+    """A company's plan limits and usage counters for one month"""
+    company_id: UUID
+    period_start: date
+    has_subscription: bool
+    plan_name: Optional[str] = None
+    cv_limit: Optional[int] = None  # None = unlimited
+    job_limit: Optional[int] = None
+    user_limit: Optional[int] = None
+    usage: Dict[str, int] = field(default_factory=dict)
+
+    def limit(self, resource_type: ResourceType) -> Optional[int]:
+        """Plan limit for a resource: None = unlimited, 0 without a subscription"""
+        if not self.has_subscription:
+            return 0
+        return {
+            ResourceType.CV_UPLOAD: self.cv_limit,
+            ResourceType.JOB_POST: self.job_limit,
+            ResourceType.USER_ACCOUNT: self.user_limit,
+            ResourceType.AI_ANALYSIS: self.cv_limit,  # Usually same as CV limit
+        }.get(resource_type)
+
+    def used(self, resource_type: ResourceType) -> int:
+        return self.usage.get(resource_type.value, 0)
+
+
+def _statements(company_id: UUID, period_start: date):
+    plan = (
+        select(SubscriptionPlan.name, SubscriptionPlan.cv_limit, SubscriptionPlan.job_limit, SubscriptionPlan.user_limit)
+        .join(CompanySubscription, CompanySubscription.plan_id == SubscriptionPlan.id)
+        .where(
+            CompanySubscription.company_id == company_id,
+            CompanySubscription.status.in_(["trial", "active"]),
+        )
+        .order_by(CompanySubscription.created_at.desc())
+        .limit(1)
+    )
+    usage = (
+        select(UsageTracking.resource_type, func.coalesce(func.sum(UsageTracking.count), 0))
+        .where(UsageTracking.company_id == company_id, UsageTracking.period_start >= period_start)
+        .group_by(UsageTracking.resource_type)
+    )
+    return plan, usage
+
+
+def _build(company_id: UUID, period_start: date, plan_row, usage_rows) -> Entitlements:
+    entitlements = Entitlements(
+        company_id=company_id,
+        period_start=period_start,
+        has_subscription=plan_row is not None,
+        usage={resource_type: int(count) for resource_type, count in usage_rows},
+    )
+    if plan_row is not None:
+        entitlements.plan_name, entitlements.cv_limit, entitlements.job_limit, entitlements.user_limit = plan_row
+    return entitlements
+
+
+class EntitlementCache:
+    """Thread-safe TTL + LRU cache of :class:`Entitlements` keyed by company id"""
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 30.0) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Entitlements]]" = OrderedDict()
+        # Bumped on every write so a load that raced one is not stored
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, company_id) -> Optional[Entitlements]:
+        key = str(company_id)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now or entry[1].period_start != current_period_start():
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def get_or_load(self, db: Session, company_id: UUID) -> Entitlements:
+        """Cached entitlements, loaded with two queries through a sync session on a miss"""
+        entitlements = self.get(company_id)
+        if entitlements is not None:
+            _HITS.inc()
+            return entitlements
+        _MISSES.inc()
+        generation = self._generation
+        period_start = current_period_start()
+        plan, usage = _statements(company_id, period_start)
+        entitlements = _build(company_id, period_start, db.execute(plan).first(), db.execute(usage).all())
+        self._put(entitlements, generation)
+        return entitlements
+
+    async def get_or_load_async(self, db: AsyncSession, company_id: UUID) -> Entitlements:
+        """Same as :meth:`get_or_load` for an async session"""
+        entitlements = self.get(company_id)
+        if entitlements is not None:
+            _HITS.inc()
+            return entitlements
+        _MISSES.inc()
+        generation = self._generation
+        period_start = current_period_start()
+        plan, usage = _statements(company_id, period_start)
+        plan_row = (await db.execute(plan)).first()
+        usage_rows = (await db.execute(usage)).all()
+        entitlements = _build(company_id, period_start, plan_row, usage_rows)
+        self._put(entitlements, generation)
+        return entitlements
+
+    def _put(self, entitlements: Entitlements, generation: int) -> None:
+        key = str(entitlements.company_id)
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, entitlements)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def add_usage(self, company_id, resource_type: str, count: int, period_start: date) -> None:
+        """Count committed usage against a cached entry (no-op when not cached)"""
+        with self._lock:
+            self._generation += 1
+            entry = self._entries.get(str(company_id))
+            if entry is not None and period_start >= entry[1].period_start:
+                usage = entry[1].usage
+                usage[resource_type] = usage.get(resource_type, 0) + count
+
+    def invalidate(self, company_id) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.pop(str(company_id), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+
+# global singleton
+entitlement_cache = EntitlementCache(
+    max_size=settings.ENTITLEMENT_CACHE_SIZE,
+    ttl_seconds=settings.ENTITLEMENT_CACHE_TTL_SECONDS,
+)
+
+
+# ── Write tracking ────────────────────────────────────────────────────
+# Collected at flush, applied once the transaction commits, dropped on rollback.
+# Async sessions run these on their underlying sync Session.
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_usage_writes(session: Session, flush_context) -> None:
+    pending = session.info.setdefault("entitlement_writes", [])
+    for obj in session.new:
+        if isinstance(obj, UsageTracking) and obj.company_id and obj.count:
+            pending.append(("add", obj.company_id, obj.resource_type, int(obj.count), obj.period_start))
+        elif isinstance(obj, CompanySubscription):
+            pending.append(("invalidate", obj.company_id))
+    for obj in list(session.dirty) + list(session.deleted):
+        if isinstance(obj, (UsageTracking, CompanySubscription)):
+            pending.append(("invalidate", obj.company_id))
+        elif isinstance(obj, SubscriptionPlan):
+            pending.append(("clear",))
+    if not pending:
+        del session.info["entitlement_writes"]
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_usage_writes(session: Session) -> None:
+    for write in session.info.pop("entitlement_writes", ()):
+        if write[0] == "add":
+            entitlement_cache.add_usage(*write[1:])
+        elif write[0] == "invalidate":
+            entitlement_cache.invalidate(write[1])
+        else:
+            entitlement_cache.clear()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_usage_writes(session: Session) -> None:
+    session.info.pop("entitlement_writes", None)
@@ -9,6 +9,7 @@ from datetime import datetime
 from typing import Tuple, Optional
 
 from app.core.config import settings
+from app.core.telemetry import traced
 
 
 class FileUploadService:
@@ -64,6 +65,7 @@ class FileUploadService:
         return f"{timestamp}_{unique_id}_{safe_name}{file_ext}"
 
     @staticmethod
+    @traced("file_upload.save_file")
     async def save_file(file_content: bytes, filename: str) -> Tuple[str, str]:
         """
         Save uploaded file to disk
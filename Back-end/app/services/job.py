@@ -13,6 +13,7 @@ from uuid import UUID
 from app.models.job import Job
 from app.models.department import Department
 from app.schemas.job import JobCreate, JobUpdate
+from app.services.public_job_cache import public_job_cache
 
 
 class JobService:
@@ -150,6 +151,7 @@ class JobService:
         db.add(job)
         db.commit()
         db.refresh(job)
+        public_job_cache.invalidate_job(job.id)
         return job
 
     @staticmethod
@@ -195,6 +197,7 @@ class JobService:
 
         db.commit()
         db.refresh(job)
+        public_job_cache.invalidate_job(job.id)
         return job
 
     @staticmethod
@@ -204,6 +207,7 @@ class JobService:
         job.is_active = not job.is_active
         db.commit()
         db.refresh(job)
+        public_job_cache.invalidate_job(job.id)
         return job
 
     @staticmethod
@@ -220,6 +224,7 @@ class JobService:
         job.status = new_status
         db.commit()
         db.refresh(job)
+        public_job_cache.invalidate_job(job.id)
         return job
 
     @staticmethod
@@ -255,4 +260,6 @@ class JobService:
             job.status = 'closed'
 
         db.commit()
+        for job in expired_jobs:
+            public_job_cache.invalidate_job(job.id)
         return len(expired_jobs)
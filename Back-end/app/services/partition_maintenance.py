@@ -0,0 +1,164 @@
+"""
+Partition Maintenance
+Keeps the monthly partitions of ``application_history`` and ``usage_tracking``
+(migration 058) ahead of the calendar and archives months past retention.
+
+Every ``PARTITION_MAINTENANCE_INTERVAL_HOURS`` the API creates partitions for
+the current and next ``PARTITION_MONTHS_AHEAD`` months, then rolls each
+partition older than the table's retention into its ``*_monthly`` summary table
+and drops it, in one transaction per partition. A Postgres advisory lock lets
+only one worker do this at a time. Tables that are not partitioned (migration
+058 not applied) are skipped.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, List, Optional
+
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.database import engine
+
+logger = logging.getLogger(__name__)
+
+_PARTITION_NAME = re.compile(r"_p(\d{4})(\d{2})$")
+
+
+@dataclass(frozen=True)
+class PartitionedTable:
+    name: str
+    retention_months: int  # 0 = keep every month
+    rollup_sql: str  # INSERT into the summary table from partition "{partition}"
+
+
+PARTITIONED_TABLES = (
+    PartitionedTable(
+        name="usage_tracking",
+        retention_months=settings.USAGE_TRACKING_RETENTION_MONTHS,
+        rollup_sql="""
+            INSERT INTO usage_tracking_monthly (company_id, resource_type, period_start, period_end, total_count, sessions)
+            SELECT company_id, resource_type::text, period_start, period_end, SUM(count), COUNT(*)
+            FROM "{partition}"
+            GROUP BY company_id, resource_type, period_start, period_end
+            ON CONFLICT (company_id, resource_type, period_start, period_end) DO UPDATE
+            SET total_count = usage_tracking_monthly.total_count + EXCLUDED.total_count,
+                sessions = usage_tracking_monthly.sessions + EXCLUDED.sessions
+        """,
+    ),
+    PartitionedTable(
+        name="application_history",
+        retention_months=settings.APPLICATION_HISTORY_RETENTION_MONTHS,
+        rollup_sql="""
+            INSERT INTO application_history_monthly (company_id, month, action_type_id, job_id, entries)
+            SELECT company_id, date_trunc('month', created_at)::date, action_type_id, job_id, COUNT(*)
+            FROM "{partition}"
+            GROUP BY company_id, date_trunc('month', created_at)::date, action_type_id, job_id
+            ON CONFLICT (company_id, month, action_type_id, job_id) DO UPDATE
+            SET entries = application_history_monthly.entries + EXCLUDED.entries
+        """,
+    ),
+)
+
+
+def _months_before(day: date, months: int) -> date:
+    """First day of the month ``months`` months before ``day``'s month"""
+    index = day.year * 12 + day.month - 1 - months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+class PartitionMaintenance:
+    """Periodic partition creation and archival bound to the app's event loop"""
+
+    _LOCK_SQL = text("SELECT pg_try_advisory_lock(hashtext('partition_maintenance'))")
+    _UNLOCK_SQL = text("SELECT pg_advisory_unlock(hashtext('partition_maintenance'))")
+    _IS_PARTITIONED_SQL = text(
+        "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:table))"
+    )
+    _ENSURE_SQL = text("SELECT ensure_monthly_partitions(:table, :months_ahead)")
+    _PARTITIONS_SQL = text(
+        """
+        SELECT c.relname FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = to_regclass(:table)
+        ORDER BY c.relname
+        """
+    )
+
+    def __init__(self, months_ahead: int = 3, interval_hours: float = 6.0) -> None:
+        self.months_ahead = months_ahead
+        self.interval_hours = interval_hours
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop(), name="partition-maintenance")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await asyncio.to_thread(self.run_once)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Partition maintenance failed: {str(e)}")
+            await asyncio.sleep(self.interval_hours * 3600)
+
+    def run_once(self, today: Optional[date] = None) -> Dict[str, List[str]]:
+        """Create upcoming partitions and archive expired ones; returns archived partitions per table"""
+        today = today or date.today()
+        archived: Dict[str, List[str]] = {}
+        with engine.connect() as lock_conn:
+            if not lock_conn.execute(self._LOCK_SQL).scalar():
+                return archived  # another worker is on it
+            try:
+                for table in PARTITIONED_TABLES:
+                    with engine.begin() as conn:
+                        if not conn.execute(self._IS_PARTITIONED_SQL, {"table": table.name}).scalar():
+                            continue
+                        conn.execute(self._ENSURE_SQL, {"table": table.name, "months_ahead": self.months_ahead})
+                    if table.retention_months > 0:
+                        archived[table.name] = self.archive(table, _months_before(today, table.retention_months))
+            finally:
+                lock_conn.execute(self._UNLOCK_SQL)
+                lock_conn.commit()
+        for name, partitions in archived.items():
+            if partitions:
+                logger.info(f"Archived {len(partitions)} {name} partitions: {', '.join(partitions)}")
+        return archived
+
+    def archive(self, table: PartitionedTable, before: date) -> List[str]:
+        """Roll every monthly partition that ends on or before ``before`` into the summary table and drop it"""
+        with engine.connect() as conn:
+            names = [row[0] for row in conn.execute(self._PARTITIONS_SQL, {"table": table.name})]
+
+        archived = []
+        for partition in names:
+            match = _PARTITION_NAME.search(partition)
+            if match is None:
+                continue  # the default partition
+            if date(int(match.group(1)), int(match.group(2)), 1) >= before:
+                continue
+            with engine.begin() as conn:
+                conn.execute(text(table.rollup_sql.format(partition=partition)))
+                conn.execute(text(f'ALTER TABLE "{table.name}" DETACH PARTITION "{partition}"'))
+                conn.execute(text(f'DROP TABLE "{partition}"'))
+            archived.append(partition)
+        return archived
+
+
+# global singleton
+partition_maintenance = PartitionMaintenance(
+    months_ahead=settings.PARTITION_MONTHS_AHEAD,
+    interval_hours=settings.PARTITION_MAINTENANCE_INTERVAL_HOURS,
+)
@@ -0,0 +1,102 @@
+"""
+Principal Cache
+Short-TTL LRU of active users so repeated authenticated calls skip the DB lookup.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app.core.config import settings
+from app.core.metrics import cache_outcome
+from app.models.user import User
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Authenticated caller resolved from an access token"""
+    user_id: int
+    email: str
+    role: Optional[str]
+    company_id: Optional[UUID]
+    token_version: int
+
+
+_HITS, _MISSES = cache_outcome("principal")
+
+# Column attributes copied out of a loaded User; relationships are never cached
+_USER_COLUMNS = tuple(c.key for c in User.__table__.columns)
+
+
+class UserPrincipalCache:
+    """Thread-safe TTL + LRU cache keyed by (user_id, token_version).
+
+    Entries hold a plain snapshot of the user's columns instead of the ORM
+    instance, so a cached user can be re-attached to whichever session the
+    caller is using without touching the database.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 30.0) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Tuple[int, int], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, db: Session, user_id: int, token_version: int) -> Optional[User]:
+        """Return a session-bound User from cache, or None on miss/expiry"""
+        key = (user_id, token_version)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                _MISSES.inc()
+                return None
+            expires_at, snapshot = entry
+            if expires_at <= now:
+                del self._entries[key]
+                _MISSES.inc()
+                return None
+            self._entries.move_to_end(key)
+        _HITS.inc()
+        return self._attach(db, snapshot)
+
+    def put(self, user: User) -> None:
+        """Store an active user's column snapshot"""
+        snapshot = {name: getattr(user, name) for name in _USER_COLUMNS}
+        key = (user.id, snapshot.get("token_version") or 0)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, snapshot)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        """Drop every cached entry for a user (all token versions)"""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == user_id]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _attach(db: Session, snapshot: Dict[str, Any]) -> User:
+        # Build a fresh detached instance per call; merge(load=False) binds it
+        # to the caller's session without emitting a SELECT.
+        user = User(**snapshot)
+        make_transient_to_detached(user)
+        return db.merge(user, load=False)
+
+
+# global singleton
+user_principal_cache = UserPrincipalCache(
+    max_size=settings.AUTH_USER_CACHE_SIZE,
+    ttl_seconds=settings.AUTH_USER_CACHE_TTL_SECONDS,
+)
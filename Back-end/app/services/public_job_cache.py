@@ -0,0 +1,106 @@
+"""
+Public Job Cache
+Serialized career-page responses (job board and job detail) with ETags.
+
+Entries are dropped explicitly when a job, its company or the company's
+intro/outro templates change; the TTL bounds staleness across workers, which
+do not see each other's invalidations.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from fastapi.encoders import jsonable_encoder
+
+from app.core.config import settings
+from app.core.metrics import cache_outcome
+
+JOB_BOARD_KEY = "board"
+
+_HITS, _MISSES = cache_outcome("public_job")
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """Encoded payload plus its strong ETag"""
+    payload: Any
+    body: bytes
+    etag: str
+
+
+def encode_response(payload: Any) -> CachedResponse:
+    body = json.dumps(jsonable_encoder(payload), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return CachedResponse(payload=payload, body=body, etag=f'"{hashlib.sha1(body).hexdigest()}"')
+
+
+class PublicJobCache:
+    """Thread-safe TTL cache keyed by ``"board"`` or a job id, tagged by company"""
+
+    def __init__(self, ttl_seconds: float = 60.0) -> None:
+        self.ttl_seconds = ttl_seconds
+        # key -> (expires_at, company_id, response)
+        self._entries: Dict[str, Tuple[float, Optional[str], CachedResponse]] = {}
+        # Bumped on every invalidation so a build that raced one is not stored
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get_or_build(
+        self,
+        key: str,
+        build: Callable[[], Tuple[Any, Optional[str]]],
+    ) -> CachedResponse:
+        """Return the cached response for ``key`` or build, encode and store it.
+
+        ``build`` returns ``(payload, company_id)``; the company id tags the
+        entry for :meth:`invalidate_company`.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                _HITS.inc()
+                return entry[2]
+            generation = self._generation
+        _MISSES.inc()
+
+        payload, company_id = build()
+        response = encode_response(payload)
+        with self._lock:
+            if generation != self._generation:
+                return response
+            self._entries[key] = (
+                now + self.ttl_seconds,
+                str(company_id) if company_id else None,
+                response,
+            )
+        return response
+
+    def invalidate_job(self, job_id: Any) -> None:
+        """Drop a job's detail entry and the job board"""
+        with self._lock:
+            self._generation += 1
+            self._entries.pop(str(job_id), None)
+            self._entries.pop(JOB_BOARD_KEY, None)
+
+    def invalidate_company(self, company_id: Any) -> None:
+        """Drop every job detail of a company and the job board"""
+        company_id = str(company_id) if company_id else None
+        with self._lock:
+            self._generation += 1
+            for key in [k for k, e in self._entries.items() if e[1] == company_id]:
+                del self._entries[key]
+            self._entries.pop(JOB_BOARD_KEY, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+
+# global singleton
+public_job_cache = PublicJobCache(ttl_seconds=settings.PUBLIC_JOB_CACHE_TTL_SECONDS)
@@ -0,0 +1,199 @@
+"""
+Rate Limiter
+Sliding-window rate limiting for public endpoints with pluggable counter stores.
+
+The sliding window is approximated from two fixed-window counters (current and
+previous), weighting the previous window by how much of it still overlaps the
+sliding window. That keeps every check O(1) in time and memory per key.
+Only allowed requests are counted, so a client that keeps retrying while
+limited is let through again once its earlier requests age out.
+"""
+from __future__ import annotations
+
+import logging
+import math
+import random
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """``limit`` requests per ``window_seconds`` for one route group"""
+    name: str
+    limit: int
+    window_seconds: int
+
+    @classmethod
+    def parse(cls, name: str, spec: str) -> "RateLimitRule":
+        """Parse ``"<limit>/<seconds>"`` (e.g. ``"5/3600"``)"""
+        limit, window = spec.split("/", 1)
+        return cls(name=name, limit=int(limit), window_seconds=int(window))
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    allowed: bool
+    retry_after: int = 0
+
+
+def _sliding_estimate(previous: int, current: int, elapsed: float, window: int) -> float:
+    return previous * (window - elapsed) / window + current
+
+
+class RateLimitStore:
+    """Counter backend interface"""
+
+    def hit(self, rule: RateLimitRule, key: str, now: float) -> RateLimitResult:
+        raise NotImplementedError
+
+
+class InMemoryRateLimitStore(RateLimitStore):
+    """Per-process store with bounded memory.
+
+    Keys live in an LRU; each hit evicts keys idle for more than two windows
+    from the cold end, and the oldest keys are dropped past ``max_keys``.
+    """
+
+    def __init__(self, max_keys: int = 100_000) -> None:
+        self.max_keys = max_keys
+        # (rule, key) -> [window_start, current, previous, last_seen, window_seconds]
+        self._buckets: "OrderedDict[Tuple[str, str], List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def hit(self, rule: RateLimitRule, key: str, now: float) -> RateLimitResult:
+        window = rule.window_seconds
+        window_start = math.floor(now / window) * window
+        bucket_key = (rule.name, key)
+
+        with self._lock:
+            self._evict_idle(now)
+
+            bucket = self._buckets.get(bucket_key)
+            if bucket is None:
+                bucket = [window_start, 0, 0, now, window]
+                self._buckets[bucket_key] = bucket
+            elif bucket[0] != window_start:
+                # Roll forward: the old current window becomes "previous" only if adjacent
+                bucket[2] = bucket[1] if window_start - bucket[0] == window else 0
+                bucket[1] = 0
+                bucket[0] = window_start
+            self._buckets.move_to_end(bucket_key)
+
+            bucket[3] = now
+            estimate = _sliding_estimate(bucket[2], bucket[1] + 1, now - window_start, window)
+            if estimate <= rule.limit:
+                bucket[1] += 1
+
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+
+        if estimate > rule.limit:
+            return RateLimitResult(False, max(1, int(window_start + window - now)))
+        return RateLimitResult(True)
+
+    def _evict_idle(self, now: float) -> None:
+        while self._buckets:
+            _, oldest = next(iter(self._buckets.items()))
+            if now - oldest[3] <= 2 * oldest[4]:
+                break
+            self._buckets.popitem(last=False)
+
+
+class PostgresRateLimitStore(RateLimitStore):
+    """Shared store so limits hold across workers and hosts.
+
+    One guarded upsert per hit increments the current window only if the
+    sliding estimate (previous window weighted by its overlap, plus this hit)
+    stays within the limit; the same check guards the insert of a window's first
+    hit and the update of later ones. Over the limit no row is written or
+    returned, so a rejected request is never counted. Expired rows are swept
+    occasionally. Uses the ``rate_limit_counters`` table (migration 053).
+    """
+
+    _HIT_SQL = text(
+        """
+        INSERT INTO rate_limit_counters (bucket_key, window_start, hits, expires_at)
+        SELECT :bucket_key, :window_start, 1, to_timestamp(:expires_at)
+        WHERE 1 + :previous_weight * COALESCE((
+            SELECT previous.hits FROM rate_limit_counters AS previous
+            WHERE previous.bucket_key = :bucket_key AND previous.window_start = :previous_start
+        ), 0) <= :limit
+        ON CONFLICT (bucket_key, window_start)
+        DO UPDATE SET hits = rate_limit_counters.hits + 1
+        WHERE rate_limit_counters.hits + 1 + :previous_weight * COALESCE((
+            SELECT previous.hits FROM rate_limit_counters AS previous
+            WHERE previous.bucket_key = :bucket_key AND previous.window_start = :previous_start
+        ), 0) <= :limit
+        RETURNING hits
+        """
+    )
+    _SWEEP_SQL = text("DELETE FROM rate_limit_counters WHERE expires_at < now()")
+
+    def __init__(self, engine, sweep_probability: float = 0.01) -> None:
+        self.engine = engine
+        self.sweep_probability = sweep_probability
+
+    def hit(self, rule: RateLimitRule, key: str, now: float) -> RateLimitResult:
+        window = rule.window_seconds
+        window_start = int(math.floor(now / window) * window)
+        with self.engine.begin() as conn:
+            counted = conn.execute(
+                self._HIT_SQL,
+                {
+                    "bucket_key": f"{rule.name}:{key}",
+                    "window_start": window_start,
+                    "previous_start": window_start - window,
+                    "previous_weight": (window - (now - window_start)) / window,
+                    "limit": rule.limit,
+                    "expires_at": window_start + 2 * window,
+                },
+            ).first()
+            if random.random() < self.sweep_probability:
+                conn.execute(self._SWEEP_SQL)
+
+        if counted is None:
+            # Over the limit; the rejected request was not counted
+            return RateLimitResult(False, max(1, int(window_start + window - now)))
+        return RateLimitResult(True)
+
+
+class RateLimiter:
+    """Applies named rules against a store; fails open if the store errors"""
+
+    def __init__(self, store: RateLimitStore, rules: Dict[str, RateLimitRule]) -> None:
+        self.store = store
+        self.rules = rules
+
+    def check(self, rule_name: str, key: str, now: Optional[float] = None) -> RateLimitResult:
+        rule = self.rules.get(rule_name)
+        if rule is None:
+            return RateLimitResult(True)
+        try:
+            return self.store.hit(rule, key, time.time() if now is None else now)
+        except Exception as e:
+            logger.warning(f"Rate limit store error for rule '{rule_name}': {e}")
+            return RateLimitResult(True)
+
+
+def _build_store() -> RateLimitStore:
+    if settings.RATE_LIMIT_BACKEND == "postgres":
+        from app.core.database import engine
+        return PostgresRateLimitStore(engine)
+    return InMemoryRateLimitStore(max_keys=settings.RATE_LIMIT_MAX_KEYS)
+
+
+# global singleton
+rate_limiter = RateLimiter(
+    store=_build_store(),
+    rules={name: RateLimitRule.parse(name, spec) for name, spec in settings.RATE_LIMIT_RULES.items()},
+)
@@ -2,14 +2,141 @@
 Usage Service
 Handles usage tracking and limit enforcement
 """
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Union
 from uuid import UUID
-from datetime import date, datetime
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
 from functools import wraps
-from sqlalchemy import select, and_, text, func
+from sqlalchemy import select, and_, text, func, update, delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.models.subscription import UsageTracking, ResourceType, CompanySubscription, SubscriptionPlan
-from app.services.subscription_service import SubscriptionService
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models.subscription import UsageTracking, UsageQuota, QuotaReservation, ResourceType, CompanySubscription, SubscriptionPlan
+from app.services.entitlement_cache import Entitlements, current_period_start, entitlement_cache
+
+
+async def _entitlements(db: Union[AsyncSession, Session], company_id: UUID) -> Entitlements:
+    # GraphQL resolvers pass their sync session, the multi-tenancy API an async one
+    if isinstance(db, AsyncSession):
+        return await entitlement_cache.get_or_load_async(db, company_id)
+    return entitlement_cache.get_or_load(db, company_id)
+
+
+async def _execute(db: Union[AsyncSession, Session], statement):
+    if isinstance(db, AsyncSession):
+        return await db.execute(statement)
+    return db.execute(statement)
+
+
+async def _commit(db: Union[AsyncSession, Session]) -> None:
+    if isinstance(db, AsyncSession):
+        await db.commit()
+    else:
+        db.commit()
+
+
+@dataclass
+class UsageReservation:
+    """Units held against a company's monthly quota while a batch runs"""
+    company_id: UUID
+    resource_type: ResourceType
+    period_start: date
+    requested: int
+    granted: int
+    metered: bool = True  # False: unlimited plan or no subscription, nothing is held
+    id: Optional[UUID] = None  # usage_reservations row; None when nothing is held
+    refreshed_at: Optional[datetime] = None
+
+    @property
+    def denied(self) -> int:
+        return self.requested - self.granted
+
+
+# ── Quota statements (usage_quotas, migration 057; usage_reservations, migration 061) ──
+
+
+def _quota_key(company_id: UUID, resource_type: ResourceType, period_start: date):
+    return (
+        UsageQuota.company_id == company_id,
+        UsageQuota.resource_type == resource_type.value,
+        UsageQuota.period_start == period_start,
+    )
+
+
+def _reservation_key(company_id: UUID, resource_type: ResourceType, period_start: date):
+    return (
+        QuotaReservation.company_id == company_id,
+        QuotaReservation.resource_type == resource_type.value,
+        QuotaReservation.period_start == period_start,
+    )
+
+
+def _expires_at():
+    return func.now() + timedelta(seconds=settings.USAGE_RESERVATION_TTL_SECONDS)
+
+
+def _lock_statement(company_id: UUID, resource_type: ResourceType, period_start: date):
+    """Committed usage of the month, locking the counter so reservations are checked one at a time"""
+    return select(UsageQuota.used).where(*_quota_key(company_id, resource_type, period_start)).with_for_update()
+
+
+def _held_statement(company_id: UUID, resource_type: ResourceType, period_start: date):
+    """Units held by unexpired reservations; holds of crashed batches stop counting once they expire"""
+    return select(func.coalesce(func.sum(QuotaReservation.units), 0)).where(
+        *_reservation_key(company_id, resource_type, period_start),
+        QuotaReservation.expires_at > func.now(),
+    )
+
+
+def _purge_statement(company_id: UUID, resource_type: ResourceType, period_start: date):
+    return delete(QuotaReservation).where(
+        *_reservation_key(company_id, resource_type, period_start),
+        QuotaReservation.expires_at <= func.now(),
+    )
+
+
+def _seed_statement(company_id: UUID, resource_type: ResourceType, period_start: date):
+    """Create the month's counter from usage already recorded (no-op if it exists)"""
+    used = (
+        select(func.coalesce(func.sum(UsageTracking.count), 0))
+        .where(
+            UsageTracking.company_id == company_id,
+            UsageTracking.resource_type == resource_type.value,
+            UsageTracking.period_start >= period_start,
+        )
+        .scalar_subquery()
+    )
+    return (
+        pg_insert(UsageQuota)
+        .values(company_id=company_id, resource_type=resource_type.value, period_start=period_start, used=used)
+        .on_conflict_do_nothing(index_elements=["company_id", "resource_type", "period_start"])
+    )
+
+
+def _settle_statement(company_id: UUID, resource_type: ResourceType, period_start: date, used: int):
+    """Count committed usage (no-op without a counter)"""
+    return (
+        update(UsageQuota)
+        .where(*_quota_key(company_id, resource_type, period_start))
+        .values(used=UsageQuota.used + used)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _release_statement(reservation_id: UUID):
+    return delete(QuotaReservation).where(QuotaReservation.id == reservation_id).execution_options(synchronize_session=False)
+
+
+def _refresh_statement(reservation_id: UUID):
+    """Extend a running batch's hold; returns no row once it expired or was settled"""
+    return (
+        update(QuotaReservation)
+        .where(QuotaReservation.id == reservation_id, QuotaReservation.expires_at > func.now())
+        .values(expires_at=_expires_at())
+        .returning(QuotaReservation.id)
+        .execution_options(synchronize_session=False)
+    )
 
 
 class UsageService:
@@ -23,23 +150,10 @@ class UsageService:
     ) -> int:
         """
         Get current month's usage count for a resource
-        Uses PostgreSQL function for efficiency
+        Served from the entitlement cache (sum of the month's session rows on a miss)
         """
-        # Sum all session counts for current month
-        today = date.today()
-        period_start = date(today.year, today.month, 1)
-        # period_end isn't needed for filtering; we use period_start >= month start
-        result = await db.execute(
-            select(func.coalesce(func.sum(UsageTracking.count), 0)).where(
-                and_(
-                    UsageTracking.company_id == company_id,
-                    UsageTracking.resource_type == resource_type.value,
-                    UsageTracking.period_start >= period_start
-                )
-            )
-        )
-        count = result.scalar() or 0
-        return int(count)
+        entitlements = await _entitlements(db, company_id)
+        return entitlements.used(resource_type)
     
     @staticmethod
     async def increment_usage(
@@ -71,18 +185,25 @@ class UsageService:
         resource_type: ResourceType,
         count: int,
         metadata: Optional[Dict] = None,
-        batch_number: Optional[str] = None
+        batch_number: Optional[str] = None,
+        reservation: Optional[UsageReservation] = None
     ) -> int:
         """
         Create a per-session usage record for the current month, keyed by batch_number.
+        The month's quota counter is updated in the same transaction and, when the
+        batch held a reservation, its units are released.
         Returns the current month's total count after insertion.
         """
         print(f"🔍 create_session_usage called: count={count}, resource_type={resource_type.value}, batch_number={batch_number}")
+        today = date.today()
+        month_start = date(today.year, today.month, 1)
+        if reservation is not None and reservation.id is not None:
+            await _execute(db, _release_statement(reservation.id))
+            reservation.id = None
         if count <= 0:
             print(f"⚠️ count={count} is <= 0, returning current usage")
+            await _commit(db)
             return await UsageService.get_current_usage(db, company_id, resource_type)
-        today = date.today()
-        month_start = date(today.year, today.month, 1)
         # Calculate real month end (last day of current month)
         if today.month == 12:
             month_end = date(today.year, 12, 31)
@@ -103,9 +224,116 @@ class UsageService:
             batch_number=batch_number
         )
         db.add(entry)
-        await db.commit()
+        await _execute(db, _settle_statement(company_id, resource_type, month_start, int(count)))
+        await _commit(db)
         print(f"✅ UsageTracking session entry committed successfully")
+        # The commit already added the row to the cached counter
         return await UsageService.get_current_usage(db, company_id, resource_type)
+
+    @staticmethod
+    async def reserve_usage(
+        db: AsyncSession,
+        company_id: UUID,
+        resource_type: ResourceType,
+        units: int,
+        allow_partial: bool = False
+    ) -> UsageReservation:
+        """
+        Reserve quota for a batch before it starts.
+        Each reservation is its own usage_reservations row. The month's
+        usage_quotas row is locked while committed usage plus unexpired holds
+        are checked, so concurrent batches (on any worker) cannot both pass the
+        limit. With allow_partial, whatever still fits is granted instead of
+        nothing. Commits the session.
+        
+        Call refresh_reservation while the batch runs and pass the result to
+        commit_reservation (or release_reservation) when it ends; the hold of a
+        batch that stops refreshing expires after USAGE_RESERVATION_TTL_SECONDS.
+        """
+        period_start = current_period_start()
+        units = max(0, int(units))
+        entitlements = await _entitlements(db, company_id)
+        limit = entitlements.limit(resource_type)
+        if units == 0 or limit is None or not entitlements.has_subscription:
+            # Unlimited resources and unsubscribed companies are not metered
+            return UsageReservation(company_id, resource_type, period_start, units, units, metered=False)
+
+        await _execute(db, _seed_statement(company_id, resource_type, period_start))
+        used = (await _execute(db, _lock_statement(company_id, resource_type, period_start))).scalar() or 0
+        await _execute(db, _purge_statement(company_id, resource_type, period_start))
+        held = (await _execute(db, _held_statement(company_id, resource_type, period_start))).scalar() or 0
+        remaining = max(0, limit - used - held)
+        granted = units if units <= remaining else (remaining if allow_partial else 0)
+
+        reservation = UsageReservation(company_id, resource_type, period_start, units, granted)
+        if granted:
+            hold = (
+                pg_insert(QuotaReservation)
+                .values(
+                    company_id=company_id,
+                    resource_type=resource_type.value,
+                    period_start=period_start,
+                    units=granted,
+                    expires_at=_expires_at(),
+                )
+                .returning(QuotaReservation.id)
+            )
+            reservation.id = (await _execute(db, hold)).scalar()
+            reservation.refreshed_at = datetime.utcnow()
+        await _commit(db)
+        print(f"🎫 Reserved {granted}/{units} {resource_type.value} for company {company_id}")
+        return reservation
+
+    @staticmethod
+    async def refresh_reservation(db: AsyncSession, reservation: UsageReservation) -> bool:
+        """
+        Keep a running batch's hold alive; call it once per processed item.
+        Writes (and commits) at most once per third of the TTL.
+        
+        Returns:
+            False when the hold already expired (its units may have gone to another batch)
+        """
+        if reservation.id is None:
+            return True
+        now = datetime.utcnow()
+        if reservation.refreshed_at and (now - reservation.refreshed_at).total_seconds() < settings.USAGE_RESERVATION_TTL_SECONDS / 3:
+            return True
+        row = (await _execute(db, _refresh_statement(reservation.id))).first()
+        await _commit(db)
+        if row is None:
+            print(f"⚠️ Usage reservation {reservation.id} expired before the batch finished")
+            return False
+        reservation.refreshed_at = now
+        return True
+
+    @staticmethod
+    async def commit_reservation(
+        db: AsyncSession,
+        reservation: UsageReservation,
+        used: int,
+        metadata: Optional[Dict] = None,
+        batch_number: Optional[str] = None
+    ) -> int:
+        """
+        Record the units a batch actually used and release the rest of its reservation
+        
+        Returns:
+            Current month's total count
+        """
+        return await UsageService.create_session_usage(
+            db,
+            reservation.company_id,
+            reservation.resource_type,
+            count=used,
+            metadata=metadata,
+            batch_number=batch_number,
+            reservation=reservation
+        )
+
+    @staticmethod
+    async def release_reservation(db: AsyncSession, reservation: UsageReservation) -> None:
+        """Give back a reservation without recording usage (batch failed or was cancelled)"""
+        await UsageService.commit_reservation(db, reservation, used=0)
     
     @staticmethod
     async def get_usage_limit(
@@ -119,26 +347,8 @@ class UsageService:
         Returns:
             Limit number or None (unlimited)
         """
-        # Get company subscription
-        subscription = await SubscriptionService.get_company_subscription(db, company_id)
-        if not subscription:
-            return 0  # No subscription = no access
-        
-        # Get plan
-        plan = await SubscriptionService.get_plan_by_id(db, subscription.plan_id)
-        if not plan:
-            return 0
-        
-        # Map resource type to plan limit
-        limit_map = {
-            ResourceType.CV_UPLOAD: plan.cv_limit,
-            ResourceType.JOB_POST: plan.job_limit,
-            ResourceType.USER_ACCOUNT: plan.user_limit,
-            ResourceType.AI_ANALYSIS: plan.cv_limit,  # Usually same as CV limit
-            ResourceType.API_CALL: None  # Usually unlimited or separate tracking
-        }
-        
-        return limit_map.get(resource_type)
+        entitlements = await _entitlements(db, company_id)
+        return entitlements.limit(resource_type)  # 0 without a subscription = no access
     
     @staticmethod
     async def check_usage_limit(
@@ -152,8 +362,9 @@ class UsageService:
         Returns:
             dict with limit_reached, current_usage, limit, remaining
         """
-        current_usage = await UsageService.get_current_usage(db, company_id, resource_type)
-        limit = await UsageService.get_usage_limit(db, company_id, resource_type)
+        entitlements = await _entitlements(db, company_id)
+        current_usage = entitlements.used(resource_type)
+        limit = entitlements.limit(resource_type)
         
         if limit is None:
             # Unlimited
@@ -282,6 +493,14 @@ class UsageService:
             count += 1
         
         if count > 0:
+            # Counters are re-seeded from the reset rows on the next reservation
+            quotas = delete(UsageQuota).where(
+                UsageQuota.company_id == company_id,
+                UsageQuota.period_start == period_start
+            )
+            if resource_type:
+                quotas = quotas.where(UsageQuota.resource_type == resource_type.value)
+            await db.execute(quotas)
             await db.commit()
         
         return count
@@ -1,8 +1,12 @@
 from passlib.context import CryptContext
 from jose import JWTError, jwt
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Optional
+import threading
+import time
 from app.core.config import settings
+from app.core.metrics import cache_outcome
 
 # Password hashing
 pwd_context = CryptContext(
@@ -53,10 +57,32 @@ def create_refresh_token(data: dict) -> str:
     return encoded_jwt
 
 
+# Verified payloads keyed by raw token, so resolvers that decode the same
+# token several times per request only pay for signature verification once.
+_decoded_tokens: "OrderedDict[str, dict]" = OrderedDict()
+_decoded_tokens_lock = threading.Lock()
+_TOKEN_HITS, _TOKEN_MISSES = cache_outcome("token_decode")
+
+
 def decode_token(token: str) -> Optional[dict]:
     """Decode and verify JWT token"""
+    with _decoded_tokens_lock:
+        cached = _decoded_tokens.get(token)
+        if cached is not None:
+            if cached.get("exp", 0) > time.time():
+                _decoded_tokens.move_to_end(token)
+                _TOKEN_HITS.inc()
+                return dict(cached)
+            del _decoded_tokens[token]
+    _TOKEN_MISSES.inc()
+
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
     except JWTError:
         return None
+
+    with _decoded_tokens_lock:
+        _decoded_tokens[token] = payload
+        while len(_decoded_tokens) > settings.TOKEN_DECODE_CACHE_SIZE:
+            _decoded_tokens.popitem(last=False)
+    return dict(payload)
@@ -0,0 +1,9 @@
+-- Migration: Add token_version to users
+-- Date: 2026-10-19
+
+-- Access tokens carry a "tv" claim; tokens whose version differs from the
+-- user's current token_version are rejected.
+ALTER TABLE users
+ADD COLUMN IF NOT EXISTS token_version INTEGER NOT NULL DEFAULT 0;
+
+COMMENT ON COLUMN users.token_version IS 'Incremented to revoke previously issued access tokens';
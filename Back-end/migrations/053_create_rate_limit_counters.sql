@@ -0,0 +1,14 @@
+-- Migration: Create rate_limit_counters table
+-- Date: 2026-10-19
+
+-- Fixed-window hit counters backing the shared (RATE_LIMIT_BACKEND=postgres)
+-- sliding-window rate limiter. Rows expire two windows after they start.
+CREATE TABLE IF NOT EXISTS rate_limit_counters (
+    bucket_key VARCHAR(255) NOT NULL,
+    window_start BIGINT NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0,
+    expires_at TIMESTAMPTZ NOT NULL,
+    PRIMARY KEY (bucket_key, window_start)
+);
+
+CREATE INDEX IF NOT EXISTS idx_rate_limit_counters_expires_at ON rate_limit_counters (expires_at);
@@ -0,0 +1,16 @@
+-- Migration: Add background processing state to applications
+-- Date: 2026-10-19
+
+-- Public applications are acknowledged immediately and parsed/matched by a
+-- background worker; these columns track that work. NULL for internal uploads.
+ALTER TABLE applications
+ADD COLUMN IF NOT EXISTS processing_status VARCHAR(20),
+ADD COLUMN IF NOT EXISTS processing_error TEXT,
+ADD COLUMN IF NOT EXISTS processing_started_at TIMESTAMP;
+
+-- Workers claim queued rows and recover stale ones on startup
+CREATE INDEX IF NOT EXISTS idx_applications_processing_status
+ON applications (processing_status)
+WHERE processing_status IN ('queued', 'processing');
+
+COMMENT ON COLUMN applications.processing_status IS 'Background parse/match state for public applications: queued, processing, completed, failed';
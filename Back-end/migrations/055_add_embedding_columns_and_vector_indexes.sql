@@ -0,0 +1,32 @@
+-- Migration: Add candidate CV embeddings and vector indexes for semantic search
+-- Date: 2026-10-19
+
+-- Requires the pgvector extension (pgvector/pgvector image in production)
+CREATE EXTENSION IF NOT EXISTS vector;
+
+-- Job embeddings were declared on the model but only created when pgvector was
+-- importable at create_all time
+ALTER TABLE jobs
+ADD COLUMN IF NOT EXISTS description_embedding vector(1536),
+ADD COLUMN IF NOT EXISTS requirements_embedding vector(1536);
+
+ALTER TABLE candidates
+ADD COLUMN IF NOT EXISTS cv_embedding vector(1536);
+
+COMMENT ON COLUMN candidates.cv_embedding IS 'Embedding of parsed CV content (AI-Service /embed); NULL until (re)embedded';
+
+-- Cosine-distance ANN indexes: HNSW on pgvector >= 0.5, IVFFlat on older versions
+DO $$
+BEGIN
+    IF string_to_array((SELECT extversion FROM pg_extension WHERE extname = 'vector'), '.')::int[] >= ARRAY[0, 5, 0] THEN
+        CREATE INDEX IF NOT EXISTS idx_candidates_cv_embedding
+        ON candidates USING hnsw (cv_embedding vector_cosine_ops);
+        CREATE INDEX IF NOT EXISTS idx_jobs_description_embedding
+        ON jobs USING hnsw (description_embedding vector_cosine_ops);
+    ELSE
+        CREATE INDEX IF NOT EXISTS idx_candidates_cv_embedding
+        ON candidates USING ivfflat (cv_embedding vector_cosine_ops) WITH (lists = 100);
+        CREATE INDEX IF NOT EXISTS idx_jobs_description_embedding
+        ON jobs USING ivfflat (description_embedding vector_cosine_ops) WITH (lists = 100);
+    END IF;
+END $$;
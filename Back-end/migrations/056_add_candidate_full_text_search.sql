@@ -0,0 +1,60 @@
+-- Migration: Full-text and fuzzy search over candidates
+-- Date: 2026-10-19
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+ALTER TABLE candidates
+ADD COLUMN IF NOT EXISTS search_vector tsvector;
+
+-- Weighted document built from the candidate row and parsed CV:
+--   A: name, email (simple - no stemming of proper names)
+--   B: skills and job titles (Turkish + English stemming)
+--   C: companies, education, certifications (simple)
+--   D: first 100k chars of raw CV text (Turkish + English)
+CREATE OR REPLACE FUNCTION candidates_search_document(
+    p_name TEXT,
+    p_email TEXT,
+    p_parsed JSONB,
+    p_cv_text TEXT
+) RETURNS tsvector
+LANGUAGE sql IMMUTABLE AS $$
+    SELECT
+        setweight(to_tsvector('simple', coalesce(p_name, '') || ' ' || coalesce(p_email, '')), 'A')
+        || setweight(jsonb_to_tsvector('turkish', coalesce(p_parsed -> 'skills', '{}'::jsonb), '["string"]'), 'B')
+        || setweight(jsonb_to_tsvector('english', coalesce(p_parsed -> 'skills', '{}'::jsonb), '["string"]'), 'B')
+        || setweight(jsonb_to_tsvector('turkish', jsonb_path_query_array(coalesce(p_parsed, '{}'::jsonb), '$.experience[*].title'), '["string"]'), 'B')
+        || setweight(jsonb_to_tsvector('english', jsonb_path_query_array(coalesce(p_parsed, '{}'::jsonb), '$.experience[*].title'), '["string"]'), 'B')
+        || setweight(jsonb_to_tsvector('simple', jsonb_path_query_array(coalesce(p_parsed, '{}'::jsonb), '$.experience[*].company'), '["string"]'), 'C')
+        || setweight(jsonb_to_tsvector('simple', coalesce(p_parsed -> 'education', '[]'::jsonb), '["string"]'), 'C')
+        || setweight(jsonb_to_tsvector('simple', coalesce(p_parsed -> 'certifications', '[]'::jsonb), '["string"]'), 'C')
+        || setweight(to_tsvector('turkish', left(coalesce(p_cv_text, ''), 100000)), 'D')
+        || setweight(to_tsvector('english', left(coalesce(p_cv_text, ''), 100000)), 'D')
+$$;
+
+CREATE OR REPLACE FUNCTION candidates_search_vector_update() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.search_vector := candidates_search_document(NEW.name, NEW.email, NEW.parsed_data, NEW.cv_text);
+    RETURN NEW;
+END
+$$;
+
+DROP TRIGGER IF EXISTS trg_candidates_search_vector ON candidates;
+CREATE TRIGGER trg_candidates_search_vector
+BEFORE INSERT OR UPDATE OF name, email, parsed_data, cv_text ON candidates
+FOR EACH ROW EXECUTE FUNCTION candidates_search_vector_update();
+
+-- Backfill existing rows
+UPDATE candidates
+SET search_vector = candidates_search_document(name, email, parsed_data, cv_text)
+WHERE search_vector IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_candidates_search_vector
+ON candidates USING gin (search_vector);
+
+-- Trigram indexes: fuzzy name matching (%, similarity) and ILIKE '%q%' without a sequential scan
+CREATE INDEX IF NOT EXISTS idx_candidates_name_trgm
+ON candidates USING gin (name gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_candidates_email_trgm
+ON candidates USING gin (email gin_trgm_ops);
@@ -0,0 +1,17 @@
+-- Migration: Create usage_quotas table
+-- Date: 2026-10-19
+
+-- One row per company, resource and month: committed usage plus units held by
+-- running upload/analysis batches. Reservations are a single conditional
+-- UPDATE ... RETURNING on this row, so concurrent batches cannot overshoot the
+-- plan limit. Rows are seeded from usage_tracking on first use each month.
+CREATE TABLE IF NOT EXISTS usage_quotas (
+    company_id UUID NOT NULL REFERENCES companies(id) ON DELETE CASCADE,
+    resource_type VARCHAR(50) NOT NULL,
+    period_start DATE NOT NULL,
+    used INTEGER NOT NULL DEFAULT 0,
+    reserved INTEGER NOT NULL DEFAULT 0,
+    reserved_until TIMESTAMPTZ NOT NULL DEFAULT now(),
+    PRIMARY KEY (company_id, resource_type, period_start),
+    CONSTRAINT check_usage_quota_non_negative CHECK (used >= 0 AND reserved >= 0)
+);
@@ -0,0 +1,181 @@
+-- Migration: Monthly range partitions for application_history and usage_tracking
+-- Date: 2026-10-19
+
+-- Both tables only grow: several history rows per candidate action, one usage
+-- row per upload/analysis session. Partitioning them by month lets date-bounded
+-- queries skip old months and lets old months be dropped as a whole.
+--
+--   application_history  PARTITION BY RANGE (created_at)
+--   usage_tracking       PARTITION BY RANGE (period_start)
+--
+-- Partitions are named <table>_pYYYYMM. A <table>_default partition catches
+-- rows outside the created ones so inserts never fail; create_monthly_partition
+-- moves such rows into the month's partition when it is created. The API
+-- (app/services/partition_maintenance.py) keeps PARTITION_MONTHS_AHEAD months
+-- created and rolls months past retention into the *_monthly summary tables.
+--
+-- The primary keys become (id, <partition key>) as PostgreSQL requires; ids
+-- stay unique through gen_random_uuid(). Requires PostgreSQL 13+.
+
+-- Create the partition holding `p_month` (no-op if it exists)
+CREATE OR REPLACE FUNCTION create_monthly_partition(p_parent TEXT, p_month DATE)
+RETURNS TEXT AS $$
+DECLARE
+    start_date DATE := date_trunc('month', p_month)::DATE;
+    end_date DATE := (date_trunc('month', p_month) + INTERVAL '1 month')::DATE;
+    partition_name TEXT := format('%s_p%s', p_parent, to_char(p_month, 'YYYYMM'));
+    key_column TEXT;
+BEGIN
+    IF to_regclass(partition_name) IS NOT NULL THEN
+        RETURN partition_name;
+    END IF;
+
+    SELECT a.attname INTO key_column
+    FROM pg_partitioned_table pt
+    JOIN pg_attribute a ON a.attrelid = pt.partrelid AND a.attnum = pt.partattrs[0]
+    WHERE pt.partrelid = p_parent::regclass;
+
+    EXECUTE format('CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS INCLUDING CONSTRAINTS)', partition_name, p_parent);
+    -- Rows that went to the default partition before this month had its own
+    IF to_regclass(p_parent || '_default') IS NOT NULL THEN
+        EXECUTE format(
+            'WITH moved AS (DELETE FROM %I WHERE %I >= %L AND %I < %L RETURNING *) INSERT INTO %I SELECT * FROM moved',
+            p_parent || '_default', key_column, start_date, key_column, end_date, partition_name
+        );
+    END IF;
+    EXECUTE format(
+        'ALTER TABLE %I ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+        p_parent, partition_name, start_date, end_date
+    );
+    RETURN partition_name;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Create partitions for the current month and the next `p_months_ahead` months
+CREATE OR REPLACE FUNCTION ensure_monthly_partitions(p_parent TEXT, p_months_ahead INTEGER)
+RETURNS VOID AS $$
+BEGIN
+    FOR i IN 0..p_months_ahead LOOP
+        PERFORM create_monthly_partition(p_parent, (date_trunc('month', CURRENT_DATE) + make_interval(months => i))::DATE);
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+
+-- ── application_history ──────────────────────────────────────────────
+
+DO $$
+DECLARE
+    v_month DATE;
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = 'application_history'::regclass) THEN
+        RETURN;
+    END IF;
+
+    ALTER TABLE application_history RENAME TO application_history_unpartitioned;
+    CREATE TABLE application_history (
+        LIKE application_history_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING COMMENTS
+    ) PARTITION BY RANGE (created_at);
+    CREATE TABLE application_history_default PARTITION OF application_history DEFAULT;
+
+    FOR v_month IN SELECT DISTINCT date_trunc('month', created_at)::DATE FROM application_history_unpartitioned LOOP
+        PERFORM create_monthly_partition('application_history', v_month);
+    END LOOP;
+    PERFORM ensure_monthly_partitions('application_history', 3);
+
+    INSERT INTO application_history SELECT * FROM application_history_unpartitioned;
+    DROP TABLE application_history_unpartitioned;
+
+    ALTER TABLE application_history ADD PRIMARY KEY (id, created_at);
+    ALTER TABLE application_history
+        ADD FOREIGN KEY (company_id) REFERENCES companies(id) ON DELETE CASCADE,
+        ADD FOREIGN KEY (application_id) REFERENCES applications(id) ON DELETE CASCADE,
+        ADD FOREIGN KEY (candidate_id) REFERENCES candidates(id) ON DELETE CASCADE,
+        ADD FOREIGN KEY (job_id) REFERENCES jobs(id) ON DELETE CASCADE,
+        ADD FOREIGN KEY (action_type_id) REFERENCES action_types(id) ON DELETE RESTRICT,
+        ADD FOREIGN KEY (performed_by) REFERENCES users(id) ON DELETE SET NULL;
+END $$;
+
+CREATE INDEX IF NOT EXISTS idx_application_history_company_id ON application_history(company_id);
+CREATE INDEX IF NOT EXISTS idx_application_history_application_id ON application_history(application_id);
+CREATE INDEX IF NOT EXISTS idx_application_history_candidate_id ON application_history(candidate_id);
+CREATE INDEX IF NOT EXISTS idx_application_history_job_id ON application_history(job_id);
+CREATE INDEX IF NOT EXISTS idx_application_history_action_type_id ON application_history(action_type_id);
+CREATE INDEX IF NOT EXISTS idx_application_history_created_at ON application_history(created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_application_history_app_created
+    ON application_history(application_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_application_history_job_candidate
+    ON application_history(job_id, candidate_id, created_at DESC);
+-- Recent activity feed and daily stats: newest partition first, stops at LIMIT
+CREATE INDEX IF NOT EXISTS idx_application_history_company_created
+    ON application_history(company_id, created_at DESC);
+
+
+-- ── usage_tracking ───────────────────────────────────────────────────
+
+DO $$
+DECLARE
+    v_month DATE;
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = 'usage_tracking'::regclass) THEN
+        RETURN;
+    END IF;
+
+    ALTER TABLE usage_tracking RENAME TO usage_tracking_unpartitioned;
+    CREATE TABLE usage_tracking (
+        LIKE usage_tracking_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING COMMENTS
+    ) PARTITION BY RANGE (period_start);
+    CREATE TABLE usage_tracking_default PARTITION OF usage_tracking DEFAULT;
+
+    FOR v_month IN SELECT DISTINCT date_trunc('month', period_start)::DATE FROM usage_tracking_unpartitioned LOOP
+        PERFORM create_monthly_partition('usage_tracking', v_month);
+    END LOOP;
+    PERFORM ensure_monthly_partitions('usage_tracking', 3);
+
+    INSERT INTO usage_tracking SELECT * FROM usage_tracking_unpartitioned;
+    DROP TABLE usage_tracking_unpartitioned;
+
+    ALTER TABLE usage_tracking ADD PRIMARY KEY (id, period_start);
+    ALTER TABLE usage_tracking ADD FOREIGN KEY (company_id) REFERENCES companies(id) ON DELETE CASCADE;
+    IF to_regproc('update_companies_updated_at') IS NOT NULL THEN
+        CREATE TRIGGER usage_tracking_updated_at_trigger
+            BEFORE UPDATE ON usage_tracking
+            FOR EACH ROW
+            EXECUTE FUNCTION update_companies_updated_at();
+    END IF;
+END $$;
+
+CREATE INDEX IF NOT EXISTS idx_usage_tracking_company ON usage_tracking(company_id);
+CREATE INDEX IF NOT EXISTS idx_usage_tracking_resource ON usage_tracking(resource_type);
+CREATE INDEX IF NOT EXISTS idx_usage_tracking_period ON usage_tracking(period_start, period_end);
+CREATE INDEX IF NOT EXISTS idx_usage_tracking_company_resource_period
+    ON usage_tracking(company_id, resource_type, period_start);
+CREATE INDEX IF NOT EXISTS idx_usage_tracking_batch_number ON usage_tracking(batch_number);
+CREATE INDEX IF NOT EXISTS idx_usage_tracking_company_resource_batch_period
+    ON usage_tracking(company_id, resource_type, batch_number, period_start);
+
+
+-- ── Rollups of archived months ───────────────────────────────────────
+
+CREATE TABLE IF NOT EXISTS usage_tracking_monthly (
+    company_id UUID NOT NULL REFERENCES companies(id) ON DELETE CASCADE,
+    resource_type VARCHAR(50) NOT NULL,
+    period_start DATE NOT NULL,
+    period_end DATE NOT NULL,
+    total_count INTEGER NOT NULL DEFAULT 0,
+    sessions INTEGER NOT NULL DEFAULT 0,
+    archived_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    PRIMARY KEY (company_id, resource_type, period_start, period_end)
+);
+
+CREATE TABLE IF NOT EXISTS application_history_monthly (
+    company_id UUID NOT NULL REFERENCES companies(id) ON DELETE CASCADE,
+    month DATE NOT NULL,
+    action_type_id UUID NOT NULL REFERENCES action_types(id) ON DELETE RESTRICT,
+    job_id VARCHAR(36) NOT NULL,
+    entries INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (company_id, month, action_type_id, job_id)
+);
+
+COMMENT ON TABLE usage_tracking_monthly IS 'Monthly usage totals of usage_tracking partitions past retention';
+COMMENT ON TABLE application_history_monthly IS 'Monthly action counts per job of application_history partitions past retention';
@@ -0,0 +1,40 @@
+-- Migration: Columns the API used to add at startup
+-- Date: 2026-10-19
+
+-- Until the migration runner, app/main.py inspected the schema in every worker
+-- and added these when missing. Databases created from the models already have
+-- them; older ones get them here, once.
+
+-- Roles (the roles table itself is created from the model)
+ALTER TABLE users ADD COLUMN IF NOT EXISTS role_id VARCHAR(36);
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_constraint
+        WHERE conrelid = 'users'::regclass AND contype = 'f' AND conkey = ARRAY[
+            (SELECT attnum FROM pg_attribute WHERE attrelid = 'users'::regclass AND attname = 'role_id')
+        ]
+    ) THEN
+        ALTER TABLE users ADD CONSTRAINT users_role_id_fkey FOREIGN KEY (role_id) REFERENCES roles(id);
+    END IF;
+END $$;
+
+-- Candidates: legacy "age" column held a birth year
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM information_schema.columns WHERE table_name = 'candidates' AND column_name = 'age')
+       AND NOT EXISTS (SELECT 1 FROM information_schema.columns WHERE table_name = 'candidates' AND column_name = 'birth_year') THEN
+        ALTER TABLE candidates RENAME COLUMN age TO birth_year;
+    END IF;
+END $$;
+
+ALTER TABLE candidates
+ADD COLUMN IF NOT EXISTS location VARCHAR(255),
+ADD COLUMN IF NOT EXISTS birth_year INTEGER,
+ADD COLUMN IF NOT EXISTS experience_months INTEGER;
+
+-- Implausible birth years (parsing errors) were cleared on every startup
+UPDATE candidates
+SET birth_year = NULL
+WHERE birth_year IS NOT NULL
+  AND (birth_year < 1900 OR birth_year > EXTRACT(YEAR FROM CURRENT_DATE)::INTEGER - 10);
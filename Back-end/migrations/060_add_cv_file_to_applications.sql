@@ -0,0 +1,12 @@
+-- Migration: Keep the submitted CV on public applications until it parses
+-- Date: 2026-10-19
+
+-- A public application's CV used to overwrite the candidate's CV before it was
+-- parsed, so a rejected file replaced a good one. The file now stays on the
+-- application and is copied to the candidate only when parsing succeeds.
+ALTER TABLE applications
+ADD COLUMN IF NOT EXISTS cv_file_name VARCHAR(500),
+ADD COLUMN IF NOT EXISTS cv_file_path VARCHAR(1000),
+ADD COLUMN IF NOT EXISTS cv_file_size INTEGER;
+
+COMMENT ON COLUMN applications.cv_file_path IS 'Stored CV; copied to the candidate once it parses';
@@ -0,0 +1,30 @@
+-- Migration: One row per usage reservation
+-- Date: 2026-10-19
+
+-- usage_quotas kept a single reserved/reserved_until pair per counter, so a
+-- batch outliving the TTL lost its hold, settling could release another
+-- batch's units and a new reservation kept units of crashed batches alive.
+-- Each batch now holds its own row: only unexpired rows count against the
+-- limit, a running batch refreshes its expires_at, and settling deletes the row
+-- by id. Reservations lock the usage_quotas row, so concurrent checks are
+-- serialized per company, resource and month.
+CREATE TABLE IF NOT EXISTS usage_reservations (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    company_id UUID NOT NULL REFERENCES companies(id) ON DELETE CASCADE,
+    resource_type VARCHAR(50) NOT NULL,
+    period_start DATE NOT NULL,
+    units INTEGER NOT NULL,
+    expires_at TIMESTAMPTZ NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    CONSTRAINT check_usage_reservation_units_positive CHECK (units > 0)
+);
+
+CREATE INDEX IF NOT EXISTS idx_usage_reservations_quota
+    ON usage_reservations(company_id, resource_type, period_start, expires_at);
+
+-- Holds of the old counter columns are dropped; batches running during the
+-- deploy settle without a reservation row (a no-op release)
+ALTER TABLE usage_quotas DROP CONSTRAINT IF EXISTS check_usage_quota_non_negative;
+ALTER TABLE usage_quotas DROP COLUMN IF EXISTS reserved;
+ALTER TABLE usage_quotas DROP COLUMN IF EXISTS reserved_until;
+ALTER TABLE usage_quotas ADD CONSTRAINT check_usage_quota_non_negative CHECK (used >= 0);
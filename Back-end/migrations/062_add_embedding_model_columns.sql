@@ -0,0 +1,19 @@
+-- Migration: Record which embedding model produced each stored vector
+-- Date: 2026-10-19
+
+-- Vectors of different AI-Service embedding models (or dimensions) live in
+-- different spaces; comparing them gives meaningless similarities. Every
+-- vector now carries the model id returned by /embed ("backend:model:dims");
+-- similarity search only compares vectors of the current model and re-embeds
+-- the rest. Existing vectors have no recorded model and are re-embedded.
+ALTER TABLE jobs
+ADD COLUMN IF NOT EXISTS embedding_model VARCHAR(200);
+
+ALTER TABLE candidates
+ADD COLUMN IF NOT EXISTS cv_embedding_model VARCHAR(200);
+
+COMMENT ON COLUMN jobs.embedding_model IS 'AI-Service embedding model id of description_embedding and requirements_embedding';
+COMMENT ON COLUMN candidates.cv_embedding_model IS 'AI-Service embedding model id of cv_embedding';
+
+CREATE INDEX IF NOT EXISTS idx_candidates_company_embedding_model
+    ON candidates(company_id, cv_embedding_model);
@@ -0,0 +1,804 @@
+"""
+Load-test and benchmark harness for the recruitment hot paths.
+
+Three steps:
+
+1. ``seed`` creates a synthetic company (admin user, departments, jobs,
+   candidates and analyzed applications) straight through the models and
+   writes a manifest with its login and ids.
+2. ``run`` drives a running API, which should talk to an AI-Service started
+   with ``AI_PROVIDER=stub`` (optionally ``STUB_LATENCY_MS``), and measures:
+
+   - ``graphql.jobs`` / ``graphql.candidates`` / ``graphql.applications`` /
+     ``graphql.applications_by_job``: query latency at the seeded scale
+   - ``graphql.upload_cvs``: batch upload of synthetic PDF CVs (files/s)
+   - ``graphql.analyze_job_candidates``: wall-clock of one analysis run
+   - ``public.apply``: ``/api/public/apply`` under concurrency, plus the time
+     the background workers need to drain the queue
+   - ``subscription.fanout``: delivery latency of a ``statsUpdates`` event
+     to many WebSocket subscribers
+
+   and writes a JSON report (percentiles, throughput, errors, git commit).
+3. ``compare`` diffs two reports (also those of
+   ``AI-Service/scripts/benchmark_throughput.py``) and exits non-zero when a
+   scenario got slower than ``--threshold`` percent.
+
+Run the API with a single worker (subscriptions are per process) and with
+rate limits off for the public endpoints: ``RATE_LIMIT_RULES='{}'``.
+
+Usage:
+    python scripts/benchmark.py seed [--candidates 5000] [--jobs 200] [--applications 20000]
+    python scripts/benchmark.py run [--api-url http://localhost:8000] [--output benchmark.json]
+    python scripts/benchmark.py compare baseline.json benchmark.json [--threshold 10]
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+REPORT_VERSION = 1
+
+SKILLS = [
+    "Python", "Java", "React", "Docker", "Kubernetes", "PostgreSQL", "AWS",
+    "TypeScript", "Go", "Kafka", "Redis", "GraphQL", "Terraform", "Django",
+]
+CITIES = ["İstanbul", "Ankara", "İzmir", "Bursa", "Antalya", "Remote"]
+TITLES = ["Backend Developer", "Frontend Developer", "Data Engineer", "DevOps Engineer", "QA Engineer"]
+LEVELS = ["junior", "mid", "senior", "lead"]
+
+
+# ── Synthetic data ────────────────────────────────────────────────────
+
+
+def synthetic_cv_text(rng: random.Random, index: int) -> str:
+    """A plain-text CV with contact details, experience and skills"""
+    skills = rng.sample(SKILLS, 5)
+    lines = [
+        f"Aday {index} Yilmaz",
+        f"aday{index}.{rng.randint(0, 10**6)}@example.com | +90 5{rng.randint(10, 59)} {rng.randint(100, 999)} {rng.randint(1000, 9999)}",
+        f"{rng.choice(CITIES)}, Turkiye",
+        "",
+        "Deneyim",
+    ]
+    for job in range(rng.randint(2, 4)):
+        start = rng.randint(2010, 2020)
+        lines.append(f"{rng.choice(TITLES)}, Firma {job} A.S. ({start} - {start + rng.randint(1, 4)})")
+        lines.append(f"Developed services with {', '.join(rng.sample(skills, 3))}; improved performance and test coverage.")
+    lines += ["", "Egitim", "Bilgisayar Muhendisligi, Orta Dogu Teknik Universitesi (2006 - 2010)", ""]
+    lines.append("Yetenekler: " + ", ".join(skills))
+    lines.append("Diller: Turkce (anadil), Ingilizce (ileri)")
+    return "\n".join(lines)
+
+
+def _pdf_escape(line: str) -> str:
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def text_pdf(text: str) -> bytes:
+    """Single-page PDF with one text line per input line (no PDF library needed)"""
+    # Helvetica/WinAnsi has no Turkish glyphs; fold them so the extracted text stays readable
+    text = text.translate(str.maketrans("ıİşŞğĞ", "iISsGg"))
+    content = ["BT", "/F1 10 Tf", "12 TL", "50 800 Td"]
+    for line in text.split("\n"):
+        content.append(f"({_pdf_escape(line)}) Tj T*")
+    content.append("ET")
+    stream = "\n".join(content).encode("latin-1", "replace")
+
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+        b"/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+        b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream",
+    ]
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+def _parsed_cv(rng: random.Random, name: str, email: str, city: str, skills: list) -> dict:
+    """parsed_data shaped like the AI-Service's CV parser output"""
+    return {
+        "personal": {"name": name, "email": email, "location": city},
+        "summary": f"Engineer experienced with {', '.join(skills[:3])}.",
+        "experience": [
+            {
+                "title": rng.choice(TITLES),
+                "company": f"Firma {i} A.S.",
+                "start_date": str(2012 + i * 2),
+                "end_date": str(2014 + i * 2),
+                "description": f"Built and operated services with {', '.join(rng.sample(skills, 2))}.",
+            }
+            for i in range(rng.randint(1, 4))
+        ],
+        "education": [{"school": "ODTÜ", "degree": "bachelor", "field": "Computer Engineering"}],
+        "skills": skills,
+        "languages": [{"name": "English", "level": "advanced"}],
+        "language": "TR",
+    }
+
+
+# ── seed ──────────────────────────────────────────────────────────────
+
+
+def _chunks(items: list, size: int):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def seed(args) -> None:
+    from app.core.database import SessionLocal
+    from app.models import Application, ApplicationStatus, Candidate, Company, Department, Job, Role, User
+    from app.utils.security import hash_password
+
+    rng = random.Random(args.seed)
+    code = args.company_code.upper()
+    email = f"bench-{code.lower()}@example.com"
+    started = time.perf_counter()
+
+    db = SessionLocal()
+    try:
+        if db.query(Company).filter(Company.company_code == code).first():
+            print(f"Company {code} already exists; use another --company-code or a fresh database")
+            sys.exit(1)
+
+        admin_role = db.query(Role).filter(Role.name == 'admin').first()
+        if not admin_role:
+            admin_role = Role(id=str(uuid.uuid4()), name='admin')
+            db.add(admin_role)
+            db.flush()
+
+        company = Company(company_code=code, name=f"Benchmark {code}", email=email, is_active=True)
+        db.add(company)
+        db.flush()
+
+        db.add(User(
+            email=email,
+            full_name="Benchmark Admin",
+            password_hash=hash_password(args.password),
+            role_id=admin_role.id,
+            company_id=company.id,
+            is_active=True,
+            is_verified=True,
+        ))
+
+        departments = [
+            Department(id=str(uuid.uuid4()), name=f"Bench Department {i}", company_id=company.id)
+            for i in range(args.departments)
+        ]
+        db.add_all(departments)
+        db.commit()
+        department_ids = [d.id for d in departments]
+        print(f"Company {code} with {len(departments)} departments")
+
+        job_ids = []
+        for chunk in _chunks(range(args.jobs), 500):
+            jobs = []
+            for i in chunk:
+                skills = rng.sample(SKILLS, 6)
+                title = f"{rng.choice(LEVELS).title()} {rng.choice(TITLES)} {i}"
+                requirements = f"{rng.randint(1, 8)}+ years with {', '.join(skills)}."
+                jobs.append(Job(
+                    id=str(uuid.uuid4()),
+                    company_id=company.id,
+                    title=title,
+                    department_id=rng.choice(department_ids),
+                    description=f"<p>{title} position working on our recruitment platform.</p>" * 3,
+                    description_plain=f"{title} position working on our recruitment platform. " * 3,
+                    requirements=f"<ul><li>{requirements}</li></ul>",
+                    requirements_plain=requirements,
+                    keywords=skills,
+                    location=rng.choice(CITIES),
+                    experience_level=rng.choice(LEVELS),
+                    required_education="bachelor",
+                    required_languages={"English": "business"},
+                    status="active",
+                    is_active=True,
+                ))
+            db.add_all(jobs)
+            db.commit()
+            job_ids.extend(j.id for j in jobs)
+        print(f"{len(job_ids)} jobs")
+
+        candidate_ids = []
+        for chunk in _chunks(range(args.candidates), 1000):
+            candidates = []
+            for i in chunk:
+                skills = rng.sample(SKILLS, 5)
+                name = f"Aday {i} Yilmaz"
+                candidate_email = f"aday{i}.{code.lower()}@example.com"
+                city = rng.choice(CITIES)
+                candidate_id = str(uuid.uuid4())
+                candidates.append(Candidate(
+                    id=candidate_id,
+                    name=name,
+                    email=candidate_email,
+                    phone=f"+90 5{rng.randint(10, 59)} {rng.randint(100, 999)} {rng.randint(1000, 9999)}",
+                    cv_file_name=f"cv_{i}.pdf",
+                    cv_file_path=f"uploads/cvs/benchmark/{candidate_id}.pdf",
+                    cv_file_size=rng.randint(40_000, 400_000),
+                    cv_text=synthetic_cv_text(rng, i),
+                    parsed_data=_parsed_cv(rng, name, candidate_email, city, skills),
+                    cv_language="TR",
+                    location=city,
+                    birth_year=rng.randint(1970, 2002),
+                    experience_months=rng.randint(0, 240),
+                    department_id=rng.choice(department_ids),
+                    company_id=company.id,
+                ))
+            db.add_all(candidates)
+            db.commit()
+            candidate_ids.extend(c.id for c in candidates)
+        print(f"{len(candidate_ids)} candidates")
+
+        per_job = min(len(candidate_ids), max(1, args.applications // max(1, len(job_ids))))
+        analyzed_at = datetime.utcnow() - timedelta(days=1)
+        pairs = [(job_id, candidate_id) for job_id in job_ids for candidate_id in rng.sample(candidate_ids, per_job)]
+        for chunk in _chunks(pairs, 2000):
+            applications = []
+            for job_id, candidate_id in chunk:
+                score = rng.randint(20, 98)
+                applications.append(Application(
+                    job_id=job_id,
+                    candidate_id=candidate_id,
+                    company_id=company.id,
+                    overall_score=score,
+                    analysis_data={
+                        "overall_score": score,
+                        "summary": "Synthetic benchmark analysis.",
+                        "strengths": rng.sample(SKILLS, 3),
+                        "weaknesses": rng.sample(SKILLS, 2),
+                    },
+                    status=rng.choice([ApplicationStatus.ANALYZED] * 4 + [ApplicationStatus.REVIEWED, ApplicationStatus.REJECTED]),
+                    analyzed_at=analyzed_at,
+                ))
+            db.add_all(applications)
+            db.commit()
+        print(f"{len(pairs)} applications")
+    finally:
+        db.close()
+
+    manifest = {
+        "company_code": code,
+        "email": email,
+        "password": args.password,
+        "department_ids": department_ids,
+        "job_ids": job_ids,
+        # Enough for the analyze scenario; the rest are only read back through queries
+        "candidate_ids": candidate_ids[:1000],
+        "counts": {
+            "departments": len(department_ids),
+            "jobs": len(job_ids),
+            "candidates": len(candidate_ids),
+            "applications": len(pairs),
+        },
+    }
+    with open(args.manifest, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    print(f"Seeded in {time.perf_counter() - started:.1f}s, manifest written to {args.manifest}")
+
+
+# ── run ───────────────────────────────────────────────────────────────
+
+JOBS_QUERY = """
+query Jobs($includeInactive: Boolean = false) {
+  jobs(includeInactive: $includeInactive) {
+    id title departmentId department { id name color icon }
+    descriptionPlain requirementsPlain keywords location remotePolicy employmentType
+    experienceLevel requiredEducation requiredLanguages status isActive
+    interviewEnabled likertEnabled createdAt updatedAt analysisCount recentApplicants
+  }
+}
+"""
+
+CANDIDATES_QUERY = """
+query Candidates($departmentId: String, $status: String) {
+  candidates(departmentId: $departmentId, status: $status) {
+    id name email phone linkedin github location birthYear experienceMonths
+    cvFileName cvFilePath cvFileSize cvLanguage status departmentId uploadedAt updatedAt
+    department { id name color }
+    inTalentPool talentPoolEntryId
+  }
+}
+"""
+
+APPLICATIONS_QUERY = """
+query Applications($jobId: String) {
+  applications(jobId: $jobId) {
+    id jobId candidateId analysisData overallScore status analyzedAt createdAt updatedAt
+    hasInterviewSession hasLikertSession isInLonglist isShortlisted hasSecondInterview
+    job { id title departmentId department { id name } location experienceLevel }
+    candidate {
+      id name email phone cvFileName cvLanguage location experienceMonths status departmentId uploadedAt
+      inTalentPool talentPoolTags { id name color }
+      department { id name }
+    }
+  }
+}
+"""
+
+UPLOAD_CVS_MUTATION = """
+mutation UploadCVs($files: [Upload!]!, $departmentId: String!) {
+  uploadCvs(files: $files, departmentId: $departmentId) {
+    totalUploaded
+    totalFailed
+    failed { fileName reason }
+  }
+}
+"""
+
+ANALYZE_MUTATION = """
+mutation AnalyzeJobCandidates($input: AnalyzeJobCandidatesInput!, $language: String) {
+  analyzeJobCandidates(input: $input, language: $language) { success message }
+}
+"""
+
+LOGIN_MUTATION = """
+mutation Login($input: LoginInput!) {
+  login(input: $input) { accessToken }
+}
+"""
+
+TOGGLE_DEPARTMENT_MUTATION = """
+mutation Toggle($id: String!) {
+  toggleDepartmentActive(id: $id) { id isActive }
+}
+"""
+
+STATS_SUBSCRIPTION = """
+subscription { statsUpdates { candidateCount jobCount applicationCount departmentCount } }
+"""
+
+
+def summarize(latencies, errors: int, wall: float, concurrency: int, **extra) -> dict:
+    """Scenario result in the report format (latencies in seconds)"""
+    ms = sorted(x * 1000 for x in latencies)
+
+    def pct(p: float) -> float:
+        if not ms:
+            return 0.0
+        return round(ms[min(len(ms) - 1, int(round(p / 100 * (len(ms) - 1))))], 2)
+
+    result = {
+        "count": len(ms) + errors,
+        "errors": errors,
+        "concurrency": concurrency,
+        "wall_s": round(wall, 3),
+        "throughput_per_s": round(len(ms) / wall, 2) if wall > 0 else 0.0,
+        "latency_ms": {
+            "p50": pct(50),
+            "p95": pct(95),
+            "p99": pct(99),
+            "mean": round(statistics.fmean(ms), 2) if ms else 0.0,
+            "max": round(ms[-1], 2) if ms else 0.0,
+        },
+    }
+    result.update(extra)
+    return result
+
+
+async def run_concurrently(calls, concurrency: int, **extra) -> dict:
+    """Run zero-argument coroutine factories with at most ``concurrency`` in flight.
+
+    A call fails by raising; the first error is printed.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    errors = 0
+
+    async def one(call):
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await call()
+            except Exception as e:
+                errors += 1
+                if errors == 1:
+                    print(f"  first error: {e}")
+                return
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(call) for call in calls))
+    return summarize(latencies, errors, time.perf_counter() - start, concurrency, **extra)
+
+
+class Api:
+    """Thin GraphQL/REST client bound to one logged-in benchmark admin"""
+
+    def __init__(self, client, token: str = "") -> None:
+        self.client = client
+        self.token = token
+
+    @property
+    def auth(self) -> dict:
+        return {"Authorization": f"Bearer {self.token}"} if self.token else {}
+
+    async def graphql(self, query: str, variables: dict = None) -> dict:
+        response = await self.client.post(
+            "/graphql", json={"query": query, "variables": variables or {}}, headers=self.auth
+        )
+        response.raise_for_status()
+        body = response.json()
+        if body.get("errors"):
+            raise Exception(body["errors"][0].get("message"))
+        return body["data"]
+
+    async def upload(self, files: list, department_id: str) -> dict:
+        operations = {
+            "query": UPLOAD_CVS_MUTATION,
+            "variables": {"files": [None] * len(files), "departmentId": department_id},
+        }
+        files_map = {str(i): [f"variables.files.{i}"] for i in range(len(files))}
+        response = await self.client.post(
+            "/graphql",
+            data={"operations": json.dumps(operations), "map": json.dumps(files_map)},
+            files={str(i): (name, content, "application/pdf") for i, (name, content) in enumerate(files)},
+            headers=self.auth,
+        )
+        response.raise_for_status()
+        body = response.json()
+        if body.get("errors"):
+            raise Exception(body["errors"][0].get("message"))
+        return body["data"]["uploadCvs"]
+
+
+async def bench_queries(api: Api, manifest: dict, args, rng: random.Random) -> dict:
+    results = {}
+    job_ids = manifest["job_ids"]
+    scenarios = [
+        ("graphql.jobs", lambda: api.graphql(JOBS_QUERY)),
+        ("graphql.candidates", lambda: api.graphql(CANDIDATES_QUERY)),
+        ("graphql.applications", lambda: api.graphql(APPLICATIONS_QUERY)),
+        ("graphql.applications_by_job", lambda: api.graphql(APPLICATIONS_QUERY, {"jobId": rng.choice(job_ids)})),
+    ]
+    for name, call in scenarios:
+        print(f"{name}: {args.query_requests} requests, concurrency {args.concurrency}")
+        await call()  # warm-up: caches, pool connections
+        results[name] = await run_concurrently([call] * args.query_requests, args.concurrency)
+    return results
+
+
+async def bench_upload(api: Api, manifest: dict, args, rng: random.Random) -> dict:
+    print(f"graphql.upload_cvs: {args.upload_batches} batches of {args.upload_batch_size} PDFs")
+    department_id = manifest["department_ids"][0]
+    failed_files = 0
+
+    async def batch(number: int):
+        nonlocal failed_files
+        files = [
+            (f"bench_cv_{number}_{i}.pdf", text_pdf(synthetic_cv_text(rng, number * 1000 + i)))
+            for i in range(args.upload_batch_size)
+        ]
+        result = await api.upload(files, department_id)
+        failed_files += result["totalFailed"]
+        if result["totalFailed"] == len(files):
+            raise Exception(f"every file failed: {result['failed'][0]['reason']}")
+
+    # Batches run one after another, as the upload page sends them
+    result = await run_concurrently([lambda n=n: batch(n) for n in range(args.upload_batches)], 1)
+    files = args.upload_batches * args.upload_batch_size
+    result["batch_size"] = args.upload_batch_size
+    result["failed_files"] = failed_files
+    result["files_per_s"] = round((files - failed_files) / result["wall_s"], 2) if result["wall_s"] else 0.0
+    return {"graphql.upload_cvs": result}
+
+
+async def bench_analyze(api: Api, manifest: dict, args, rng: random.Random) -> dict:
+    candidate_ids = manifest["candidate_ids"][:args.analyze_candidates]
+    print(f"graphql.analyze_job_candidates: {len(candidate_ids)} candidates, {args.analyze_runs} run(s)")
+
+    async def analyze():
+        data = await api.graphql(ANALYZE_MUTATION, {
+            "input": {"jobId": rng.choice(manifest["job_ids"]), "candidateIds": candidate_ids},
+            "language": "turkish",
+        })
+        if not data["analyzeJobCandidates"]["success"]:
+            raise Exception(data["analyzeJobCandidates"]["message"])
+
+    result = await run_concurrently([analyze] * args.analyze_runs, 1, candidates=len(candidate_ids))
+    result["candidates_per_s"] = (
+        round(len(candidate_ids) / (result["latency_ms"]["mean"] / 1000), 2) if result["latency_ms"]["mean"] else 0.0
+    )
+    return {"graphql.analyze_job_candidates": result}
+
+
+async def bench_apply(api: Api, manifest: dict, args, rng: random.Random) -> dict:
+    print(f"public.apply: {args.apply_requests} applications, concurrency {args.apply_concurrency}")
+    run_id = uuid.uuid4().hex[:8]
+    application_ids = []
+
+    async def apply(i: int):
+        text = synthetic_cv_text(rng, i)
+        response = await api.client.post(
+            "/api/public/apply",
+            data={
+                "job_id": rng.choice(manifest["job_ids"]),
+                "full_name": f"Applicant {i}",
+                "email": f"applicant{i}.{run_id}@example.com",
+                "phone": f"+90 555 {i:07d}",
+            },
+            files={"cv_file": (f"applicant_{i}.pdf", text_pdf(text), "application/pdf")},
+        )
+        if response.status_code != 200:
+            raise Exception(f"HTTP {response.status_code}: {response.text[:200]}")
+        application_ids.append(response.json()["application_id"])
+
+    result = await run_concurrently(
+        [lambda i=i: apply(i) for i in range(args.apply_requests)], args.apply_concurrency
+    )
+
+    # Time until the background workers parsed and matched every accepted application
+    start = time.perf_counter()
+    pending = set(application_ids)
+    failed = 0
+    while pending and time.perf_counter() - start < args.drain_timeout:
+        for application_id in list(pending):
+            response = await api.client.get(f"/api/public/applications/{application_id}/status")
+            status = response.json().get("processing_status") if response.status_code == 200 else None
+            if status in ("completed", "failed"):
+                pending.discard(application_id)
+                failed += status == "failed"
+        if pending:
+            await asyncio.sleep(0.5)
+    result["drain_s"] = round(time.perf_counter() - start, 3)
+    result["processing_failed"] = failed
+    result["processing_timed_out"] = len(pending)
+    return {"public.apply": result}
+
+
+async def _subscriber_count(api: Api) -> int:
+    response = await api.client.get("/metrics")
+    match = re.search(r"^pubsub_subscribers (\S+)$", response.text, re.MULTILINE)
+    return int(float(match.group(1))) if match else -1
+
+
+async def bench_fanout(api: Api, manifest: dict, args, rng: random.Random) -> dict:
+    import websockets
+
+    print(f"subscription.fanout: {args.subscribers} subscribers, {args.fanout_events} events")
+    ws_url = re.sub(r"^http", "ws", args.api_url.rstrip("/")) + "/graphql"
+    baseline = await _subscriber_count(api)
+    arrivals = [[] for _ in range(args.fanout_events)]
+    received = [0] * args.subscribers
+
+    async def subscriber(index: int, ready: asyncio.Event, done: asyncio.Event):
+        async with websockets.connect(ws_url, subprotocols=["graphql-transport-ws"], max_queue=None) as ws:
+            await ws.send(json.dumps({"type": "connection_init", "payload": {"Authorization": f"Bearer {api.token}"}}))
+            await ws.recv()  # connection_ack
+            await ws.send(json.dumps({"id": "1", "type": "subscribe", "payload": {"query": STATS_SUBSCRIPTION}}))
+            ready.set()
+            while not done.is_set():
+                try:
+                    message = json.loads(await asyncio.wait_for(ws.recv(), timeout=0.5))
+                except asyncio.TimeoutError:
+                    continue
+                if message.get("type") == "next" and received[index] < args.fanout_events:
+                    arrivals[received[index]].append(time.perf_counter())
+                    received[index] += 1
+
+    done = asyncio.Event()
+    readies = [asyncio.Event() for _ in range(args.subscribers)]
+    tasks = [asyncio.create_task(subscriber(i, readies[i], done)) for i in range(args.subscribers)]
+    department_id = manifest["department_ids"][-1]
+    latencies = []
+    missed = 0
+    try:
+        all_ready = asyncio.ensure_future(asyncio.gather(*(r.wait() for r in readies)))
+        await asyncio.wait([all_ready, *tasks], timeout=60, return_when=asyncio.FIRST_COMPLETED)
+        if not all_ready.done():
+            all_ready.cancel()
+            failed = next((t for t in tasks if t.done() and t.exception()), None)
+            raise failed.exception() if failed else Exception("subscribers did not connect within 60s")
+
+        # The server registers a subscription after the subscribe message; wait until all are listening
+        deadline = time.perf_counter() + 30
+        while baseline >= 0 and await _subscriber_count(api) < baseline + args.subscribers:
+            if time.perf_counter() > deadline:
+                raise Exception("subscribers did not register within 30s")
+            await asyncio.sleep(0.2)
+        if baseline < 0:
+            await asyncio.sleep(2)  # /metrics unavailable
+
+        start = time.perf_counter()
+        for event in range(args.fanout_events):
+            sent = time.perf_counter()
+            await api.graphql(TOGGLE_DEPARTMENT_MUTATION, {"id": department_id})
+            deadline = sent + args.fanout_timeout
+            while len(arrivals[event]) < args.subscribers and time.perf_counter() < deadline:
+                await asyncio.sleep(0.01)
+            latencies.extend(t - sent for t in arrivals[event])
+            missed += args.subscribers - len(arrivals[event])
+        wall = time.perf_counter() - start
+    finally:
+        done.set()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    if args.fanout_events % 2:
+        await api.graphql(TOGGLE_DEPARTMENT_MUTATION, {"id": department_id})  # restore
+
+    return {"subscription.fanout": summarize(
+        latencies, missed, wall, args.subscribers, subscribers=args.subscribers, events=args.fanout_events
+    )}
+
+
+SCENARIOS = {
+    "queries": bench_queries,
+    "upload": bench_upload,
+    "analyze": bench_analyze,
+    "apply": bench_apply,
+    "fanout": bench_fanout,
+}
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+async def _run(args) -> dict:
+    import httpx
+
+    with open(args.manifest, encoding="utf-8") as f:
+        manifest = json.load(f)
+    rng = random.Random(args.seed)
+
+    limits = httpx.Limits(max_connections=max(args.concurrency, args.apply_concurrency) + 10)
+    async with httpx.AsyncClient(base_url=args.api_url, timeout=args.timeout, limits=limits) as client:
+        api = Api(client)
+        data = await api.graphql(LOGIN_MUTATION, {"input": {
+            "companyCode": manifest["company_code"],
+            "email": manifest["email"],
+            "password": manifest["password"],
+        }})
+        api.token = data["login"]["accessToken"]
+
+        scenarios = {}
+        for name in args.scenarios:
+            try:
+                scenarios.update(await SCENARIOS[name](api, manifest, args, rng))
+            except Exception as e:
+                print(f"  {name} aborted: {e}")
+
+    params = {k: v for k, v in vars(args).items() if k not in ("command", "func", "output", "manifest")}
+    return {
+        "benchmark": "api",
+        "version": REPORT_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git_commit": git_commit(),
+        "dataset": manifest["counts"],
+        "params": params,
+        "scenarios": scenarios,
+    }
+
+
+def print_report(report: dict) -> None:
+    print(f"\n{'scenario':<32} {'n':>6} {'err':>5} {'ops/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for name, result in report["scenarios"].items():
+        latency = result["latency_ms"]
+        print(
+            f"{name:<32} {result['count']:>6} {result['errors']:>5} {result['throughput_per_s']:>9.2f} "
+            f"{latency['p50']:>9.2f} {latency['p95']:>9.2f} {latency['p99']:>9.2f}"
+        )
+
+
+def run(args) -> None:
+    report = asyncio.run(_run(args))
+    print_report(report)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"\nReport written to {args.output}")
+
+
+# ── compare ───────────────────────────────────────────────────────────
+
+
+def _delta(old: float, new: float) -> float:
+    return (new - old) / old * 100 if old else 0.0
+
+
+def compare(args) -> None:
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    with open(args.current, encoding="utf-8") as f:
+        current = json.load(f)
+
+    print(f"baseline {baseline.get('git_commit')} ({baseline.get('created_at')})")
+    print(f"current  {current.get('git_commit')} ({current.get('created_at')})\n")
+    if baseline.get("dataset") != current.get("dataset"):
+        print(f"warning: datasets differ: {baseline.get('dataset')} vs {current.get('dataset')}\n")
+
+    print(f"{'scenario':<32} {'p50 ms':>18} {'p95 ms':>18} {'ops/s':>18} {'errors':>9}")
+    regressions = []
+    old_scenarios, new_scenarios = baseline["scenarios"], current["scenarios"]
+    for name in sorted(set(old_scenarios) | set(new_scenarios)):
+        if name not in old_scenarios or name not in new_scenarios:
+            print(f"{name:<32} only in {'current' if name in new_scenarios else 'baseline'}")
+            continue
+        old, new = old_scenarios[name], new_scenarios[name]
+        p50 = _delta(old["latency_ms"]["p50"], new["latency_ms"]["p50"])
+        p95 = _delta(old["latency_ms"]["p95"], new["latency_ms"]["p95"])
+        ops = _delta(old["throughput_per_s"], new["throughput_per_s"])
+        print(
+            f"{name:<32} {new['latency_ms']['p50']:>9.1f} {p50:>+7.1f}% {new['latency_ms']['p95']:>9.1f} {p95:>+7.1f}% "
+            f"{new['throughput_per_s']:>9.2f} {ops:>+7.1f}% {old['errors']:>4}→{new['errors']:<4}"
+        )
+        if p95 > args.threshold or -ops > args.threshold or new["errors"] > old["errors"]:
+            regressions.append(name)
+
+    if regressions:
+        print(f"\nRegressed beyond {args.threshold}%: {', '.join(regressions)}")
+        sys.exit(1)
+    print(f"\nNo regression beyond {args.threshold}%")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    seed_parser = commands.add_parser("seed", help="create the synthetic company")
+    seed_parser.add_argument("--company-code", default="BENCH1", help="6 characters, must not exist yet")
+    seed_parser.add_argument("--password", default="benchmark")
+    seed_parser.add_argument("--departments", type=int, default=8)
+    seed_parser.add_argument("--jobs", type=int, default=200)
+    seed_parser.add_argument("--candidates", type=int, default=5000)
+    seed_parser.add_argument("--applications", type=int, default=20000)
+    seed_parser.add_argument("--seed", type=int, default=0)
+    seed_parser.add_argument("--manifest", default="benchmark_seed.json")
+    seed_parser.set_defaults(func=seed)
+
+    run_parser = commands.add_parser("run", help="run the scenarios against a running API")
+    run_parser.add_argument("--api-url", default="http://localhost:8000")
+    run_parser.add_argument("--manifest", default="benchmark_seed.json")
+    run_parser.add_argument("--output", default="benchmark.json")
+    run_parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    run_parser.add_argument("--concurrency", type=int, default=4, help="concurrent GraphQL queries")
+    run_parser.add_argument("--query-requests", type=int, default=20, help="requests per query scenario")
+    run_parser.add_argument("--upload-batches", type=int, default=3)
+    run_parser.add_argument("--upload-batch-size", type=int, default=20)
+    run_parser.add_argument("--analyze-candidates", type=int, default=50)
+    run_parser.add_argument("--analyze-runs", type=int, default=1)
+    run_parser.add_argument("--apply-requests", type=int, default=100)
+    run_parser.add_argument("--apply-concurrency", type=int, default=20)
+    run_parser.add_argument("--drain-timeout", type=float, default=300.0)
+    run_parser.add_argument("--subscribers", type=int, default=200)
+    run_parser.add_argument("--fanout-events", type=int, default=6)
+    run_parser.add_argument("--fanout-timeout", type=float, default=10.0)
+    run_parser.add_argument("--timeout", type=float, default=600.0, help="HTTP timeout per request (s)")
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.set_defaults(func=run)
+
+    compare_parser = commands.add_parser("compare", help="diff two reports")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=10.0, help="allowed slowdown in percent")
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args()
+    args.func(args)
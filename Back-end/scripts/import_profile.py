@@ -0,0 +1,149 @@
+"""
+Import-time profile of the API: what every worker pays before it can serve.
+
+Imports ``app.main`` in fresh interpreters with ``python -X importtime`` and
+reports:
+
+- total import time (median of ``--runs``) against the startup budget
+- self time per top-level package (app, strawberry, sqlalchemy, ...)
+- the slowest ``app.*`` modules, cumulative (including what they import)
+- modules that must load on first use but were imported at startup
+  (``LAZY_MODULES``, see ``app/graphql/lazy_resolvers.py``)
+
+Exits non-zero when the budget is exceeded or a lazy module was imported, so
+it can gate CI or a deploy. Run it from ``Back-end/`` with the usual ``.env``;
+no database connection is made.
+
+Usage:
+    python scripts/import_profile.py [--runs 5] [--budget-ms 4000] [--top 15]
+    python scripts/import_profile.py --output import-profile.md
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+BACKEND_DIR = os.path.join(os.path.dirname(__file__), '..')
+
+# Import of app.main, in milliseconds, measured with -X importtime. Measured
+# baseline (import-profile.md): median ~2900-3100 ms, slowest run ~3600 ms;
+# the budget sits above the noise so only a real regression fails it
+IMPORT_BUDGET_MS = 4000
+
+# Implementations of rarely used subsystems; they load on the first request
+LAZY_MODULES = (
+    "app.graphql.ai_generation",
+    "app.modules.offer.resolvers",
+    "app.modules.benefits.resolvers",
+    "app.modules.calendar.resolvers",
+    "app.modules.likert_template.resolvers",
+    "app.modules.ai_interview_template.resolvers",
+)
+
+# (self µs, cumulative µs, depth, module) per imported module
+ImportRecord = Tuple[int, int, int, str]
+
+
+def profile_once(target: str) -> Tuple[List[ImportRecord], float]:
+    """Import ``target`` in a fresh interpreter; returns the importtime records and wall-clock ms"""
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+    )
+    wall_ms = (time.perf_counter() - start) * 1000
+    if proc.returncode != 0:
+        tail = "\n".join(proc.stderr.splitlines()[-20:])
+        raise RuntimeError(f"import {target} failed:\n{tail}")
+
+    records: List[ImportRecord] = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        depth = (len(name) - len(name.lstrip())) // 2
+        records.append((int(self_us), int(cumulative_us), depth, name.strip()))
+    return records, wall_ms
+
+
+def summarize(records: List[ImportRecord]) -> Dict[str, object]:
+    by_package: Dict[str, int] = defaultdict(int)
+    for self_us, _, _, name in records:
+        by_package[name.split(".")[0]] += self_us
+    return {
+        "total_ms": sum(self_us for self_us, _, _, _ in records) / 1000,
+        "by_package": by_package,
+        "app_modules": {name: cumulative for _, cumulative, _, name in records if name.startswith("app.")},
+        "modules": {name for _, _, _, name in records},
+    }
+
+
+def render(target: str, runs: List[Dict[str, object]], walls: List[float], budget_ms: float, top: int) -> Tuple[str, bool]:
+    totals = [run["total_ms"] for run in runs]
+    median_ms = statistics.median(totals)
+    # Tables come from the run closest to the median
+    run = min(runs, key=lambda r: abs(r["total_ms"] - median_ms))
+    eager_lazy = [m for m in LAZY_MODULES if any(m in r["modules"] for r in runs)]
+    ok = median_ms <= budget_ms and not eager_lazy
+
+    lines = [
+        "# Back-end import-time profile",
+        "",
+        f"- Python {sys.version.split()[0]}, {len(runs)} runs",
+        f"- Import of `{target}`: median {median_ms:.0f} ms (min {min(totals):.0f}, max {max(totals):.0f})",
+        f"- Process wall clock incl. interpreter start: median {statistics.median(walls):.0f} ms",
+        f"- Budget: {budget_ms:.0f} ms, {'OK' if median_ms <= budget_ms else 'EXCEEDED'}",
+        "",
+        "## Self time by package",
+        "",
+        "| package | ms | share |",
+        "|---|---:|---:|",
+    ]
+    for package, self_us in sorted(run["by_package"].items(), key=lambda kv: -kv[1])[:top]:
+        lines.append(f"| {package} | {self_us / 1000:.1f} | {self_us / 10 / run['total_ms']:.0f}% |")
+
+    lines += ["", "## Slowest app modules (cumulative)", "", "| module | ms |", "|---|---:|"]
+    for name, cumulative in sorted(run["app_modules"].items(), key=lambda kv: -kv[1])[:top]:
+        lines.append(f"| {name} | {cumulative / 1000:.1f} |")
+
+    lines += ["", "## Lazily loaded modules", ""]
+    for module in LAZY_MODULES:
+        lines.append(f"- `{module}`: {'imported at startup' if module in eager_lazy else 'deferred'}")
+    return "\n".join(lines) + "\n", ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", default="app.main", help="module to import (default: app.main)")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=IMPORT_BUDGET_MS)
+    parser.add_argument("--top", type=int, default=15, help="rows per table")
+    parser.add_argument("--output", help="write the Markdown report here instead of stdout")
+    args = parser.parse_args()
+
+    runs, walls = [], []
+    try:
+        for _ in range(args.runs):
+            records, wall_ms = profile_once(args.target)
+            runs.append(summarize(records))
+            walls.append(wall_ms)
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        sys.exit(2)
+
+    report, ok = render(args.target, runs, walls, args.budget_ms, args.top)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(report)
+        print(f"Report written to {args.output}")
+    else:
+        print(report)
+    if not ok:
+        print("❌ Import-time budget exceeded or a lazy module was imported at startup")
+    sys.exit(0 if ok else 1)
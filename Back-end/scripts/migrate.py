@@ -0,0 +1,61 @@
+"""
+Apply database migrations (run once per deploy, before starting the API).
+
+Creates tables for new models, applies pending ``migrations/NNN_*.sql`` files
+in order and seeds default data, under a Postgres advisory lock so parallel
+runs are safe. See ``app/core/migrations.py``.
+
+Usage:
+    python scripts/migrate.py            # apply pending migrations
+    python scripts/migrate.py status     # list applied / pending migrations
+"""
+import argparse
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from sqlalchemy import create_engine
+
+from app.core.config import settings
+from app.core.migrations import MigrationError, MigrationRunner, discover
+
+
+def upgrade(runner: MigrationRunner, args) -> int:
+    ran = runner.upgrade(create_tables=not args.no_create_tables, seed=not args.no_seed)
+    print(f"Database is up to date ({len(ran)} migrations applied)")
+    return 0
+
+
+def status(runner: MigrationRunner, args) -> int:
+    applied = runner.applied()
+    pending = {m.version for m in runner.pending()}
+    changed = {m.version for m in runner.changed()}
+    for migration in discover(runner.directory):
+        if migration.version in pending:
+            state = "pending"
+        elif migration.version in applied:
+            state = "baselined" if applied[migration.version].execution_ms is None else "applied"
+            if migration.version in changed:
+                state += " (changed since)"
+        else:
+            state = "to be baselined (not run)"
+        print(f"{migration.filename:<60} {state}")
+    print(f"\n{len(pending)} pending")
+    return 1 if pending else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", nargs="?", choices=["upgrade", "status"], default="upgrade")
+    parser.add_argument("--no-create-tables", action="store_true", help="only apply SQL files")
+    parser.add_argument("--no-seed", action="store_true", help="skip default roles/admin/tags")
+    args = parser.parse_args()
+
+    runner = MigrationRunner(create_engine(settings.DATABASE_URL, pool_pre_ping=True))
+    try:
+        sys.exit({"upgrade": upgrade, "status": status}[args.command](runner, args))
+    except MigrationError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
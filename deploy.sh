@@ -35,6 +35,11 @@ docker compose -f docker-compose.prod.yml build --no-cache
 echo -e "${YELLOW}🛑 Stopping existing containers...${NC}"
 docker compose -f docker-compose.prod.yml down
 
+# Apply database migrations once, before any API worker starts
+echo -e "${YELLOW}📊 Applying database migrations...${NC}"
+docker compose -f docker-compose.prod.yml up -d --wait postgres
+docker compose -f docker-compose.prod.yml run --rm --no-deps backend python scripts/migrate.py
+
 echo -e "${YELLOW}🚀 Starting services...${NC}"
 docker compose -f docker-compose.prod.yml up -d
 
@@ -42,26 +47,6 @@ docker compose -f docker-compose.prod.yml up -d
 echo -e "${YELLOW}⏳ Waiting for services to be healthy...${NC}"
 sleep 10
 
-# Create database tables from SQLAlchemy models
-echo -e "${YELLOW}📊 Creating database tables...${NC}"
-docker compose -f docker-compose.prod.yml exec -T backend python -c "
-from app.core.database import engine, Base
-from sqlalchemy import text
-
-# Enable pgvector extension
-print('Enabling pgvector extension...')
-with engine.connect() as conn:
-    conn.execute(text('CREATE EXTENSION IF NOT EXISTS vector'))
-    conn.commit()
-print('pgvector extension enabled!')
-
-# Import all models to register them with Base
-from app.models import *
-print('Creating tables from SQLAlchemy models...')
-Base.metadata.create_all(bind=engine)
-print('Tables created successfully!')
-"
-
 # Show status
 echo -e "${YELLOW}📊 Container Status:${NC}"
 docker compose -f docker-compose.prod.yml ps
@@ -74,4 +59,5 @@ echo "Useful commands:"
 echo "  - View logs: docker compose -f docker-compose.prod.yml logs -f"
 echo "  - Stop: docker compose -f docker-compose.prod.yml down"
 echo "  - Restart: docker compose -f docker-compose.prod.yml restart"
+echo "  - Migration status: docker compose -f docker-compose.prod.yml exec backend python scripts/migrate.py status"
 